@@ -37,6 +37,7 @@ def create_dag_bag() -> DBDagBag:
     """Create DagBag with configurable LRU+TTL caching for API server usage."""
     cache_size = conf.getint("api", "dag_cache_size", fallback=64)
     cache_ttl_config = conf.getint("api", "dag_cache_ttl", fallback=3600)
+    lazy_tasks = conf.getboolean("api", "dag_cache_lazy_tasks", fallback=False)
 
     if cache_size < 0:
         log.warning("dag_cache_size must be >= 0, using unbounded dict")
@@ -47,12 +48,12 @@ def create_dag_bag() -> DBDagBag:
 
     # Use unbounded dict (no eviction) if cache_size is 0
     if cache_size <= 0:
-        return DBDagBag(cache_size=0)
+        return DBDagBag(cache_size=0, lazy_tasks=lazy_tasks)
 
     # Disable TTL if cache_ttl is 0
     cache_ttl: int | None = cache_ttl_config if cache_ttl_config > 0 else None
 
-    return DBDagBag(cache_size=cache_size, cache_ttl=cache_ttl)
+    return DBDagBag(cache_size=cache_size, cache_ttl=cache_ttl, lazy_tasks=lazy_tasks)
 
 
 def dag_bag_from_app(request: Request) -> DBDagBag:
@@ -280,6 +280,17 @@ ARG_LIST_LOCAL = Arg(
     help="Shows local parsed DAGs and their import errors, ignores content serialized in DB",
 )
 
+# dag_report
+ARG_PROFILE_IMPORTS = Arg(
+    ("--profile-imports",),
+    help=(
+        "Show the time each file spends running its top-level code, and its slowest imports. "
+        "All the files are parsed in the same process, so a module imported by several files is only "
+        "reported for the first of them"
+    ),
+    action="store_true",
+)
+
 # list_dag_runs
 ARG_NO_BACKFILL = Arg(
     ("--no-backfill",), help="filter all the backfill dagruns given the dag id", action="store_true"
@@ -1240,7 +1251,7 @@ DAGS_COMMANDS = (
         name="report",
         help="Show DagBag loading report",
         func=lazy_load_command("airflow.cli.commands.dag_command.dag_report"),
-        args=(ARG_BUNDLE_NAME, ARG_OUTPUT, ARG_VERBOSE),
+        args=(ARG_BUNDLE_NAME, ARG_PROFILE_IMPORTS, ARG_OUTPUT, ARG_VERBOSE),
     ),
     ActionCommand(
         name="list-runs",
@@ -2250,6 +2261,15 @@ core_commands: list[CLICommand] = [
             ARG_QUEUES,
             ARG_TRIGGERER_TEAM_NAME,
         ),
+        epilog=(
+            "Signals:\n"
+            "\n"
+            "  - SIGUSR2: Log the event loop lag and the triggers blocking it the most,\n"
+            "    when [profiling] triggerer_step_accounting is enabled.\n"
+            "\n"
+            "    Example:\n"
+            '        pkill -f -USR2 "airflow triggerer"'
+        ),
     ),
     ActionCommand(
         name="dag-processor",
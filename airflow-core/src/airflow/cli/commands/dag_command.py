@@ -713,25 +713,36 @@ def dag_report(args) -> None:
     else:
         bundles_to_reserialize = {b.name for b in all_bundles}
 
+    profile_imports = args.profile_imports
     all_dagbag_stats = []
+    import_profiles = {}
     for bundle in all_bundles:
         if bundle.name not in bundles_to_reserialize:
             continue
         bundle.initialize()
-        dagbag = BundleDagBag(bundle.path, bundle_path=bundle.path, bundle_name=bundle.name)
+        dagbag = BundleDagBag(
+            bundle.path, bundle_path=bundle.path, bundle_name=bundle.name, profile_imports=profile_imports
+        )
         all_dagbag_stats.extend(dagbag.dagbag_stats)
+        import_profiles.update(
+            ((bundle.name, file), profile) for file, profile in dagbag.import_profiles.items()
+        )
 
-    AirflowConsole().print_as(
-        data=all_dagbag_stats,
-        output=args.output,
-        mapper=lambda x: {
+    def mapper(x):
+        row = {
             "file": x.file,
             "duration": x.duration,
             "dag_num": x.dag_num,
             "task_num": x.task_num,
             "dags": sorted(ast.literal_eval(x.dags)),
-        },
-    )
+        }
+        if profile_imports:
+            profile = import_profiles.get((x.bundle_name, x.file))
+            row["top_level_code_duration"] = profile.top_level_code_duration if profile else None
+            row["slowest_imports"] = profile.format_slowest() if profile else None
+        return row
+
+    AirflowConsole().print_as(data=all_dagbag_stats, output=args.output, mapper=mapper)
 
 
 @deprecated_for_airflowctl("airflowctl jobs list")
@@ -889,3 +900,7 @@ def dag_reserialize(args, *, session: Session = NEW_SESSION) -> None:
         sync_bag_to_db(
             dag_bag, bundle.name, bundle_version=version, version_data=version_data, session=session
         )
+
+    # DAGs that did not change are not rewritten above, convert them to the configured storage format.
+    if count := SerializedDagModel.reencode_stored_dags(bundle_names=bundles_to_reserialize, session=session):
+        log.info("Rewrote %d serialized DAGs in the configured storage format", count)
@@ -261,6 +261,8 @@ class AirflowConfigParser(_SharedAirflowConfigParser):
             "modified_time",
             "random_seeded_by_host",
             "alphabetical",
+            "duration",
+            "parse_sla",
         ],
         ("logging", "logging_level"): _available_logging_levels,
         ("logging", "fab_logging_level"): _available_logging_levels,
@@ -297,6 +297,8 @@ class BaseDagBundle(ABC):
     """
 
     supports_versioning: bool = False
+    supports_file_watching: bool = False
+    """Whether the DAG processor can watch the files of :attr:`path` for changes, see ``file_change_detection``."""
 
     _locked: bool = False
 
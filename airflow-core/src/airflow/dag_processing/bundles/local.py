@@ -31,6 +31,7 @@ class LocalDagBundle(BaseDagBundle):
     """
 
     supports_versioning = False
+    supports_file_watching = True
 
     def __init__(self, *, path: str | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -28,6 +28,7 @@ This should generally only be called by internal methods such as
 from __future__ import annotations
 
 import traceback
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 import structlog
@@ -70,7 +71,7 @@ from airflow.utils.sqlalchemy import get_dialect_name, with_row_locks
 from airflow.utils.types import DagRunType
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterable, Iterator
+    from collections.abc import Collection, Iterable, Iterator, Sequence
 
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import Select
@@ -478,12 +479,50 @@ def _update_import_errors(
         )
 
 
+def _write_dags_to_db(
+    bundle_name: str,
+    bundle_version: str | None,
+    dags: Collection[LazyDeserializedDAG],
+    parse_duration: float | Mapping[str, float | None] | None,
+    version_data: dict | None,
+    session: Session,
+) -> list[tuple[tuple[str, str], str]]:
+    """Write the DAGs and their serialized versions, and return the serialization errors."""
+    serialize_errors: list[tuple[tuple[str, str], str]] = []
+    log.debug("Calling the DAG.bulk_sync_to_db method")
+    try:
+        SerializedDAG.bulk_write_to_db(bundle_name, bundle_version, dags, parse_duration, session=session)
+        # Bulk prefetch metadata for all DAGs to avoid the standard per-DAG
+        # metadata lookups in write_dag. This replaces the update-interval,
+        # hash, and version queries with 2 bulk queries total; DAGs with
+        # deadlines may still do an additional lookup for deadline UUID reuse.
+        prefetched_metadata = SerializedDagModel._prefetch_dag_write_metadata(
+            [dag.dag_id for dag in dags], session=session
+        )
+        # Write Serialized DAGs to DB, capturing errors
+        for dag in dags:
+            serialize_errors.extend(
+                _serialize_dag_capturing_errors(
+                    dag=dag,
+                    bundle_name=bundle_name,
+                    bundle_version=bundle_version,
+                    version_data=version_data,
+                    session=session,
+                    _prefetched=prefetched_metadata.get(dag.dag_id),
+                )
+            )
+    except OperationalError:
+        session.rollback()
+        raise
+    return serialize_errors
+
+
 def update_dag_parsing_results_in_db(
     bundle_name: str,
     bundle_version: str | None,
     dags: Collection[LazyDeserializedDAG],
     import_errors: dict[tuple[str, str], str],
-    parse_duration: float | None,
+    parse_duration: float | Mapping[str, float | None] | None,
     warnings: set[DagWarning],
     session: Session,
     *,
@@ -494,6 +533,7 @@ def update_dag_parsing_results_in_db(
         DagWarningType.RUNTIME_VARYING_VALUE,
     ),
     files_parsed: set[tuple[str, str]] | None = None,
+    _retry: bool = True,
 ):
     """
     Update everything to do with DAG parsing in the DB.
@@ -512,13 +552,14 @@ def update_dag_parsing_results_in_db(
 
     ``import_errors`` will be updated in place with an new errors
 
+    :param parse_duration: Duration of the parsing of the DAGs, or the duration of the parsing of the file
+        of each DAG, by dag_id, when the DAGs come from several files.
     :param files_parsed: Set of (bundle_name, relative_fileloc) tuples for all files that were parsed.
         If None, will be inferred from dags and import_errors. Passing this explicitly ensures that
         import errors are cleared for files that were parsed but no longer contain DAGs.
+    :param _retry: Whether to retry writing the DAGs on operational errors. The caller must retry the
+        whole transaction otherwise, as the session is rolled back on such errors.
     """
-    # Retry 'DAG.bulk_write_to_db' & 'SerializedDagModel.bulk_sync_to_db' in case
-    # of any Operational Errors
-    # In case of failures, provide_session handles rollback
     try:
         duplicate_warnings = _build_duplicate_dag_id_warnings(dags, bundle_name, session)
     except Exception:
@@ -526,44 +567,27 @@ def update_dag_parsing_results_in_db(
     else:
         warnings = set(warnings) | duplicate_warnings
 
-    for attempt in run_with_db_retries(logger=log):
-        with attempt:
-            serialize_errors = []
-            log.debug(
-                "Running dagbag.bulk_write_to_db with retries. Try %d of %d",
-                attempt.retry_state.attempt_number,
-                MAX_DB_RETRIES,
-            )
-            log.debug("Calling the DAG.bulk_sync_to_db method")
-            try:
-                SerializedDAG.bulk_write_to_db(
-                    bundle_name, bundle_version, dags, parse_duration, session=session
+    if _retry:
+        # Retry 'DAG.bulk_write_to_db' & 'SerializedDagModel.bulk_sync_to_db' in case
+        # of any Operational Errors
+        # In case of failures, provide_session handles rollback
+        for attempt in run_with_db_retries(logger=log):
+            with attempt:
+                log.debug(
+                    "Running dagbag.bulk_write_to_db with retries. Try %d of %d",
+                    attempt.retry_state.attempt_number,
+                    MAX_DB_RETRIES,
                 )
-                # Bulk prefetch metadata for all DAGs to avoid the standard per-DAG
-                # metadata lookups in write_dag. This replaces the update-interval,
-                # hash, and version queries with 2 bulk queries total; DAGs with
-                # deadlines may still do an additional lookup for deadline UUID reuse.
-                prefetched_metadata = SerializedDagModel._prefetch_dag_write_metadata(
-                    [dag.dag_id for dag in dags], session=session
+                serialize_errors = _write_dags_to_db(
+                    bundle_name, bundle_version, dags, parse_duration, version_data, session
                 )
-                # Write Serialized DAGs to DB, capturing errors
-                for dag in dags:
-                    serialize_errors.extend(
-                        _serialize_dag_capturing_errors(
-                            dag=dag,
-                            bundle_name=bundle_name,
-                            bundle_version=bundle_version,
-                            version_data=version_data,
-                            session=session,
-                            _prefetched=prefetched_metadata.get(dag.dag_id),
-                        )
-                    )
-            except OperationalError:
-                session.rollback()
-                raise
-            # Only now we are "complete" do we update import_errors - don't want to record errors from
-            # previous failed attempts
-            import_errors.update(serialize_errors)
+    else:
+        serialize_errors = _write_dags_to_db(
+            bundle_name, bundle_version, dags, parse_duration, version_data, session
+        )
+    # Only now we are "complete" do we update import_errors - don't want to record errors from
+    # previous failed attempts
+    import_errors.update(serialize_errors)
     # Record import errors into the ORM - we don't retry on this one as it's not as critical that it works
     try:
         _update_import_errors(
@@ -584,6 +608,90 @@ def update_dag_parsing_results_in_db(
     session.flush()
 
 
+class ParsedDagFile(NamedTuple):
+    """Result of the parsing of a DAG file, to write with :func:`update_dag_parsing_results_in_db_batch`."""
+
+    relative_fileloc: str
+    dags: Collection[LazyDeserializedDAG]
+    import_errors: dict[tuple[str, str], str]
+    parse_duration: float | None
+    warnings: set[DagWarning]
+
+
+def _split_duplicate_dag_ids(files: Sequence[ParsedDagFile]) -> Iterator[list[ParsedDagFile]]:
+    """Split files in consecutive groups in which every dag_id is defined by at most one file."""
+    group: list[ParsedDagFile] = []
+    dag_ids: set[str] = set()
+    for file in files:
+        file_dag_ids = {dag.dag_id for dag in file.dags}
+        if not dag_ids.isdisjoint(file_dag_ids):
+            yield group
+            group = []
+            dag_ids = set()
+        group.append(file)
+        dag_ids.update(file_dag_ids)
+    if group:
+        yield group
+
+
+def update_dag_parsing_results_in_db_batch(
+    bundle_name: str,
+    bundle_version: str | None,
+    files: Sequence[ParsedDagFile],
+    session: Session,
+    *,
+    version_data: dict | None = None,
+) -> None:
+    """
+    Update everything to do with the parsing of several files of a bundle in the DB.
+
+    This is equivalent to calling :func:`update_dag_parsing_results_in_db` for each file in turn, but the
+    DAGs, assets, import errors and warnings of all the files are written with the same bulk queries.
+
+    When several files define the same dag_id, they are written in separate rounds, in order, so the last
+    file wins and the other files get duplicate dag_id warnings, like when they are written one by one.
+    The rounds share the transaction of ``session``, so they are all written again when one of them fails
+    with an operational error.
+    """
+    groups = list(_split_duplicate_dag_ids(files))
+    for attempt in run_with_db_retries(logger=log):
+        with attempt:
+            log.debug(
+                "Writing the parsing results of %d files in %d rounds. Try %d of %d",
+                len(files),
+                len(groups),
+                attempt.retry_state.attempt_number,
+                MAX_DB_RETRIES,
+            )
+            for group in groups:
+                dags: list[LazyDeserializedDAG] = []
+                import_errors: dict[tuple[str, str], str] = {}
+                files_parsed: set[tuple[str, str]] = set()
+                warnings: set[DagWarning] = set()
+                parse_durations: dict[str, float | None] = {}
+                for file in group:
+                    dags.extend(file.dags)
+                    import_errors.update(file.import_errors)
+                    files_parsed.add((bundle_name, file.relative_fileloc))
+                    files_parsed.update(file.import_errors)
+                    warnings.update(file.warnings)
+                    parse_durations.update(
+                        dict.fromkeys((dag.dag_id for dag in file.dags), file.parse_duration)
+                    )
+                update_dag_parsing_results_in_db(
+                    bundle_name=bundle_name,
+                    bundle_version=bundle_version,
+                    version_data=version_data,
+                    dags=dags,
+                    import_errors=import_errors,
+                    parse_duration=parse_durations,
+                    warnings=warnings,
+                    session=session,
+                    files_parsed=files_parsed,
+                    _retry=False,
+                )
+
+
 class DagModelOperation(NamedTuple):
     """Collect DAG objects and perform database operations for them."""
 
@@ -624,7 +732,7 @@ class DagModelOperation(NamedTuple):
     def update_dags(
         self,
         orm_dags: dict[str, DagModel],
-        parse_duration: float | None,
+        parse_duration: float | Mapping[str, float | None] | None,
         *,
         session: Session,
     ) -> None:
@@ -638,7 +746,10 @@ class DagModelOperation(NamedTuple):
             dm.is_stale = False
             dm.has_import_errors = False
             dm.last_parsed_time = utcnow()
-            dm.last_parse_duration = parse_duration
+            if isinstance(parse_duration, Mapping):
+                dm.last_parse_duration = parse_duration.get(dag_id)
+            else:
+                dm.last_parse_duration = parse_duration
             if hasattr(dag, "_dag_display_property_value"):
                 dm._dag_display_property_value = dag._dag_display_property_value
             elif dag.dag_display_name != dag.dag_id:
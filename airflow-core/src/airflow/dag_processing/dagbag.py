@@ -32,6 +32,7 @@ from tabulate import tabulate
 from airflow import settings
 from airflow._shared.timezones import timezone
 from airflow.configuration import conf
+from airflow.dag_processing.import_profiler import ImportProfiler
 from airflow.dag_processing.importers import get_importer_registry
 from airflow.exceptions import (
     AirflowClusterPolicyError,
@@ -54,6 +55,7 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
     from airflow import DAG
+    from airflow.dag_processing.import_profiler import DagFileImportProfile
     from airflow.models.dagwarning import DagWarning
 
 
@@ -205,6 +207,8 @@ class DagBag(LoggingMixin):
         are not loaded to not run User code in Scheduler.
     :param collect_dags: when True, collects dags during class initialization.
     :param known_pools: If not none, then generate warnings if a Task attempts to use an unknown pool.
+    :param profile_imports: when True, records the time spent importing modules and running the top-level
+        code of every collected file in ``import_profiles``.
     """
 
     def __init__(
@@ -216,10 +220,14 @@ class DagBag(LoggingMixin):
         known_pools: set[str] | None = None,
         bundle_path: Path | None = None,
         bundle_name: str | None = None,
+        profile_imports: bool = False,
     ):
         super().__init__()
         self.bundle_path = bundle_path
         self.bundle_name = bundle_name
+        self.profile_imports = profile_imports
+        # Import profiles of the collected files, by path relative to the dag folder
+        self.import_profiles: dict[str, DagFileImportProfile] = {}
 
         dag_folder = dag_folder or settings.DAGS_FOLDER
         self.dag_folder = dag_folder
@@ -501,7 +509,10 @@ class DagBag(LoggingMixin):
         for filepath in files_to_parse:
             try:
                 file_parse_start_dttm = timezone.utcnow()
-                found_dags = self.process_file(filepath, only_if_updated=only_if_updated, safe_mode=safe_mode)
+                with ImportProfiler() if self.profile_imports else contextlib.nullcontext() as profiler:
+                    found_dags = self.process_file(
+                        filepath, only_if_updated=only_if_updated, safe_mode=safe_mode
+                    )
 
                 file_parse_end_dttm = timezone.utcnow()
                 try:
@@ -509,6 +520,8 @@ class DagBag(LoggingMixin):
                 except ValueError:
                     # filepath is not under dag_folder (e.g., example DAGs from a different location)
                     relative_file = Path(filepath).as_posix()
+                if profiler is not None:
+                    self.import_profiles[relative_file] = profiler.profile()
                 stats.append(
                     FileLoadStat(
                         file=relative_file,
@@ -0,0 +1,185 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Detection of changes to the files of a local DAG bundle, using Linux inotify."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import structlog
+
+log = structlog.get_logger(logger_name=__name__)
+
+# Constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+_STRUCTURAL_EVENTS = IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Files whose changes can change the set of DAG files of a bundle.
+_DAG_FILE_SUFFIXES = (".py", ".zip")
+_IGNORE_FILE_NAME = ".airflowignore"
+
+
+class DagFileChanges(NamedTuple):
+    """Changes to the files of a bundle since the previous poll."""
+
+    modified: set[Path]
+    """Relative paths of the files written to."""
+    rescan: bool
+    """Whether files were added, removed or renamed, so the list of DAG files has to be rebuilt."""
+
+
+def _load_libc() -> ctypes.CDLL:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+class DagFileWatcher:
+    """
+    Watch a directory tree with inotify, and report which DAG files changed.
+
+    Every directory of the tree is watched, including the directories created later on. Events are only
+    read when :meth:`poll` is called, so the watcher does not need a thread.
+
+    Only the changes made through the kernel of this host are reported: on network file systems, changes
+    made by other hosts are not seen, so a periodic full scan of the bundle is still needed.
+
+    :param path: Root of the directory tree to watch
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._libc = _load_libc()
+        self.path = Path(path)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd: int | None = fd
+        self._directories: dict[int, Path] = {}
+        try:
+            self._watch_tree(self.path)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, root: Path) -> None:
+        visited = {os.path.realpath(directory) for directory in self._directories.values()}
+        self._watch_directory(root)
+        visited.add(os.path.realpath(root))
+        for directory, subdirectories, _ in os.walk(root, followlinks=True):
+            for name in list(subdirectories):
+                path = Path(directory, name)
+                real_path = os.path.realpath(path)
+                if real_path in visited:
+                    # A symbolic link to a directory already watched, e.g. to one of its parents
+                    subdirectories.remove(name)
+                    continue
+                visited.add(real_path)
+                self._watch_directory(path)
+
+    def _watch_directory(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                # Removed since it was listed, the event of its parent triggers a rescan anyway.
+                return
+            raise OSError(error, f"Cannot watch {directory}: {os.strerror(error)}")
+        self._directories[wd] = directory
+
+    def poll(self) -> DagFileChanges:
+        """
+        Return the changes since the previous poll, without blocking.
+
+        :raises OSError: if a directory created since the previous poll cannot be watched, e.g. when the
+            inotify watch limit is reached. Changes may have been lost, so the watcher should not be used
+            anymore.
+        """
+        modified: set[Path] = set()
+        rescan = False
+        for wd, mask, name in self._read_events():
+            if mask & IN_Q_OVERFLOW:
+                log.warning("Too many file changes in %s to track them, rescanning it", self.path)
+                rescan = True
+                continue
+            if mask & IN_IGNORED:
+                self._directories.pop(wd, None)
+                continue
+            directory = self._directories.get(wd)
+            if directory is None:
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                rescan = True
+                continue
+            path = directory / name
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+                rescan = True
+            elif name == _IGNORE_FILE_NAME:
+                rescan = True
+            elif path.suffix in _DAG_FILE_SUFFIXES:
+                if mask & _STRUCTURAL_EVENTS:
+                    rescan = True
+                else:
+                    modified.add(path.relative_to(self.path))
+        return DagFileChanges(modified=modified, rescan=rescan)
+
+    def _read_events(self):
+        if self._fd is None:
+            raise ValueError("The watcher is closed")
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                yield wd, mask, name
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,143 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Profiling of the module imports made while parsing a DAG file.
+
+The profiler measures the same times as ``python -X importtime``, for the modules imported for the first
+time while a DAG file is loaded, and derives the time spent running the top-level code of the file itself.
+"""
+
+from __future__ import annotations
+
+import importlib._bootstrap
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+
+class ModuleImportTime(BaseModel):
+    """Time spent importing a module while parsing a DAG file."""
+
+    module: str
+    self_duration: float
+    """Seconds spent executing the module, excluding the modules it imports."""
+    cumulative_duration: float
+    """Seconds spent importing the module, including the modules it imports."""
+    direct: bool
+    """Whether the module is imported by the DAG file itself rather than by another module."""
+
+
+class DagFileImportProfile(BaseModel):
+    """Split of the time spent loading a DAG file between its imports and its own top-level code."""
+
+    total_duration: float
+    top_level_code_duration: float
+    """Seconds spent loading the file outside of imports of new modules."""
+    imports: list[ModuleImportTime]
+    """The slowest imports, by cumulative duration."""
+
+    def format_slowest(self, limit: int = 3) -> str:
+        """Return a short human readable summary of the slowest direct imports."""
+        direct = [module for module in self.imports if module.direct][:limit]
+        return ", ".join(f"{module.module} ({module.cumulative_duration:.3f}s)" for module in direct)
+
+
+class ImportProfiler:
+    """
+    Context manager recording the imports of new modules made by the current thread.
+
+    Only the modules that are not in ``sys.modules`` yet are recorded, so modules already imported by the
+    DAG processor (see ``[dag_processor] parsing_pre_import_modules`` and
+    ``[dag_processor] parsing_preload_modules``) or by a previous file of the same process cost nothing and
+    are not reported.
+
+    :param max_modules: The number of slowest imports to keep in the profile
+    """
+
+    def __init__(self, max_modules: int = 30) -> None:
+        self.max_modules = max_modules
+        self._thread_id: int | None = None
+        self._original: Callable[[str, Any], Any] | None = None
+        self._stack: list[list[float]] = []
+        self._records: list[ModuleImportTime] = []
+        self._direct_duration = 0.0
+        self._start = 0.0
+        self._total_duration = 0.0
+
+    def __enter__(self) -> ImportProfiler:
+        if self._original is not None:
+            raise RuntimeError("The import profiler is already running")
+        self._thread_id = threading.get_ident()
+        self._original = importlib._bootstrap._find_and_load
+        importlib._bootstrap._find_and_load = self._find_and_load
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._total_duration = time.perf_counter() - self._start
+        importlib._bootstrap._find_and_load = self._original
+        self._original = None
+
+    def _find_and_load(self, name: str, import_: Any) -> Any:
+        original = self._original or importlib._bootstrap._find_and_load
+        if threading.get_ident() != self._thread_id or name in sys.modules:
+            return original(name, import_)
+
+        # The single item is the time spent importing the modules imported by this one
+        frame = [0.0]
+        direct = not self._stack
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return original(name, import_)
+        finally:
+            cumulative = time.perf_counter() - start
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][0] += cumulative
+            else:
+                self._direct_duration += cumulative
+            self._records.append(
+                ModuleImportTime(
+                    module=name,
+                    self_duration=cumulative - frame[0],
+                    cumulative_duration=cumulative,
+                    direct=direct,
+                )
+            )
+
+    def profile(self) -> DagFileImportProfile:
+        """Return the profile of the imports made while the profiler was running."""
+        slowest = sorted(self._records, key=lambda record: record.cumulative_duration, reverse=True)
+        return DagFileImportProfile(
+            total_duration=self._total_duration,
+            top_level_code_duration=max(self._total_duration - self._direct_duration, 0.0),
+            imports=slowest[: self.max_modules],
+        )
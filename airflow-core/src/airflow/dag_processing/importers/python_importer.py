@@ -18,15 +18,20 @@
 
 from __future__ import annotations
 
+import _imp
 import contextlib
+import hashlib
 import importlib
+import importlib.abc
 import importlib.machinery
 import importlib.util
 import logging
+import marshal
 import os
 import signal
 import sys
 import traceback
+import types
 import warnings
 import zipfile
 from collections.abc import Iterator
@@ -46,6 +51,7 @@ from airflow.utils.docs import get_docs_url
 from airflow.utils.file import get_unique_dag_module_name, might_contain_dag
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from types import ModuleType
 
     from airflow.sdk import DAG
@@ -76,6 +82,121 @@ def _timeout(seconds: float = 1, error_message: str = "Timeout"):
             signal.setitimer(signal.ITIMER_REAL, 0)
 
 
+class _CachedBytecodeLoader(importlib.machinery.SourceFileLoader):
+    """
+    Source file loader reading the compiled code of modules from a cache shared by the parsing processes.
+
+    The cache is keyed by the hash of the source, so unchanged modules are compiled once even when the
+    bundle is checked out again in another directory for a new version. Writes are atomic, so several
+    processes can fill the cache concurrently. The cached code is executed, so the cache directory must
+    only be writable by the user running the parsing processes (see ``_get_bytecode_cache_dir``).
+    """
+
+    def __init__(self, fullname: str, path: str, cache_dir: Path) -> None:
+        super().__init__(fullname, path)
+        self.cache_dir = cache_dir
+
+    def get_code(self, fullname: str) -> types.CodeType:
+        source_path = self.get_filename(fullname)
+        source = self.get_data(source_path)
+        key = hashlib.sha256(importlib.util.MAGIC_NUMBER + bytes([sys.flags.optimize]) + source).hexdigest()
+        cache_path = self.cache_dir / key[:2] / f"{key}.bin"
+        try:
+            code = marshal.loads(cache_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            code = None
+        if isinstance(code, types.CodeType):
+            # The cached code can come from a copy of the module in another directory
+            _imp._fix_co_filename(code, source_path)
+        else:
+            code = self.source_to_code(source, source_path)
+            self._store(cache_path, marshal.dumps(code))
+        return code
+
+    @staticmethod
+    def _store(cache_path: Path, data: bytes) -> None:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            log.debug("Could not write the bytecode cache file %s", cache_path, exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+
+class _BundleBytecodeCacheFinder(importlib.abc.MetaPathFinder):
+    """Find the modules of a bundle on ``sys.path``, and load them with the bytecode cache."""
+
+    def __init__(self, bundle_path: Path, cache_dir: Path) -> None:
+        self.bundle_path = bundle_path
+        self.cache_dir = cache_dir
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None
+    ) -> importlib.machinery.ModuleSpec | None:
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if (
+            spec is None
+            or spec.origin is None
+            or type(spec.loader) is not importlib.machinery.SourceFileLoader
+            or not Path(spec.origin).is_relative_to(self.bundle_path)
+        ):
+            # Let the regular finders import the module
+            return None
+        spec.loader = _CachedBytecodeLoader(fullname, spec.origin, self.cache_dir)
+        return spec
+
+
+def _get_bytecode_cache_dir() -> Path | None:
+    """
+    Return the directory of the bytecode cache, or None if the cache is disabled.
+
+    The code read from the cache is executed, so the directory is created private to the current user,
+    and an existing directory owned by another user or writable by others is refused.
+    """
+    cache_dir = conf.get("dag_processor", "parsing_bytecode_cache_dir", fallback="")
+    if not cache_dir:
+        return None
+    path = Path(cache_dir).expanduser()
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        stat_result = path.stat()
+    except OSError:
+        log.warning(
+            "Could not create the bytecode cache directory %s, disabling the cache", path, exc_info=True
+        )
+        return None
+    if stat_result.st_uid != os.getuid() or stat_result.st_mode & 0o022:
+        log.warning(
+            "The bytecode cache directory %s is not owned by the current user or is writable by other "
+            "users, disabling the cache",
+            path,
+        )
+        return None
+    return path
+
+
+@contextlib.contextmanager
+def _bundle_bytecode_cache(bundle_path: Path | None, cache_dir: Path | None) -> Iterator[None]:
+    """Load the modules of the bundle imported in the context with the bytecode cache."""
+    if bundle_path is None or cache_dir is None:
+        yield
+        return
+    finder = _BundleBytecodeCacheFinder(Path(bundle_path), cache_dir)
+    # Modules of the bundle are found on sys.path, so keep the builtin and frozen modules first
+    try:
+        index = sys.meta_path.index(importlib.machinery.PathFinder)
+    except ValueError:
+        index = len(sys.meta_path)
+    sys.meta_path.insert(index, finder)
+    try:
+        yield
+    finally:
+        sys.meta_path.remove(finder)
+
+
 class PythonDagImporter(AbstractDagImporter):
     """
     Importer for Python DAG files and zip archives containing Python DAGs.
@@ -156,10 +277,16 @@ class PythonDagImporter(AbstractDagImporter):
         # Capture warnings during import
         captured_warnings: list[warnings.WarningMessage] = []
 
+        bytecode_cache_dir = _get_bytecode_cache_dir()
         try:
-            with warnings.catch_warnings(record=True) as captured_warnings:
+            with (
+                warnings.catch_warnings(record=True) as captured_warnings,
+                _bundle_bytecode_cache(bundle_path, bytecode_cache_dir),
+            ):
                 if filepath.endswith(".py") or not zipfile.is_zipfile(filepath):
-                    modules = self._load_modules_from_file(filepath, safe_mode, result)
+                    modules = self._load_modules_from_file(
+                        filepath, safe_mode, result, bytecode_cache_dir=bytecode_cache_dir
+                    )
                 else:
                     modules = self._load_modules_from_zip(filepath, safe_mode, result)
         except TypeError:
@@ -196,7 +323,12 @@ class PythonDagImporter(AbstractDagImporter):
         return result
 
     def _load_modules_from_file(
-        self, filepath: str, safe_mode: bool, result: DagImportResult
+        self,
+        filepath: str,
+        safe_mode: bool,
+        result: DagImportResult,
+        *,
+        bytecode_cache_dir: Path | None = None,
     ) -> list[ModuleType]:
         from airflow.sdk.definitions._internal.contextmanager import DagContext
 
@@ -231,7 +363,11 @@ class PythonDagImporter(AbstractDagImporter):
 
         def parse(mod_name: str, filepath: str) -> list[ModuleType]:
             try:
-                loader = importlib.machinery.SourceFileLoader(mod_name, filepath)
+                loader: importlib.machinery.SourceFileLoader
+                if bytecode_cache_dir is not None:
+                    loader = _CachedBytecodeLoader(mod_name, filepath, bytecode_cache_dir)
+                else:
+                    loader = importlib.machinery.SourceFileLoader(mod_name, filepath)
                 spec = importlib.util.spec_from_loader(mod_name, loader)
                 new_module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
                 sys.modules[spec.name] = new_module  # type: ignore[union-attr]
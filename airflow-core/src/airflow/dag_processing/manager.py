@@ -31,6 +31,8 @@ import sys
 import time
 import zipfile
 from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from operator import attrgetter, itemgetter
@@ -54,8 +56,18 @@ from airflow.dag_processing.bundles.base import (
     unpack_bundle_version,
 )
 from airflow.dag_processing.bundles.manager import DagBundlesManager
-from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.collection import (
+    ParsedDagFile,
+    update_dag_parsing_results_in_db,
+    update_dag_parsing_results_in_db_batch,
+)
+from airflow.dag_processing.file_watcher import DagFileChanges, DagFileWatcher
+from airflow.dag_processing.parse_cache import DagFileParseCache
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    preload_parsing_modules,
+)
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DagPriorityParsingRequest
@@ -68,7 +80,7 @@ from airflow.sdk import SecretCache
 from airflow.sdk.log import init_log_file, logging_processors
 from airflow.typing_compat import assert_never
 from airflow.utils.file import list_py_file_paths, might_contain_dag
-from airflow.utils.helpers import prune_dict
+from airflow.utils.helpers import chunks, prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.net import get_hostname
 from airflow.utils.process_utils import (
@@ -84,7 +96,7 @@ from airflow.utils.sqlalchemy import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+    from collections.abc import Callable, Collection, Iterable, Iterator, KeysView, Sequence
     from socket import socket
 
     from sqlalchemy.orm import Session
@@ -120,6 +132,24 @@ class BundleState(NamedTuple):
     version: str | None
 
 
+class _BundleRefreshResult(NamedTuple):
+    version: str | None
+    version_data: dict | None
+    rel_paths: list[Path] | None
+    """Relative paths of the files of the bundle, None when its version did not change"""
+
+
+@attrs.define
+class _BundleRefresh:
+    """Refresh of a DAG bundle running in a worker thread."""
+
+    bundle: BaseDagBundle
+    future: Future[_BundleRefreshResult]
+    refresh_time: datetime
+    start_time: float
+    timed_out: bool = False
+
+
 @attrs.define
 class DagFileStat:
     """Information about single processing of one file."""
@@ -158,10 +188,89 @@ class DagFileInfo:
         return normalize_name_for_stats(str(self.rel_path))
 
 
+class DagFileStatIndex(MutableMapping[DagFileInfo, DagFileStat]):
+    """
+    Stats of the DAG files, indexed by file and by presence key.
+
+    Several files can share a presence key, e.g. the unversioned file and a versioned file queued for a
+    callback. Looking the stats up by presence key is O(1), so preparing the file queue stays O(n log n)
+    in the number of files. Like a ``defaultdict``, getting the stat of an unknown file adds a new one.
+    """
+
+    def __init__(self, stats: Mapping[DagFileInfo, DagFileStat] | None = None) -> None:
+        self._stats: dict[DagFileInfo, DagFileStat] = {}
+        self._files_by_presence_key: dict[tuple[str, Path], dict[DagFileInfo, None]] = {}
+        if stats:
+            self.update(stats)
+
+    def __getitem__(self, file: DagFileInfo) -> DagFileStat:
+        try:
+            return self._stats[file]
+        except KeyError:
+            stat = self[file] = DagFileStat()
+            return stat
+
+    def __setitem__(self, file: DagFileInfo, stat: DagFileStat) -> None:
+        self._stats[file] = stat
+        self._files_by_presence_key.setdefault(file.presence_key, {})[file] = None
+
+    def __delitem__(self, file: DagFileInfo) -> None:
+        del self._stats[file]
+        files = self._files_by_presence_key[file.presence_key]
+        del files[file]
+        if not files:
+            del self._files_by_presence_key[file.presence_key]
+
+    def __contains__(self, file: object) -> bool:
+        return file in self._stats
+
+    def __iter__(self) -> Iterator[DagFileInfo]:
+        return iter(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._stats!r})"
+
+    def get(self, file: DagFileInfo, default: DagFileStat | None = None) -> DagFileStat | None:  # type: ignore[override]
+        return self._stats.get(file, default)
+
+    def presence_keys(self) -> KeysView[tuple[str, Path]]:
+        return self._files_by_presence_key.keys()
+
+    def get_by_presence_key(self, presence_key: tuple[str, Path]) -> DagFileStat | None:
+        """Return the stat of the most recently added file with this presence key, if any."""
+        files = self._files_by_presence_key.get(presence_key)
+        if not files:
+            return None
+        return self._stats[next(reversed(files))]
+
+    def items_by_presence_key(self) -> Iterator[tuple[tuple[str, Path], DagFileStat]]:
+        """Iterate over the presence keys, with the stat :meth:`get_by_presence_key` returns for each."""
+        for presence_key, files in self._files_by_presence_key.items():
+            yield presence_key, self._stats[next(reversed(files))]
+
+    def pop_presence_key(self, presence_key: tuple[str, Path]) -> None:
+        """Remove the stats of all files with this presence key."""
+        for file in self._files_by_presence_key.pop(presence_key, ()):
+            del self._stats[file]
+
+
+def _to_file_stat_index(stats: Mapping[DagFileInfo, DagFileStat]) -> DagFileStatIndex:
+    if isinstance(stats, DagFileStatIndex):
+        return stats
+    return DagFileStatIndex(stats)
+
+
 def _config_int_factory(section: str, key: str):
     return functools.partial(conf.getint, section, key)
 
 
+def _config_float_factory(section: str, key: str):
+    return functools.partial(conf.getfloat, section, key)
+
+
 def _config_bool_factory(section: str, key: str):
     return functools.partial(conf.getboolean, section, key)
 
@@ -258,8 +367,8 @@ class DagFileProcessorManager(LoggingMixin):
     """An overridable heartbeat called once every time around the loop"""
 
     _file_queue: OrderedDict[DagFileInfo, None] = attrs.field(factory=OrderedDict, init=False)
-    _file_stats: dict[DagFileInfo, DagFileStat] = attrs.field(
-        factory=lambda: defaultdict(DagFileStat), init=False
+    _file_stats: DagFileStatIndex = attrs.field(
+        factory=DagFileStatIndex, converter=_to_file_stat_index, init=False
     )
 
     _dag_bundles: list[BaseDagBundle] = attrs.field(factory=list, init=False)
@@ -281,6 +390,10 @@ class DagFileProcessorManager(LoggingMixin):
         factory=_config_int_factory("dag_processor", "max_callbacks_per_loop")
     )
 
+    _parsing_result_batch_size: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_result_batch_size")
+    )
+
     base_log_dir: str = attrs.field(
         factory=_config_get_factory("logging", "dag_processor_child_process_log_directory")
     )
@@ -293,11 +406,37 @@ class DagFileProcessorManager(LoggingMixin):
     """Last time we checked if any bundles are ready to be refreshed"""
     _force_refresh_bundles: set[str] = attrs.field(factory=set, init=False)
     """List of bundles that need to be force refreshed in the next loop"""
+    bundle_refresh_workers: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "bundle_refresh_workers")
+    )
+    """Number of threads refreshing the bundles concurrently, 1 to refresh them one after the other in the loop"""
+    _bundle_refresh_pool: ThreadPoolExecutor | None = attrs.field(default=None, init=False)
+    _bundle_refreshes: dict[str, _BundleRefresh] = attrs.field(factory=dict, init=False)
+    """Refreshes running in the worker threads, by bundle name"""
+    bundle_refresh_timeout: float = attrs.field(
+        factory=_config_float_factory("dag_processor", "bundle_refresh_timeout")
+    )
 
     _file_parsing_sort_mode: str = attrs.field(
         factory=_config_get_factory("dag_processor", "file_parsing_sort_mode")
     )
 
+    _file_change_detection: str = attrs.field(
+        factory=_config_get_factory("dag_processor", "file_change_detection")
+    )
+    _bundle_watchers: dict[str, DagFileWatcher | None] = attrs.field(factory=dict, init=False)
+    """inotify watchers of the bundles, None for the bundles that cannot be watched"""
+
+    _parse_cache: DagFileParseCache | None = attrs.field(
+        factory=lambda: (
+            DagFileParseCache()
+            if conf.getboolean("dag_processor", "enable_parse_cache", fallback=False)
+            else None
+        )
+    )
+    _parse_fingerprints: dict[DagFileInfo, str] = attrs.field(factory=dict, init=False)
+    """Fingerprints of the files being parsed, cached with their result once parsed"""
+
     _api_server: InProcessExecutionAPI = attrs.field(init=False, factory=_make_execution_api)
     """API server to interact with Metadata DB"""
 
@@ -358,6 +497,8 @@ class DagFileProcessorManager(LoggingMixin):
         try:
             return self._run_parsing_loop()
         finally:
+            self._close_bundle_watchers()
+            self._stop_bundle_refreshes()
             self.after_run()
 
     def before_run(self) -> None:
@@ -369,6 +510,7 @@ class DagFileProcessorManager(LoggingMixin):
         self.log.info("Process each file at most once every %s seconds", self._file_process_interval)
         self.prepare_bundles()
         self._symlink_latest_log_directory()
+        preload_parsing_modules(self.log)
         # To prevent COW in forked process parsing dag file
         gc.freeze()
 
@@ -571,6 +713,8 @@ class DagFileProcessorManager(LoggingMixin):
 
             self._refresh_dag_bundles(known_files=known_files)
 
+            self._process_bundle_file_changes(known_files=known_files)
+
             if not self._file_queue:
                 # Generate more file paths to process if we processed all the files already. Note for this to
                 # clear down, we must have cleared all files found from scanning the dags dir _and_ have
@@ -633,6 +777,10 @@ class DagFileProcessorManager(LoggingMixin):
     def _queue_requested_files_for_parsing(self) -> None:
         """Queue any files requested for parsing as requested by users via UI/API."""
         files = self.claim_priority_files()
+        if self._parse_cache is not None:
+            # A requested parse always runs, e.g. to pick up inputs the file does not declare.
+            for file in files:
+                self._parse_cache.discard(file.presence_key)
         self._add_files_to_queue(files, mode="frontprio")
         self.request_bundle_refresh(file.bundle_name for file in files)
         if self._force_refresh_bundles:
@@ -831,24 +979,29 @@ class DagFileProcessorManager(LoggingMixin):
     def _refresh_dag_bundles(self, known_files: dict[str, set[DagFileInfo]]):
         """Refresh DAG bundles, if required."""
         now = timezone.utcnow()
+        any_refreshed = self._collect_bundle_refreshes(known_files=known_files)
 
         # we don't need to check if it's time to refresh every loop - that is way too often
         next_check = self._bundles_last_refreshed + self.bundle_refresh_check_interval
         now_seconds = time.monotonic()
-        if now_seconds < next_check and not self._force_refresh_bundles:
+        if now_seconds < next_check and not self._force_refresh_bundles.difference(self._bundle_refreshes):
             self.log.debug(
                 "Not time to check if DAG Bundles need refreshed yet - skipping. Next check in %.2f seconds",
                 next_check - now_seconds,
             )
+            if any_refreshed:
+                self._handle_refreshed_bundles(known_files=known_files)
             return
 
         self._bundles_last_refreshed = now_seconds
 
-        any_refreshed = False
         for bundle in self._dag_bundles:
+            if bundle.name in self._bundle_refreshes:
+                # Still being refreshed by a worker thread
+                continue
             # TODO: AIP-66 handle errors in the case of incomplete cloning? And test this.
             #  What if the cloning/refreshing took too long(longer than the dag processor timeout)
-            if not bundle.is_initialized:
+            if not bundle.is_initialized and self.bundle_refresh_workers <= 1:
                 try:
                     bundle.initialize()
                     any_refreshed = True
@@ -864,16 +1017,17 @@ class DagFileProcessorManager(LoggingMixin):
                 self.log.warning("Bundle model not found for %s", bundle.name)
                 continue
             elapsed_time_since_refresh = (now - (bundle_state.last_refreshed or utc_epoch())).total_seconds()
-            if bundle.supports_versioning:
+            pre_refresh_version = self._bundle_versions.get(bundle.name)
+            if bundle.supports_versioning and bundle.is_initialized:
                 # we will also check the version of the bundle to see if another DAG processor has seen
                 # a new version
-                pre_refresh_version = self._bundle_versions.get(bundle.name)
                 # Use `is None` (not falsy) so an empty-string version is treated as a valid cached value.
                 if pre_refresh_version is None:
                     pre_refresh_version, _ = unpack_bundle_version(bundle.get_current_version(), bundle)
                 current_version_matches_db = pre_refresh_version == bundle_state.version
             else:
-                # With no versioning, it always "matches"
+                # With no versioning, it always "matches". Bundles not initialized yet are refreshed anyway,
+                # as they cannot have been seen before.
                 current_version_matches_db = True
 
             previously_seen = bundle.name in self._bundle_versions
@@ -888,69 +1042,235 @@ class DagFileProcessorManager(LoggingMixin):
 
             self.log.info("Refreshing bundle %s", bundle.name)
 
+            if self.bundle_refresh_workers > 1:
+                if self._bundle_refresh_pool is None:
+                    self._bundle_refresh_pool = ThreadPoolExecutor(
+                        max_workers=self.bundle_refresh_workers, thread_name_prefix="bundle-refresh"
+                    )
+                self._bundle_refreshes[bundle.name] = _BundleRefresh(
+                    bundle=bundle,
+                    future=self._bundle_refresh_pool.submit(
+                        self._refresh_bundle,
+                        bundle,
+                        previously_seen=previously_seen,
+                        pre_refresh_version=pre_refresh_version,
+                    ),
+                    refresh_time=now,
+                    start_time=now_seconds,
+                )
+                continue
+
             try:
-                bundle.refresh()
-                any_refreshed = True
+                result = self._refresh_bundle(
+                    bundle, previously_seen=previously_seen, pre_refresh_version=pre_refresh_version
+                )
             except Exception:
                 self.log.exception("Error refreshing bundle %s", bundle.name)
                 continue
+            self._apply_bundle_refresh(bundle, result, refresh_time=now, known_files=known_files)
+            any_refreshed = True
 
-            self._force_refresh_bundles.discard(bundle.name)
+        if any_refreshed:
+            self._handle_refreshed_bundles(known_files=known_files)
+
+    def _handle_refreshed_bundles(self, known_files: dict[str, set[DagFileInfo]]) -> None:
+        # Bundle-to-team assignments can only change on bundle refresh, so clear the cache.
+        self._bundle_name_to_team_name = {}
+        self.handle_removed_files(known_files=known_files)
+        self._resort_file_queue()
+        self._add_new_files_to_queue(known_files=known_files)
+
+    def _refresh_bundle(
+        self, bundle: BaseDagBundle, *, previously_seen: bool, pre_refresh_version: str | None
+    ) -> _BundleRefreshResult:
+        """
+        Refresh a bundle, and list its files if its version changed.
 
-            if bundle.supports_versioning:
-                # We can short-circuit the rest of this if (1) bundle was seen before by
-                # this dag processor and (2) the version of the bundle did not change
-                # after refreshing it
-                version_after_refresh, version_data_after_refresh = unpack_bundle_version(
-                    bundle.get_current_version(), bundle
-                )
-                if previously_seen and pre_refresh_version == version_after_refresh:
-                    self.log.debug(
-                        "Bundle %s version not changed after refresh: %s",
-                        bundle.name,
-                        version_after_refresh,
-                    )
-                    try:
-                        self.update_bundle_state(bundle.name, last_refreshed=now, version=None)
-                    except Exception:
-                        self.log.exception("Error persisting state for bundle %s", bundle.name)
-                    continue
+        This does not access the metadata database, so it can run in a worker thread.
+        """
+        with stats.timer(
+            "dag_processing.bundle_refresh_duration",
+            tags={"bundle_name": normalize_name_for_stats(bundle.name)},
+        ):
+            if not bundle.is_initialized:
+                bundle.initialize()
+            bundle.refresh()
 
-                self.log.info("Version changed for %s, new version: %s", bundle.name, version_after_refresh)
-            else:
-                version_after_refresh = None
-                version_data_after_refresh = None
+            if not bundle.supports_versioning:
+                return _BundleRefreshResult(None, None, self._find_files_in_bundle(bundle))
+
+            # We can short-circuit the rest of this if (1) bundle was seen before by
+            # this dag processor and (2) the version of the bundle did not change
+            # after refreshing it
+            version, version_data = unpack_bundle_version(bundle.get_current_version(), bundle)
+            if previously_seen and pre_refresh_version == version:
+                return _BundleRefreshResult(version, version_data, None)
+            return _BundleRefreshResult(version, version_data, self._find_files_in_bundle(bundle))
+
+    def _apply_bundle_refresh(
+        self,
+        bundle: BaseDagBundle,
+        result: _BundleRefreshResult,
+        *,
+        refresh_time: datetime,
+        known_files: dict[str, set[DagFileInfo]],
+    ) -> None:
+        """Record the refresh of a bundle in the metadata database, and update the list of its files."""
+        self._force_refresh_bundles.discard(bundle.name)
 
-            # Persistence failure must not skip file scanning (bundle is already refreshed locally).
-            # _bundle_versions is only advanced on success to stay consistent with the DB.
+        if result.rel_paths is None:
+            self.log.debug("Bundle %s version not changed after refresh: %s", bundle.name, result.version)
             try:
-                self.update_bundle_state(bundle.name, last_refreshed=now, version=version_after_refresh)
+                self.update_bundle_state(bundle.name, last_refreshed=refresh_time, version=None)
             except Exception:
                 self.log.exception("Error persisting state for bundle %s", bundle.name)
-            else:
-                self._bundle_versions[bundle.name] = version_after_refresh
-                self._bundle_version_data[bundle.name] = version_data_after_refresh
+            return
 
-            found_files = {
-                DagFileInfo(rel_path=p, bundle_name=bundle.name, bundle_path=bundle.path)
-                for p in self._find_files_in_bundle(bundle)
-            }
+        if bundle.supports_versioning:
+            self.log.info("Version changed for %s, new version: %s", bundle.name, result.version)
+
+        # Persistence failure must not skip file scanning (bundle is already refreshed locally).
+        # _bundle_versions is only advanced on success to stay consistent with the DB.
+        try:
+            self.update_bundle_state(bundle.name, last_refreshed=refresh_time, version=result.version)
+        except Exception:
+            self.log.exception("Error persisting state for bundle %s", bundle.name)
+        else:
+            self._bundle_versions[bundle.name] = result.version
+            self._bundle_version_data[bundle.name] = result.version_data
+
+        self._start_bundle_watcher(bundle)
+        self._scan_bundle(bundle, known_files=known_files, rel_paths=result.rel_paths)
+
+    def _collect_bundle_refreshes(self, known_files: dict[str, set[DagFileInfo]]) -> bool:
+        """
+        Apply the bundle refreshes completed by the worker threads, and report the ones taking too long.
+
+        :return: Whether any bundle was refreshed
+        """
+        any_refreshed = False
+        for name, refresh in list(self._bundle_refreshes.items()):
+            if not refresh.future.done():
+                elapsed = time.monotonic() - refresh.start_time
+                if not refresh.timed_out and 0 < self.bundle_refresh_timeout < elapsed:
+                    refresh.timed_out = True
+                    self.log.error(
+                        "Refreshing bundle %s has been running for %.1f seconds. It is not refreshed again "
+                        "until this refresh completes.",
+                        name,
+                        elapsed,
+                    )
+                    stats.incr(
+                        "dag_processing.bundle_refresh_timeouts",
+                        tags={"bundle_name": normalize_name_for_stats(name)},
+                    )
+                continue
+
+            del self._bundle_refreshes[name]
+            try:
+                result = refresh.future.result()
+            except Exception:
+                self.log.exception("Error refreshing bundle %s", name)
+                continue
+            self._apply_bundle_refresh(
+                refresh.bundle, result, refresh_time=refresh.refresh_time, known_files=known_files
+            )
+            any_refreshed = True
+        return any_refreshed
+
+    def _stop_bundle_refreshes(self) -> None:
+        if self._bundle_refresh_pool is not None:
+            # Threads cannot be interrupted, do not wait for the refreshes still running.
+            self._bundle_refresh_pool.shutdown(wait=False, cancel_futures=True)
+            self._bundle_refresh_pool = None
+        self._bundle_refreshes.clear()
+
+    def _scan_bundle(
+        self,
+        bundle: BaseDagBundle,
+        known_files: dict[str, set[DagFileInfo]],
+        rel_paths: list[Path] | None = None,
+    ) -> None:
+        """Rebuild the list of files of a bundle, and deactivate the DAGs of the files removed from it."""
+        if rel_paths is None:
+            rel_paths = self._find_files_in_bundle(bundle)
+        found_files = {
+            DagFileInfo(rel_path=p, bundle_name=bundle.name, bundle_path=bundle.path) for p in rel_paths
+        }
 
-            known_files[bundle.name] = found_files
+        known_files[bundle.name] = found_files
+
+        self.deactivate_deleted_dags(bundle_name=bundle.name, present=found_files)
+        self.clear_orphaned_import_errors(
+            bundle_name=bundle.name,
+            observed_filelocs=self._get_observed_filelocs(found_files),
+        )
 
-            self.deactivate_deleted_dags(bundle_name=bundle.name, present=found_files)
-            self.clear_orphaned_import_errors(
-                bundle_name=bundle.name,
-                observed_filelocs=self._get_observed_filelocs(found_files),
+    def _start_bundle_watcher(self, bundle: BaseDagBundle) -> None:
+        """Watch the files of a bundle with inotify, if enabled and supported by the bundle."""
+        if (
+            self._file_change_detection != "inotify"
+            or not bundle.supports_file_watching
+            or bundle.name in self._bundle_watchers
+        ):
+            return
+        try:
+            self._bundle_watchers[bundle.name] = DagFileWatcher(bundle.path)
+        except OSError as e:
+            self.log.warning(
+                "Cannot watch the files of bundle %s, falling back to polling: %s", bundle.name, e
             )
+            self._bundle_watchers[bundle.name] = None
+        else:
+            self.log.info("Watching the files of bundle %s at %s", bundle.name, bundle.path)
 
-        if any_refreshed:
-            # Bundle-to-team assignments can only change on bundle refresh, so clear the cache.
-            self._bundle_name_to_team_name = {}
+    def _process_bundle_file_changes(self, known_files: dict[str, set[DagFileInfo]]) -> None:
+        """
+        Apply the changes reported by the bundle watchers since the previous loop.
+
+        Added, removed or renamed files trigger a rescan of their bundle, and modified DAG files are queued
+        for parsing right away, without waiting for the bundle's next refresh.
+        """
+        if not self._bundle_watchers:
+            return
+        any_rescanned = False
+        for bundle in self._dag_bundles:
+            watcher = self._bundle_watchers.get(bundle.name)
+            if watcher is None or bundle.name not in known_files:
+                continue
+            try:
+                changes = watcher.poll()
+            except OSError as e:
+                self.log.warning(
+                    "Cannot watch the files of bundle %s anymore, falling back to polling: %s",
+                    bundle.name,
+                    e,
+                )
+                watcher.close()
+                self._bundle_watchers[bundle.name] = None
+                # Some of the changes may have been read already, so make sure none of them is missed.
+                changes = DagFileChanges(modified=set(), rescan=True)
+            bundle_files = {file.rel_path: file for file in known_files[bundle.name]}
+            if changes.rescan or not changes.modified.issubset(bundle_files):
+                # A modified file that is not known yet may now contain a DAG.
+                self.log.info("Files changed in bundle %s, rescanning it", bundle.name)
+                self._scan_bundle(bundle, known_files=known_files)
+                any_rescanned = True
+            modified_files = [bundle_files[path] for path in changes.modified if path in bundle_files]
+            if modified_files:
+                self.log.info("Queueing %d modified files of bundle %s", len(modified_files), bundle.name)
+                self._add_files_to_queue(modified_files, mode="front")
+
+        if any_rescanned:
             self.handle_removed_files(known_files=known_files)
-            self._resort_file_queue()
             self._add_new_files_to_queue(known_files=known_files)
 
+    def _close_bundle_watchers(self) -> None:
+        for watcher in self._bundle_watchers.values():
+            if watcher is not None:
+                watcher.close()
+        self._bundle_watchers.clear()
+
     def _find_files_in_bundle(self, bundle: BaseDagBundle) -> list[Path]:
         """Get relative paths for dag files from bundle dir."""
         # Build up a list of Python files that could contain DAGs
@@ -1196,9 +1516,10 @@ class DagFileProcessorManager(LoggingMixin):
     def remove_orphaned_file_stats(self, present: set[DagFileInfo]):
         """Remove the stats for any dag files that don't exist anymore."""
         present_keys = {file.presence_key for file in present}
-        stats_to_remove = {file for file in self._file_stats if file.presence_key not in present_keys}
-        for file in stats_to_remove:
-            del self._file_stats[file]
+        for presence_key in self._file_stats.presence_keys() - present_keys:
+            self._file_stats.pop_presence_key(presence_key)
+            if self._parse_cache is not None:
+                self._parse_cache.discard(presence_key)
 
     def terminate_orphan_processes(self, present: set[DagFileInfo]):
         """Stop processors that are working on deleted files."""
@@ -1253,23 +1574,8 @@ class DagFileProcessorManager(LoggingMixin):
         throttles immediate retries, so other files in the same
         ``_collect_results`` cycle still run.
         """
-        is_callback_only = proc.had_callbacks and proc.parsing_result is None
-        if is_callback_only:
-            self.log.debug("Detected callback-only processing for %s", file)
-
         run_duration = time.monotonic() - proc.start_time
-        finish_time = timezone.utcnow()
-        team_name = self._get_team_name(file.bundle_name)
-        next_stat = process_parse_results(
-            run_duration=run_duration,
-            finish_time=finish_time,
-            run_count=self._file_stats[file].run_count,
-            bundle_name=file.bundle_name,
-            parsing_result=proc.parsing_result,
-            is_callback_only=is_callback_only,
-            relative_fileloc=str(file.rel_path),
-            team_name=team_name,
-        )
+        next_stat = self._process_parsing_result(file, proc, run_duration=run_duration)
 
         if proc.parsing_result is not None:
             try:
@@ -1290,17 +1596,93 @@ class DagFileProcessorManager(LoggingMixin):
                     str(file.rel_path),
                     file.bundle_name,
                 )
-                current_stat = self._file_stats[file]
-                self._file_stats[file] = DagFileStat(
-                    num_dags=current_stat.num_dags,
-                    import_errors=current_stat.import_errors,
-                    last_finish_time=finish_time,
-                    last_duration=run_duration,
-                    run_count=current_stat.run_count + 1,
-                    last_num_of_db_queries=current_stat.last_num_of_db_queries,
-                )
+                self._update_file_stat(file, proc, next_stat, persisted=False)
                 return
 
+        self._update_file_stat(file, proc, next_stat, persisted=True)
+
+    @provide_session
+    def handle_parsing_results(
+        self,
+        results: Mapping[DagFileInfo, DagFileProcessorProcess],
+        *,
+        session: Session = NEW_SESSION,
+    ) -> None:
+        """
+        Post-process several finished parse results, persisting them in a single transaction.
+
+        The results are persisted with :meth:`persist_parsing_results`. If this fails, the transaction is
+        rolled back and every result is handled on its own with :meth:`handle_parsing_result`, so a result
+        that cannot be persisted does not prevent the others from being persisted.
+        """
+        run_durations = {file: time.monotonic() - proc.start_time for file, proc in results.items()}
+        try:
+            self.persist_parsing_results(
+                [
+                    (file, proc.parsing_result, run_durations[file])
+                    for file, proc in results.items()
+                    if proc.parsing_result is not None
+                ],
+                session=session,
+            )
+            session.flush()
+        except Exception:
+            self.log.exception(
+                "Failed to persist the parsing results of %d files together, persisting them one by one",
+                len(results),
+            )
+            session.rollback()
+            for file, proc in results.items():
+                self.handle_parsing_result(file, proc)
+            return
+
+        for file, proc in results.items():
+            next_stat = self._process_parsing_result(file, proc, run_duration=run_durations[file])
+            self._update_file_stat(file, proc, next_stat, persisted=True)
+
+    def _process_parsing_result(
+        self, file: DagFileInfo, proc: DagFileProcessorProcess, *, run_duration: float
+    ) -> DagFileStat:
+        """Emit the metrics of a finished parse, and return the stat of the file if it is persisted."""
+        is_callback_only = proc.had_callbacks and proc.parsing_result is None
+        if is_callback_only:
+            self.log.debug("Detected callback-only processing for %s", file)
+
+        return process_parse_results(
+            run_duration=run_duration,
+            finish_time=timezone.utcnow(),
+            run_count=self._file_stats[file].run_count,
+            bundle_name=file.bundle_name,
+            parsing_result=proc.parsing_result,
+            is_callback_only=is_callback_only,
+            relative_fileloc=str(file.rel_path),
+            team_name=self._get_team_name(file.bundle_name),
+        )
+
+    def _update_file_stat(
+        self, file: DagFileInfo, proc: DagFileProcessorProcess, next_stat: DagFileStat, *, persisted: bool
+    ) -> None:
+        fingerprint = self._parse_fingerprints.pop(file, None)
+        if proc.parsing_result is not None and self._parse_cache is not None:
+            if persisted and fingerprint is not None and not proc.parsing_result.import_errors:
+                self._parse_cache.store(
+                    file, fingerprint, [dag.dag_id for dag in proc.parsing_result.serialized_dags]
+                )
+            else:
+                self._parse_cache.discard(file.presence_key)
+
+        if not persisted:
+            current_stat = self._file_stats[file]
+            self._file_stats[file] = DagFileStat(
+                num_dags=current_stat.num_dags,
+                import_errors=current_stat.import_errors,
+                last_finish_time=next_stat.last_finish_time,
+                last_duration=next_stat.last_duration,
+                run_count=current_stat.run_count + 1,
+                last_num_of_db_queries=current_stat.last_num_of_db_queries,
+            )
+            return
+
         self._file_stats[file] = next_stat
 
     def persist_parsing_result(
@@ -1344,14 +1726,53 @@ class DagFileProcessorManager(LoggingMixin):
             files_parsed=files_parsed,
         )
 
+    def persist_parsing_results(
+        self,
+        results: list[tuple[DagFileInfo, DagFileParsingResult, float]],
+        *,
+        session: Session,
+    ) -> None:
+        """
+        Persist the parsed DAG data of several files to the metadata database.
+
+        :param results: The file, parsing result and parsing duration of each file
+        """
+        files_by_bundle: dict[str, list[ParsedDagFile]] = defaultdict(list)
+        for file, parsing_result, run_duration in results:
+            warnings = parsing_result.warnings or []
+            if warnings and isinstance(warnings[0], dict):
+                warnings = [DagWarning(**warn) for warn in warnings]
+            files_by_bundle[file.bundle_name].append(
+                ParsedDagFile(
+                    relative_fileloc=str(file.rel_path),
+                    dags=parsing_result.serialized_dags,
+                    import_errors={
+                        (file.bundle_name, rel_path): error
+                        for rel_path, error in (parsing_result.import_errors or {}).items()
+                    },
+                    parse_duration=run_duration,
+                    warnings=set(warnings),
+                )
+            )
+
+        for bundle_name, files in files_by_bundle.items():
+            update_dag_parsing_results_in_db_batch(
+                bundle_name=bundle_name,
+                bundle_version=self._bundle_versions[bundle_name],
+                version_data=self._bundle_version_data.get(bundle_name),
+                files=files,
+                session=session,
+            )
+
     def _collect_results(self):
-        finished = []
-        for file, proc in self._processors.items():
-            if not proc.is_ready:
-                # This processor hasn't finished yet, or we haven't read all the output from it yet
-                continue
-            finished.append(file)
-            self.handle_parsing_result(file, proc)
+        finished = {file: proc for file, proc in self._processors.items() if proc.is_ready}
+
+        if self._parsing_result_batch_size > 1 and len(finished) > 1:
+            for batch in chunks(list(finished), self._parsing_result_batch_size):
+                self.handle_parsing_results({file: finished[file] for file in batch})
+        else:
+            for file, proc in finished.items():
+                self.handle_parsing_result(file, proc)
 
         for file in finished:
             processor = self._processors.pop(file)
@@ -1438,12 +1859,19 @@ class DagFileProcessorManager(LoggingMixin):
         """Start more processors if we have enough slots and files to process."""
         bundle_to_team = self._get_team_names({file.bundle_name for file in self._file_queue})
 
+        cache_hits: dict[DagFileInfo, list[str]] = {}
         while self._parallelism > len(self._processors) and self._file_queue:
             file, _ = self._file_queue.popitem(last=False)
             # Stop creating duplicate processor i.e. processor with the same filepath
             if file in self._processors:
                 continue
 
+            if self._parse_cache is not None and file not in self._callback_to_execute:
+                dag_ids = self._check_parse_cache(file, team_name=bundle_to_team.get(file.bundle_name))
+                if dag_ids is not None:
+                    cache_hits[file] = dag_ids
+                    continue
+
             processor = self._create_process(file)
             stats.incr(
                 "dag_processing.processes",
@@ -1459,6 +1887,107 @@ class DagFileProcessorManager(LoggingMixin):
             self._processors[file] = processor
             stats.gauge("dag_processing.file_path_queue_size", len(self._file_queue))
 
+        if cache_hits:
+            self._handle_parse_cache_hits(cache_hits, bundle_to_team=bundle_to_team)
+
+    def _check_parse_cache(self, file: DagFileInfo, *, team_name: str | None) -> list[str] | None:
+        """
+        Return the Dags of a file if its last parsing result can be reused, else None.
+
+        The fingerprint of a file that has to be parsed is kept until its parsing result is handled.
+        """
+        if TYPE_CHECKING:
+            assert self._parse_cache is not None
+        from airflow.models.variable import Variable
+
+        try:
+            fingerprint = self._parse_cache.fingerprint(
+                file,
+                bundle_version=self._bundle_versions.get(file.bundle_name),
+                get_variable=lambda key: Variable.get_variable_from_secrets(key=key, team_name=team_name),
+            )
+        except Exception:
+            self.log.exception("Failed to compute the fingerprint of %s, parsing it", file.rel_path)
+            return None
+        if fingerprint is None:
+            return None
+
+        entry = self._parse_cache.get(file)
+        if entry is None or entry.fingerprint != fingerprint:
+            self._parse_fingerprints[file] = fingerprint
+            return None
+        return entry.dag_ids
+
+    def _handle_parse_cache_hits(
+        self, cache_hits: dict[DagFileInfo, list[str]], *, bundle_to_team: dict[str, str | None]
+    ) -> None:
+        """
+        Record the files whose last parsing result is reused as parsed.
+
+        A file whose Dags no longer have an active row, e.g. they were deleted through the API, is parsed
+        again instead, to recreate them.
+        """
+        if TYPE_CHECKING:
+            assert self._parse_cache is not None
+        inactive_dag_ids = self.record_cached_parsing_results(
+            dag_ids=[dag_id for dag_ids in cache_hits.values() for dag_id in dag_ids]
+        )
+        invalidated = []
+        for file, dag_ids in cache_hits.items():
+            if not inactive_dag_ids.isdisjoint(dag_ids):
+                self._parse_cache.discard(file.presence_key)
+                invalidated.append(file)
+                continue
+            stat = self._file_stats[file]
+            self._file_stats[file] = DagFileStat(
+                num_dags=len(dag_ids),
+                import_errors=0,
+                last_finish_time=timezone.utcnow(),
+                last_duration=stat.last_duration,
+                run_count=stat.run_count + 1,
+                last_num_of_db_queries=stat.last_num_of_db_queries,
+            )
+            stats.incr(
+                "dag_processing.parse_cache_hits",
+                tags=prune_dict(
+                    {
+                        "file_path": file.normalized_file_path_for_stats,
+                        "bundle_name": normalize_name_for_stats(file.bundle_name),
+                        "team_name": bundle_to_team.get(file.bundle_name),
+                    }
+                ),
+            )
+        if invalidated:
+            self.log.info(
+                "Parsing %d unchanged files again, their Dags were deleted or deactivated", len(invalidated)
+            )
+            self._add_files_to_queue(invalidated, mode="front")
+
+    @provide_session
+    def record_cached_parsing_results(
+        self, *, dag_ids: list[str], session: Session = NEW_SESSION
+    ) -> set[str]:
+        """
+        Record that the Dags of the files skipped thanks to the parse cache were parsed.
+
+        Their last parsed time is updated, so they are not deactivated as stale.
+
+        :return: The Dags without an active row, which are not updated
+        """
+        active_dag_ids = set(
+            session.scalars(
+                select(DagModel.dag_id).where(DagModel.dag_id.in_(dag_ids), ~DagModel.is_stale)
+            )
+        )
+        if active_dag_ids:
+            session.execute(
+                update(DagModel)
+                .where(DagModel.dag_id.in_(active_dag_ids))
+                .values(last_parsed_time=timezone.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+        return set(dag_ids) - active_dag_ids
+
     def _add_new_files_to_queue(self, known_files: dict[str, set[DagFileInfo]]):
         """
         Add new files to the front of the queue.
@@ -1467,7 +1996,7 @@ class DagFileProcessorManager(LoggingMixin):
         """
         new_files = []
         tracked_presence_keys = {file.presence_key for file in self._file_queue}
-        tracked_presence_keys.update(file.presence_key for file in self._file_stats)
+        tracked_presence_keys.update(self._file_stats.presence_keys())
         tracked_presence_keys.update(file.presence_key for file in self._processors)
         for files in known_files.values():
             for file in files:
@@ -1498,7 +2027,6 @@ class DagFileProcessorManager(LoggingMixin):
             self._file_queue = OrderedDict.fromkeys(callback_files + sorted_regular_files)
 
     def _sort_by_mtime(self, files: Iterable[DagFileInfo]):
-        file_stats_by_presence_key = {file.presence_key: stat for file, stat in self._file_stats.items()}
         files_with_mtime: dict[DagFileInfo, float] = {}
         changed_recently = set()
         for file in files:
@@ -1506,7 +2034,7 @@ class DagFileProcessorManager(LoggingMixin):
                 modified_timestamp = os.path.getmtime(file.absolute_path)
                 modified_datetime = datetime.fromtimestamp(modified_timestamp, tz=timezone.utc)
                 files_with_mtime[file] = modified_timestamp
-                stat = file_stats_by_presence_key.get(file.presence_key)
+                stat = self._file_stats.get_by_presence_key(file.presence_key)
                 last_time = stat.last_finish_time if stat else None
                 if not last_time:
                     continue
@@ -1514,26 +2042,44 @@ class DagFileProcessorManager(LoggingMixin):
                     changed_recently.add(file)
             except FileNotFoundError:
                 self.log.warning("Skipping processing of missing file: %s", file)
-                stats_to_remove = [
-                    tracked_file
-                    for tracked_file in self._file_stats
-                    if tracked_file.presence_key == file.presence_key
-                ]
-                for tracked_file in stats_to_remove:
-                    self._file_stats.pop(tracked_file, None)
+                self._file_stats.pop_presence_key(file.presence_key)
+                if self._parse_cache is not None:
+                    self._parse_cache.discard(file.presence_key)
                 continue
         file_infos = [info for info, ts in sorted(files_with_mtime.items(), key=itemgetter(1), reverse=True)]
         return file_infos, changed_recently
 
+    def _sort_by_last_duration(self, files: Iterable[DagFileInfo]) -> list[DagFileInfo]:
+        """
+        Sort files by decreasing duration of their last parse, files never parsed first.
+
+        Processors pick the files in the order of the queue, so starting the longest parses first balances
+        the load across the processors, and shortens the time needed to parse all the files.
+        """
+
+        def sort_key(file: DagFileInfo) -> tuple[bool, float, Path]:
+            stat = self._file_stats.get_by_presence_key(file.presence_key)
+            last_duration = stat.last_duration if stat else None
+            if last_duration is None:
+                return False, 0.0, file.rel_path
+            return True, -last_duration, file.rel_path
+
+        return sorted(files, key=sort_key)
+
+    def _sort_by_last_finish_time(self, files: Iterable[DagFileInfo]) -> list[DagFileInfo]:
+        """Sort files by the time they were last parsed, files never parsed first."""
+
+        def sort_key(file: DagFileInfo) -> tuple[bool, datetime, Path]:
+            stat = self._file_stats.get_by_presence_key(file.presence_key)
+            last_finish_time = stat.last_finish_time if stat else None
+            if last_finish_time is None:
+                return False, utc_epoch(), file.rel_path
+            return True, last_finish_time, file.rel_path
+
+        return sorted(files, key=sort_key)
+
     def processed_recently(self, now, file):
-        stat = next(
-            (
-                stat
-                for tracked_file, stat in self._file_stats.items()
-                if tracked_file.presence_key == file.presence_key
-            ),
-            None,
-        )
+        stat = self._file_stats.get_by_presence_key(file.presence_key)
         last_time = stat.last_finish_time if stat else None
         if not last_time:
             return False
@@ -1560,7 +2106,6 @@ class DagFileProcessorManager(LoggingMixin):
         # If the file path is already being processed, or if a file was
         # processed recently, wait until the next batch
         in_progress_keys = {file.presence_key for file in self._processors}
-        file_stats_by_presence_key = {file.presence_key: stat for file, stat in self._file_stats.items()}
         now = timezone.utcnow()
 
         # Sort the file paths by the parsing order mode
@@ -1570,7 +2115,7 @@ class DagFileProcessorManager(LoggingMixin):
         for bundle_files in known_files.values():
             for file in bundle_files:
                 files.append(file)
-                stat = file_stats_by_presence_key.get(file.presence_key)
+                stat = self._file_stats.get_by_presence_key(file.presence_key)
                 last_time = stat.last_finish_time if stat else None
                 if last_time and (now - last_time).total_seconds() < self._file_process_interval:
                     recently_processed.add(file)
@@ -1584,10 +2129,14 @@ class DagFileProcessorManager(LoggingMixin):
             # Shuffle the list seeded by hostname so multiple DAG processors can work on different
             # set of files. Since we set the seed, the sort order will remain same per host
             random.Random(get_hostname()).shuffle(files)
+        elif self._file_parsing_sort_mode == "duration":
+            files = self._sort_by_last_duration(files)
+        elif self._file_parsing_sort_mode == "parse_sla":
+            files = self._sort_by_last_finish_time(files)
 
         at_run_limit_keys = {
             presence_key
-            for presence_key, stat in file_stats_by_presence_key.items()
+            for presence_key, stat in self._file_stats.items_by_presence_key()
             if stat.run_count == self.max_runs
         }
         to_exclude = in_progress_keys.union(at_run_limit_keys)
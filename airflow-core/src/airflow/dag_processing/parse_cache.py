@@ -0,0 +1,210 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of DAG file parsing results, to skip parsing the files that did not change.
+
+A file is only parsed again when its fingerprint changes. The fingerprint covers the content of the file,
+the content of the bundle-local modules it imports (transitively), the bundle version, and the inputs the
+file declares with a directive comment::
+
+    # airflow-parse-cache: env=DEPLOYMENT,REGION variables=tables_to_sync
+
+Files generating DAGs from other external state opt out of the cache with::
+
+    # airflow-parse-cache: disable
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import attrs
+
+if TYPE_CHECKING:
+    from airflow.dag_processing.manager import DagFileInfo
+
+_DIRECTIVE = re.compile(rb"^\s*#\s*airflow-parse-cache:(.*)$", re.MULTILINE)
+
+
+class _SourceInfo(NamedTuple):
+    stat_key: tuple[int, int, int]
+    digest: bytes
+    imports: list[tuple[str, int]]
+    """Imported module names, with the level of relative imports."""
+    directives: dict[str, tuple[str, ...]]
+
+
+@attrs.define
+class ParseCacheEntry:
+    """Result of the last successful parse of a file, reused while its fingerprint does not change."""
+
+    fingerprint: str
+    dag_ids: list[str]
+
+
+def _parse_directives(source: bytes) -> dict[str, tuple[str, ...]]:
+    directives: dict[str, tuple[str, ...]] = {}
+    for match in _DIRECTIVE.finditer(source):
+        for item in match.group(1).decode(errors="replace").split():
+            name, _, values = item.partition("=")
+            directives[name] = directives.get(name, ()) + tuple(v for v in values.split(",") if v)
+    return directives
+
+
+def _find_imports(source: bytes, path: Path) -> list[tuple[str, int]]:
+    try:
+        tree = ast.parse(source, filename=os.fspath(path))
+    except (SyntaxError, ValueError):
+        # Parsing the file reports the error, there are no dependencies to track.
+        return []
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, 0) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            imports.append((module, node.level))
+            # The imported names can be submodules
+            imports.extend((f"{module}.{alias.name}".lstrip("."), node.level) for alias in node.names)
+    return list(dict.fromkeys(imports))
+
+
+class DagFileParseCache:
+    """
+    Fingerprints of the DAG files, and the results of their last successful parse.
+
+    The content of the files is only read again when their size, modification time or inode changes, so
+    checking the fingerprint of an unchanged file only costs a ``stat`` per file and local dependency.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, Path], ParseCacheEntry] = {}
+        self._sources: dict[Path, _SourceInfo] = {}
+
+    def get(self, file: DagFileInfo) -> ParseCacheEntry | None:
+        return self._entries.get(file.presence_key)
+
+    def store(self, file: DagFileInfo, fingerprint: str, dag_ids: list[str]) -> None:
+        self._entries[file.presence_key] = ParseCacheEntry(fingerprint=fingerprint, dag_ids=dag_ids)
+
+    def discard(self, presence_key: tuple[str, Path]) -> None:
+        self._entries.pop(presence_key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fingerprint(
+        self,
+        file: DagFileInfo,
+        *,
+        bundle_version: str | None,
+        get_variable: Callable[[str], str | None],
+    ) -> str | None:
+        """
+        Return the fingerprint of a DAG file, or None if the file must always be parsed.
+
+        :param file: The DAG file
+        :param bundle_version: The version of the bundle of the file
+        :param get_variable: Return the value of a Variable declared as input of the file
+        """
+        if file.bundle_path is None:
+            return None
+        path = file.absolute_path
+        try:
+            source = self._read(path)
+        except OSError:
+            return None
+        if "disable" in source.directives:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(f"{bundle_version}\0".encode())
+        digest.update(source.digest)
+        for dependency in sorted(self._local_dependencies(path, source, file.bundle_path)):
+            try:
+                dependency_source = self._read(dependency)
+            except OSError:
+                continue
+            digest.update(os.fsencode(dependency))
+            digest.update(dependency_source.digest)
+        for name in source.directives.get("env", ()):
+            digest.update(f"env:{name}={os.environ.get(name)}\0".encode())
+        for key in source.directives.get("variables", ()):
+            digest.update(f"variable:{key}={get_variable(key)}\0".encode())
+        return digest.hexdigest()
+
+    def _read(self, path: Path) -> _SourceInfo:
+        st = os.stat(path)
+        stat_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._sources.get(path)
+        if cached is not None and cached.stat_key == stat_key:
+            return cached
+        content = path.read_bytes()
+        is_python = path.suffix == ".py"
+        info = _SourceInfo(
+            stat_key=stat_key,
+            digest=hashlib.sha256(content).digest(),
+            imports=_find_imports(content, path) if is_python else [],
+            directives=_parse_directives(content) if is_python else {},
+        )
+        self._sources[path] = info
+        return info
+
+    def _local_dependencies(self, path: Path, source: _SourceInfo, bundle_path: Path) -> set[Path]:
+        """Return the modules of the bundle imported by a file, directly or through other local modules."""
+        dependencies: set[Path] = set()
+        to_visit = [(path, source)]
+        while to_visit:
+            module_path, module_source = to_visit.pop()
+            for name, level in module_source.imports:
+                if level:
+                    base = module_path.parent
+                    for _ in range(level - 1):
+                        base = base.parent
+                else:
+                    base = bundle_path
+                for dependency in _resolve_module(base, name):
+                    if dependency in dependencies or dependency == path:
+                        continue
+                    dependencies.add(dependency)
+                    try:
+                        to_visit.append((dependency, self._read(dependency)))
+                    except OSError:
+                        continue
+        return dependencies
+
+
+def _resolve_module(base: Path, name: str) -> list[Path]:
+    """Return the files of ``base`` executed when importing module ``name`` relative to it."""
+    parts = [part for part in name.split(".") if part]
+    found = []
+    for index in range(1, len(parts) + 1):
+        package_init = base.joinpath(*parts[:index], "__init__.py")
+        if package_init.is_file():
+            found.append(package_init)
+    if parts:
+        module_file = base.joinpath(*parts).with_suffix(".py")
+        if module_file.is_file():
+            found.append(module_file)
+    return found
@@ -17,9 +17,11 @@
 from __future__ import annotations
 
 import contextlib
+import gc
 import importlib
 import logging
 import os
+import sys
 import traceback
 from collections.abc import Callable, Sequence
 from pathlib import Path
@@ -136,6 +138,9 @@ class DagFileParsingResult(BaseModel):
 
     This is the result of a successful DAG parse, in this class, we gather all serialized DAGs,
     import errors and warnings to send back to the scheduler to store in the DB.
+
+    Files defining many DAGs send most of their serialized DAGs ahead in ``DagFileParsingResultChunk``
+    messages, and this message only carries the remaining ones.
     """
 
     fileloc: str
@@ -145,8 +150,21 @@ class DagFileParsingResult(BaseModel):
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
+class DagFileParsingResultChunk(BaseModel):
+    """
+    Serialized DAGs of a DAG file, sent ahead of the ``DagFileParsingResult`` of the file.
+
+    Sending the DAGs in bounded chunks keeps the messages small, and lets the parsing process free the
+    serialized DAGs as it goes, for files defining many DAGs.
+    """
+
+    serialized_dags: list[LazyDeserializedDAG]
+    type: Literal["DagFileParsingResultChunk"] = "DagFileParsingResultChunk"
+
+
 ToManager = Annotated[
     DagFileParsingResult
+    | DagFileParsingResultChunk
     | GetConnection
     | GetVariable
     | GetVariableKeys
@@ -198,11 +216,33 @@ def _pre_import_airflow_modules(file_path: str, log: FilteringBoundLogger) -> No
     if not conf.getboolean("dag_processor", "parsing_pre_import_modules", fallback=True):
         return
 
+    num_modules = len(sys.modules)
     for module in iter_airflow_imports(file_path):
         try:
             importlib.import_module(module)
         except Exception as e:
             log.warning("Error when trying to pre-import module '%s' found in %s: %s", module, file_path, e)
+    if len(sys.modules) != num_modules:
+        # Move the new modules to the permanent generation too, so the garbage collector of the parsing
+        # processes does not write to the memory pages they share with this process.
+        gc.freeze()
+
+
+def preload_parsing_modules(log: FilteringBoundLogger | logging.Logger) -> None:
+    """
+    Import the ``[dag_processor] parsing_preload_modules`` in the DAG processor.
+
+    The parsing processes are forked from the DAG processor, so they start with these modules already
+    imported instead of importing them for every DAG file.
+    """
+    modules = conf.getlist("dag_processor", "parsing_preload_modules", fallback=[])
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.warning("Error when trying to preload module '%s': %s", module, e)
+    if modules:
+        log.info("Preloaded %d modules for DAG parsing", len(modules))
 
 
 def _parse_file_entrypoint():
@@ -226,13 +266,25 @@ def _parse_file_entrypoint():
     task_runner.SUPERVISOR_COMMS = comms_decoder
     log = structlog.get_logger(logger_name="task")
 
-    result = _parse_file(msg, log)
+    result = _parse_file(msg, log, send_chunk=comms_decoder.send)
 
     if result is not None:
         comms_decoder.send(result)
 
 
-def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileParsingResult | None:
+def _parse_file(
+    msg: DagFileParseRequest,
+    log: FilteringBoundLogger,
+    *,
+    send_chunk: Callable[[DagFileParsingResultChunk], object] | None = None,
+) -> DagFileParsingResult | None:
+    """
+    Parse a DAG file, and return the result to send to the DAG processor.
+
+    :param send_chunk: Send serialized DAGs ahead of the result, in chunks of at most
+        ``[dag_processor] parsing_result_chunk_size`` DAGs. When not set, all the DAGs are returned in the
+        result.
+    """
     # TODO: Set known_pool names on DagBag!
 
     stability_check_result = check_dag_file_stability(os.fspath(msg.file))
@@ -250,6 +302,8 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         bundle_path=msg.bundle_path,
         bundle_name=msg.bundle_name,
         load_op_links=False,
+        profile_imports=not msg.callback_requests
+        and conf.getboolean("dag_processor", "parsing_import_profiling", fallback=False),
     )
 
     if msg.callback_requests:
@@ -257,7 +311,22 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         _execute_callbacks(bag, msg.callback_requests, log)
         return None
 
-    serialized_dags, serialization_import_errors = _serialize_dags(bag, log)
+    # The bag only collects the parsed file
+    import_profile = next(iter(bag.import_profiles.values()), None)
+    if import_profile is not None:
+        log.info(
+            "DAG file import profile",
+            total_duration=round(import_profile.total_duration, 3),
+            top_level_code_duration=round(import_profile.top_level_code_duration, 3),
+            slowest_imports=import_profile.format_slowest(limit=10),
+        )
+
+    serialized_dags, serialization_import_errors = _serialize_dags(
+        bag,
+        log,
+        send_chunk=send_chunk,
+        chunk_size=conf.getint("dag_processor", "parsing_result_chunk_size", fallback=0),
+    )
     bag.import_errors.update(serialization_import_errors)
     result = DagFileParsingResult(
         fileloc=msg.file,
@@ -271,7 +340,16 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
 def _serialize_dags(
     bag: DagBag,
     log: FilteringBoundLogger,
+    *,
+    send_chunk: Callable[[DagFileParsingResultChunk], object] | None = None,
+    chunk_size: int = 0,
 ) -> tuple[list[LazyDeserializedDAG], dict[str, str]]:
+    """
+    Serialize the DAGs of the bag.
+
+    When ``send_chunk`` is set, every ``chunk_size`` serialized DAGs are sent as soon as they are ready,
+    and only the remaining DAGs are returned.
+    """
     serialization_import_errors = {}
     serialized_dags = []
     for dag in bag.dags.values():
@@ -288,6 +366,9 @@ def _serialize_dags(
             serialization_import_errors[error_path] = traceback.format_exc(
                 limit=-dagbag_import_error_traceback_depth
             )
+        if send_chunk is not None and chunk_size > 0 and len(serialized_dags) >= chunk_size:
+            send_chunk(DagFileParsingResultChunk(serialized_dags=serialized_dags))
+            serialized_dags = []
     return serialized_dags, serialization_import_errors
 
 
@@ -564,6 +645,8 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
 
     logger_filehandle: BinaryIO
     parsing_result: DagFileParsingResult | None = None
+    _streamed_dags: list[LazyDeserializedDAG] = attrs.field(factory=list, init=False)
+    """Serialized DAGs received in chunks, ahead of the parsing result."""
     decoder: ClassVar[TypeAdapter[ToManager]] = TypeAdapter[ToManager](ToManager)
     had_callbacks: bool = False  # Track if this process was started with callbacks to prevent stale DAG detection false positives
 
@@ -658,7 +741,12 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
 
         resp: BaseModel | None = None
         dump_opts: dict[str, bool] = {}
-        if isinstance(msg, DagFileParsingResult):
+        if isinstance(msg, DagFileParsingResultChunk):
+            self._streamed_dags.extend(msg.serialized_dags)
+        elif isinstance(msg, DagFileParsingResult):
+            if self._streamed_dags:
+                msg.serialized_dags[:0] = self._streamed_dags
+                self._streamed_dags = []
             self.parsing_result = msg
         elif isinstance(msg, GetConnection):
             conn = self.client.connections.get(msg.conn_id)
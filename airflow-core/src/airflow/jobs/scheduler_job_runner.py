@@ -27,7 +27,8 @@ import sys
 import time
 from collections import Counter, defaultdict, deque
 from collections.abc import Callable, Collection, Iterable, Iterator
-from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, nullcontext
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import groupby
@@ -52,6 +53,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.orm import joinedload, lazyload, load_only, make_transient, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy.sql import expression
 
 from airflow import settings
@@ -64,7 +66,7 @@ from airflow.callbacks.callback_requests import (
     EmailRequest,
     TaskCallbackRequest,
 )
-from airflow.configuration import conf
+from airflow.configuration import AIRFLOW_HOME, conf
 from airflow.dag_processing.bundles.base import BundleUsageTrackingManager
 from airflow.exceptions import DagNotFound
 from airflow.executors import workloads
@@ -101,9 +103,9 @@ from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion, _resolve_version_data
 from airflow.models.dagbag import DBDagBag
 from airflow.models.dagbundle import DagBundleModel
-from airflow.models.dagrun import DagRun
+from airflow.models.dagrun import DagRun, defer_dagrun_state_notifications
 from airflow.models.dagwarning import DagWarning, DagWarningType
-from airflow.models.pool import normalize_pool_name_for_stats
+from airflow.models.pool import PoolOccupancy, normalize_pool_name_for_stats
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskinstancekey import TaskInstanceKey
@@ -120,6 +122,7 @@ from airflow.triggers.base import TriggerEvent
 from airflow.utils.event_scheduler import EventScheduler
 from airflow.utils.helpers import prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.loop_profiler import LoopProfiler, StackSampler
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import (
@@ -250,17 +253,31 @@ class ConcurrencyMap:
     It contains a map from (dag_id, task_id) to # of task instances, a map from (dag_id, task_id)
     to # of task instances in the given state list and a map from (dag_id, run_id, task_id)
     to # of task instances in the given state list in each DAG run.
+
+    The maps can either be rebuilt from the database on every use with :meth:`load`, or kept in
+    memory and updated incrementally with :meth:`record_queued` and :meth:`record_finished`, in
+    which case :meth:`reconcile` periodically replaces them with the database view.
+
+    In incremental mode, the deferred task instances the map counts are tracked individually: they
+    keep counting towards task-level concurrency, so when they resume, :meth:`record_queued` only
+    counts them again towards their DAG run. Task instances queued since the last :meth:`commit`
+    are uncounted by :meth:`rollback`. Deferred task instances finished by the triggerer, without an
+    executor event, keep being counted until the next reconciliation.
     """
 
     def __init__(self):
         self.dag_run_active_tasks_map: Counter[tuple[str, str]] = Counter()
         self.task_concurrency_map: Counter[tuple[str, str]] = Counter()
         self.task_dagrun_concurrency_map: Counter[tuple[str, str, str]] = Counter()
+        self.deferred_tis: set[tuple[str, str, str, int]] = set()
+        self.loaded_at: float | None = None
+        self._uncommitted: list[tuple[tuple[str, str, str, int], bool]] = []
 
     def load(self, session: Session) -> None:
         self.dag_run_active_tasks_map.clear()
         self.task_concurrency_map.clear()
         self.task_dagrun_concurrency_map.clear()
+        self._uncommitted.clear()
         query = session.execute(
             select(TI.dag_id, TI.task_id, TI.run_id, TI.state, func.count("*"))
             .where(TI.state.in_(ACTIVE_STATES))
@@ -276,6 +293,117 @@ class ConcurrencyMap:
             # are in-flight but parked, holding no worker slot.
             if state not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
                 self.dag_run_active_tasks_map[dag_id, run_id] += count
+        self.loaded_at = time.monotonic()
+
+    def load_deferred(self, session: Session) -> None:
+        """Load the deferred task instances counted by the map, for :meth:`record_queued` to see them."""
+        self.deferred_tis = {
+            (dag_id, run_id, task_id, map_index)
+            for dag_id, run_id, task_id, map_index in session.execute(
+                select(TI.dag_id, TI.run_id, TI.task_id, TI.map_index).where(
+                    TI.state == TaskInstanceState.DEFERRED
+                )
+            )
+        }
+
+    def reconcile(self, session: Session) -> int:
+        """
+        Replace the in-memory counters with a fresh view from the database.
+
+        :return: The drift, i.e. the sum of absolute differences between the in-memory
+            counters and the database counters over all three maps.
+        """
+        fresh = ConcurrencyMap()
+        fresh.load(session=session)
+        fresh.load_deferred(session=session)
+        drift = sum(
+            _counter_drift(current, loaded)
+            for current, loaded in (
+                (self.dag_run_active_tasks_map, fresh.dag_run_active_tasks_map),
+                (self.task_concurrency_map, fresh.task_concurrency_map),
+                (self.task_dagrun_concurrency_map, fresh.task_dagrun_concurrency_map),
+            )
+        )
+        self.dag_run_active_tasks_map = fresh.dag_run_active_tasks_map
+        self.task_concurrency_map = fresh.task_concurrency_map
+        self.task_dagrun_concurrency_map = fresh.task_dagrun_concurrency_map
+        self.deferred_tis = fresh.deferred_tis
+        self.loaded_at = fresh.loaded_at
+        self._uncommitted.clear()
+        return drift
+
+    def record_queued(self, ti: TI) -> None:
+        """
+        Count a task instance the scheduler is about to move to queued.
+
+        A task instance resuming from deferral is already counted towards task-level concurrency.
+        The change is kept by :meth:`commit`, or undone by :meth:`rollback`.
+        """
+        key = (ti.dag_id, ti.run_id, ti.task_id, ti.map_index)
+        resumed = key in self.deferred_tis
+        self.deferred_tis.discard(key)
+        self.dag_run_active_tasks_map[(ti.dag_id, ti.run_id)] += 1
+        if not resumed:
+            self.task_concurrency_map[(ti.dag_id, ti.task_id)] += 1
+            self.task_dagrun_concurrency_map[(ti.dag_id, ti.run_id, ti.task_id)] += 1
+        self._uncommitted.append((key, resumed))
+
+    def commit(self) -> None:
+        """Keep the task instances recorded as queued, once the transaction queueing them committed."""
+        self._uncommitted.clear()
+
+    def rollback(self) -> None:
+        """Undo the task instances recorded as queued, when the transaction queueing them rolled back."""
+        for key, resumed in reversed(self._uncommitted):
+            dag_id, run_id, task_id, _ = key
+            _decrement(self.dag_run_active_tasks_map, (dag_id, run_id))
+            if resumed:
+                self.deferred_tis.add(key)
+            else:
+                _decrement(self.task_concurrency_map, (dag_id, task_id))
+                _decrement(self.task_dagrun_concurrency_map, (dag_id, run_id, task_id))
+        self._uncommitted.clear()
+
+    def saturated_dag_runs(self, max_active_tasks: dict[str, int]) -> set[tuple[str, str]]:
+        """Return the DAG runs whose active task instances reached their DAG's ``max_active_tasks``."""
+        return {
+            dag_run_key
+            for dag_run_key, count in self.dag_run_active_tasks_map.items()
+            if dag_run_key[0] in max_active_tasks and count >= max_active_tasks[dag_run_key[0]]
+        }
+
+    def record_finished(self, ti: TI) -> None:
+        """
+        Stop counting a task instance whose executor reported that it finished.
+
+        The task instance state is the one it ends up with after the event was handled, e.g. failed
+        for a task instance killed externally. A task instance that is still queued or running (e.g.
+        it was requeued) keeps being counted; a deferred or awaiting-input one only releases its
+        DAG-run slot.
+        """
+        if ti.state in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
+            _decrement(self.dag_run_active_tasks_map, (ti.dag_id, ti.run_id))
+            if ti.state == TaskInstanceState.DEFERRED:
+                self.deferred_tis.add((ti.dag_id, ti.run_id, ti.task_id, ti.map_index))
+            return
+        if ti.state in ACTIVE_STATES:
+            return
+        _decrement(self.dag_run_active_tasks_map, (ti.dag_id, ti.run_id))
+        _decrement(self.task_concurrency_map, (ti.dag_id, ti.task_id))
+        _decrement(self.task_dagrun_concurrency_map, (ti.dag_id, ti.run_id, ti.task_id))
+
+
+def _decrement(counter: Counter, key: tuple[str, ...]) -> None:
+    # Never let a counter go negative: the in-memory view may not have seen the task instance
+    # being queued (e.g. it was queued before the last reconciliation).
+    if counter[key] <= 1:
+        counter.pop(key, None)
+    else:
+        counter[key] -= 1
+
+
+def _counter_drift(current: Counter, loaded: Counter) -> int:
+    return sum(abs(current[key] - loaded[key]) for key in current.keys() | loaded.keys())
 
 
 def _is_parent_process() -> bool:
@@ -358,6 +486,23 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._dag_tags_in_metrics = conf.getboolean("metrics", "dag_tags_in_metrics", fallback=False)
         self._max_partition_dag_runs_per_loop = MAX_PARTITION_DAG_RUNS_PER_LOOP
         self._dag_id_to_team_name: dict[str, str | None] = {}
+        self._concurrency_map_reconcile_interval = conf.getfloat(
+            "scheduler", "concurrency_map_reconcile_interval"
+        )
+        self._concurrency_map: ConcurrencyMap | None = None
+        self._pool_occupancy_reconcile_interval = conf.getfloat(
+            "scheduler", "pool_occupancy_reconcile_interval"
+        )
+        self._pool_occupancy: PoolOccupancy | None = None
+        self._dag_run_scheduling_workers = conf.getint("scheduler", "dag_run_scheduling_workers")
+        # Unexpected error of a DagRun scheduling thread, raised once the other threads' results are used.
+        self._dag_run_scheduling_error: Exception | None = None
+        self._loop_profiler: LoopProfiler | None = None
+        if conf.getboolean("profiling", "scheduler_loop_profiling"):
+            self._loop_profiler = LoopProfiler(stats_prefix="scheduler", engine=settings.engine)
+        self._stack_sampler: StackSampler | None = None
+        if (sampling_interval := conf.getfloat("profiling", "scheduler_sampling_interval")) > 0:
+            self._stack_sampler = StackSampler(sampling_interval)
 
         self.executors: list[BaseExecutor] = executors if executors else ExecutorLoader.init_executors()
         self.executor: BaseExecutor = self.executors[0]
@@ -370,7 +515,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         if log:
             self._log = log
 
-        self.scheduler_dag_bag = DBDagBag(load_op_links=False)
+        self.scheduler_dag_bag = DBDagBag(
+            load_op_links=False,
+            cache_max_bytes=conf.getint("scheduler", "dag_cache_max_size_mb") * 1024 * 1024,
+            stats_prefix="scheduler.dag_bag",
+        )
 
         # Set of (dag_id, asset_name, asset_uri) tuples for trigger policies that
         # are permanently unreachable for the rollup window's cardinality — the
@@ -562,6 +711,70 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.info("\n\t".join(map(repr, callstack)))
             self.log.info("-" * 80)
 
+        if self._loop_profiler:
+            self.log.info("Scheduler loop phases:\n%s", self._loop_profiler.summary())
+            self.log.info("-" * 80)
+        if self._stack_sampler:
+            self._stack_sampler.dump(os.path.join(AIRFLOW_HOME, "scheduler_profile.folded"))
+
+    def _profile_phase(self, name: str) -> AbstractContextManager[None]:
+        """Time a phase of the scheduler loop when ``[profiling] scheduler_loop_profiling`` is enabled."""
+        if self._loop_profiler is None:
+            return nullcontext()
+        return self._loop_profiler.phase(name)
+
+    def _profiled(self, name: str, action: Callable[[], Any]) -> Callable[[], Any]:
+        if self._loop_profiler is None:
+            return action
+        return self._loop_profiler.wrap(name, action)
+
+    def _get_concurrency_map(self, session: Session) -> ConcurrencyMap:
+        """
+        Return the concurrency map to use for this critical section.
+
+        By default the map is rebuilt from the database every time. When
+        ``[scheduler] concurrency_map_reconcile_interval`` is set, the map is kept in memory,
+        updated from the task instances this scheduler queues and from executor events, and
+        only reconciled with the database once the interval has elapsed.
+        """
+        if self._concurrency_map_reconcile_interval <= 0:
+            concurrency_map = ConcurrencyMap()
+            concurrency_map.load(session=session)
+            return concurrency_map
+
+        if self._concurrency_map is None or self._concurrency_map.loaded_at is None:
+            self._concurrency_map = ConcurrencyMap()
+            self._concurrency_map.load(session=session)
+            self._concurrency_map.load_deferred(session=session)
+        elif time.monotonic() - self._concurrency_map.loaded_at >= self._concurrency_map_reconcile_interval:
+            drift = self._concurrency_map.reconcile(session=session)
+            if drift:
+                self.log.debug("Concurrency map drifted by %d from the database", drift)
+            stats.gauge("scheduler.concurrency_map.drift", drift)
+            stats.incr("scheduler.concurrency_map.reconciled")
+        return self._concurrency_map
+
+    def _get_pool_occupancy(self, session: Session) -> PoolOccupancy | None:
+        """
+        Return the pool occupancy ledger to use for this critical section.
+
+        Returns None, meaning ``Pool.slots_stats`` aggregates over task instances itself, unless
+        ``[scheduler] pool_occupancy_reconcile_interval`` is set.
+        """
+        if self._pool_occupancy_reconcile_interval <= 0:
+            return None
+
+        if self._pool_occupancy is None or self._pool_occupancy.loaded_at is None:
+            self._pool_occupancy = PoolOccupancy()
+            self._pool_occupancy.load(session=session)
+        elif time.monotonic() - self._pool_occupancy.loaded_at >= self._pool_occupancy_reconcile_interval:
+            drift = self._pool_occupancy.reconcile(session=session)
+            if drift:
+                self.log.debug("Pool occupancy drifted by %d slots from the database", drift)
+            stats.gauge("scheduler.pool_occupancy.drift", drift)
+            stats.incr("scheduler.pool_occupancy.reconciled")
+        return self._pool_occupancy
+
     def _task_concurrency_allows_execution(
         self,
         *,
@@ -675,7 +888,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = Pool.slots_stats(lock_rows=True, session=session)
+        pool_occupancy = self._get_pool_occupancy(session=session)
+        pools = Pool.slots_stats(lock_rows=True, occupancy=pool_occupancy, session=session)
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -694,8 +908,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             pool_to_team_name = Pool.get_name_to_team_name_mapping(list(pools.keys()), session=session)
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
-        concurrency_map.load(session=session)
+        concurrency_map = self._get_concurrency_map(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -707,19 +920,20 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         pool_num_starving_tasks: dict[str, int] = Counter()
 
+        # When the concurrency map is kept in memory, the DAG runs that reached max_active_tasks are
+        # skipped using its counters; only the limits of their DAGs are read.
+        incremental = self._concurrency_map_reconcile_interval > 0
+        dag_max_active_tasks: dict[str, int] = {}
+        if incremental and (dag_ids := {dag_id for dag_id, _ in concurrency_map.dag_run_active_tasks_map}):
+            dag_max_active_tasks_query = select(DM.dag_id, DM.max_active_tasks).where(DM.dag_id.in_(dag_ids))
+            dag_max_active_tasks = dict(session.execute(dag_max_active_tasks_query).all())
+
         for loop_count in itertools.count(start=1):
             num_starved_pools = len(starved_pools)
             num_starved_dags = len(starved_dags)
             num_starved_tasks = len(starved_tasks)
             num_starved_tasks_task_dagrun_concurrency = len(starved_tasks_task_dagrun_concurrency)
 
-            # This behaves the same as 'concurrency_map.load()' with the difference that
-            # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
-            # subquery object that is then executed along with main query.
-            # The results of 'load()' aren't used again here because by the time the main query
-            # executes, there could be a change that will be ignored.
-            dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
-
             query = (
                 select(TI)
                 .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
@@ -729,19 +943,28 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .where(~DM.is_paused)
                 .where(TI.state == TaskInstanceState.SCHEDULED)
                 .where(DM.bundle_name.is_not(None))
-                .join(
+            )
+            if incremental:
+                if saturated_dag_runs := concurrency_map.saturated_dag_runs(dag_max_active_tasks):
+                    query = query.where(tuple_(TI.dag_id, TI.run_id).not_in(saturated_dag_runs))
+            else:
+                # This behaves the same as 'concurrency_map.load()' with the difference that
+                # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
+                # subquery object that is then executed along with main query.
+                # The results of 'load()' aren't used again here because by the time the main query
+                # executes, there could be a change that will be ignored.
+                dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
+                query = query.join(
                     dr_task_concurrency_subquery,
                     and_(
                         TI.dag_id == dr_task_concurrency_subquery.c.dag_id,
                         TI.run_id == dr_task_concurrency_subquery.c.run_id,
                     ),
                     isouter=True,
-                )
-                .where(
+                ).where(
                     func.coalesce(dr_task_concurrency_subquery.c.task_per_dr_count, 0) < DM.max_active_tasks
                 )
-                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
-            )
+            query = query.order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
 
             # Starvation filters should be applied before computing the row_num based on the
             # max_active_tasks limit. That way, starved dags and tasks that shouldn't run,
@@ -1003,11 +1226,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.record_queued(task_instance)
+                if pool_occupancy is not None:
+                    pool_occupancy.record_queued(task_instance)
 
                 pool_stats["open"] = open_slots
 
@@ -1156,6 +1377,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         for ti in task_instances:
             if ti.dag_run.state in State.finished_dr_states:
                 ti.set_state(None, session=session)
+                # It was counted as queued when picked in this critical section.
+                if self._concurrency_map is not None:
+                    self._concurrency_map.record_finished(ti)
+                if self._pool_occupancy is not None:
+                    self._pool_occupancy.record_finished(ti)
                 continue
             if not ti.dag_version_id:
                 self.log.warning(
@@ -1327,6 +1553,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 scheduler_dag_bag=self.scheduler_dag_bag,
                 session=session,
                 eagerly_load_dag_tags=self._dag_tags_in_metrics,
+                concurrency_map=self._concurrency_map,
+                pool_occupancy=self._pool_occupancy,
             )
         except Exception as exc:
             stats.incr("scheduler.executor_events.failed", tags={"exception_class": type(exc).__name__})
@@ -1345,6 +1573,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         scheduler_dag_bag: DBDagBag,
         session: Session,
         eagerly_load_dag_tags: bool = False,
+        concurrency_map: ConcurrencyMap | None = None,
+        pool_occupancy: PoolOccupancy | None = None,
     ) -> int:
         """
         Process task completion events from the executor and update task instance states.
@@ -1370,6 +1600,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param eagerly_load_dag_tags: When True, eager-load dag_model.tags so the per-finished-task
             metrics carry Dag tags without a per-TI lazy load. The scheduler passes its cached flag so
             the hot path never reads conf; other callers (e.g. ``dag.test()``) leave it at the default.
+        :param concurrency_map: In-memory concurrency map kept by the scheduler in incremental mode.
+            Task instances that finished are removed from it.
+        :param pool_occupancy: Ledger of occupied pool slots kept by the scheduler in incremental mode.
+            Slots of task instances that finished are released from it.
 
         :return: Number of events processed from the executor event buffer
 
@@ -1471,6 +1705,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # multi-schedulers
         locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
         tis: Iterator[TI] = session.scalars(locked_query)
+        finished_tis: list[TI] = []
         for ti in tis:
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
@@ -1492,6 +1727,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 cls.logger().info("Setting external_executor_id for %s to %s", ti, info)
                 continue
 
+            if ti.try_number == try_number:
+                # Recorded once the event is handled, when e.g. a task instance killed externally has
+                # been failed.
+                finished_tis.append(ti)
+
             msg = (
                 "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, ti_id=%s, "
                 "run_start_date=%s, run_end_date=%s, "
@@ -1683,6 +1923,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Update task state - emails are handled by DAG processor now
                 ti.handle_failure(error=msg, session=session)
 
+        for ti in finished_tis:
+            if concurrency_map is not None:
+                concurrency_map.record_finished(ti)
+            if pool_occupancy is not None:
+                pool_occupancy.record_finished(ti)
+
         cls._emit_executor_events_batch_metrics(num_events)
         return len(event_buffer)
 
@@ -1715,7 +1961,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
             )
 
-            self._run_scheduler_loop()
+            if self._stack_sampler:
+                self._stack_sampler.start()
+                reset_signals.callback(self._stack_sampler.stop)
+            with self._loop_profiler or nullcontext():
+                self._run_scheduler_loop()
 
             if settings.Session is not None:
                 settings.Session.remove()
@@ -1825,7 +2075,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "task_instance_heartbeat_timeout_detection_interval", fallback=10.0),
-            self._find_and_purge_task_instances_without_heartbeats,
+            self._profiled("heartbeat_timeout_purge", self._find_and_purge_task_instances_without_heartbeats),
         )
 
         timers.call_regular_interval(60.0, self._update_dag_run_state_for_paused_dags)
@@ -1870,7 +2120,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # are picked up each iteration without requiring a scheduler restart.
             self._dag_id_to_team_name = {}
             with stats.timer("scheduler.scheduler_loop_duration") as timer:
-                with create_session() as session:
+                with self._profile_phase("scheduling"), create_session() as session:
                     # This will schedule for as many executors as possible.
                     num_queued_tis = self._do_scheduling(session)
                     # Don't keep any objects alive -- we've possibly just looked at 500+ ORM objects!
@@ -1889,9 +2139,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                             }
                         ),
                     ):
-                        executor.heartbeat()
+                        with self._profile_phase("executor_heartbeat"):
+                            executor.heartbeat()
 
-                with create_session() as session:
+                with self._profile_phase("executor_events"), create_session() as session:
                     num_finished_events = 0
                     for executor in self.executors:
                         num_finished_events += self._process_executor_events(
@@ -1905,7 +2156,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     except Exception:
                         self.log.exception("Something went wrong when trying to save task event logs.")
 
-                with create_session() as session:
+                with self._profile_phase("deadlines"), create_session() as session:
                     # Lock expired, unhandled deadlines with FOR UPDATE SKIP LOCKED so
                     # concurrent HA scheduler replicas don't both process the same row
                     # and create duplicate callbacks.
@@ -1937,7 +2188,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 )
 
                 # Run any pending timed events
-                next_event = timers.run(blocking=False)
+                with self._profile_phase("timed_events"):
+                    next_event = timers.run(blocking=False)
                 self.log.debug("Next timed event is in %f", next_event)
 
             self.log.debug("Ran scheduling loop in %.2f ms", timer.duration)
@@ -1997,25 +2249,27 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if self._scheduler_use_job_schedule:
-                self._create_dagruns_for_dags(guard, session)
-
-            self._start_queued_dagruns(session)
-            guard.commit()
-
-            # Bulk fetch the currently active dag runs for the dags we are
-            # examining, rather than making one query per DagRun.
-            # Materialize into a list because the multi-team block below iterates
-            # the result and ScalarResult is a one-pass iterator.
-            dag_runs = list(
-                DagRun.get_running_dag_runs_to_examine(
-                    session=session, eagerly_load_dag_tags=self._dag_tags_in_metrics
+                with self._profile_phase("dagrun_creation"):
+                    self._create_dagruns_for_dags(guard, session)
+
+            with self._profile_phase("dagrun_scheduling"):
+                self._start_queued_dagruns(session)
+                guard.commit()
+
+                # Bulk fetch the currently active dag runs for the dags we are
+                # examining, rather than making one query per DagRun.
+                # Materialize into a list because the multi-team block below iterates
+                # the result and ScalarResult is a one-pass iterator.
+                dag_runs = list(
+                    DagRun.get_running_dag_runs_to_examine(
+                        session=session, eagerly_load_dag_tags=self._dag_tags_in_metrics
+                    )
                 )
-            )
 
-            # Team name should be added before listeners are called in _schedule_all_dag_runs()
-            self._stamp_team_names(dag_runs, session)
+                # Team name should be added before listeners are called in _schedule_all_dag_runs()
+                self._stamp_team_names(dag_runs, session)
 
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
         # cache saves time during scheduling of many dag_runs for same dag
@@ -2030,6 +2284,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             else:
                 self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
 
+        if (error := self._dag_run_scheduling_error) is not None:
+            self._dag_run_scheduling_error = None
+            raise error
+
         with prohibit_commit(session) as guard:
             # Without this, the session has an invalid view of the DB
             session.expunge_all()
@@ -2047,13 +2305,18 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     timer.start()
 
                     # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
-                    num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
+                    with self._profile_phase("critical_section"):
+                        num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
 
                     # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew the
                     # metric, way down
                     timer.stop(send=True)
                 except OperationalError as e:
                     timer.stop(send=False)
+                    if self._concurrency_map is not None:
+                        self._concurrency_map.rollback()
+                    if self._pool_occupancy is not None:
+                        self._pool_occupancy.rollback()
 
                     if is_lock_not_available_error(error=e):
                         self.log.debug("Critical section lock held by another Scheduler")
@@ -2063,6 +2326,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     raise
 
             guard.commit()
+            if self._concurrency_map is not None:
+                self._concurrency_map.commit()
+            if self._pool_occupancy is not None:
+                self._pool_occupancy.commit()
 
         return num_queued_tis
 
@@ -2893,6 +3160,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         session: Session,
     ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
         """Make scheduling decisions for all `dag_runs`."""
+        if self._dag_run_scheduling_workers > 1:
+            dag_runs = list(dag_runs)
+            if len(dag_runs) > 1:
+                return self._schedule_all_dag_runs_in_parallel(guard, dag_runs, session)
         callback_tuples = []
         for run in dag_runs:
             try:
@@ -2905,6 +3176,111 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         guard.commit()
         return callback_tuples
 
+    def _schedule_all_dag_runs_in_parallel(
+        self,
+        guard: CommitProhibitorGuard,
+        dag_runs: list[DagRun],
+        session: Session,
+    ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
+        """
+        Make scheduling decisions for all `dag_runs` on ``[scheduler] dag_run_scheduling_workers`` threads.
+
+        The runs are partitioned by dag_id, so two threads never update the same DagModel row. Every
+        thread locks its runs again in its own session (see :meth:`_schedule_dag_runs_in_own_session`),
+        so the locks taken by this session are released before handing them out.
+
+        Every thread commits, and retries on database errors, independently of the others: a partition that
+        still fails is left for the next loop, without losing the callbacks of the partitions committed.
+        DagRun state change listeners are called from this thread once all partitions are done. Any other
+        error of a partition is kept in ``_dag_run_scheduling_error``, for :meth:`_do_scheduling` to raise
+        it once the callbacks of the committed partitions are sent.
+
+        :return: The callbacks to run, paired with the DagRun objects of ``session``
+        """
+        partitions: list[list[int]] = [
+            [] for _ in range(min(self._dag_run_scheduling_workers, len(dag_runs)))
+        ]
+        runs_by_dag_id: dict[str, list[int]] = defaultdict(list)
+        for run in dag_runs:
+            runs_by_dag_id[run.dag_id].append(run.id)
+        # Largest Dags first, each to the least loaded thread.
+        for run_ids in sorted(runs_by_dag_id.values(), key=len, reverse=True):
+            min(partitions, key=len).extend(run_ids)
+
+        guard.commit()
+
+        with ThreadPoolExecutor(
+            max_workers=len(partitions), thread_name_prefix="scheduler-dag-run"
+        ) as executor:
+            futures = [
+                executor.submit(self._schedule_dag_runs_in_own_session, partition) for partition in partitions
+            ]
+
+        dag_runs_by_id = {run.id: run for run in dag_runs}
+        callback_tuples = []
+        notifications: list[tuple[int, str]] = []
+        for partition, future in zip(partitions, futures):
+            try:
+                callbacks, partition_notifications = future.result()
+            except (DBAPIError, StaleDataError):
+                self.log.exception(
+                    "Error scheduling DAG runs %s, they will be examined again in the next loop", partition
+                )
+                continue
+            except Exception as e:
+                self.log.exception("Unexpected error scheduling DAG runs %s", partition)
+                if self._dag_run_scheduling_error is None:
+                    self._dag_run_scheduling_error = e
+                continue
+            callback_tuples.extend((dag_runs_by_id[run_id], callback) for run_id, callback in callbacks)
+            notifications.extend(partition_notifications)
+
+        for run_id, msg in notifications:
+            dag_run = dag_runs_by_id[run_id]
+            # Load the state committed by the thread; the team name stamped on the run is kept.
+            session.refresh(dag_run)
+            dag_run.notify_dagrun_state_changed(msg=msg)
+        return callback_tuples
+
+    def _schedule_dag_runs_in_own_session(
+        self, dag_run_ids: list[int]
+    ) -> tuple[list[tuple[int, DagCallbackRequest | None]], list[tuple[int, str]]]:
+        """
+        Lock and make scheduling decisions for the given DagRuns in a new session and transaction.
+
+        Runs locked by another scheduler since they were selected are skipped. The transaction is rolled back
+        and retried on database errors, independently of the ones of other threads.
+
+        :return: The callbacks to run, and the DagRun state changes to notify listeners of, by DagRun id
+        """
+        callbacks: list[tuple[int, DagCallbackRequest | None]] = []
+        notifications: list[tuple[int, str]] = []
+        for attempt in run_with_db_retries(logger=self.log):
+            with (
+                attempt,
+                create_session() as session,
+                prohibit_commit(session) as guard,
+                defer_dagrun_state_notifications() as notifications,
+            ):
+                callbacks = []
+                query = select(DagRun).where(DagRun.id.in_(dag_run_ids))
+                if self._dag_tags_in_metrics:
+                    query = query.options(joinedload(DagRun.dag_model).selectinload(DM.tags))
+                dag_runs = (
+                    session.scalars(with_row_locks(query, of=DagRun, session=session, skip_locked=True))
+                    .unique()
+                    .all()
+                )
+                for run in dag_runs:
+                    try:
+                        callbacks.append((run.id, self._schedule_dag_run(run, session=session)))
+                    except DBAPIError:
+                        raise  # roll back and retry the whole transaction
+                    except Exception:
+                        self.log.exception("Error scheduling DAG run %s of %s", run.run_id, run.dag_id)
+                guard.commit()
+        return callbacks, notifications
+
     def _schedule_dag_run(
         self,
         dag_run: DagRun,
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import json
 import logging
 import math
 import os
@@ -26,8 +27,9 @@ import signal
 import sys
 import threading
 import time
+import zlib
 from collections import deque
-from collections.abc import Callable, Generator, Hashable, Iterable, Iterator
+from collections.abc import AsyncIterator, Callable, Coroutine, Generator, Hashable, Iterable, Iterator
 from contextlib import contextmanager, suppress
 from datetime import datetime
 from socket import socket
@@ -127,11 +129,13 @@ from airflow.sdk.execution_time.request_handlers import (
 )
 from airflow.sdk.execution_time.supervisor import WatchedSubprocess, make_buffered_socket_reader
 from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
+from airflow.serialization.enums import stringify_encoding_keys
 from airflow.serialization.serialized_objects import DagSerialization
 from airflow.triggers.base import BaseEventTrigger, BaseTrigger, DiscrimatedTriggerEvent, TriggerEvent
 from airflow.triggers.shared_stream import SharedStreamManager
 from airflow.utils.helpers import log_filename_template_renderer, prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.loop_profiler import PhaseHistogram, StepStats, run_in_timed_steps
 from airflow.utils.session import create_session, provide_session
 
 if TYPE_CHECKING:
@@ -213,6 +217,9 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             raise ValueError(f"Capacity number {capacity!r} is invalid")
         self.queues = queues
         self.team_name = team_name
+        self.runner_processes = conf.getint("triggerer", "runner_processes", fallback=1)
+        if self.runner_processes < 1:
+            raise ValueError(f"Number of runner processes {self.runner_processes!r} is invalid")
         # Set up only when _execute() starts the subprocess; keep it defined so that
         # signal handlers (or other code) firing before startup don't hit AttributeError.
         self.trigger_runner: TriggerRunnerSupervisor | None = None
@@ -221,6 +228,8 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         """Register signals that stop child processes."""
         signal.signal(signal.SIGINT, self._exit_gracefully)
         signal.signal(signal.SIGTERM, self._exit_gracefully)
+        if conf.getboolean("profiling", "triggerer_step_accounting", fallback=False):
+            signal.signal(signal.SIGUSR2, self._debug_dump)
 
     @classmethod
     @provide_session
@@ -252,6 +261,15 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
                 self.trigger_runner.kill(signal.SIGKILL)
             sys.exit(os.EX_SOFTWARE)
 
+    def _debug_dump(self, signum, frame) -> None:
+        """Forward the signal to the runner subprocesses, which log their trigger step accounting."""
+        if not self.trigger_runner:
+            return
+        for runner in self.trigger_runner.runners:
+            if runner._exit_code is None:
+                with suppress(runner._process.ProcessNotFound):
+                    runner._signal_subprocess(signal.SIGUSR2)
+
     def _execute(self) -> int | None:
         # Mark as server context for secrets backend detection when handling GetConnection
         # requests from the TriggerRunner subprocess (needs MetastoreBackend).
@@ -275,6 +293,7 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
                 logger=log,
                 queues=self.queues,
                 team_name=self.team_name,
+                runner_processes=self.runner_processes,
             )
             # Run the main DB comms loop in this process
             self.trigger_runner.run()
@@ -332,6 +351,9 @@ class messages:
         # Format of list[str] is the exc traceback format
         failures: list[tuple[int, list[str] | None]] | None = None
         finished: list[int] | None = None
+        # Cumulative milliseconds each running trigger has kept the event loop busy, sent periodically when
+        # [triggerer] load_aware_assignment is on
+        busy_time: dict[int, float] | None = None
 
     class TriggerStateSync(BaseModel):
         type: Literal["TriggerStateSync"] = "TriggerStateSync"
@@ -342,6 +364,8 @@ class messages:
         # since the previous sync; the runner releases the matching broker
         # advances on receipt.
         events_persisted: list[int] | None = None
+        # Triggers to stop without invoking on_kill(), so another triggerer can take them over
+        to_release: set[int] | None = None
 
 
 class HITLDetailResponseResult(HITLDetailResponse):
@@ -491,10 +515,20 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
     runner_health_check_threshold = conf.getfloat("triggerer", "runner_health_check_threshold")
+    event_batch_size = conf.getint("triggerer", "event_batch_size", fallback=1)
+    load_aware_assignment = conf.getboolean("triggerer", "load_aware_assignment", fallback=False)
+    max_loop_utilization = conf.getfloat("triggerer", "max_loop_utilization", fallback=0.75)
 
     runner: TriggerRunner | None = None
     stop: bool = False
 
+    runner_index: int = 0
+    """Index of the runner subprocess, when the triggerer runs several of them."""
+
+    # The other runner subprocesses of the triggerer, when [triggerer] runner_processes is more than 1. This
+    # supervisor makes the database calls for all of them, and their sockets are registered in its selector.
+    shards: list[TriggerRunnerSupervisor] = attrs.field(factory=list, init=False)
+
     # Timestamp of the last message received from the TriggerRunner subprocess.  Updated on
     # every message; if it goes silent for longer than runner_health_check_threshold the
     # subprocess's async event loop has likely deadlocked.  Initialised to +inf so the watchdog
@@ -528,9 +562,29 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, list[str] | None]] = attrs.field(factory=deque, init=False)
 
+    # Cumulative milliseconds each trigger has kept the event loop of the subprocess busy, as last reported
+    # by it when [triggerer] load_aware_assignment is on
+    trigger_busy_ms: dict[int, float] = attrs.field(factory=dict, init=False)
+
+    # Triggers we have told the async process to stop so that another triggerer takes them over. We keep them
+    # here until we receive the FinishedTriggers message, they are then unassigned in released_triggers
+    releasing_triggers: set[int] = attrs.field(factory=set, init=False)
+    release_requests: deque[int] = attrs.field(factory=deque, init=False)
+    released_triggers: set[int] = attrs.field(factory=set, init=False)
+
+    # Time and busy time of the triggers at the start of the current load sample, and the number of triggers
+    # to assign to this triggerer until the end of it
+    _load_sample: tuple[float, dict[int, float]] | None = attrs.field(init=False, default=None)
+    _load_aware_capacity: int = attrs.field(init=False, default=0)
+
+    @property
+    def runners(self) -> list[TriggerRunnerSupervisor]:
+        """All the runner subprocesses of the triggerer, starting with this one."""
+        return [self, *self.shards]
+
     def is_alive(self) -> bool:
         # Set by `_service_subprocess` in the loop
-        return self._exit_code is None
+        return all(runner._exit_code is None for runner in self.runners)
 
     @classmethod
     def start(  # type: ignore[override]
@@ -538,8 +592,30 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         *,
         job: Job | None = None,
         logger=None,
+        runner_processes: int = 1,
         **kwargs,
     ):
+        """
+        Start the trigger runner subprocess.
+
+        :param runner_processes: The number of runner subprocesses to start. The triggers are split between
+            them, and the returned supervisor manages the other ones in ``shards``.
+        """
+        proc = cls._start_runner(job=job, logger=logger, **kwargs)
+        try:
+            for runner_index in range(1, runner_processes):
+                proc.shards.append(
+                    cls._start_runner(
+                        job=job, logger=logger, runner_index=runner_index, selector=proc.selector, **kwargs
+                    )
+                )
+        except BaseException:
+            proc.kill(escalation_delay=10, force=True)
+            raise
+        return proc
+
+    @classmethod
+    def _start_runner(cls, *, job: Job | None, logger, **kwargs):
         proc_id = job.id if job is not None else uuid4()
         # Triggers run user code that polls APIs / watches queues / hits HTTP
         # endpoints -- almost always network calls that trigger macOS-unsafe ObjC
@@ -590,9 +666,15 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 self.events.extend(msg.events)
             if msg.failures:
                 self.failed_triggers.extend(msg.failures)
+            if msg.busy_time is not None:
+                self.trigger_busy_ms = msg.busy_time
             for id in msg.finished or ():
                 self.running_triggers.discard(id)
                 self.cancelling_triggers.discard(id)
+                self.trigger_busy_ms.pop(id, None)
+                if id in self.releasing_triggers:
+                    self.releasing_triggers.discard(id)
+                    self.released_triggers.add(id)
                 if factory := self.logger_cache.pop(id, None):
                     try:
                         factory.upload_to_remote()
@@ -618,6 +700,10 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             while self.creating_triggers:
                 workload = self.creating_triggers.popleft()
                 response.to_create.append(workload)
+            if self.release_requests:
+                response.to_release = set()
+                while self.release_requests:
+                    response.to_release.add(self.release_requests.popleft())
             self.running_triggers.update(m.id for m in response.to_create)
             resp = response
 
@@ -710,8 +796,10 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         """Perform a single iteration of the run loop."""
         self.load_triggers()
 
-        # Wait for up to 1 second for activity
+        # Wait for up to 1 second for activity, of any runner subprocess as they share the selector
         self._service_subprocess(1)
+        for shard in self.shards:
+            shard._check_subprocess_exit()
 
         self.handle_events()
         self.handle_failed_triggers()
@@ -726,7 +814,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.heartbeat() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
-        elapsed = time.monotonic() - self._last_runner_comms
+        elapsed = time.monotonic() - min(runner._last_runner_comms for runner in self.runners)
         if self.runner_health_check_threshold > 0 and elapsed > self.runner_health_check_threshold:
             if not self._runner_comms_silence_logged:
                 log.error(
@@ -751,34 +839,120 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.load_triggers() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
-        Trigger.assign_unassigned(
-            self.job.id,
-            self.capacity,
-            self.health_check_threshold,
-            queues=self.queues,
-            team_name=self.team_name,
-        )
+        released_trigger_ids = set().union(*(runner.released_triggers for runner in self.runners))
+        if released_trigger_ids:
+            Trigger.release(released_trigger_ids, self.job.id)
+            for runner in self.runners:
+                runner.released_triggers.clear()
+        capacity = self.assignable_capacity() if self.load_aware_assignment else self.capacity
+        if capacity > 0:
+            Trigger.assign_unassigned(
+                self.job.id,
+                capacity,
+                self.health_check_threshold,
+                queues=self.queues,
+                team_name=self.team_name,
+            )
         ids = Trigger.ids_for_triggerer(self.job.id, queues=self.queues, team_name=self.team_name)
         self.update_triggers(set(ids))
 
+    def assignable_capacity(self) -> int:
+        """
+        Return how many triggers to assign to this triggerer, given the load the running triggers put on it.
+
+        The share of time the event loops of the runner subprocesses spend running triggers is measured every
+        ``_LOAD_SAMPLE_INTERVAL`` seconds, from the busy time of the triggers they report. Below
+        ``[triggerer] max_loop_utilization``, the triggerer takes as many more triggers as the average cost of
+        its triggers leaves room for. Above it, it takes no more, and hands the busiest trigger over to
+        another triggerer, one per interval so that the load moves gradually.
+        """
+        now = time.monotonic()
+        busy_ms: dict[int, float] = {}
+        for runner in self.runners:
+            busy_ms.update(runner.trigger_busy_ms)
+        if self._load_sample is None:
+            # Nothing to measure the load against yet
+            self._load_sample = (now, busy_ms)
+            self._load_aware_capacity = self.capacity
+        sample_start, sample_busy_ms = self._load_sample
+        if now - sample_start < _LOAD_SAMPLE_INTERVAL:
+            return self._load_aware_capacity
+        self._load_sample = (now, busy_ms)
+
+        elapsed_ms = (now - sample_start) * 1000
+        trigger_load = {
+            trigger_id: max(trigger_busy_ms - sample_busy_ms.get(trigger_id, 0.0), 0.0) / elapsed_ms
+            for trigger_id, trigger_busy_ms in busy_ms.items()
+        }
+        utilization = sum(trigger_load.values()) / len(self.runners)
+        running = sum(len(runner.running_triggers) for runner in self.runners)
+        stats.gauge("triggerer.loop_utilization", utilization, tags=self.metric_tags())
+
+        if utilization >= self.max_loop_utilization:
+            self._load_aware_capacity = 0
+            # Only move triggers that ran for the whole sample, not ones that were just assigned
+            candidates = {
+                trigger_id: load for trigger_id, load in trigger_load.items() if trigger_id in sample_busy_ms
+            }
+            if running > 1 and candidates:
+                self._release_busiest_trigger(candidates)
+        elif utilization > 0 and running:
+            headroom = math.floor((self.max_loop_utilization - utilization) / (utilization / running))
+            self._load_aware_capacity = min(self.capacity, running + headroom)
+        else:
+            self._load_aware_capacity = self.capacity
+        return self._load_aware_capacity
+
+    def _release_busiest_trigger(self, trigger_load: dict[int, float]) -> None:
+        """Stop the busiest trigger without invoking on_kill(), so that another triggerer takes it over."""
+        if self.job is None or not Trigger.has_other_alive_triggerer(
+            self.job.id, self.health_check_threshold
+        ):
+            return
+        trigger_id = max(trigger_load, key=trigger_load.__getitem__)
+        for runner in self.runners:
+            if trigger_id in runner.running_triggers and trigger_id not in runner.cancelling_triggers:
+                log.info(
+                    "Moving trigger %s to another triggerer, it kept the event loop busy %.0f%% of the time",
+                    trigger_id,
+                    trigger_load[trigger_id] * 100,
+                )
+                runner.releasing_triggers.add(trigger_id)
+                runner.release_requests.append(trigger_id)
+                stats.incr("triggers.released", tags=self.metric_tags())
+                return
+
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
-        while self.events:
-            entry = self.events.popleft()
-            # Tell the model to wake up its tasks
-            self.on_trigger_event(trigger_id=entry.trigger_id, event=entry.event)
-            # Only reached when on_trigger_event returned, i.e. the event was
-            # persisted; a raise above leaves the seq unconfirmed so the
-            # bound shared-stream advance fails out and the broker redelivers.
-            if entry.persist_seq is not None:
-                self.persisted_event_seqs.append(entry.persist_seq)
-            # Emit stat event
-            stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
+        for runner in self.runners:
+            while runner.events:
+                if self.event_batch_size > 1:
+                    entries = [
+                        runner.events.popleft() for _ in range(min(self.event_batch_size, len(runner.events)))
+                    ]
+                    # Tell the model to wake up the tasks of all the triggers at once
+                    self.on_trigger_events([(entry.trigger_id, entry.event) for entry in entries])
+                else:
+                    entries = [runner.events.popleft()]
+                    # Tell the model to wake up its tasks
+                    self.on_trigger_event(trigger_id=entries[0].trigger_id, event=entries[0].event)
+                for entry in entries:
+                    # Only reached when the events were persisted; a raise above
+                    # leaves the seqs unconfirmed so the bound shared-stream
+                    # advance fails out and the broker redelivers.
+                    if entry.persist_seq is not None:
+                        runner.persisted_event_seqs.append(entry.persist_seq)
+                    # Emit stat event
+                    stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
 
     def on_trigger_event(self, trigger_id: int, event: TriggerEvent) -> None:
         """Record that a trigger fired an event."""
         Trigger.submit_event(trigger_id=trigger_id, event=event)
 
+    def on_trigger_events(self, events: list[tuple[int, TriggerEvent]]) -> None:
+        """Record that triggers fired a batch of events, when ``[triggerer] event_batch_size`` is more than 1."""
+        Trigger.submit_events(events)
+
     def clean_unused(self) -> None:
         """Remove triggers that are no longer needed."""
         Trigger.clean_unused()
@@ -789,12 +963,13 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         Task Instances that depend on them need failing.
         """
-        while self.failed_triggers:
-            # Tell the model to fail this trigger's deps
-            trigger_id, exc = self.failed_triggers.popleft()
-            self.on_trigger_failure(trigger_id=trigger_id, exc=exc)
-            # Emit stat event
-            stats.incr("triggers.failed", tags=prune_dict({"team_name": self.team_name}))
+        for runner in self.runners:
+            while runner.failed_triggers:
+                # Tell the model to fail this trigger's deps
+                trigger_id, exc = runner.failed_triggers.popleft()
+                self.on_trigger_failure(trigger_id=trigger_id, exc=exc)
+                # Emit stat event
+                stats.incr("triggers.failed", tags=prune_dict({"team_name": self.team_name}))
 
     def on_trigger_failure(self, trigger_id: int, exc: list[str] | None) -> None:
         """Record that a trigger failed."""
@@ -820,13 +995,14 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def emit_metrics(self):
         tags = self.metric_tags()
+        running_triggers = sum(len(runner.running_triggers) for runner in self.runners)
         stats.gauge(
             "triggers.running",
-            len(self.running_triggers),
+            running_triggers,
             tags=tags,
         )
 
-        capacity_left = self.capacity - len(self.running_triggers)
+        capacity_left = self.capacity - running_triggers
         stats.gauge(
             "triggerer.capacity_left",
             capacity_left,
@@ -964,17 +1140,59 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         Works out the differences - ones to add, and ones to remove - then
         adds them to the dequeues so the subprocess can actually mutate the running
-        trigger set.
+        trigger set. With several runner subprocesses, the triggers are split between them first.
         """
-        known_trigger_ids = self.running_triggers.union(
+        if not self.shards:
+            self._update_runner_triggers(requested_trigger_ids)
+            return
+        for runner, trigger_ids in zip(self.runners, self._split_between_runners(requested_trigger_ids)):
+            runner._update_runner_triggers(trigger_ids)
+
+    def _known_trigger_ids(self) -> set[int]:
+        """Return the IDs of the triggers handled by the runner subprocess, in any state."""
+        return self.running_triggers.union(
             (x[0] for x in self.events),
             self.cancelling_triggers,
             (trigger[0] for trigger in self.failed_triggers),
             (trigger.id for trigger in self.creating_triggers),
+            self.releasing_triggers,
+            self.released_triggers,
         )
+
+    def _split_between_runners(self, requested_trigger_ids: set[int]) -> list[set[int]]:
+        """
+        Return the requested triggers each runner subprocess should run, in the order of ``runners``.
+
+        Triggers stay in the runner they were started in, since moving them would restart them. A new
+        trigger goes to the runner chosen by rendezvous hashing of its ID, so the split does not depend
+        on the order the triggers are assigned in, unless that runner handles more triggers than the
+        least loaded one by a tenth of its share of the capacity. It then goes to the least loaded one.
+        """
+        runners = self.runners
+        split: list[set[int]] = []
+        remaining = set(requested_trigger_ids)
+        for runner in runners:
+            known = runner._known_trigger_ids()
+            split.append(remaining & known)
+            remaining -= known
+        loads = [len(runner._known_trigger_ids()) for runner in runners]
+        slack = max(1, math.ceil(self.capacity / len(runners) / 10))
+        for trigger_id in sorted(remaining):
+            preferred = max(
+                range(len(runners)), key=lambda index: zlib.crc32(f"{trigger_id}:{index}".encode())
+            )
+            least_loaded = min(range(len(runners)), key=loads.__getitem__)
+            index = preferred if loads[preferred] < loads[least_loaded] + slack else least_loaded
+            split[index].add(trigger_id)
+            loads[index] += 1
+        return split
+
+    def _update_runner_triggers(self, requested_trigger_ids: set[int]) -> None:
+        """Update the triggers this runner subprocess runs."""
+        known_trigger_ids = self._known_trigger_ids()
         # Work out the two difference sets
         new_trigger_ids = requested_trigger_ids - known_trigger_ids
-        cancel_trigger_ids = self.running_triggers - requested_trigger_ids
+        cancel_trigger_ids = self.running_triggers - requested_trigger_ids - self.releasing_triggers
 
         if new_trigger_ids:
             workloads_to_create = self.build_trigger_workloads(new_trigger_ids)
@@ -1056,11 +1274,38 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             if lvl_name := NAME_TO_LEVEL.get(event.pop("level")):
                 log.log(lvl_name, event.pop("event", None), **event)
 
+    def kill(
+        self,
+        signal_to_send: signal.Signals = signal.SIGINT,
+        escalation_delay: float = 5.0,
+        force: bool = False,
+    ):
+        if self.shards:
+            # Signal every runner subprocess first, so they clean up their triggers concurrently
+            for runner in self.runners:
+                if runner._exit_code is None:
+                    with suppress(runner._process.ProcessNotFound):
+                        runner._signal_subprocess(signal_to_send)
+            for shard in self.shards:
+                shard.kill(signal_to_send, escalation_delay=escalation_delay, force=force)
+        super().kill(signal_to_send, escalation_delay=escalation_delay, force=force)
+
     @classmethod
     def run_in_process(cls):
         TriggerRunner().run()
 
 
+# Number of triggers, or trigger classes, reported by the trigger step accounting
+_STEP_ACCOUNTING_TOP_N = 10
+
+# Seconds between two reports of the busy time of the triggers to the supervisor, for load-aware assignment
+_BUSY_TIME_REPORT_INTERVAL = 10.0
+
+# Seconds over which the supervisor measures the event loop utilization, for load-aware assignment. At most one
+# trigger is moved to another triggerer per interval
+_LOAD_SAMPLE_INTERVAL = 30.0
+
+
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
@@ -1070,6 +1315,142 @@ class TriggerDetails(TypedDict):
     events: int
 
 
+# Marks the end of the run of coalesced triggers in the event queues of their subscribers
+_COALESCED_RUN_END = object()
+
+
+@attrs.define
+class _CoalescedRun:
+    trigger: BaseTrigger
+    subscribers: dict[int, asyncio.Queue] = attrs.field(factory=dict)
+    subscriber_step_stats: dict[int, StepStats] = attrs.field(factory=dict)
+    events: list[TriggerEvent] = attrs.field(factory=list)
+    task: asyncio.Task | None = None
+
+
+class _CoalescedRunStepStats(StepStats):
+    """Step stats of a coalesced run, whose time is shared out evenly between the triggers waiting for it."""
+
+    def __init__(self, run: _CoalescedRun, step_stats: StepStats) -> None:
+        # Slow steps are reported as the ones of the trigger the run was started for
+        super().__init__(
+            step_stats.label, slow_step_ms=step_stats.slow_step_ms, on_slow_step=step_stats.on_slow_step
+        )
+        self.run = run
+
+    def record(self, wall_ms: float, cpu_ms: float) -> None:
+        super().record(wall_ms, cpu_ms)
+        if subscriber_step_stats := list(self.run.subscriber_step_stats.values()):
+            share = len(subscriber_step_stats)
+            for step_stats in subscriber_step_stats:
+                step_stats.add(wall_ms / share, cpu_ms / share)
+
+
+class CoalescedTriggerRuns:
+    """
+    Run identical triggers once, and fan the events of the run out to every one of them.
+
+    Triggers opt in with :attr:`~airflow.triggers.base.BaseTrigger.supports_coalescing`; they are identical
+    when they serialize to the same classpath and kwargs. The first of them is run, and the others subscribe
+    to it; the events the run already fired are replayed to them first. The run is stopped, and its trigger
+    cleaned up, once no trigger is left waiting for it. The time spent running it is shared out between the
+    step stats of the triggers waiting for it, if they have some.
+    """
+
+    def __init__(self) -> None:
+        self._runs: dict[Hashable, _CoalescedRun] = {}
+
+    @staticmethod
+    def key_for(trigger: BaseTrigger) -> Hashable | None:
+        """Return the key shared by the triggers identical to this one, or None if it cannot be coalesced."""
+        if not trigger.supports_coalescing:
+            return None
+        from airflow.sdk.serde import serialize
+
+        try:
+            classpath, kwargs = trigger.serialize()
+            return classpath, json.dumps(serialize(stringify_encoding_keys(kwargs)), sort_keys=True)
+        except Exception:
+            log.warning(
+                "Cannot coalesce trigger, its kwargs failed to serialize", trigger=type(trigger).__name__
+            )
+            return None
+
+    def subscribe(
+        self,
+        trigger_id: int,
+        trigger: BaseTrigger,
+        key: Hashable,
+        step_stats: StepStats | None = None,
+    ) -> AsyncIterator[TriggerEvent]:
+        """Return the events the run of the triggers identical to ``trigger`` fires, starting it if needed."""
+        run = self._runs.get(key)
+        if run is None:
+            run = self._runs[key] = _CoalescedRun(trigger)
+            coro: Coroutine[Any, Any, None] = self._run(key, run)
+            if step_stats is not None:
+                coro = run_in_timed_steps(coro, _CoalescedRunStepStats(run, step_stats))
+            run.task = asyncio.create_task(coro, name=f"coalesced {key[0]}")  # type: ignore[index]
+        queue: asyncio.Queue = asyncio.Queue()
+        for event in run.events:
+            queue.put_nowait(event)
+        run.subscribers[trigger_id] = queue
+        if step_stats is not None:
+            run.subscriber_step_stats[trigger_id] = step_stats
+        return self._events(queue)
+
+    def trigger_to_kill(self, trigger_id: int, key: Hashable) -> BaseTrigger | None:
+        """Return the trigger of the run if only the given trigger waits for it, so killing it harms no other."""
+        run = self._runs.get(key)
+        if run is None or set(run.subscribers) != {trigger_id}:
+            return None
+        return run.trigger
+
+    async def unsubscribe(self, trigger_id: int, key: Hashable) -> None:
+        """Stop fanning events out to the trigger, and stop the run if no other trigger waits for it."""
+        run = self._runs.get(key)
+        if run is None or run.subscribers.pop(trigger_id, None) is None:
+            return
+        run.subscriber_step_stats.pop(trigger_id, None)
+        if run.subscribers:
+            return
+        del self._runs[key]
+        if run.task is not None and not run.task.done():
+            run.task.cancel()
+            with suppress(asyncio.CancelledError):
+                await run.task
+
+    @staticmethod
+    async def _events(queue: asyncio.Queue) -> AsyncIterator[TriggerEvent]:
+        while (item := await queue.get()) is not _COALESCED_RUN_END:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    async def _run(self, key: Hashable, run: _CoalescedRun) -> None:
+        # Logs of the shared run go to the triggerer log rather than to the log of the trigger it started with
+        structlog.contextvars.clear_contextvars()
+        if not os.environ.get("AIRFLOW_DISABLE_GREENBACK_PORTAL", "").lower() == "true":
+            await greenback.ensure_portal()
+        end: Any = _COALESCED_RUN_END
+        try:
+            async for event in run.trigger.run():
+                # Kept for the triggers subscribing later on
+                run.events.append(event)
+                for queue in run.subscribers.values():
+                    queue.put_nowait(event)
+        except Exception as e:
+            end = e
+        finally:
+            # Unregister the run before awaiting anything, so that no trigger subscribes to it once it is over
+            if self._runs.get(key) is run:
+                del self._runs[key]
+            for queue in run.subscribers.values():
+                queue.put_nowait(end)
+            with suppress(Exception):
+                await run.trigger.cleanup()
+
+
 @attrs.define(kw_only=True)
 class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
     _async_writer: asyncio.StreamWriter = attrs.field(alias="async_writer")
@@ -1084,6 +1465,13 @@ class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
     _loop_thread_id: int | None = attrs.field(default=None, repr=False)
     _reader_task: asyncio.Task | None = attrs.field(default=None, repr=False)
 
+    # Seconds connections fetched from the supervisor are reused for, by their conn_id, so that the triggers
+    # creating hooks for the same connection share one lookup. Concurrent lookups of a connection share one
+    # request to the supervisor too. 0 fetches the connection on every lookup.
+    connection_cache_ttl: float = attrs.field(default=0.0, repr=False)
+    _connections: dict[str, tuple[float, ConnectionResult]] = attrs.field(factory=dict, repr=False)
+    _connection_requests: dict[str, asyncio.Future] = attrs.field(factory=dict, repr=False)
+
     async def _aread_frame(self):
         try:
             len_bytes = await self._async_reader.readexactly(4)
@@ -1144,6 +1532,30 @@ class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
             # non-blocking for the foreign loop.
             cf = asyncio.run_coroutine_threadsafe(self.asend(msg), self._loop)
             return await asyncio.wrap_future(cf)
+        if self.connection_cache_ttl > 0 and isinstance(msg, GetConnection):
+            return await self._aget_connection(msg)
+        return await self._asend_frame(msg, current_loop)
+
+    async def _aget_connection(self, msg: GetConnection) -> ToTriggerRunner | None:
+        if (cached := self._connections.get(msg.conn_id)) and time.monotonic() - cached[
+            0
+        ] < self.connection_cache_ttl:
+            return cached[1]
+        request = self._connection_requests.get(msg.conn_id)
+        if request is None:
+            request = self._connection_requests[msg.conn_id] = asyncio.ensure_future(
+                self._asend_frame(msg, asyncio.get_running_loop())
+            )
+            request.add_done_callback(lambda _: self._connection_requests.pop(msg.conn_id, None))
+        # Shielded, so that a cancelled trigger does not cancel the lookup of the others waiting for it
+        result = await asyncio.shield(request)
+        if isinstance(result, ConnectionResult):
+            self._connections[msg.conn_id] = (time.monotonic(), result)
+        return result
+
+    async def _asend_frame(
+        self, msg: ToTriggerSupervisor, current_loop: asyncio.AbstractEventLoop
+    ) -> ToTriggerRunner | None:
         frame = _RequestFrame(id=next(self.id_counter), body=msg.model_dump())
         future: asyncio.Future = current_loop.create_future()
         self._pending[frame.id] = future
@@ -1210,9 +1622,20 @@ class TriggerRunner:
             ack_timeout=conf.getfloat("triggerer", "shared_stream_ack_timeout"),
             cohort_grace_period=conf.getfloat("triggerer", "shared_stream_cohort_grace_period"),
         )
+        self._coalesced_runs = CoalescedTriggerRuns()
         self.blocked_main_thread_warning_threshold = conf.getfloat(
             "triggerer", "blocked_main_thread_warning_threshold"
         )
+        # Time each trigger spends blocking the event loop, when [profiling] triggerer_step_accounting is on,
+        # or reported to the supervisor when [triggerer] load_aware_assignment is
+        self.report_busy_time = conf.getboolean("triggerer", "load_aware_assignment", fallback=False)
+        self.step_accounting = self.report_busy_time or conf.getboolean(
+            "profiling", "triggerer_step_accounting", fallback=False
+        )
+        self._last_busy_time_report = 0.0
+        self.trigger_step_stats: dict[int, StepStats] = {}
+        self.loop_lag = PhaseHistogram()
+        self._debug_dump_requested = False
 
     def _handle_signal(self, signum, frame) -> None:
         """Handle termination signals gracefully."""
@@ -1220,6 +1643,10 @@ class TriggerRunner:
         if self._stop_event is not None:
             self._stop_event.set()
 
+    def _request_debug_dump(self, signum, frame) -> None:
+        """Log the trigger step accounting from the main loop, which is not interrupted mid-write then."""
+        self._debug_dump_requested = True
+
     def run(self):
         """Sync entrypoint - just run arun in an async loop."""
         # Mark as client-side (runs user trigger/callback code)
@@ -1229,6 +1656,8 @@ class TriggerRunner:
         try:
             signal.signal(signal.SIGINT, self._handle_signal)
             signal.signal(signal.SIGTERM, self._handle_signal)
+            if self.step_accounting:
+                signal.signal(signal.SIGUSR2, self._request_debug_dump)
             asyncio.run(self.arun())
         finally:
             if prev_ctx is None:
@@ -1269,12 +1698,17 @@ class TriggerRunner:
                 # Sleep for a bit, or exit early if stop is requested.
                 with anyio.move_on_after(1):
                     await stop_event.wait()
+                if self._debug_dump_requested:
+                    self._debug_dump_requested = False
+                    await self.log.ainfo("Trigger step accounting:\n%s", self.step_accounting_summary())
                 # Every minute, log status
                 if (now := time.monotonic()) - last_status >= 60:
                     watchers = len([trigger for trigger in self.triggers.values() if trigger["is_watcher"]])
                     triggers = len(self.triggers) - watchers
                     self.log.info("%i triggers currently running", triggers)
                     self.log.info("%i watchers currently running", watchers)
+                    if self.step_accounting:
+                        self.emit_step_accounting_metrics()
                     last_status = now
 
         except Exception:
@@ -1311,6 +1745,7 @@ class TriggerRunner:
         self.comms_decoder = TriggerCommsDecoder(
             async_writer=writer,
             async_reader=reader,
+            connection_cache_ttl=conf.getfloat("triggerer", "connection_cache_ttl", fallback=0.0),
         )
 
         task_runner.SUPERVISOR_COMMS = self.comms_decoder
@@ -1415,11 +1850,18 @@ class TriggerRunner:
                     tags=prune_dict({"team_name": self.team_name}),
                 )
 
+            coro = self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context)
+            if self.step_accounting:
+                step_stats = self.trigger_step_stats[trigger_id] = StepStats(
+                    workload.classpath,
+                    slow_step_ms=self.blocked_main_thread_warning_threshold * 1000,
+                    on_slow_step=functools.partial(
+                        self._on_blocking_step, trigger_id, trigger_name, workload.classpath
+                    ),
+                )
+                coro = run_in_timed_steps(coro, step_stats)
             self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
-                    self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
-                    name=trigger_name,
-                ),
+                "task": asyncio.create_task(coro, name=trigger_name),
                 "is_watcher": isinstance(trigger_instance, BaseEventTrigger),
                 "name": trigger_name,
                 "events": 0,
@@ -1467,6 +1909,7 @@ class TriggerRunner:
                     # If we don't, then the system requesting a trigger be removed -
                     # which turns into CancelledError - results in a failure.
                     del self.triggers[trigger_id]
+                    self.trigger_step_stats.pop(trigger_id, None)
                     continue
                 except BaseException as e:
                     # This is potentially bad, so log it.
@@ -1493,6 +1936,7 @@ class TriggerRunner:
                     # TODO: better formatting of the exception?
                     self.failed_triggers.append((trigger_id, saved_exc))
                 del self.triggers[trigger_id]
+                self.trigger_step_stats.pop(trigger_id, None)
             await asyncio.sleep(0)
         return finished_ids
 
@@ -1509,10 +1953,21 @@ class TriggerRunner:
             tb = format_exception(type(exc), exc, exc.__traceback__) if exc else None
             failures_to_send.append((trigger_id, tb))
 
+        busy_time: dict[int, float] | None = None
+        if self.report_busy_time:
+            now = time.monotonic()
+            if now - self._last_busy_time_report >= _BUSY_TIME_REPORT_INTERVAL:
+                busy_time = {
+                    trigger_id: step_stats.wall_ms
+                    for trigger_id, step_stats in self.trigger_step_stats.items()
+                }
+                self._last_busy_time_report = now
+
         return messages.TriggerStateChanges(
             events=events_to_send if events_to_send else None,
             finished=finished_ids if finished_ids else None,
             failures=failures_to_send if failures_to_send else None,
+            busy_time=busy_time,
         )
 
     def sanitize_trigger_events(self, msg: messages.TriggerStateChanges) -> messages.TriggerStateChanges:
@@ -1541,6 +1996,7 @@ class TriggerRunner:
             events=events_to_send if events_to_send else None,
             finished=msg.finished,
             failures=msg.failures,
+            busy_time=msg.busy_time,
         )
 
     async def sync_state_to_supervisor(self, finished_ids: list[int]) -> None:
@@ -1556,6 +2012,10 @@ class TriggerRunner:
         if resp:
             self.to_create.extend(resp.to_create)
             self.to_cancel.extend(resp.to_cancel)
+            for trigger_id in resp.to_release or ():
+                if trigger_id in self.triggers:
+                    # Not a user action: the trigger carries on in another triggerer, so on_kill() must not run
+                    self.triggers[trigger_id]["task"].cancel()
             if resp.events_persisted:
                 self._shared_streams.confirm_persisted(resp.events_persisted)
 
@@ -1591,6 +2051,10 @@ class TriggerRunner:
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            if self.step_accounting:
+                lag_ms = max(time_elapsed - 0.1, 0.0) * 1000
+                self.loop_lag.record(lag_ms)
+                stats.timing("triggerer.loop_lag", lag_ms, tags=prune_dict({"team_name": self.team_name}))
             if time_elapsed > self.blocked_main_thread_warning_threshold:
                 await self.log.ainfo(
                     "Triggerer's async thread was blocked for %.2f seconds, "
@@ -1605,6 +2069,53 @@ class TriggerRunner:
                     tags=prune_dict({"team_name": self.team_name}),
                 )
 
+    def _on_blocking_step(self, trigger_id: int, name: str, classpath: str, duration_ms: float) -> None:
+        """Report a trigger which ran for longer than the blocked main thread threshold without awaiting."""
+        self.log.warning(
+            "Trigger %s blocked the async thread for %.2f ms without awaiting; it likely makes synchronous "
+            "calls",
+            name,
+            duration_ms,
+            trigger_id=trigger_id,
+            classpath=classpath,
+        )
+        stats.incr(
+            "triggers.blocking_step",
+            tags=prune_dict({"trigger_class": classpath, "team_name": self.team_name}),
+        )
+
+    def emit_step_accounting_metrics(self) -> None:
+        """Emit the time spent running the trigger classes which were busy the most since the last call."""
+        busy: dict[str, list[float]] = {}
+        for step_stats in self.trigger_step_stats.values():
+            wall_ms, cpu_ms = step_stats.take_window()
+            totals = busy.setdefault(step_stats.label, [0.0, 0.0])
+            totals[0] += wall_ms
+            totals[1] += cpu_ms
+        top = sorted(busy.items(), key=lambda item: -item[1][0])[:_STEP_ACCOUNTING_TOP_N]
+        for classpath, (wall_ms, cpu_ms) in top:
+            tags = prune_dict({"trigger_class": classpath, "team_name": self.team_name})
+            stats.gauge("triggerer.trigger_class_busy_time", wall_ms, tags=tags)
+            stats.gauge("triggerer.trigger_class_cpu_time", cpu_ms, tags=tags)
+
+    def step_accounting_summary(self) -> str:
+        """Render the event loop lag histogram, and the triggers which blocked the async thread the most."""
+        lag = self.loop_lag
+        lines = [
+            f"loop lag: count={lag.count} mean={lag.total_ms / lag.count if lag.count else 0.0:.2f}ms "
+            f"p50={lag.percentile(50):.2f}ms p95={lag.percentile(95):.2f}ms p99={lag.percentile(99):.2f}ms "
+            f"max={lag.max_ms:.2f}ms",
+            f"{'trigger':<60} {'steps':>10} {'wall ms':>12} {'cpu ms':>12} {'max step ms':>12}",
+        ]
+        top = sorted(self.trigger_step_stats.items(), key=lambda item: -item[1].wall_ms)
+        for trigger_id, step_stats in top[:_STEP_ACCOUNTING_TOP_N]:
+            name = self.triggers[trigger_id]["name"] if trigger_id in self.triggers else f"ID {trigger_id}"
+            lines.append(
+                f"{name:<60} {step_stats.steps:>10} {step_stats.wall_ms:>12.2f} {step_stats.cpu_ms:>12.2f} "
+                f"{step_stats.max_step_ms:>12.2f}"
+            )
+        return "\n".join(lines)
+
     async def run_trigger(
         self,
         trigger_id: int,
@@ -1641,6 +2152,8 @@ class TriggerRunner:
         if isinstance(trigger, BaseEventTrigger):
             event_trigger = trigger
         shared_key: Hashable | None = None
+        # Task triggers identical to other running ones share a single run of them, see CoalescedTriggerRuns
+        coalesce_key: Hashable | None = None
 
         with _make_trigger_span(ti=trigger.task_instance, trigger_id=trigger_id, name=name) as span:
             try:
@@ -1662,6 +2175,10 @@ class TriggerRunner:
                         trigger_id=trigger_id, trigger=event_trigger, key=shared_key
                     )
                     event_stream = event_trigger.filter_shared_stream(shared_stream)
+                elif ti is not None and (coalesce_key := CoalescedTriggerRuns.key_for(trigger)) is not None:
+                    event_stream = self._coalesced_runs.subscribe(
+                        trigger_id, trigger, coalesce_key, step_stats=self.trigger_step_stats.get(trigger_id)
+                    )
                 else:
                     event_stream = trigger.run()
 
@@ -1692,10 +2209,14 @@ class TriggerRunner:
                         await self.log.aerror("Trigger cancelled due to timeout")
                         span.set_status(Status(StatusCode.ERROR), description=str(e))
                         raise
-                if e.args and e.args[0] == _USER_ACTION_CANCEL_MSG:
+                # A coalesced trigger is only killed with the last of the identical triggers waiting for it
+                kill_target: BaseTrigger | None = trigger
+                if coalesce_key is not None:
+                    kill_target = self._coalesced_runs.trigger_to_kill(trigger_id, coalesce_key)
+                if e.args and e.args[0] == _USER_ACTION_CANCEL_MSG and kill_target is not None:
                     await self.log.ainfo("Trigger cancelled by user action, invoking on_kill", name=name)
                     try:
-                        await asyncio.wait_for(trigger.on_kill(), timeout=_ON_CANCEL_TIMEOUT)
+                        await asyncio.wait_for(kill_target.on_kill(), timeout=_ON_CANCEL_TIMEOUT)
                     except TimeoutError:
                         await self.log.awarning("on_kill() timed out", timeout=_ON_CANCEL_TIMEOUT, name=name)
                     except asyncio.CancelledError:
@@ -1726,8 +2247,12 @@ class TriggerRunner:
                             trigger_id=trigger_id,
                             key=shared_key,
                         )
-                with suppress(Exception):
-                    await trigger.cleanup()
+                if coalesce_key is not None:
+                    # The shared run cleans its trigger up once it stops
+                    await self._coalesced_runs.unsubscribe(trigger_id, coalesce_key)
+                else:
+                    with suppress(Exception):
+                        await trigger.cleanup()
 
                 await self.log.ainfo("trigger completed", name=name)
 
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import hashlib
+import operator
 import time
 from collections.abc import MutableMapping
 from contextlib import nullcontext
@@ -25,9 +26,10 @@ from threading import RLock
 from typing import TYPE_CHECKING, Any, NamedTuple
 from uuid import UUID
 
+import structlog
 from cachetools import LRUCache, TTLCache
 from sqlalchemy import String, select
-from sqlalchemy.orm import Mapped, joinedload, mapped_column
+from sqlalchemy.orm import Mapped, joinedload, mapped_column, undefer
 
 from airflow._shared.observability.metrics import stats
 from airflow.configuration import conf
@@ -43,6 +45,8 @@ if TYPE_CHECKING:
     from airflow.models.serialized_dag import SerializedDagModel
     from airflow.serialization.definitions.dag import SerializedDAG
 
+log = structlog.get_logger(__name__)
+
 
 class _CacheEntry(NamedTuple):
     """A cached deserialized DAG plus the metadata needed to detect staleness on lookup."""
@@ -56,15 +60,41 @@ class _CacheEntry(NamedTuple):
     # different clock than the dag processor's write throttle, worst-case staleness is bounded to
     # roughly one-to-two update intervals -- still bounded, vs. the previous unbounded-until-restart.
     last_validated: float
+    # Estimated size of the DAG in bytes; only computed when the cache is bounded by size.
+    size: int = 0
+
+
+class _SizedLRUCache(LRUCache):
+    """LRU cache of :class:`_CacheEntry` bounded by the total estimated size of the cached DAGs."""
+
+    def __init__(self, maxsize: int, stats_prefix: str) -> None:
+        super().__init__(maxsize=maxsize, getsizeof=operator.attrgetter("size"))
+        self._stats_prefix = stats_prefix
+
+    def popitem(self):
+        item = super().popitem()
+        stats.incr(f"{self._stats_prefix}.cache_eviction")
+        return item
+
+
+def _estimate_dag_size(serdag: SerializedDagModel) -> int:
+    """
+    Estimate the memory used by the DAG deserialized from ``serdag``, in bytes.
+
+    This is the length of its payload as stored in the database, so the DAG does not have to be
+    serialized again: the deserialized objects take more memory than that, but roughly in proportion,
+    which is what matters to compare DAGs against each other and a budget.
+    """
+    return serdag._data_size or 0
 
 
 class DBDagBag:
     """
     Internal class for retrieving dags from the database.
 
-    Optionally supports LRU+TTL caching when cache_size is provided.
-    The scheduler uses this without caching, while the API server can
-    enable caching via configuration.
+    Optionally supports LRU+TTL caching when cache_size is provided, or LRU caching bounded by the
+    estimated size of the cached DAGs when cache_max_bytes is provided. The API server enables the
+    former and the scheduler the latter via configuration; both are unbounded by default.
 
     :meta private:
     """
@@ -74,6 +104,9 @@ class DBDagBag:
         load_op_links: bool = True,
         cache_size: int | None = None,
         cache_ttl: int | None = None,
+        cache_max_bytes: int | None = None,
+        stats_prefix: str = "api_server.dag_bag",
+        lazy_tasks: bool = False,
     ) -> None:
         """
         Initialize DBDagBag.
@@ -81,15 +114,28 @@ class DBDagBag:
         :param load_op_links: Should the extra operator link be loaded when de-serializing the DAG?
         :param cache_size: Size of LRU cache. If None or 0, uses unbounded dict (no eviction).
         :param cache_ttl: Time-to-live for cache entries in seconds. If None or 0, no TTL (LRU only).
+        :param cache_max_bytes: Budget for the estimated size of the cached DAGs, in bytes. If set
+            and > 0, least recently used DAGs are evicted to stay within it, and cache_size and
+            cache_ttl are ignored.
+        :param stats_prefix: Prefix of the cache metrics emitted when caching is enabled.
+        :param lazy_tasks: Deserialize the tasks of a DAG only when they are first accessed, so
+            requests that only need a few tasks of a large DAG do not deserialize all of them.
         """
         self.load_op_links = load_op_links
+        self.lazy_tasks = lazy_tasks
         self._dags: MutableMapping[UUID | str, _CacheEntry] = {}
         self._use_cache = False
+        self._size_bounded = False
+        self._stats_prefix = stats_prefix
 
         self._revalidation_interval = conf.getint("core", "min_serialized_dag_update_interval")
 
+        if cache_max_bytes and cache_max_bytes > 0:
+            self._dags = _SizedLRUCache(maxsize=cache_max_bytes, stats_prefix=stats_prefix)
+            self._use_cache = True
+            self._size_bounded = True
         # Initialize bounded cache if cache_size is provided and > 0
-        if cache_size and cache_size > 0:
+        elif cache_size and cache_size > 0:
             if cache_ttl and cache_ttl > 0:
                 self._dags = TTLCache(maxsize=cache_size, ttl=cache_ttl)
             else:
@@ -104,16 +150,38 @@ class DBDagBag:
     def _read_dag(self, serdag: SerializedDagModel) -> SerializedDAG | None:
         """Read and cache a SerializedDAG (with its ``dag_hash`` for staleness detection)."""
         serdag.load_op_links = self.load_op_links
+        serdag.lazy_tasks = self.lazy_tasks
         dag = serdag.dag
         if not dag:
             return None
+        size = _estimate_dag_size(serdag) if self._size_bounded else 0
         with self._lock:
-            self._dags[serdag.dag_version_id] = _CacheEntry(dag, serdag.dag_hash, time.monotonic())
+            try:
+                self._dags[serdag.dag_version_id] = _CacheEntry(dag, serdag.dag_hash, time.monotonic(), size)
+            except ValueError:
+                # Larger than the whole budget: serve it, but do not cache it.
+                log.warning(
+                    "Serialized Dag is larger than the Dag cache budget, not caching it",
+                    dag_id=serdag.dag_id,
+                    size=size,
+                )
             cache_size = len(self._dags)
+            cache_bytes = self._dags.currsize if isinstance(self._dags, _SizedLRUCache) else 0
         if self._use_cache:
-            stats.gauge("api_server.dag_bag.cache_size", cache_size, rate=0.1)
+            stats.gauge(f"{self._stats_prefix}.cache_size", cache_size, rate=0.1)
+        if self._size_bounded:
+            stats.gauge(f"{self._stats_prefix}.cache_bytes", cache_bytes, rate=0.1)
         return dag
 
+    def _serialized_dag_loader(self):
+        """Return the loader option of the serialized DAG of a version, with its size when it is needed."""
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        loader = joinedload(DagVersion.serialized_dag)
+        if self._size_bounded:
+            loader = loader.undefer(SerializedDagModel._data_size)
+        return loader
+
     @staticmethod
     def _current_dag_hash(version_id: UUID | str, session: Session) -> str | None:
         """Return the current ``dag_hash`` of the serialized DAG for ``version_id``, or None."""
@@ -134,7 +202,7 @@ class DBDagBag:
             # cannot have gone stale yet -- serve it without touching the DB.
             if now - cached.last_validated < self._revalidation_interval:
                 if self._use_cache:
-                    stats.incr("api_server.dag_bag.cache_hit")
+                    stats.incr(f"{self._stats_prefix}.cache_hit")
                 return cached.dag
             # Past the window: a version may have been updated in place (same dag_version_id, new
             # content + new dag_hash) by SerializedDagModel.write_dag, so confirm the cached copy
@@ -149,13 +217,13 @@ class DBDagBag:
                     if current is not None and current.dag_hash == cached.dag_hash:
                         self._dags[version_id] = current._replace(last_validated=now)
                 if self._use_cache:
-                    stats.incr("api_server.dag_bag.cache_hit")
+                    stats.incr(f"{self._stats_prefix}.cache_hit")
                 return cached.dag
             # Stale (updated in place) or the version no longer exists: drop and reload below.
             with self._lock:
                 self._dags.pop(version_id, None)
 
-        dag_version = session.get(DagVersion, version_id, options=[joinedload(DagVersion.serialized_dag)])
+        dag_version = session.get(DagVersion, version_id, options=[self._serialized_dag_loader()])
         if not dag_version:
             return None
         if not (serdag := dag_version.serialized_dag):
@@ -169,9 +237,9 @@ class DBDagBag:
         if self._use_cache:
             with self._lock:
                 if (cached := self._dags.get(version_id)) is not None:
-                    stats.incr("api_server.dag_bag.cache_hit")
+                    stats.incr(f"{self._stats_prefix}.cache_hit")
                     return cached.dag
-            stats.incr("api_server.dag_bag.cache_miss")
+            stats.incr(f"{self._stats_prefix}.cache_miss")
         return self._read_dag(serdag)
 
     def get_dag(self, version_id: UUID | str, session: Session) -> SerializedDAG | None:
@@ -190,6 +258,7 @@ class DBDagBag:
         if not dag_version or not (serdag := dag_version.serialized_dag):
             return None
         serdag.load_op_links = self.load_op_links
+        serdag.lazy_tasks = self.lazy_tasks
         return serdag
 
     def clear_cache(self) -> int:
@@ -203,8 +272,8 @@ class DBDagBag:
             self._dags.clear()
 
         if self._use_cache:
-            stats.incr("api_server.dag_bag.cache_clear")
-            stats.gauge("api_server.dag_bag.cache_size", 0)
+            stats.incr(f"{self._stats_prefix}.cache_clear")
+            stats.gauge(f"{self._stats_prefix}.cache_size", 0)
         return count
 
     @staticmethod
@@ -231,6 +300,7 @@ class DBDagBag:
 
         for sdm in session.scalars(select(SerializedDagModel)):
             sdm.load_op_links = self.load_op_links
+            sdm.lazy_tasks = self.lazy_tasks
             if dag := sdm.dag:
                 yield dag
 
@@ -238,7 +308,11 @@ class DBDagBag:
         """Get the latest version of a dag by its id."""
         from airflow.models.serialized_dag import SerializedDagModel
 
-        if not (serdag := SerializedDagModel.get(dag_id, session=session)):
+        query = SerializedDagModel.latest_item_select_object(dag_id)
+        if self._size_bounded:
+            # Load the size with the serialized DAG, rather than with a query of its own when caching it
+            query = query.options(undefer(SerializedDagModel._data_size))
+        if not (serdag := session.scalar(query)):
             return None
         return self._read_dag(serdag)
 
@@ -21,8 +21,10 @@ import itertools
 import logging
 import os
 import re
+import threading
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast, overload
 from uuid import UUID
@@ -47,6 +49,7 @@ from sqlalchemy import (
     and_,
     case,
     func,
+    insert,
     not_,
     or_,
     text,
@@ -66,6 +69,7 @@ from sqlalchemy.orm import (
     synonym,
     validates,
 )
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy.sql.expression import false, select
 from sqlalchemy.sql.functions import coalesce
@@ -94,6 +98,7 @@ from airflow.models.tasklog import LogTemplate
 from airflow.models.taskmap import TaskMap
 from airflow.serialization.definitions.deadline import SerializedReferenceModels
 from airflow.serialization.definitions.notset import NOTSET, ArgNotSet, is_arg_set
+from airflow.serialization.definitions.topology import DagTopology
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_states import SCHEDULEABLE_STATES
 from airflow.utils.helpers import chunks, is_container, prune_dict
@@ -126,6 +131,7 @@ if TYPE_CHECKING:
     from airflow.sdk import DAG as SDKDAG
     from airflow.serialization.definitions.dag import SerializedDAG
     from airflow.serialization.definitions.mappedoperator import Operator
+    from airflow.ti_deps.deps.trigger_rule_dep import UpstreamStateCounts
     from airflow.timetables.base import Timetable
 
     CreatedTasks = TypeVar("CreatedTasks", Iterator["dict[str, Any]"], Iterator[TI])
@@ -139,6 +145,24 @@ log = structlog.get_logger(__name__)
 
 tracer = trace.get_tracer(__name__)
 
+_deferred_notifications = threading.local()
+
+
+@contextmanager
+def defer_dagrun_state_notifications() -> Generator[list[tuple[int, str]], None, None]:
+    """
+    Collect the DagRun state change notifications of the current thread instead of calling listeners.
+
+    Yields the list of ``(dag_run_id, msg)`` pairs the caller is responsible for sending, e.g. from the thread
+    listeners are expected to be called on once the changes are committed.
+    """
+    notifications: list[tuple[int, str]] = []
+    _deferred_notifications.notifications = notifications
+    try:
+        yield notifications
+    finally:
+        del _deferred_notifications.notifications
+
 
 class TISchedulingDecision(NamedTuple):
     """Type of return for DagRun.task_instance_scheduling_decisions."""
@@ -1173,21 +1197,7 @@ class DagRun(Base, LoggingMixin):
         Teardown tasks by default are not considered for the purpose of dag run state.  But
         users may enable such consideration with on_failure_fail_dagrun.
         """
-
-        def is_effective_leaf(task):
-            for down_task_id in task.downstream_task_ids:
-                down_task = dag.get_task(down_task_id)
-                if not down_task.is_teardown or down_task.on_failure_fail_dagrun:
-                    # we found a down task that is not ignorable; not a leaf
-                    return False
-            # we found no ignorable downstreams
-            # evaluate whether task is itself ignorable
-            return not task.is_teardown or task.on_failure_fail_dagrun
-
-        leaf_task_ids = {x.task_id for x in dag.tasks if is_effective_leaf(x)}
-        if not leaf_task_ids:
-            # can happen if dag is exclusively teardown tasks
-            leaf_task_ids = {x.task_id for x in dag.tasks if not x.downstream_list}
+        leaf_task_ids = DagTopology.of(dag).leaf_task_ids
         leaf_tis = {ti for ti in tis if ti.task_id in leaf_task_ids if ti.state != TaskInstanceState.REMOVED}
         return leaf_tis
 
@@ -1465,16 +1475,24 @@ class DagRun(Base, LoggingMixin):
                 else:
                     yield ti
 
-        tis = list(_filter_tis_and_exclude_removed(self.get_dag(), tis))
+        dag = self.get_dag()
+        tis = list(_filter_tis_and_exclude_removed(dag, tis))
 
         unfinished_tis = [t for t in tis if t.state in State.unfinished]
         finished_tis = [t for t in tis if t.state in State.finished]
         if unfinished_tis:
+            from airflow.ti_deps.deps.trigger_rule_dep import UpstreamStateCounts
+
             schedulable_tis = [ut for ut in unfinished_tis if ut.state in SCHEDULEABLE_STATES]
             self.log.debug("number of scheduleable tasks for %s: %s task(s)", self, len(schedulable_tis))
             schedulable_tis, changed_tis, expansion_happened = self._get_ready_tis(
                 schedulable_tis,
                 finished_tis,
+                # All the task instances of the run are loaded anyway; counting them once here saves the
+                # trigger rules from querying the upstream counts of every schedulable task instance.
+                upstream_state_counts=(
+                    UpstreamStateCounts.build(self, DagTopology.of(dag), tis) if schedulable_tis else None
+                ),
                 session=session,
             )
 
@@ -1498,6 +1516,10 @@ class DagRun(Base, LoggingMixin):
         )
 
     def notify_dagrun_state_changed(self, msg: str):
+        deferred = getattr(_deferred_notifications, "notifications", None)
+        if deferred is not None:
+            deferred.append((self.id, msg))
+            return
         try:
             if self.state == DagRunState.RUNNING:
                 get_listener_manager().hook.on_dag_run_running(dag_run=self, msg=msg)
@@ -1631,6 +1653,7 @@ class DagRun(Base, LoggingMixin):
         schedulable_tis: list[TI],
         finished_tis: list[TI],
         session: Session,
+        upstream_state_counts: UpstreamStateCounts | None = None,
     ) -> tuple[list[TI], bool, bool]:
         old_states: dict[TaskInstanceKey, Any] = {}
         ready_tis: list[TI] = []
@@ -1646,6 +1669,7 @@ class DagRun(Base, LoggingMixin):
             flag_upstream_failed=True,
             ignore_unmapped_tasks=True,  # Ignore this Dep, as we will expand it if we can.
             finished_tis=finished_tis,
+            upstream_state_counts=upstream_state_counts,
         )
 
         def _expand_mapped_task_if_needed(ti: TI) -> Iterable[TI] | None:
@@ -1685,6 +1709,9 @@ class DagRun(Base, LoggingMixin):
         expansion_happened = False
         # Set of task ids for which was already done _revise_map_indexes_if_mapped
         revised_map_index_task_ids: set[str] = set()
+        # Only mapped tasks and tasks in a mapped task group are expanded or revised, so the others skip
+        # the per-task lookups (and queries) both steps start with.
+        expanding_task_ids = DagTopology.of(self.get_dag()).expanding_task_ids
         for schedulable in itertools.chain(schedulable_tis, additional_tis):
             if TYPE_CHECKING:
                 assert isinstance(schedulable.task, Operator)
@@ -1699,7 +1726,8 @@ class DagRun(Base, LoggingMixin):
             # expanded before executed. Also see _revise_map_indexes_if_mapped
             # docstring for additional information.
             new_tis = None
-            if schedulable.map_index < 0:
+            needs_expansion = schedulable.task_id in expanding_task_ids
+            if needs_expansion and schedulable.map_index < 0:
                 new_tis = _expand_mapped_task_if_needed(schedulable)
                 if new_tis is not None:
                     additional_tis.extend(new_tis)
@@ -1711,7 +1739,7 @@ class DagRun(Base, LoggingMixin):
             if new_tis is None and schedulable.state in SCHEDULEABLE_STATES:
                 # It's enough to revise map index once per task id,
                 # checking the map index for each mapped task significantly slows down scheduling
-                if schedulable.task.task_id not in revised_map_index_task_ids:
+                if needs_expansion and schedulable.task.task_id not in revised_map_index_task_ids:
                     revised_tis = self._revise_map_indexes_if_mapped(
                         schedulable.task, dag_version_id=schedulable.dag_version_id, session=session
                     )
@@ -1996,14 +2024,9 @@ class DagRun(Base, LoggingMixin):
 
             def create_ti_mapping(task: Operator, indexes: Iterable[int]) -> Iterator[dict[str, Any]]:
                 created_counts[task.task_type] += 1
-                for map_index in indexes:
-                    yield TI.insert_mapping(
-                        self.run_id,
-                        task,
-                        map_index=map_index,
-                        dag_version_id=dag_version_id,
-                        dag_run=self,
-                    )
+                return TI.insert_mappings(
+                    self.run_id, task, indexes, dag_version_id=dag_version_id, dag_run=self
+                )
 
             creator = create_ti_mapping
 
@@ -2076,7 +2099,7 @@ class DagRun(Base, LoggingMixin):
         run_id = self.run_id
         try:
             if hook_is_noop:
-                session.bulk_insert_mappings(TI.__mapper__, tasks)
+                _insert_task_instances(cast("Iterator[dict[str, Any]]", tasks), session=session)
             else:
                 session.bulk_save_objects(tasks)
 
@@ -2114,6 +2137,7 @@ class DagRun(Base, LoggingMixin):
         """
         from airflow.models.expandinput import NotFullyPopulated
         from airflow.serialization.definitions.mappedoperator import get_mapped_ti_count
+        from airflow.settings import task_instance_mutation_hook
 
         try:
             total_length = get_mapped_ti_count(task, self.run_id, session=session)
@@ -2145,16 +2169,51 @@ class DagRun(Base, LoggingMixin):
             )
             session.flush()
 
+        new_indexes = [index for index in range(total_length) if index not in existing_indexes]
+        if not new_indexes:
+            return []
+        if getattr(task_instance_mutation_hook, "is_noop", False):
+            return self._insert_mapped_tis(task, new_indexes, dag_version_id=dag_version_id, session=session)
+
         new_tis: list[TI] = []
-        for index in range(total_length):
-            if index in existing_indexes:
-                continue
+        for index in new_indexes:
             ti = TI(task, run_id=self.run_id, map_index=index, state=None, dag_version_id=dag_version_id)
             self.log.debug("Expanding TIs upserted %s", ti)
             _add_and_prime_mapped_ti(ti, task, self, session=session)
             new_tis.append(ti)
-        if new_tis:
-            session.flush()
+        session.flush()
+        return new_tis
+
+    def _insert_mapped_tis(
+        self, task: Operator, map_indexes: list[int], *, dag_version_id: UUID | None, session: Session
+    ) -> list[TI]:
+        """
+        Bulk insert the task instances of ``task`` at ``map_indexes`` and load them back.
+
+        This bypasses the ORM unit of work, which matters when a mapped task grows by thousands of
+        task instances; it is only used when the task instance mutation hook is a no-op.
+        """
+        self.log.debug("Expanding %d TIs of %s with a bulk insert", len(map_indexes), task.task_id)
+        _insert_task_instances(
+            TI.insert_mappings(self.run_id, task, map_indexes, dag_version_id=dag_version_id, dag_run=self),
+            session=session,
+        )
+        new_indexes = set(map_indexes)
+        new_tis = [
+            ti
+            for ti in session.scalars(
+                select(TI).where(
+                    TI.dag_id == self.dag_id,
+                    TI.task_id == task.task_id,
+                    TI.run_id == self.run_id,
+                    TI.map_index >= min(map_indexes),
+                )
+            )
+            if ti.map_index in new_indexes
+        ]
+        for ti in new_tis:
+            ti.task = task
+            set_committed_value(ti, "dag_run", self)
         return new_tis
 
     @classmethod
@@ -2402,6 +2461,22 @@ class DagRunNote(Base):
 
 _TI_CHUNK_SIZE = 500
 
+# Number of task instances inserted per statement by _insert_task_instances.
+_TI_INSERT_BATCH_SIZE = 1000
+
+
+def _insert_task_instances(mappings: Iterable[dict[str, Any]], *, session: Session) -> None:
+    """
+    Insert task instances from their insert mappings, in batches.
+
+    Each batch is a single ORM bulk INSERT, which SQLAlchemy renders as multi-row ``INSERT ... VALUES``
+    statements where the database supports it. Consuming ``mappings`` lazily keeps the memory needed
+    to create a very large number of task instances bounded by the batch size.
+    """
+    it = iter(mappings)
+    while batch := list(itertools.islice(it, _TI_INSERT_BATCH_SIZE)):
+        session.execute(insert(TI), batch)
+
 
 def clear_partition_runs(
     *,
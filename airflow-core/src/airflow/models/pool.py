@@ -18,10 +18,12 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+import time
+from collections import Counter
+from collections.abc import Collection, Sequence
 from typing import TYPE_CHECKING, Any, TypedDict
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text, func, select
+from sqlalchemy import Boolean, ForeignKey, Integer, String, Text, and_, func, or_, select
 from sqlalchemy.orm import Mapped, mapped_column
 
 from airflow._shared.observability.metrics.stats import normalize_name_for_stats
@@ -34,7 +36,9 @@ from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
     from sqlalchemy.orm.session import Session
-    from sqlalchemy.sql import Select
+    from sqlalchemy.sql import ColumnElement, Select
+
+    from airflow.models.taskinstance import TaskInstance
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +76,139 @@ class PoolStats(TypedDict):
     scheduled: int
 
 
+class PoolOccupancy:
+    """
+    In-memory ledger of pool slots held by task instances, by pool and state.
+
+    The scheduler keeps one of these when ``[scheduler] pool_occupancy_reconcile_interval`` is set, so
+    :meth:`Pool.slots_stats` does not have to aggregate over the ``task_instance`` table while holding
+    the pool row locks. The ledger is updated with the task instances the scheduler queues and the ones
+    its executors report as finished, and is periodically replaced with the database view by
+    :meth:`reconcile`.
+
+    Slots of task instances that moved from queued to running without the scheduler noticing stay
+    accounted as queued until the next reconciliation; only their sum is used to compute open slots.
+    Task instances become scheduled, and leave the deferred state when their trigger fires or finishes
+    them in the triggerer, without the scheduler being told. The ledger does not keep track of scheduled
+    slots, and these and the deferred slots of pools that count them as occupied are read from the
+    database by :meth:`untracked_slots` every time they are used, before the pool rows are locked.
+
+    Slots taken by another scheduler are not seen until the next reconciliation either, so with several
+    schedulers each can queue up to the open slots it sees, and pools can be over-subscribed in between.
+    """
+
+    STATES = EXECUTION_STATES | {TaskInstanceState.DEFERRED}
+
+    def __init__(self):
+        self.slots: Counter[tuple[str, TaskInstanceState]] = Counter()
+        self.loaded_at: float | None = None
+        self._uncommitted: list[tuple[str, int]] = []
+
+    @staticmethod
+    def aggregate(*where: ColumnElement[bool], session: Session) -> Counter[tuple[str, TaskInstanceState]]:
+        """Sum the pool slots of the task instances matching ``where``, by pool and state."""
+        from airflow.models.taskinstance import TaskInstance  # Avoid circular import
+
+        slots: Counter[tuple[str, TaskInstanceState]] = Counter()
+        state_count_by_pool = session.execute(
+            select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
+            .where(*where)
+            .group_by(TaskInstance.pool, TaskInstance.state)
+        )
+        for pool_name, state, decimal_count in state_count_by_pool:
+            # Some databases return decimal.Decimal here.
+            slots[(pool_name, TaskInstanceState(state))] = int(decimal_count)
+        return slots
+
+    def load(self, session: Session) -> None:
+        from airflow.models.taskinstance import TaskInstance  # Avoid circular import
+
+        self.slots = self.aggregate(TaskInstance.state.in_(self.STATES), session=session)
+        self.loaded_at = time.monotonic()
+
+    def reconcile(self, session: Session) -> int:
+        """
+        Replace the ledger with a fresh view from the database.
+
+        :return: The drift, i.e. the sum of absolute differences between the ledger and the database.
+        """
+        fresh = PoolOccupancy()
+        fresh.load(session=session)
+        drift = sum(abs(self.slots[key] - fresh.slots[key]) for key in self.slots.keys() | fresh.slots.keys())
+        self.slots = fresh.slots
+        self.loaded_at = fresh.loaded_at
+        self._uncommitted.clear()
+        return drift
+
+    def untracked_slots(self, session: Session) -> Counter[tuple[str, TaskInstanceState]]:
+        """
+        Read the slots the ledger cannot keep track of from the database.
+
+        These are the scheduled slots of all pools, and the deferred slots of the pools that include
+        them in their occupied slots.
+        """
+        from airflow.models.taskinstance import TaskInstance  # Avoid circular import
+
+        return self.aggregate(
+            or_(
+                TaskInstance.state == TaskInstanceState.SCHEDULED,
+                and_(
+                    TaskInstance.state == TaskInstanceState.DEFERRED,
+                    TaskInstance.pool.in_(select(Pool.pool).where(Pool.include_deferred)),
+                ),
+            ),
+            session=session,
+        )
+
+    def record_queued(self, ti: TaskInstance) -> None:
+        """
+        Account for a scheduled task instance the scheduler is about to move to queued.
+
+        The change is kept by :meth:`commit`, or undone by :meth:`rollback`.
+        """
+        self.slots[(ti.pool, TaskInstanceState.QUEUED)] += ti.pool_slots
+        self._uncommitted.append((ti.pool, ti.pool_slots))
+
+    def commit(self) -> None:
+        """Keep the task instances recorded as queued, once the transaction queueing them committed."""
+        self._uncommitted.clear()
+
+    def rollback(self) -> None:
+        """Undo the task instances recorded as queued, when the transaction queueing them rolled back."""
+        for pool_name, count in reversed(self._uncommitted):
+            self._release(pool_name, count, TaskInstanceState.QUEUED)
+        self._uncommitted.clear()
+
+    def record_finished(self, ti: TaskInstance) -> None:
+        """
+        Release the slots of a task instance whose executor reported that it finished.
+
+        The task instance state is the one it ends up with after the event was handled, e.g. failed for
+        a task instance killed externally. A task instance that is still queued or running (e.g. it was
+        requeued) keeps its slots; a deferred one moves them to the deferred bucket.
+        """
+        if ti.state in EXECUTION_STATES:
+            return
+        self._release(ti.pool, ti.pool_slots, TaskInstanceState.QUEUED, TaskInstanceState.RUNNING)
+        if ti.state == TaskInstanceState.DEFERRED:
+            self.slots[(ti.pool, TaskInstanceState.DEFERRED)] += ti.pool_slots
+
+    def _release(self, pool_name: str, count: int, *states: TaskInstanceState) -> None:
+        # Take the slots from the given states in order, never letting a bucket go negative:
+        # the ledger may not have seen the task instance enter that state.
+        remaining = count
+        for state in states:
+            key = (pool_name, state)
+            taken = min(remaining, self.slots[key])
+            if taken == self.slots[key]:
+                self.slots.pop(key, None)
+            else:
+                self.slots[key] -= taken
+            remaining -= taken
+            if not remaining:
+                break
+
+
 class Pool(Base):
     """the class to get Pool info."""
 
@@ -185,6 +322,7 @@ class Pool(Base):
     def slots_stats(
         *,
         lock_rows: bool = False,
+        occupancy: PoolOccupancy | None = None,
         session: Session = NEW_SESSION,
     ) -> dict[str, PoolStats]:
         """
@@ -195,6 +333,7 @@ class Pool(Base):
         OperationalError.
 
         :param lock_rows: Should we attempt to obtain a row-level lock on all the Pool rows returns
+        :param occupancy: Ledger of occupied slots to use instead of aggregating over task instances
         :param session: SQLAlchemy ORM Session
         """
         from airflow.models.taskinstance import TaskInstance  # Avoid circular import
@@ -202,6 +341,10 @@ class Pool(Base):
         pools: dict[str, PoolStats] = {}
         pool_includes_deferred: dict[str, bool] = {}
 
+        if occupancy is not None:
+            # Read before locking the pool rows, so the locks are not held while aggregating.
+            untracked_slots = occupancy.untracked_slots(session=session)
+
         # The below type annotation is acceptable on SQLA2.1, but not on 2.0
         query: Select[str, int, bool] = select(Pool.pool, Pool.slots, Pool.include_deferred)  # type: ignore[type-arg]
 
@@ -216,21 +359,22 @@ class Pool(Base):
             )
             pool_includes_deferred[pool_name] = include_deferred
 
-        allowed_execution_states = EXECUTION_STATES | {
-            TaskInstanceState.DEFERRED,
-            TaskInstanceState.SCHEDULED,
-        }
-        state_count_by_pool = session.execute(
-            select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
-            .filter(TaskInstance.state.in_(allowed_execution_states))
-            .group_by(TaskInstance.pool, TaskInstance.state)
-        )
+        if occupancy is None:
+            slots = PoolOccupancy.aggregate(
+                TaskInstance.state.in_(PoolOccupancy.STATES | {TaskInstanceState.SCHEDULED}), session=session
+            )
+        else:
+            slots = Counter(
+                {
+                    (pool_name, state): count
+                    for (pool_name, state), count in occupancy.slots.items()
+                    if state != TaskInstanceState.DEFERRED or not pool_includes_deferred.get(pool_name)
+                }
+            )
+            slots.update(untracked_slots)
 
         # calculate queued and running metrics
-        for pool_name, state, decimal_count in state_count_by_pool:
-            # Some databases return decimal.Decimal here.
-            count = int(decimal_count)
-
+        for (pool_name, state), count in slots.items():
             stats_dict: PoolStats | None = pools.get(pool_name)
             if not stats_dict:
                 continue
@@ -244,7 +388,7 @@ class Pool(Base):
             elif state == TaskInstanceState.SCHEDULED:
                 stats_dict["scheduled"] = count
             else:
-                raise AirflowException(f"Unexpected state. Expected values: {allowed_execution_states}.")
+                raise AirflowException(f"Unexpected state. Expected values: {PoolOccupancy.STATES}.")
 
         # calculate open metric
         for pool_name, stats_dict in pools.items():
@@ -21,15 +21,29 @@ from __future__ import annotations
 
 import logging
 import zlib
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 from uuid import UUID
 
+import msgspec
 import uuid6
-from sqlalchemy import JSON, ForeignKey, Index, LargeBinary, String, Uuid, exists, select, tuple_, update
+from sqlalchemy import (
+    JSON,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    Uuid,
+    cast,
+    exists,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.orm import Mapped, backref, foreign, mapped_column, relationship
+from sqlalchemy.orm import Mapped, backref, column_property, foreign, mapped_column, relationship
 from sqlalchemy.sql.expression import func, literal
 
 from airflow._shared.observability.metrics import stats
@@ -70,6 +84,45 @@ log = logging.getLogger(__name__)
 
 # If set to True, serialized DAGs is compressed before writing to DB,
 _COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
+# Format serialized DAGs are written to the DB in, "json" or "msgpack".
+_SERIALIZED_DAG_STORAGE_FORMAT = conf.get("core", "serialized_dag_storage_format", fallback="json")
+
+# Serialized DAGs stored as msgpack in the ``data_compressed`` column start with one of these markers. A
+# zlib stream never starts with either byte, so zlib-compressed JSON written before remains readable.
+_MSGPACK_MARKER = b"\x01"
+_MSGPACK_ZLIB_MARKER = b"\x02"
+
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def _stores_binary_data() -> bool:
+    """Whether serialized DAGs are written to the ``data_compressed`` column rather than ``data``."""
+    return _COMPRESS_SERIALIZED_DAGS or _SERIALIZED_DAG_STORAGE_FORMAT == "msgpack"
+
+
+def _encode_dag_data(dag_data: dict[str, Any]) -> tuple[dict[str, Any] | None, bytes | None]:
+    """Encode a serialized DAG into the (``data``, ``data_compressed``) columns, in the configured format."""
+    if not _stores_binary_data():
+        return dag_data, None
+    # partially ordered json data
+    dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
+    if _SERIALIZED_DAG_STORAGE_FORMAT == "msgpack":
+        # Round-trip through JSON so the stored data is exactly what JSON storage would read back.
+        payload = msgspec.msgpack.encode(msgspec.json.decode(dag_data_json))
+        if _COMPRESS_SERIALIZED_DAGS:
+            return None, _MSGPACK_ZLIB_MARKER + zlib.compress(payload)
+        return None, _MSGPACK_MARKER + payload
+    return None, zlib.compress(dag_data_json)
+
+
+def _decode_dag_data(data: bytes) -> dict[str, Any]:
+    """Decode a serialized DAG stored in the ``data_compressed`` column, in any storage format."""
+    marker = data[:1]
+    if marker == _MSGPACK_MARKER:
+        return _msgpack_decoder.decode(memoryview(data)[1:])
+    if marker == _MSGPACK_ZLIB_MARKER:
+        return _msgpack_decoder.decode(zlib.decompress(memoryview(data)[1:]))
+    return json.loads(zlib.decompress(data))
 
 
 class DagWriteMetadata(NamedTuple):
@@ -295,6 +348,8 @@ class SerializedDagModel(Base):
       to use a smaller interval such as 60
     * ``[core] compress_serialized_dags``:
       whether compressing the dag data to the Database.
+    * ``[core] serialized_dag_storage_format``:
+      whether the dag data is stored as JSON or msgpack.
 
     It is used by webserver to load dags
     because reading from database is lightweight compared to importing from files,
@@ -308,6 +363,10 @@ class SerializedDagModel(Base):
         "data", JSON().with_variant(JSONB, "postgresql"), nullable=True
     )
     _data_compressed: Mapped[bytes | None] = mapped_column("data_compressed", LargeBinary, nullable=True)
+    # Length of the stored payload, used to estimate the size of the DAG without serializing it again.
+    _data_size: Mapped[int | None] = column_property(
+        func.coalesce(func.length(_data_compressed), func.length(cast(_data, Text))), deferred=True
+    )
     created_at: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False, default=timezone.utcnow)
     last_updated: Mapped[datetime] = mapped_column(
         UtcDateTime, nullable=False, default=timezone.utcnow, onupdate=timezone.utcnow
@@ -344,6 +403,7 @@ class SerializedDagModel(Base):
     )
 
     load_op_links = True
+    lazy_tasks = False
     __table_args__ = (Index("idx_serialized_dag_dag_id_created_at", dag_id, created_at),)
 
     def __init__(self, dag: LazyDeserializedDAG) -> None:
@@ -351,18 +411,10 @@ class SerializedDagModel(Base):
         dag_data = dag.data
         self.dag_hash = SerializedDagModel.hash(dag_data)
 
-        # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
-
-        if _COMPRESS_SERIALIZED_DAGS:
-            self._data = None
-            self._data_compressed = zlib.compress(dag_data_json)
-        else:
-            self._data = dag_data
-            self._data_compressed = None
+        self._data, self._data_compressed = _encode_dag_data(dag_data)
 
         # serve as cache so no need to decompress and load, when accessing data field
-        # when COMPRESS_SERIALIZED_DAGS is True
+        # when the data is stored in the data_compressed column
         self.__data_cache: dict[Any, Any] | None = dag_data
 
     def __repr__(self) -> str:
@@ -790,6 +842,56 @@ class SerializedDagModel(Base):
         stats.incr("dag.serialization_writes", tags={"dag_id": dag.dag_id, "bundle_name": bundle_name})
         return True
 
+    @classmethod
+    @provide_session
+    def reencode_stored_dags(
+        cls,
+        *,
+        bundle_names: Collection[str] | None = None,
+        batch_size: int = 100,
+        session: Session = NEW_SESSION,
+    ) -> int:
+        """
+        Rewrite stored serialized DAGs in the configured storage format.
+
+        Serialized DAGs are only rewritten when they change, so after changing ``[core]
+        compress_serialized_dags`` or ``[core] serialized_dag_storage_format`` this converts the DAGs
+        stored before, including previous versions. The stored DAGs and their hashes are unchanged.
+
+        :param bundle_names: Only rewrite the DAGs of these bundles. All DAGs if *None*.
+        :param batch_size: Number of serialized DAGs loaded at once.
+        :param session: ORM Session
+
+        :returns: Number of serialized DAGs rewritten
+        """
+        query = select(cls.id)
+        if bundle_names is not None:
+            query = query.join(cls.dag_version).where(DagVersion.bundle_name.in_(bundle_names))
+        ids = session.scalars(query).all()
+
+        count = 0
+        for start in range(0, len(ids), batch_size):
+            rows = session.execute(
+                select(cls.id, cls._data, cls._data_compressed).where(
+                    cls.id.in_(ids[start : start + batch_size])
+                )
+            )
+            for row_id, data, data_compressed in rows:
+                dag_data = _decode_dag_data(data_compressed) if data_compressed else data
+                if not dag_data:
+                    continue
+                new_data, new_data_compressed = _encode_dag_data(dag_data)
+                if new_data_compressed == data_compressed and (new_data is None) == (data is None):
+                    continue
+                session.execute(
+                    update(cls)
+                    .where(cls.id == row_id)
+                    .values({cls._data: new_data, cls._data_compressed: new_data_compressed})
+                    .execution_options(synchronize_session=False)
+                )
+                count += 1
+        return count
+
     @classmethod
     def latest_item_select_object(cls, dag_id):
         from airflow.settings import engine
@@ -891,7 +993,7 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                self.__data_cache = _decode_dag_data(self._data_compressed)
             else:
                 self.__data_cache = self._data
 
@@ -907,7 +1009,7 @@ class SerializedDagModel(Base):
             data = json.loads(self.data)
         else:
             raise ValueError("invalid or missing serialized DAG data")
-        return DagSerialization.from_dict(data)
+        return DagSerialization.from_dict(data, lazy=self.lazy_tasks)
 
     @classmethod
     @provide_session
@@ -949,7 +1051,7 @@ class SerializedDagModel(Base):
         """
         load_json: Callable
         data_col_to_select: ColumnElement[Any] | InstrumentedAttribute[bytes | None]
-        if _COMPRESS_SERIALIZED_DAGS is False:
+        if not _stores_binary_data():
             dialect = get_dialect_name(session)
             if dialect in ["sqlite", "mysql"]:
                 data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
@@ -970,7 +1072,7 @@ class SerializedDagModel(Base):
             data_col_to_select = cls._data_compressed
 
             def load_json(deps_data):
-                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
+                return _decode_dag_data(deps_data)["dag"]["dag_dependencies"] if deps_data else []
 
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
@@ -24,7 +24,7 @@ import logging
 import math
 import warnings
 from collections import defaultdict
-from collections.abc import Callable, Collection, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, NamedTuple
 from urllib.parse import quote
@@ -96,7 +96,10 @@ from airflow.models.taskreschedule import TaskReschedule
 from airflow.models.xcom import XCOM_RETURN_KEY, LazyXComSelectSequence, XComModel
 from airflow.serialization.enums import stringify_encoding_keys
 from airflow.settings import task_instance_mutation_hook
-from airflow.task.priority_strategy import validate_and_load_priority_weight_strategy
+from airflow.task.priority_strategy import (
+    get_airflow_priority_weight_strategies,
+    validate_and_load_priority_weight_strategy,
+)
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_deps import REQUEUEABLE_DEPS, RUNNING_DEPS
 from airflow.ti_deps.deps.ready_to_reschedule import ReadyToRescheduleDep
@@ -767,17 +770,45 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
         """
         Insert mapping.
 
+        :meta private:
+        """
+        return next(
+            TaskInstance.insert_mappings(
+                run_id, task, (map_index,), dag_version_id=dag_version_id, dag_run=dag_run
+            )
+        )
+
+    @staticmethod
+    def insert_mappings(
+        run_id: str,
+        task: Operator,
+        map_indexes: Iterable[int],
+        *,
+        dag_version_id: UUID | None,
+        dag_run: DagRun,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Insert mappings for the task instances of one task, one per map index.
+
+        The attributes shared by all the task instances are computed once, including the priority
+        weight when it comes from one of the built-in strategies, which only depend on the task.
+
         :meta private:
         """
         weight_rule = task.weight_rule
         if not hasattr(weight_rule, "get_weight"):
             weight_rule = validate_and_load_priority_weight_strategy(weight_rule)
-        priority_weight = weight_rule.get_weight(
-            TaskInstance(task=task, run_id=run_id, map_index=map_index, dag_version_id=dag_version_id)
-        )
-        context_carrier = new_task_run_carrier(dag_run.context_carrier)
 
-        return {
+        def get_weight(map_index: int) -> int:
+            # Computed from the task's weight rule by refresh_from_task.
+            ti = TaskInstance(task=task, run_id=run_id, map_index=map_index, dag_version_id=dag_version_id)
+            return ti.priority_weight
+
+        shared_priority_weight: int | None = None
+        if type(weight_rule) in get_airflow_priority_weight_strategies().values():
+            shared_priority_weight = get_weight(-1)
+
+        common = {
             "dag_id": task.dag_id,
             "task_id": task.task_id,
             "run_id": run_id,
@@ -787,18 +818,24 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
             "queue": task.queue,
             "pool": task.pool,
             "pool_slots": task.pool_slots,
-            "priority_weight": priority_weight,
             "run_as_user": task.run_as_user,
             "max_tries": task.retries,
             "executor": task.executor,
             "executor_config": task.executor_config,
             "operator": task.task_type,
             "custom_operator_name": getattr(task, "operator_name", None),
-            "map_index": map_index,
             "_task_display_property_value": task.task_display_name,
             "dag_version_id": dag_version_id,
-            "context_carrier": context_carrier,
         }
+        for map_index in map_indexes:
+            yield {
+                **common,
+                "map_index": map_index,
+                "priority_weight": (
+                    get_weight(map_index) if shared_priority_weight is None else shared_priority_weight
+                ),
+                "context_carrier": new_task_run_carrier(dag_run.context_carrier),
+            }
 
     @reconstructor
     def init_on_load(self) -> None:
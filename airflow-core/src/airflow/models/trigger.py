@@ -303,6 +303,87 @@ class Trigger(Base):
         if trigger.callback:
             trigger.callback.handle_event(event, session)
 
+    @classmethod
+    @provide_session
+    def submit_events(
+        cls, events: Iterable[tuple[int, TriggerEvent]], *, session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Fire a batch of events, as :meth:`submit_event` does for every one of them, in order.
+
+        The deferred task instances of all the triggers, and the triggers, are loaded with one query each,
+        and the task instances resumed by a plain :class:`TriggerEvent` are updated with one bulk statement
+        instead of one flush each. Events handled differently, e.g. task end events, and task instances which
+        cannot be resumed go through :func:`handle_event_submit` one by one.
+        """
+        events_by_trigger: dict[int, list[TriggerEvent]] = {}
+        for trigger_id, event in events:
+            events_by_trigger.setdefault(trigger_id, []).append(event)
+        if not events_by_trigger:
+            return
+
+        # Only the first event of a trigger resumes its task instances, the next ones find none deferred
+        plain_event_handler = handle_event_submit.dispatch(object)
+        resuming_events = {
+            trigger_id: trigger_events[0] for trigger_id, trigger_events in events_by_trigger.items()
+        }
+        fast_trigger_ids = {
+            trigger_id
+            for trigger_id, event in resuming_events.items()
+            if handle_event_submit.dispatch(type(event)) is plain_event_handler
+        }
+        deferred = (
+            TaskInstance.trigger_id.in_(resuming_events),
+            TaskInstance.state == TaskInstanceState.DEFERRED,
+        )
+        resumed: list[dict[str, Any]] = []
+        slow_ti_ids: list[Any] = []
+        for ti_id, trigger_id, next_kwargs_raw in session.execute(
+            select(TaskInstance.id, TaskInstance.trigger_id, TaskInstance.next_kwargs).where(*deferred)
+        ):
+            if trigger_id not in fast_trigger_ids:
+                slow_ti_ids.append(ti_id)
+                continue
+            try:
+                next_kwargs = _resumed_next_kwargs(next_kwargs_raw, resuming_events[trigger_id])
+            except Exception:
+                # handle_event_submit fails the task instance, reporting what went wrong
+                slow_ti_ids.append(ti_id)
+                continue
+            resumed.append({"id": ti_id, "next_kwargs": next_kwargs})
+        if resumed:
+            now = timezone.utcnow()
+            for values in resumed:
+                values.update(trigger_id=None, state=TaskInstanceState.SCHEDULED, scheduled_dttm=now)
+            session.execute(update(TaskInstance), resumed)
+        if slow_ti_ids:
+            for task_instance in session.scalars(
+                select(TaskInstance).where(TaskInstance.id.in_(slow_ti_ids), *deferred)
+            ):
+                handle_event_submit(
+                    resuming_events[task_instance.trigger_id], task_instance=task_instance, session=session
+                )
+
+        # Send the events to assets and callbacks
+        triggers = session.scalars(
+            select(cls)
+            .where(cls.id.in_(events_by_trigger))
+            .options(
+                selectinload(cls.asset_watchers).selectinload(AssetWatcherModel.asset),
+                selectinload(cls.callback),
+            )
+        )
+        for trigger in triggers:
+            for event in events_by_trigger[trigger.id]:
+                for asset in trigger.assets:
+                    AssetManager.register_asset_change(
+                        asset=asset.to_serialized(),
+                        extra={"from_trigger": True, "payload": event.payload},
+                        session=session,
+                    )
+                if trigger.callback:
+                    trigger.callback.handle_event(event, session)
+
     @classmethod
     @provide_session
     def submit_failure(cls, trigger_id, exc=None, *, session: Session = NEW_SESSION) -> None:
@@ -387,8 +468,6 @@ class Trigger(Base):
         health check threshold, and the queues and assigns unassigned triggers until that
         capacity is reached, or there are no more unassigned triggers.
         """
-        from airflow.jobs.job import Job  # To avoid circular import
-
         count = session.scalar(select(func.count(cls.id)).filter(cls.triggerer_id == triggerer_id))
         capacity -= count
 
@@ -400,11 +479,7 @@ class Trigger(Base):
             )
             return
 
-        alive_triggerer_ids = select(Job.id).where(
-            Job.end_date.is_(None),
-            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
-            Job.job_type == "TriggererJob",
-        )
+        alive_triggerer_ids = cls._alive_triggerer_ids(health_check_threshold)
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
@@ -425,6 +500,43 @@ class Trigger(Base):
 
         session.commit()
 
+    @staticmethod
+    def _alive_triggerer_ids(health_check_threshold) -> Select:
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        return select(Job.id).where(
+            Job.end_date.is_(None),
+            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+            Job.job_type == "TriggererJob",
+        )
+
+    @classmethod
+    @provide_session
+    def has_other_alive_triggerer(
+        cls, triggerer_id, health_check_threshold, *, session: Session = NEW_SESSION
+    ) -> bool:
+        """Return whether a triggerer other than the given one is alive to take over triggers."""
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        alive_triggerer_ids = cls._alive_triggerer_ids(health_check_threshold).where(Job.id != triggerer_id)
+        return bool(session.scalar(select(alive_triggerer_ids.exists())))
+
+    @classmethod
+    @provide_session
+    def release(cls, trigger_ids: Iterable[int], triggerer_id, *, session: Session = NEW_SESSION) -> None:
+        """
+        Unassign triggers from a triggerer, so that another triggerer can take them over.
+
+        Triggers that were assigned to another triggerer in the meantime are left alone.
+        """
+        session.execute(
+            update(cls)
+            .where(cls.id.in_(list(trigger_ids)), cls.triggerer_id == triggerer_id)
+            .values(triggerer_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+
     @classmethod
     def get_sorted_triggers(
         cls,
@@ -529,6 +641,15 @@ def _decode_next_kwargs(next_kwargs_raw: Any) -> dict[str, Any]:
     return next_kwargs
 
 
+def _resumed_next_kwargs(next_kwargs_raw: dict | None, event: TriggerEvent) -> dict:
+    """Return the serialized ``next_kwargs`` of a task instance resumed by ``event``, with its payload."""
+    from airflow.sdk.serde import serialize
+
+    next_kwargs = _decode_next_kwargs(next_kwargs_raw or {})
+    next_kwargs["event"] = event.payload
+    return serialize(next_kwargs)
+
+
 def _fail_unresumable_task_instance(
     task_instance: TaskInstance, reason: str, exc: BaseException, *, session: Session
 ) -> None:
@@ -54,6 +54,7 @@ from airflow.sdk.definitions.deadline import VariableInterval
 from airflow.serialization.decoders import decode_deadline_alert
 from airflow.serialization.definitions.deadline import DeadlineAlertFields, SerializedReferenceModels
 from airflow.serialization.definitions.param import SerializedParamsDict
+from airflow.serialization.definitions.topology import DagTopology
 from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
 from airflow.timetables.base import DagRunInfo, DataInterval, TimeRestriction
 from airflow.utils.helpers import prune_dict
@@ -63,7 +64,7 @@ from airflow.utils.types import DagRunType
 
 if TYPE_CHECKING:
     import datetime
-    from collections.abc import Collection, Iterable, Sequence
+    from collections.abc import Collection, Iterable, Mapping, Sequence
     from typing import Any, Literal
 
     from pendulum.tz.timezone import FixedTimezone, Timezone
@@ -194,7 +195,7 @@ class SerializedDAG:
         bundle_name: str,
         bundle_version: str | None,
         dags: Collection[DAG | LazyDeserializedDAG],
-        parse_duration: float | None = None,
+        parse_duration: float | Mapping[str, float | None] | None = None,
         *,
         session: Session = NEW_SESSION,
     ) -> None:
@@ -278,6 +279,11 @@ class SerializedDAG:
     def task_group_dict(self):
         return {k: v for k, v in self.task_group.get_task_group_dict().items() if k is not None}
 
+    @functools.cached_property
+    def topology(self) -> DagTopology:
+        """Integer-indexed topology of this DAG, built on first access and kept with the deserialized DAG."""
+        return DagTopology.build(self)
+
     def partial_subset(
         self,
         task_ids: str | Iterable[str],
@@ -297,6 +303,8 @@ class SerializedDAG:
         # the tasks anyway, so we copy the tasks manually later
         memo = {id(self.task_dict): None, id(self.task_group): None}
         dag = copy.deepcopy(self, memo)
+        # The subset has different tasks, so it must build its own topology.
+        dag.__dict__.pop("topology", None)
 
         if isinstance(task_ids, str):
             matched_tasks = [t for t in self.tasks if task_ids in t.task_id]
@@ -180,7 +180,10 @@ class SerializedTaskGroup(TaskGroupMixin, DAGNode):
             if not isinstance(node, SerializedTaskGroup):
                 return
             yield node.group_id, node
-            for child in node.children.values():
+            # The children of a lazily deserialized DAG's groups can list the child groups without
+            # deserializing the child tasks.
+            iter_task_groups = getattr(node.children, "iter_task_groups", node.children.values)
+            for child in iter_task_groups():
                 yield from build_map(child)
 
         return dict(build_map(self))
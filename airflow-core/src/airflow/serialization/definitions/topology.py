@@ -0,0 +1,262 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import attrs
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
+
+
+def _csr(edges: Iterable[Iterable[str]], indexes: dict[str, int]):
+    """Pack per-task relative ids into compressed sparse row (``indptr``, ``indices``) arrays."""
+    indptr = array("l", [0])
+    indices = array("l")
+    for relative_ids in edges:
+        indices.extend(sorted(indexes[r] for r in relative_ids if r in indexes))
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+class TopologyNode(NamedTuple):
+    """The part of a task a :class:`DagTopology` is built from."""
+
+    task_id: str
+    downstream_task_ids: Collection[str]
+    is_setup: bool
+    is_teardown: bool
+    on_failure_fail_dagrun: bool
+    needs_expansion: bool
+    task_group_id: str | None
+    mapped_task_group_id: str | None
+
+    @classmethod
+    def of(cls, task: Any) -> TopologyNode:
+        """Describe an operator, serialized or from the SDK."""
+        task_group = task.task_group
+        mapped_task_group = task.get_closest_mapped_task_group()
+        return cls(
+            task_id=task.task_id,
+            downstream_task_ids=task.downstream_task_ids,
+            is_setup=task.is_setup,
+            is_teardown=task.is_teardown,
+            on_failure_fail_dagrun=task.on_failure_fail_dagrun,
+            needs_expansion=task.is_mapped or mapped_task_group is not None,
+            task_group_id=task_group.group_id if task_group is not None else None,
+            mapped_task_group_id=mapped_task_group.group_id if mapped_task_group is not None else None,
+        )
+
+
+@attrs.define(eq=False, kw_only=True)
+class DagTopology:
+    """
+    Integer-indexed graph of a DAG, for the graph queries the scheduler runs repeatedly.
+
+    Tasks are numbered by their position in ``task_ids``; direct relatives are stored as CSR arrays
+    (the relatives of task ``i`` are ``indices[indptr[i]:indptr[i + 1]]``). Effective leaves, teardown
+    scopes and the closest mapped task group of every task are computed once when the topology is built,
+    and flat (transitive) relatives and relevant setups are memoized on first use.
+
+    A topology is built from the DAG structure only, so it stays valid for as long as that structure does;
+    :attr:`SerializedDAG.topology <airflow.serialization.definitions.dag.SerializedDAG.topology>` caches
+    one per deserialized DAG, i.e. per DAG version.
+    """
+
+    task_ids: tuple[str, ...]
+    indexes: dict[str, int]
+    upstream_indptr: array
+    upstream_indices: array
+    downstream_indptr: array
+    downstream_indices: array
+    task_group_ids: tuple[str | None, ...]
+    mapped_task_group_ids: tuple[str | None, ...]
+    setup_task_ids: frozenset[str]
+    teardown_task_ids: frozenset[str]
+    expanding_task_ids: frozenset[str]
+    """Tasks that need expansion: mapped tasks, and tasks in a mapped task group."""
+    leaf_task_ids: frozenset[str]
+    teardown_scopes: dict[str, frozenset[str]]
+
+    _flat_relative_ids: dict[tuple[int, bool], frozenset[str]] = attrs.field(
+        factory=dict, init=False, repr=False
+    )
+    _relevant_setup_ids: dict[int, frozenset[str]] = attrs.field(factory=dict, init=False, repr=False)
+
+    @classmethod
+    def build(cls, dag: Any) -> DagTopology:
+        """
+        Build the topology of ``dag`` from its ``task_dict``.
+
+        A ``task_dict`` that can describe its tasks without deserializing them (see
+        :class:`~airflow.serialization.serialized_objects._LazyTaskDict`) is asked for their
+        :class:`TopologyNode` with ``iter_topology_nodes``.
+        """
+        task_dict = dag.task_dict
+        if (iter_topology_nodes := getattr(task_dict, "iter_topology_nodes", None)) is not None:
+            nodes = list(iter_topology_nodes())
+        else:
+            nodes = [TopologyNode.of(t) for t in task_dict.values()]
+        task_ids = tuple(n.task_id for n in nodes)
+        indexes = {task_id: i for i, task_id in enumerate(task_ids)}
+        upstream_ids: dict[str, list[str]] = {task_id: [] for task_id in task_ids}
+        for n in nodes:
+            for downstream_id in n.downstream_task_ids:
+                if downstream_id in upstream_ids:
+                    upstream_ids[downstream_id].append(n.task_id)
+        upstream_indptr, upstream_indices = _csr(upstream_ids.values(), indexes)
+        downstream_indptr, downstream_indices = _csr((n.downstream_task_ids for n in nodes), indexes)
+
+        topology = cls(
+            task_ids=task_ids,
+            indexes=indexes,
+            upstream_indptr=upstream_indptr,
+            upstream_indices=upstream_indices,
+            downstream_indptr=downstream_indptr,
+            downstream_indices=downstream_indices,
+            task_group_ids=tuple(n.task_group_id for n in nodes),
+            mapped_task_group_ids=tuple(n.mapped_task_group_id for n in nodes),
+            setup_task_ids=frozenset(n.task_id for n in nodes if n.is_setup),
+            teardown_task_ids=frozenset(n.task_id for n in nodes if n.is_teardown),
+            expanding_task_ids=frozenset(n.task_id for n in nodes if n.needs_expansion),
+            leaf_task_ids=frozenset(),
+            teardown_scopes={},
+        )
+        topology.leaf_task_ids = topology._compute_leaf_task_ids(nodes)
+        topology.teardown_scopes = {
+            n.task_id: topology._compute_teardown_scope(n.task_id) for n in nodes if n.is_teardown
+        }
+        return topology
+
+    @classmethod
+    def of(cls, dag: Any) -> DagTopology:
+        """
+        Get the topology of ``dag``.
+
+        This is the cached :attr:`SerializedDAG.topology` where there is one; any other DAG object (e.g.
+        an SDK DAG in tests) gets a freshly built topology.
+        """
+        if (topology := getattr(dag, "topology", None)) is not None:
+            return topology
+        return cls.build(dag)
+
+    def _iter_relative_indexes(self, index: int, *, upstream: bool) -> Iterator[int]:
+        if upstream:
+            indptr, indices = self.upstream_indptr, self.upstream_indices
+        else:
+            indptr, indices = self.downstream_indptr, self.downstream_indices
+        return iter(indices[indptr[index] : indptr[index + 1]])
+
+    def _compute_leaf_task_ids(self, nodes: list[TopologyNode]) -> frozenset[str]:
+        def _is_ignorable(index: int) -> bool:
+            node = nodes[index]
+            return node.is_teardown and not node.on_failure_fail_dagrun
+
+        leaves = frozenset(
+            self.task_ids[i]
+            for i in range(len(nodes))
+            if not _is_ignorable(i)
+            and all(_is_ignorable(d) for d in self._iter_relative_indexes(i, upstream=False))
+        )
+        if not leaves:
+            # Can happen if the DAG is exclusively teardown tasks.
+            leaves = frozenset(
+                self.task_ids[i]
+                for i in range(len(nodes))
+                if self.downstream_indptr[i] == self.downstream_indptr[i + 1]
+            )
+        return leaves
+
+    def _compute_teardown_scope(self, task_id: str) -> frozenset[str]:
+        index = self.indexes[task_id]
+        direct_upstream_ids = set(self.upstream_task_ids(task_id))
+        indirect_upstream_ids = self.flat_relative_ids(task_id, upstream=True) - direct_upstream_ids
+        if not indirect_upstream_ids:
+            return frozenset()
+        in_scope_ids: set[str] = set()
+        for setup_index in self._iter_relative_indexes(index, upstream=True):
+            if (setup_id := self.task_ids[setup_index]) in self.setup_task_ids:
+                in_scope_ids.update(indirect_upstream_ids & self.flat_relative_ids(setup_id, upstream=False))
+        return frozenset(in_scope_ids)
+
+    def upstream_task_ids(self, task_id: str) -> list[str]:
+        """Get the direct upstream task ids of ``task_id``."""
+        return [self.task_ids[i] for i in self._iter_relative_indexes(self.indexes[task_id], upstream=True)]
+
+    def downstream_task_ids(self, task_id: str) -> list[str]:
+        """Get the direct downstream task ids of ``task_id``."""
+        return [self.task_ids[i] for i in self._iter_relative_indexes(self.indexes[task_id], upstream=False)]
+
+    def flat_relative_ids(self, task_id: str, *, upstream: bool = False) -> frozenset[str]:
+        """
+        Get all relatives of ``task_id``, upstream or downstream, like ``get_flat_relative_ids``.
+
+        The result is memoized, so repeated queries for the same task are a dict lookup.
+        """
+        key = (self.indexes[task_id], upstream)
+        if (relatives := self._flat_relative_ids.get(key)) is not None:
+            return relatives
+        seen: set[int] = set()
+        to_visit = list(self._iter_relative_indexes(key[0], upstream=upstream))
+        while to_visit:
+            index = to_visit.pop()
+            if index in seen:
+                continue
+            seen.add(index)
+            to_visit.extend(self._iter_relative_indexes(index, upstream=upstream))
+        relatives = self._flat_relative_ids[key] = frozenset(self.task_ids[i] for i in seen)
+        return relatives
+
+    def teardown_scope_ids(self, task_id: str) -> frozenset[str]:
+        """
+        Get the ids of the tasks between the setups of teardown ``task_id`` and itself.
+
+        These are the indirect upstreams of the teardown which are downstream of one of its direct setup
+        upstreams; they must all be done before the teardown can run. Empty for non-teardown tasks.
+        """
+        return self.teardown_scopes.get(task_id, frozenset())
+
+    def relevant_setup_ids(self, task_id: str) -> frozenset[str]:
+        """
+        Get the ids of the upstream setups ``task_id`` must wait for, like ``get_upstreams_only_setups``.
+
+        These are the setups among its flat upstreams that have no teardown, or a teardown downstream of
+        ``task_id``. The result is memoized.
+        """
+        index = self.indexes[task_id]
+        if (setup_ids := self._relevant_setup_ids.get(index)) is not None:
+            return setup_ids
+        downstream_teardown_ids = self.flat_relative_ids(task_id, upstream=False) & self.teardown_task_ids
+        relevant: set[str] = set()
+        for setup_id in self.flat_relative_ids(task_id, upstream=True) & self.setup_task_ids:
+            teardown_ids = self.teardown_task_ids.intersection(self.downstream_task_ids(setup_id))
+            if not teardown_ids or teardown_ids & downstream_teardown_ids:
+                relevant.add(setup_id)
+        setup_ids = self._relevant_setup_ids[index] = frozenset(relevant)
+        return setup_ids
+
+    def task_group_id(self, task_id: str) -> str | None:
+        """Get the id of the task group ``task_id`` is directly in, or *None* for the root group."""
+        return self.task_group_ids[self.indexes[task_id]]
+
+    def closest_mapped_task_group_id(self, task_id: str) -> str | None:
+        """Get the id of the closest mapped task group ``task_id`` is in, or *None* if it is in none."""
+        return self.mapped_task_group_ids[self.indexes[task_id]]
@@ -29,7 +29,7 @@ import logging
 import math
 import sys
 import weakref
-from collections.abc import Collection, Iterable, Mapping
+from collections.abc import Collection, Iterable, Iterator, Mapping
 from functools import cache, cached_property, lru_cache
 from inspect import Parameter, signature
 from textwrap import dedent
@@ -84,6 +84,7 @@ from airflow.serialization.definitions.node import DAGNode
 from airflow.serialization.definitions.operatorlink import XComOperatorLink
 from airflow.serialization.definitions.param import SerializedParam, SerializedParamsDict
 from airflow.serialization.definitions.taskgroup import SerializedMappedTaskGroup, SerializedTaskGroup
+from airflow.serialization.definitions.topology import TopologyNode
 from airflow.serialization.definitions.xcom_arg import SchedulerXComArg, deserialize_xcom_arg
 from airflow.serialization.encoders import (
     coerce_to_core_timetable,
@@ -1113,6 +1114,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         op: SerializedOperator,
         encoded_op: dict[str, Any],
         client_defaults: dict[str, Any] | None = None,
+        load_op_links: bool | None = None,
     ) -> None:
         """
         Populate operator attributes with serialized values.
@@ -1121,7 +1123,12 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         DAG. Setting references (such as ``op.dag`` and task dependencies) is
         done in ``set_task_dag_references`` instead, which is called after the
         DAG is hydrated.
+
+        :param load_op_links: Whether to load the extra operator links, defaults to
+            ``_load_operator_extra_links``.
         """
+        if load_op_links is None:
+            load_op_links = cls._load_operator_extra_links
         # Apply defaults by merging them into encoded_op BEFORE main deserialization
         encoded_op = cls._apply_defaults_to_encoded_op(encoded_op, client_defaults)
 
@@ -1131,7 +1138,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         op_extra_links_from_plugin = {}
 
         # We don't want to load Extra Operator links in Scheduler
-        if cls._load_operator_extra_links:
+        if load_op_links:
             from airflow import plugins_manager
 
             for ope in plugins_manager.get_operator_extra_links():
@@ -1162,7 +1169,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             if k in encoded_op.get("template_fields", []):
                 pass  # Template fields are handled separately
             elif k == "_operator_extra_links":
-                if cls._load_operator_extra_links:
+                if load_op_links:
                     op_predefined_extra_links = cls._deserialize_operator_extra_links(v)
 
                     # If OperatorLinks with the same name exists, Links via Plugin have higher precedence
@@ -1265,13 +1272,19 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         setattr(op, "start_from_trigger", bool(encoded_op.get("start_from_trigger", False)))
 
     @staticmethod
-    def set_task_dag_references(task: SerializedOperator | MappedOperator, dag: SerializedDAG) -> None:
+    def set_task_dag_references(
+        task: SerializedOperator | MappedOperator, dag: SerializedDAG, *, link_downstream: bool = True
+    ) -> None:
         """
         Handle DAG references on an operator.
 
         The operator should have been mostly populated earlier by calling
         ``populate_operator``. This function further fixes object references
         that were not possible before the task's containing DAG is hydrated.
+
+        :param link_downstream: Whether to add the task to the upstream task ids of its downstream
+            tasks. Lazily deserialized DAGs set the upstream task ids of each task when it is
+            deserialized instead, so they do not have to deserialize the downstream tasks.
         """
         task.dag = dag
 
@@ -1284,6 +1297,8 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             if isinstance(kwargs_ref := getattr(task, k, None), _ExpandInputRef):
                 setattr(task, k, kwargs_ref.deref(dag))
 
+        if not link_downstream:
+            return
         for task_id in task.downstream_task_ids:
             # Bypass set_upstream etc here - it does more than we want
             dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
@@ -1325,8 +1340,14 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         cls,
         encoded_op: dict[str, Any],
         client_defaults: dict[str, Any] | None = None,
+        load_op_links: bool | None = None,
     ) -> SerializedOperator:
-        """Deserializes an operator from a JSON object."""
+        """
+        Deserializes an operator from a JSON object.
+
+        :param load_op_links: Whether to load the extra operator links, defaults to
+            ``_load_operator_extra_links``.
+        """
         op: SerializedOperator
         if encoded_op.get("_is_mapped", False):
             from airflow.serialization.definitions.mappedoperator import SerializedMappedOperator
@@ -1365,7 +1386,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         else:
             op = SerializedBaseOperator(task_id=encoded_op["task_id"])
 
-        cls.populate_operator(op, encoded_op, client_defaults)
+        cls.populate_operator(op, encoded_op, client_defaults, load_op_links)
 
         return op
 
@@ -1720,6 +1741,165 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         return result
 
 
+class _LazyTaskDict(collections.abc.MutableMapping):
+    """
+    ``task_dict`` of a DAG deserialized with ``lazy=True``.
+
+    Holds the encoded tasks by task_id, and deserializes each one the first time it is accessed. Relations
+    that normally need every task deserialized are resolved from the encoded data instead: upstream task
+    ids are indexed from the encoded downstream task ids, and task groups register which group each task
+    belongs to while they are deserialized.
+
+    Iterating over values or items deserializes every task, so e.g. ``SerializedDAG.tasks`` behaves as
+    for an eagerly deserialized DAG; :meth:`iter_topology_nodes` describes the DAG structure without doing
+    so.
+    """
+
+    def __init__(
+        self,
+        dag: SerializedDAG,
+        encoded_tasks: Iterable[dict[str, Any]],
+        client_defaults: dict[str, Any] | None,
+        load_op_links: bool,
+    ) -> None:
+        self._dag = dag
+        self._client_defaults = client_defaults
+        self._load_op_links = load_op_links
+        # Encoded tasks are replaced by the deserialized operator on first access.
+        self._entries: dict[str, SerializedOperator | dict[str, Any]] = {}
+        self._upstream_task_ids: dict[str, set[str]] = collections.defaultdict(set)
+        self._task_groups: dict[str, SerializedTaskGroup] = {}
+        for encoded_op in encoded_tasks:
+            task_id = encoded_op["task_id"]
+            self._entries[task_id] = encoded_op
+            for downstream_id in encoded_op.get(
+                "downstream_task_ids", encoded_op.get("_downstream_task_ids", ())
+            ):
+                self._upstream_task_ids[downstream_id].add(task_id)
+
+    def __getitem__(self, task_id: str) -> SerializedOperator:
+        entry = self._entries[task_id]
+        if isinstance(entry, dict):
+            return self._deserialize_task(task_id, entry)
+        return entry
+
+    def __setitem__(self, task_id: str, task: SerializedOperator) -> None:
+        self._entries[task_id] = task
+
+    def __delitem__(self, task_id: str) -> None:
+        del self._entries[task_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._entries
+
+    def is_deserialized(self, task_id: str) -> bool:
+        """Whether the task has been deserialized yet."""
+        return not isinstance(self._entries[task_id], dict)
+
+    def set_task_group(self, task_id: str, group: SerializedTaskGroup) -> None:
+        """Register the task group the task belongs to, set on the task when it is deserialized."""
+        self._task_groups[task_id] = group
+        if self.is_deserialized(task_id):
+            self[task_id].task_group = weakref.proxy(group)
+
+    def iter_topology_nodes(self) -> Iterator[TopologyNode]:
+        """
+        Describe every task for :class:`~airflow.serialization.definitions.topology.DagTopology`.
+
+        Tasks not deserialized yet are described from their encoded data, so building the topology of a
+        lazily deserialized DAG does not deserialize any task.
+        """
+        for task_id, entry in self._entries.items():
+            if not isinstance(entry, dict):
+                yield TopologyNode.of(entry)
+                continue
+            group = self._task_groups.get(task_id)
+            mapped_group = next(group.iter_mapped_task_groups(), None) if group is not None else None
+            yield TopologyNode(
+                task_id=task_id,
+                downstream_task_ids=entry.get("downstream_task_ids", entry.get("_downstream_task_ids", ())),
+                is_setup=self._get_encoded_flag(entry, "is_setup"),
+                is_teardown=self._get_encoded_flag(entry, "is_teardown"),
+                on_failure_fail_dagrun=self._get_encoded_flag(entry, "on_failure_fail_dagrun"),
+                needs_expansion=entry.get("_is_mapped", False) or mapped_group is not None,
+                task_group_id=group.group_id if group is not None else None,
+                mapped_task_group_id=mapped_group.group_id if mapped_group is not None else None,
+            )
+
+    def _get_encoded_flag(self, encoded_op: dict[str, Any], key: str) -> bool:
+        """Read a boolean operator field from encoded data, resolved as ``populate_operator`` would."""
+        task_defaults = self._client_defaults.get("tasks", {}) if self._client_defaults else {}
+        # A mapped operator keeps these fields in partial_kwargs, which client defaults fill in before
+        # the top-level fields are moved there.
+        if encoded_op.get("_is_mapped", False):
+            sources = (encoded_op.get("partial_kwargs", {}), task_defaults, encoded_op)
+        else:
+            sources = (encoded_op, task_defaults)
+        for source in sources:
+            # Older serializations use a leading underscore, e.g. "_on_failure_fail_dagrun".
+            for k in (key, f"_{key}"):
+                if k in source:
+                    return bool(source[k])
+        return False
+
+    def _deserialize_task(self, task_id: str, encoded_op: dict[str, Any]) -> SerializedOperator:
+        # The flag is passed along rather than set on OperatorSerialization, as tasks of DAGs loaded with
+        # different flags can be deserialized concurrently, e.g. by the threads of the API server.
+        task = OperatorSerialization.deserialize_operator(
+            encoded_op, self._client_defaults, load_op_links=self._load_op_links
+        )
+        # Another thread may have deserialized the task in the meantime; keep a single object.
+        if not isinstance(current := self._entries[task_id], dict):
+            return current
+        self._entries[task_id] = task
+        task.upstream_task_ids.update(self._upstream_task_ids.get(task_id, ()))
+        if (group := self._task_groups.get(task_id)) is not None:
+            task.task_group = weakref.proxy(group)
+        OperatorSerialization.set_task_dag_references(task, self._dag, link_downstream=False)
+        return task
+
+
+class _LazyTaskGroupChildren(collections.abc.MutableMapping):
+    """
+    ``children`` of a task group of a DAG deserialized with ``lazy=True``.
+
+    Child task groups are held directly; child tasks are held by task_id and looked up in the DAG's
+    :class:`_LazyTaskDict` when accessed, so building the task group tree does not deserialize any task.
+    """
+
+    def __init__(self, task_dict: _LazyTaskDict, children: dict[str, DAGNode | str]) -> None:
+        self._task_dict = task_dict
+        self._children = children
+
+    def __getitem__(self, label: str) -> DAGNode:
+        child = self._children[label]
+        if isinstance(child, str):
+            return self._task_dict[child]
+        return child
+
+    def __setitem__(self, label: str, child: DAGNode) -> None:
+        self._children[label] = child
+
+    def __delitem__(self, label: str) -> None:
+        del self._children[label]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._children)
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def iter_task_groups(self) -> Iterator[SerializedTaskGroup]:
+        """Iterate over the child task groups, without deserializing the child tasks."""
+        return (child for child in self._children.values() if isinstance(child, SerializedTaskGroup))
+
+
 class DagSerialization(BaseSerialization):
     """Logic to encode a ``DAG`` object and decode the data into ``SerializedDAG``."""
 
@@ -1803,9 +1983,13 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def deserialize_dag(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None, *, lazy: bool = False
     ) -> SerializedDAG:
-        """Deserializes a DAG from a JSON object."""
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param lazy: Deserialize each task only when it is first accessed, see :class:`_LazyTaskDict`.
+        """
         if "dag_id" not in encoded_dag:
             raise DeserializationError(
                 message="Encoded dag object has no dag_id key. "
@@ -1815,7 +1999,7 @@ class DagSerialization(BaseSerialization):
         dag_id = encoded_dag["dag_id"]
 
         try:
-            return cls._deserialize_dag_internal(encoded_dag, client_defaults)
+            return cls._deserialize_dag_internal(encoded_dag, client_defaults, lazy=lazy)
         except (TimetableNotRegistered, DeserializationError):
             # Let specific errors bubble up unchanged
             raise
@@ -1825,7 +2009,7 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def _deserialize_dag_internal(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None, *, lazy: bool = False
     ) -> SerializedDAG:
         """Handle the main Dag deserialization logic."""
         dag = SerializedDAG(dag_id=encoded_dag["dag_id"])
@@ -1838,6 +2022,14 @@ class DagSerialization(BaseSerialization):
             v = v_in  # surpass PLW2901
             if k == "_downstream_task_ids":
                 v = set(v)
+            elif k == "tasks" and lazy:
+                k = "task_dict"
+                v = _LazyTaskDict(
+                    dag,
+                    (obj[Encoding.VAR] for obj in v if obj.get(Encoding.TYPE) == DAT.OP),
+                    client_defaults,
+                    cls._load_operator_extra_links,
+                )
             elif k == "tasks":
                 OperatorSerialization._load_operator_extra_links = cls._load_operator_extra_links
                 tasks = {}
@@ -1913,8 +2105,9 @@ class DagSerialization(BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for t in dag.task_dict.values():
-            OperatorSerialization.set_task_dag_references(t, dag)
+        if not isinstance(dag.task_dict, _LazyTaskDict):
+            for t in dag.task_dict.values():
+                OperatorSerialization.set_task_dag_references(t, dag)
 
         return dag
 
@@ -2115,8 +2308,12 @@ class DagSerialization(BaseSerialization):
         ser_obj["__version"] = 3
 
     @classmethod
-    def from_dict(cls, serialized_obj: dict) -> SerializedDAG:
-        """Deserializes a python dict in to the DAG and operators it contains."""
+    def from_dict(cls, serialized_obj: dict, *, lazy: bool = False) -> SerializedDAG:
+        """
+        Deserializes a python dict in to the DAG and operators it contains.
+
+        :param lazy: Deserialize each operator only when it is first accessed.
+        """
         ver = serialized_obj.get("__version", "<not present>")
         if ver not in (1, 2, 3):
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
@@ -2129,7 +2326,7 @@ class DagSerialization(BaseSerialization):
         client_defaults = serialized_obj.get("client_defaults", {})
 
         # Pass client_defaults directly to deserialize_dag
-        return cls.deserialize_dag(serialized_obj["dag"], client_defaults)
+        return cls.deserialize_dag(serialized_obj["dag"], client_defaults, lazy=lazy)
 
 
 class TaskGroupSerialization(BaseSerialization):
@@ -2201,14 +2398,24 @@ class TaskGroupSerialization(BaseSerialization):
             task.task_group = weakref.proxy(group)
             return task
 
-        group.children = {
-            label: (
-                set_ref(task_dict[val])
-                if _type == DAT.OP
-                else cls.deserialize_task_group(val, group, task_dict, dag=dag)
-            )
-            for label, (_type, val) in sorted(encoded_group["children"].items())
-        }
+        if isinstance(task_dict, _LazyTaskDict):
+            children: dict[str, DAGNode | str] = {}
+            for label, (_type, val) in sorted(encoded_group["children"].items()):
+                if _type == DAT.OP:
+                    task_dict.set_task_group(val, group)
+                    children[label] = val
+                else:
+                    children[label] = cls.deserialize_task_group(val, group, task_dict, dag=dag)
+            group.children = _LazyTaskGroupChildren(task_dict, children)  # type: ignore[assignment]
+        else:
+            group.children = {
+                label: (
+                    set_ref(task_dict[val])
+                    if _type == DAT.OP
+                    else cls.deserialize_task_group(val, group, task_dict, dag=dag)
+                )
+                for label, (_type, val) in sorted(encoded_group["children"].items())
+            }
         group.upstream_group_ids.update(cls.deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls.deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls.deserialize(encoded_group["upstream_task_ids"]))
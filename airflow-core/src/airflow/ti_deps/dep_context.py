@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import contextlib
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import attr
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
 
     from airflow.models.dagrun import DagRun
     from airflow.models.taskinstance import TaskInstance
+    from airflow.ti_deps.deps.trigger_rule_dep import UpstreamStateCounts
 
 
 @attr.define
@@ -107,6 +109,26 @@ class DepContext:
     fresh empty dict, so they would neither read the memo nor warm it for anything else.
     """
 
+    finished_tis_by_task_id: dict[str, list[TaskInstance]] | None = attr.ib(default=None, repr=False)
+    """
+    Per-pass index of ``finished_tis`` by task_id, built on first use by
+    :meth:`ensure_finished_tis_by_task_id`.
+
+    Dependencies that only care about the finished task instances of a few tasks (e.g. the direct
+    upstreams when evaluating trigger rules) use it to look those up, instead of scanning every
+    finished task instance of the run for every task instance they evaluate. Like ``finished_tis``,
+    it is a snapshot for one scheduling pass.
+    """
+
+    upstream_state_counts: UpstreamStateCounts | None = attr.ib(default=None, repr=False)
+    """
+    Per-pass counts of the task instances of the DAG run by task and state, which trigger rules read
+    the upstream states and instance counts from instead of querying them for every task instance.
+
+    Passed in by :meth:`~airflow.models.dagrun.DagRun.task_instance_scheduling_decisions`, and dropped
+    by :meth:`invalidate_upstream_task_id_counts` since they go stale the same way.
+    """
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -126,6 +148,22 @@ class DepContext:
             finished_tis = self.finished_tis
         return finished_tis
 
+    def ensure_finished_tis_by_task_id(
+        self, dag_run: DagRun, session: Session
+    ) -> dict[str, list[TaskInstance]]:
+        """
+        Ensure finished_tis_by_task_id is populated from :meth:`ensure_finished_tis`.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        :return: The finished task instances of this DAG run, grouped by task_id
+        """
+        if self.finished_tis_by_task_id is None:
+            finished_tis_by_task_id: dict[str, list[TaskInstance]] = defaultdict(list)
+            for ti in self.ensure_finished_tis(dag_run, session=session):
+                finished_tis_by_task_id[ti.task_id].append(ti)
+            self.finished_tis_by_task_id = dict(finished_tis_by_task_id)
+        return self.finished_tis_by_task_id
+
     def invalidate_upstream_task_id_counts(self) -> None:
         """
         Drop the memoized trigger-rule upstream counts.
@@ -134,3 +172,4 @@ class DepContext:
         later in the same pass recomputes the count instead of reading a stale one.
         """
         self.upstream_task_id_counts.clear()
+        self.upstream_state_counts = None
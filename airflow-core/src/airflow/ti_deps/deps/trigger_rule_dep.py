@@ -20,22 +20,26 @@ from __future__ import annotations
 import collections.abc
 import functools
 from collections import Counter
-from collections.abc import Iterator, KeysView, Mapping
+from collections.abc import Collection, Iterator
 from typing import TYPE_CHECKING, NamedTuple
 
+import attrs
 from sqlalchemy import and_, func, or_, select
 
 from airflow.models.taskinstance import PAST_DEPENDS_MET
+from airflow.serialization.definitions.topology import DagTopology
 from airflow.task.trigger_rule import TriggerRule as TR
 from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
-from airflow.utils.state import TaskInstanceState
+from airflow.utils.state import State, TaskInstanceState
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import ColumnElement
 
+    from airflow.models.dagrun import DagRun
     from airflow.models.taskinstance import TaskInstance
-    from airflow.serialization.definitions.mappedoperator import Operator
     from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
     from airflow.ti_deps.dep_context import DepContext
     from airflow.ti_deps.deps.base_ti_dep import TIDepStatus
@@ -77,6 +81,11 @@ class _UpstreamTIStates(NamedTuple):
             counter.update(curr_state)
             if ti.task.is_setup:
                 setup_counter.update(curr_state)
+        return cls.from_counters(counter, setup_counter)
+
+    @classmethod
+    def from_counters(cls, counter: Counter[str], setup_counter: Counter[str]) -> _UpstreamTIStates:
+        """Build the states from the finished upstream tis counted by state, all and setups only."""
         return _UpstreamTIStates(
             success=counter.get(TaskInstanceState.SUCCESS, 0),
             skipped=counter.get(TaskInstanceState.SKIPPED, 0),
@@ -89,6 +98,64 @@ class _UpstreamTIStates(NamedTuple):
         )
 
 
+@attrs.define(eq=False, kw_only=True)
+class UpstreamStateCounts:
+    """
+    Task instances of a DAG run counted per task, indexed like the DAG's :class:`DagTopology`.
+
+    :meth:`DagRun.task_instance_scheduling_decisions
+    <airflow.models.dagrun.DagRun.task_instance_scheduling_decisions>` builds these once per scheduling
+    pass from the task instances it already loaded, so :class:`TriggerRuleDep` can sum the upstream states
+    and instance counts of a task instance instead of querying them for each one. Task instances in a
+    mapped task group depend on selected map indexes of their upstreams, and are still evaluated one by
+    one.
+    """
+
+    dag_id: str
+    run_id: str
+    topology: DagTopology
+    finished: list[Counter[str]]
+    """The finished task instances of each task, counted by state."""
+    totals: list[int]
+    """The number of task instances of each task, in any state."""
+
+    @classmethod
+    def build(
+        cls, dag_run: DagRun, topology: DagTopology, tis: Iterable[TaskInstance]
+    ) -> UpstreamStateCounts:
+        """Count ``tis``, which must be all the task instances of ``dag_run``."""
+        finished: list[Counter[str]] = [Counter() for _ in topology.task_ids]
+        totals = [0] * len(topology.task_ids)
+        for ti in tis:
+            if (index := topology.indexes.get(ti.task_id)) is None:
+                continue
+            totals[index] += 1
+            if ti.state in State.finished:
+                finished[index][ti.state] += 1
+        return cls(
+            dag_id=dag_run.dag_id, run_id=dag_run.run_id, topology=topology, finished=finished, totals=totals
+        )
+
+    def covers(self, ti: TaskInstance, topology: DagTopology) -> bool:
+        """Whether these counts are of ``ti``'s DAG run, over the same topology."""
+        return self.topology is topology and self.dag_id == ti.dag_id and self.run_id == ti.run_id
+
+    def upstream_states(self, upstream_ids: Iterable[str]) -> _UpstreamTIStates:
+        """Sum the finished states of all the task instances of ``upstream_ids``."""
+        counter: Counter[str] = Counter()
+        setup_counter: Counter[str] = Counter()
+        for upstream_id in upstream_ids:
+            states = self.finished[self.topology.indexes[upstream_id]]
+            counter.update(states)
+            if upstream_id in self.topology.setup_task_ids:
+                setup_counter.update(states)
+        return _UpstreamTIStates.from_counters(counter, setup_counter)
+
+    def count(self, task_ids: Iterable[str]) -> int:
+        """Count the task instances of ``task_ids``."""
+        return sum(self.totals[self.topology.indexes[task_id]] for task_id in task_ids)
+
+
 class TriggerRuleDep(BaseTIDep):
     """Determines if a task's upstream tasks are in a state that allows a given task instance to run."""
 
@@ -138,6 +205,17 @@ class TriggerRuleDep(BaseTIDep):
         if TYPE_CHECKING:
             assert task
 
+        # Upstream, setup and teardown relations are read from the DAG's integer-indexed topology rather
+        # than by walking the operator objects.
+        topology = DagTopology.of(task.dag)
+        upstream_ids = frozenset(topology.upstream_task_ids(task.task_id))
+        in_mapped_task_group = topology.closest_mapped_task_group_id(task.task_id) is not None
+        # Outside a mapped task group every task instance of an upstream is relevant, so the counts of the
+        # whole DAG run answer for any task instance of this task.
+        state_counts = dep_context.upstream_state_counts
+        if state_counts is not None and (in_mapped_task_group or not state_counts.covers(ti, topology)):
+            state_counts = None
+
         @functools.lru_cache
         def _get_expanded_ti_count() -> int:
             """
@@ -184,7 +262,7 @@ class TriggerRuleDep(BaseTIDep):
             # expanded instance (see #50210). The task may be nested in plain task
             # groups inside the mapped one (see #39801), so check the closest mapped
             # ancestor rather than only the immediate parent group.
-            if ti.map_index < 0 and task.get_closest_mapped_task_group() is not None:
+            if ti.map_index < 0 and in_mapped_task_group:
                 is_fast_triggered = task.trigger_rule in (
                     TR.ONE_SUCCESS,
                     TR.ONE_FAILED,
@@ -206,7 +284,7 @@ class TriggerRuleDep(BaseTIDep):
                 session=session,
             )
 
-        def _is_relevant_upstream(upstream: TaskInstance, relevant_ids: set[str] | KeysView[str]) -> bool:
+        def _is_relevant_upstream(upstream: TaskInstance, relevant_ids: Collection[str]) -> bool:
             """
             Whether a task instance is a "relevant upstream" of the current task.
 
@@ -221,7 +299,7 @@ class TriggerRuleDep(BaseTIDep):
                 return False
             # The current task is not in a mapped task group. All tis from an
             # upstream task are relevant.
-            if task.get_closest_mapped_task_group() is None:
+            if not in_mapped_task_group:
                 return True
             # The upstream ti is not expanded. The upstream may be mapped or
             # not, but the ti is relevant either way.
@@ -238,17 +316,32 @@ class TriggerRuleDep(BaseTIDep):
                 return True
             return False
 
-        def _iter_upstream_conditions(relevant_tasks: dict) -> Iterator[ColumnElement]:
+        def _iter_finished_relevant_upstreams(relevant_ids: Collection[str]) -> Iterator[TaskInstance]:
+            """
+            Iterate over the finished task instances which are relevant upstreams of the current task.
+
+            Only the finished task instances of ``relevant_ids`` are looked at, so the cost of evaluating
+            a task instance does not grow with the total number of finished task instances in the run.
+            """
+            finished_tis_by_task_id = dep_context.ensure_finished_tis_by_task_id(
+                ti.get_dagrun(session=session), session=session
+            )
+            for upstream_id in relevant_ids:
+                for upstream in finished_tis_by_task_id.get(upstream_id, ()):
+                    if _is_relevant_upstream(upstream=upstream, relevant_ids=relevant_ids):
+                        yield upstream
+
+        def _iter_upstream_conditions(relevant_ids: Collection[str]) -> Iterator[ColumnElement]:
             # Optimization: If the current task is not in a mapped task group,
             # it depends on all upstream task instances.
             from airflow.models.taskinstance import TaskInstance
 
-            if task.get_closest_mapped_task_group() is None:
-                yield TaskInstance.task_id.in_(relevant_tasks.keys())
+            if not in_mapped_task_group:
+                yield TaskInstance.task_id.in_(relevant_ids)
                 return
             # Otherwise we need to figure out which map indexes are depended on
             # for each upstream by the current task instance.
-            for upstream_id in relevant_tasks:
+            for upstream_id in relevant_ids:
                 map_indexes = _get_relevant_upstream_map_indexes(upstream_id)
                 if map_indexes is None:  # All tis of this upstream are dependencies.
                     yield TaskInstance.task_id == upstream_id
@@ -270,23 +363,22 @@ class TriggerRuleDep(BaseTIDep):
                     yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
 
         def _evaluate_setup_constraint(
-            *, relevant_setups: Mapping[str, Operator]
+            *, relevant_setups: frozenset[str]
         ) -> Iterator[tuple[TIDepStatus, bool]]:
             """
             Evaluate whether ``ti``'s trigger rule was met as part of the setup constraint.
 
-            :param relevant_setups: Relevant setups for the current task instance.
+            :param relevant_setups: Ids of the relevant setups for the current task instance.
             """
             if not relevant_setups:
                 return
 
-            indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            indirect_setups = relevant_setups.difference(upstream_ids)
+            if state_counts is not None:
+                upstream_states = state_counts.upstream_states(indirect_setups)
+            else:
+                finished_upstream_tis = _iter_finished_relevant_upstreams(relevant_ids=indirect_setups)
+                upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -297,13 +389,15 @@ class TriggerRuleDep(BaseTIDep):
 
             # Optimization: Don't need to hit the database if all upstreams are
             # "simple" tasks (no task or task group mapping involved).
-            if not any(t.get_needs_expansion() for t in indirect_setups.values()):
+            if topology.expanding_task_ids.isdisjoint(indirect_setups):
                 upstream = len(indirect_setups)
+            elif state_counts is not None:
+                upstream = state_counts.count(indirect_setups)
             else:
                 task_id_counts = session.execute(
                     select(TaskInstance.task_id, func.count(TaskInstance.task_id))
                     .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=indirect_setups)))
+                    .where(or_(*_iter_upstream_conditions(relevant_ids=indirect_setups)))
                     .group_by(TaskInstance.task_id)
                 ).all()
                 upstream = sum(count for _, count in task_id_counts)
@@ -350,7 +444,7 @@ class TriggerRuleDep(BaseTIDep):
                 yield (
                     self._failing_status(
                         reason=(
-                            f"All setup tasks must complete successfully. Relevant setups: {relevant_setups}: "
+                            f"All setup tasks must complete successfully. Relevant setups: {sorted(relevant_setups)}: "
                             f"upstream_states={upstream_states}, "
                             f"upstream_task_ids={task.upstream_task_ids}"
                         ),
@@ -360,18 +454,14 @@ class TriggerRuleDep(BaseTIDep):
 
         def _evaluate_direct_relatives() -> Iterator[TIDepStatus]:
             """Evaluate whether ``ti``'s trigger rule in direct relatives was met."""
-            upstream_tasks = {t.task_id: t for t in task.upstream_list}
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(
-                    ti.get_dagrun(session=session), session=session
-                )
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            if state_counts is not None:
+                upstream_states = state_counts.upstream_states(upstream_ids)
+            else:
+                finished_upstream_tis = _iter_finished_relevant_upstreams(relevant_ids=upstream_ids)
+                upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -384,9 +474,12 @@ class TriggerRuleDep(BaseTIDep):
 
             # Optimization: Don't need to hit the database if all upstreams are
             # "simple" tasks (no task or task group mapping involved).
-            if not any(t.get_needs_expansion() for t in upstream_tasks.values()):
-                upstream = len(upstream_tasks)
-                upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
+            if topology.expanding_task_ids.isdisjoint(upstream_ids):
+                upstream = len(upstream_ids)
+                upstream_setup = len(topology.setup_task_ids.intersection(upstream_ids))
+            elif state_counts is not None:
+                upstream = state_counts.count(upstream_ids)
+                upstream_setup = state_counts.count(topology.setup_task_ids.intersection(upstream_ids))
             else:
                 # In the simple case, `_iter_upstream_conditions` emits exactly
                 # `task_id IN (upstream_task_ids)` (the matching `get_closest_mapped_task_group()
@@ -402,8 +495,8 @@ class TriggerRuleDep(BaseTIDep):
                 # need no invalidation.
                 cache_key: tuple[str, str, frozenset[str]] | None = None
                 task_id_counts: list[tuple[str, int]] | None = None
-                if task.get_closest_mapped_task_group() is None:
-                    cache_key = (ti.dag_id, ti.run_id, frozenset(upstream_tasks))
+                if not in_mapped_task_group:
+                    cache_key = (ti.dag_id, ti.run_id, frozenset(upstream_ids))
                     task_id_counts = dep_context.upstream_task_id_counts.get(cache_key)
                 if task_id_counts is None:
                     task_id_counts = [
@@ -411,16 +504,14 @@ class TriggerRuleDep(BaseTIDep):
                         for task_id, count in session.execute(
                             select(TaskInstance.task_id, func.count(TaskInstance.task_id))
                             .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                            .where(or_(*_iter_upstream_conditions(relevant_tasks=upstream_tasks)))
+                            .where(or_(*_iter_upstream_conditions(relevant_ids=upstream_ids)))
                             .group_by(TaskInstance.task_id)
                         )
                     ]
                     if cache_key is not None:
                         dep_context.upstream_task_id_counts[cache_key] = task_id_counts
-                # `task_id_counts` only contains task_ids matched by `task_id IN (upstream_tasks)`,
-                # so every key is present in `upstream_tasks`; is_setup is re-derived locally.
                 upstream = sum(count for _, count in task_id_counts)
-                upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
+                upstream_setup = sum(c for t, c in task_id_counts if t in topology.setup_task_ids)
 
             upstream_done = done >= upstream
 
@@ -559,7 +650,7 @@ class TriggerRuleDep(BaseTIDep):
                     yield self._failing_status(
                         reason=(
                             f"Task's trigger rule '{trigger_rule_str}' requires all upstream tasks to have "
-                            f"completed, but found {len(upstream_tasks) - done} task(s) that were "
+                            f"completed, but found {len(upstream_ids) - done} task(s) that were "
                             f"not done. upstream_states={upstream_states}, "
                             f"upstream_task_ids={task.upstream_task_ids}"
                         )
@@ -620,7 +711,7 @@ class TriggerRuleDep(BaseTIDep):
                     yield self._failing_status(
                         reason=(
                             f"Task's trigger rule '{trigger_rule_str}' requires all upstream tasks to have "
-                            f"completed, but found {len(upstream_tasks) - done} task(s) that were not done. "
+                            f"completed, but found {len(upstream_ids) - done} task(s) that were not done. "
                             f"upstream_states={upstream_states}, "
                             f"upstream_task_ids={task.upstream_task_ids}"
                         )
@@ -673,41 +764,25 @@ class TriggerRuleDep(BaseTIDep):
 
         def _evaluate_teardown_scope() -> Iterator[TIDepStatus]:
             """Ensure all tasks between setup(s) and this teardown have completed."""
-            if not task.dag:
-                return
-
-            setup_task_ids = {t.task_id for t in task.upstream_list if t.is_setup}
-
-            all_upstream_ids = task.get_flat_relative_ids(upstream=True)
-            indirect_upstream_ids = all_upstream_ids - task.upstream_task_ids
-
-            if not indirect_upstream_ids:
-                return
-
-            in_scope_ids = set()
-            for setup_id in setup_task_ids:
-                setup_obj = task.dag.get_task(setup_id)
-                in_scope_ids.update(indirect_upstream_ids & setup_obj.get_flat_relative_ids(upstream=False))
-
+            in_scope_ids = topology.teardown_scope_ids(task.task_id)
             if not in_scope_ids:
                 return
 
-            in_scope_tasks = {tid: task.dag.get_task(tid) for tid in in_scope_ids}
-
-            done = sum(
-                1
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=in_scope_ids)
-            )
+            if state_counts is not None:
+                done = state_counts.upstream_states(in_scope_ids).done
+            else:
+                done = sum(1 for _ in _iter_finished_relevant_upstreams(relevant_ids=in_scope_ids))
 
-            if not any(t.get_needs_expansion() for t in in_scope_tasks.values()):
-                expected = len(in_scope_tasks)
+            if topology.expanding_task_ids.isdisjoint(in_scope_ids):
+                expected = len(in_scope_ids)
+            elif state_counts is not None:
+                expected = state_counts.count(in_scope_ids)
             else:
                 expected = (
                     session.scalar(
                         select(func.count(TaskInstance.task_id))
                         .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                        .where(or_(*_iter_upstream_conditions(relevant_tasks=in_scope_tasks)))
+                        .where(or_(*_iter_upstream_conditions(relevant_ids=in_scope_ids)))
                     )
                     or 0
                 )
@@ -719,13 +794,13 @@ class TriggerRuleDep(BaseTIDep):
                         f"Task's trigger rule '{trigger_rule_str}' requires all tasks between "
                         f"setup and teardown to have completed, but found {expected - done} "
                         f"in-scope task(s) not done. "
-                        f"in_scope_task_ids={in_scope_ids}"
+                        f"in_scope_task_ids={sorted(in_scope_ids)}"
                     )
                 )
 
         if not task.is_teardown:
             # a teardown cannot have any indirect setups
-            if relevant_setups := {t.task_id: t for t in task.get_upstreams_only_setups()}:
+            if relevant_setups := topology.relevant_setup_ids(task.task_id):
                 for status, changed in _evaluate_setup_constraint(relevant_setups=relevant_setups):
                     yield status
                     if not status.passed and changed:
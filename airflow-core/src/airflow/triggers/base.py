@@ -80,6 +80,13 @@ class BaseTrigger(abc.ABC, Templater, LoggingMixin):
 
     supports_triggerer_queue: bool = True
 
+    # Whether the triggerer may run identical instances of the trigger, with the same serialized kwargs, as
+    # a single one whose events go to all of them. Only set it on triggers whose run() depends on nothing but
+    # their kwargs: neither the task instance nor on_kill() and cleanup() are run for every instance then.
+    # An instance joining a run that already fired events receives those events first, so run() must yield
+    # events that stay valid for an identical trigger started later, e.g. not "value changed since start".
+    supports_coalescing: bool = False
+
     def __init__(self, **kwargs):
         super().__init__()
         # these values are set by triggerer when preparing to run the instance
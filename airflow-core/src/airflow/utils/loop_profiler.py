@@ -0,0 +1,333 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Profiling of the phases of a component's main loop, e.g. the scheduler loop, or of its coroutines."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from sqlalchemy import event
+
+from airflow._shared.observability.metrics import stats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Generator
+    from types import FrameType
+
+    from sqlalchemy.engine import Engine
+
+log = structlog.get_logger(logger_name=__name__)
+
+# Upper bounds, in milliseconds, of the buckets of the phase duration histograms.
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+
+class PhaseHistogram:
+    """Histogram of the durations of one loop phase, with the queries it ran."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.queries = 0
+        self.query_ms = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        self.buckets[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile of the durations, as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return 0.0
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, bucket_count in zip(HISTOGRAM_BUCKETS_MS, self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+
+class LoopProfiler:
+    """
+    Time the phases of a loop, and count the database queries run in each phase.
+
+    Every phase is timed with :meth:`phase`; its duration is emitted as the ``<stats_prefix>.loop_phase_duration``
+    timer tagged with the phase, and kept in an in-memory :class:`PhaseHistogram` for :meth:`summary`. While the
+    profiler is active (used as a context manager), SQLAlchemy cursor events count the queries run by the
+    innermost active phase of the thread running them, and their duration. Phases are tracked per thread;
+    queries run by a thread outside of any of its phases, e.g. a worker thread of the loop, count towards
+    the innermost phase of the thread that created the profiler.
+    """
+
+    def __init__(self, *, stats_prefix: str, engine: Engine | None = None) -> None:
+        self._stats_prefix = stats_prefix
+        self._engine = engine
+        self.histograms: dict[str, PhaseHistogram] = {}
+        self._local = threading.local()
+        self._owner_phase_stack = self._phase_stack
+        self._lock = threading.Lock()
+
+    @property
+    def _phase_stack(self) -> list[str]:
+        """The phases active in the current thread, innermost last."""
+        try:
+            return self._local.phase_stack
+        except AttributeError:
+            stack: list[str] = []
+            self._local.phase_stack = stack
+            return stack
+
+    def __enter__(self) -> LoopProfiler:
+        if self._engine is not None:
+            event.listen(self._engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(self._engine, "after_cursor_execute", self._after_cursor_execute)
+            event.listen(self._engine, "handle_error", self._handle_error)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._engine is not None:
+            event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+            event.remove(self._engine, "handle_error", self._handle_error)
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Time a phase of the loop; phases can be nested, queries count towards the innermost one."""
+        with self._lock:
+            histogram = self.histograms.setdefault(name, PhaseHistogram())
+        self._phase_stack.append(name)
+        queries, query_ms = histogram.queries, histogram.query_ms
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            self._phase_stack.pop()
+            with self._lock:
+                histogram.record(duration_ms)
+                queries, query_ms = histogram.queries - queries, histogram.query_ms - query_ms
+            tags = {"phase": name}
+            stats.timing(f"{self._stats_prefix}.loop_phase_duration", duration_ms, tags=tags)
+            if queries:
+                stats.incr(f"{self._stats_prefix}.loop_phase_queries", queries, tags=tags)
+                stats.timing(f"{self._stats_prefix}.loop_phase_query_duration", query_ms, tags=tags)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``func`` run as phase ``name``, e.g. for actions run by an event scheduler."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        wrapper.__name__ = getattr(func, "__name__", name)
+        return wrapper
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("loop_profiler_query_start", []).append((context, time.perf_counter()))
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        starts = conn.info.get("loop_profiler_query_start")
+        if not starts:  # The query started before the listeners were registered.
+            return
+        _, start = starts.pop()
+        try:
+            phase = (self._phase_stack or self._owner_phase_stack)[-1]
+        except IndexError:  # Queries run outside of any phase are not counted.
+            return
+        with self._lock:
+            histogram = self.histograms[phase]
+            histogram.queries += 1
+            histogram.query_ms += (time.perf_counter() - start) * 1000
+
+    def _handle_error(self, exception_context) -> None:
+        # A query failing in the database does not reach after_cursor_execute: drop its start, so that it
+        # does not stay in the info of the pooled connection.
+        if exception_context.connection is None:
+            return
+        starts = exception_context.connection.info.get("loop_profiler_query_start")
+        if starts and starts[-1][0] is exception_context.execution_context:
+            starts.pop()
+
+    def summary(self) -> str:
+        """Render the phase histograms as a table."""
+        lines = [
+            f"{'phase':<28} {'count':>8} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} "
+            f"{'queries':>10} {'query ms':>10}"
+        ]
+        with self._lock:
+            for name, histogram in sorted(self.histograms.items(), key=lambda item: -item[1].total_ms):
+                mean = histogram.total_ms / histogram.count if histogram.count else 0.0
+                lines.append(
+                    f"{name:<28} {histogram.count:>8} {mean:>10.2f} {histogram.percentile(50):>10.2f} "
+                    f"{histogram.percentile(95):>10.2f} {histogram.max_ms:>10.2f} {histogram.queries:>10} "
+                    f"{histogram.query_ms:>10.2f}"
+                )
+        return "\n".join(lines)
+
+
+class StepStats:
+    """
+    Time spent running a coroutine between two awaits, i.e. blocking the event loop it runs in.
+
+    The totals since the coroutine started are kept along the ones of the current window, which the
+    reporter takes and resets with :meth:`take_window`. The duration of a step longer than ``slow_step_ms``
+    is passed to ``on_slow_step``.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        *,
+        slow_step_ms: float = math.inf,
+        on_slow_step: Callable[[float], None] | None = None,
+    ) -> None:
+        self.label = label
+        self.slow_step_ms = slow_step_ms
+        self.on_slow_step = on_slow_step
+        self.steps = 0
+        self.wall_ms = 0.0
+        self.cpu_ms = 0.0
+        self.max_step_ms = 0.0
+        self.window_wall_ms = 0.0
+        self.window_cpu_ms = 0.0
+
+    def record(self, wall_ms: float, cpu_ms: float) -> None:
+        self.steps += 1
+        self.add(wall_ms, cpu_ms)
+        self.max_step_ms = max(self.max_step_ms, wall_ms)
+        if wall_ms > self.slow_step_ms and self.on_slow_step is not None:
+            self.on_slow_step(wall_ms)
+
+    def add(self, wall_ms: float, cpu_ms: float) -> None:
+        """Add time spent on behalf of the coroutine by another one, without counting it as a step."""
+        self.wall_ms += wall_ms
+        self.cpu_ms += cpu_ms
+        self.window_wall_ms += wall_ms
+        self.window_cpu_ms += cpu_ms
+
+    def take_window(self) -> tuple[float, float]:
+        """Return the wall and CPU time spent since the last call, in milliseconds, and start a new window."""
+        window = self.window_wall_ms, self.window_cpu_ms
+        self.window_wall_ms = self.window_cpu_ms = 0.0
+        return window
+
+
+async def run_in_timed_steps(coro: Coroutine[Any, Any, Any], step_stats: StepStats) -> Any:
+    """
+    Run ``coro``, recording the wall and CPU time of every step between its awaits in ``step_stats``.
+
+    Wrap the coroutine of an asyncio task with it to find which task blocks the event loop, e.g. with
+    synchronous I/O. Time spent in a greenlet switched out of the step, e.g. by ``greenback.await_``,
+    counts towards the step.
+    """
+    return await _timed_steps(coro, step_stats)
+
+
+@types.coroutine
+def _timed_steps(coro: Coroutine[Any, Any, Any], step_stats: StepStats) -> Generator[Any, Any, Any]:
+    send: Callable[[Any], Any] = coro.send
+    message: Any = None
+    while True:
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yielded = send(message)
+        except StopIteration as e:
+            step_stats.record((time.perf_counter() - wall) * 1000, (time.thread_time() - cpu) * 1000)
+            return e.value
+        except BaseException:
+            step_stats.record((time.perf_counter() - wall) * 1000, (time.thread_time() - cpu) * 1000)
+            raise
+        step_stats.record((time.perf_counter() - wall) * 1000, (time.thread_time() - cpu) * 1000)
+        try:
+            message = yield yielded
+        except BaseException as e:
+            # Thrown in by the event loop, e.g. CancelledError: hand it over to the wrapped coroutine
+            send, message = coro.throw, e
+        else:
+            send = coro.send
+
+
+class StackSampler:
+    """
+    Sampling profiler: record the Python stacks of all threads of the process at a regular interval.
+
+    The samples are aggregated as "folded" stacks, one line per distinct stack with the number of times it
+    was seen, which flamegraph tools (``flamegraph.pl``, speedscope, ...) render as a flame graph.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(exclude={own_ident})
+
+    def sample(self, exclude: set[int] | frozenset[int] = frozenset()) -> None:
+        """Record the current stack of every thread, except the ``exclude`` ones."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident not in exclude:
+                self.samples[_fold(names.get(ident, str(ident)), frame)] += 1
+
+    def dump(self, path: str) -> int:
+        """Write the folded stacks to ``path``; return the number of distinct stacks written."""
+        samples = self.samples.copy()
+        with open(path, "w") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+        log.info("Wrote %d sampled stacks to %s", len(samples), path)
+        return len(samples)
+
+
+def _fold(thread_name: str, frame: FrameType | None) -> str:
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    frames.append(thread_name)
+    return ";".join(reversed(frames)).replace(" ", "_")
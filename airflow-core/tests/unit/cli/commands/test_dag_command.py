@@ -325,6 +325,18 @@ class TestCliDags:
         data = json.loads(out)
         assert any(item["file"].endswith("example_complex.py") for item in data)
         assert any("example_complex" in item["dags"] for item in data)
+        assert all("top_level_code_duration" not in item for item in data)
+
+    def test_cli_report_profile_imports(self, stdout_capture):
+        args = self.parser.parse_args(["dags", "report", "--profile-imports", "--output", "json"])
+        with stdout_capture as temp_stdout:
+            dag_command.dag_report(args)
+            out = temp_stdout.getvalue()
+
+        data = json.loads(out)
+        assert data
+        assert all(item["top_level_code_duration"] is not None for item in data)
+        assert all("slowest_imports" in item for item in data)
 
     def test_cli_get_dag_details(self, stdout_capture):
         args = self.parser.parse_args(["dags", "details", "example_complex", "--output", "yaml"])
@@ -0,0 +1,167 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Tests for the bytecode cache of the PythonDagImporter."""
+
+from __future__ import annotations
+
+import sys
+import textwrap
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.importers import PythonDagImporter
+from airflow.dag_processing.importers.python_importer import _CachedBytecodeLoader
+
+from tests_common.test_utils.config import conf_vars
+
+DAG_SOURCE = textwrap.dedent(
+    """\
+    from airflow.sdk import DAG
+
+    from cached_helpers import DEFAULT_ID
+
+    dag = DAG(DEFAULT_ID, schedule=None)
+    """
+)
+
+
+@pytest.fixture
+def bundle_path(tmp_path, monkeypatch):
+    bundle_path = tmp_path / "bundle"
+    bundle_path.mkdir()
+    (bundle_path / "cached_helpers.py").write_text("DEFAULT_ID = 'cached_dag'\n")
+    (bundle_path / "cached_dag.py").write_text(DAG_SOURCE)
+    monkeypatch.syspath_prepend(bundle_path)
+    yield bundle_path
+    sys.modules.pop("cached_helpers", None)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache_dir = tmp_path / "cache"
+    with conf_vars({("dag_processor", "parsing_bytecode_cache_dir"): str(cache_dir)}):
+        yield cache_dir
+
+
+def import_dags(path, bundle_path):
+    sys.modules.pop("cached_helpers", None)
+    result = PythonDagImporter().import_file(path, bundle_path=bundle_path, bundle_name="testing")
+    assert not result.errors
+    return result
+
+
+class TestBytecodeCache:
+    def test_disabled_by_default(self, bundle_path):
+        with mock.patch.object(_CachedBytecodeLoader, "get_code") as get_code:
+            import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        get_code.assert_not_called()
+
+    def test_dag_file_and_bundle_modules_are_cached(self, bundle_path, cache_dir):
+        result = import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        assert [dag.dag_id for dag in result.dags] == ["cached_dag"]
+        assert len(list(cache_dir.glob("*/*.bin"))) == 2
+        assert sys.modules["cached_helpers"].__loader__.cache_dir == cache_dir
+
+    def test_cached_code_is_reused(self, bundle_path, cache_dir):
+        import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        with mock.patch.object(_CachedBytecodeLoader, "source_to_code") as source_to_code:
+            result = import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        source_to_code.assert_not_called()
+        assert [dag.dag_id for dag in result.dags] == ["cached_dag"]
+
+    def test_cache_is_shared_by_copies_of_the_bundle(self, bundle_path, cache_dir, tmp_path, monkeypatch):
+        import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        other_version = tmp_path / "other_version"
+        other_version.mkdir()
+        (other_version / "cached_helpers.py").write_text("DEFAULT_ID = 'cached_dag'\n")
+        (other_version / "cached_dag.py").write_text(DAG_SOURCE)
+        monkeypatch.syspath_prepend(other_version)
+        with mock.patch.object(_CachedBytecodeLoader, "source_to_code") as source_to_code:
+            result = import_dags(other_version / "cached_dag.py", other_version)
+
+        source_to_code.assert_not_called()
+        assert len(list(cache_dir.glob("*/*.bin"))) == 2
+        # Tracebacks point to the files of the imported copy
+        assert sys.modules["cached_helpers"].__file__ == str(other_version / "cached_helpers.py")
+        assert result.dags[0].fileloc == str(other_version / "cached_dag.py")
+
+    def test_changed_module_is_compiled_again(self, bundle_path, cache_dir):
+        import_dags(bundle_path / "cached_dag.py", bundle_path)
+        (bundle_path / "cached_helpers.py").write_text("DEFAULT_ID = 'renamed_dag'\n")
+
+        result = import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        assert [dag.dag_id for dag in result.dags] == ["renamed_dag"]
+        assert len(list(cache_dir.glob("*/*.bin"))) == 3
+
+    def test_corrupted_entries_are_ignored(self, bundle_path, cache_dir):
+        import_dags(bundle_path / "cached_dag.py", bundle_path)
+        for entry in cache_dir.glob("*/*.bin"):
+            entry.write_bytes(b"corrupted")
+
+        result = import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        assert [dag.dag_id for dag in result.dags] == ["cached_dag"]
+
+    def test_modules_outside_of_the_bundle_are_not_cached(
+        self, bundle_path, cache_dir, tmp_path, monkeypatch
+    ):
+        library_path = tmp_path / "library"
+        library_path.mkdir()
+        (library_path / "cached_library.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(library_path)
+        (bundle_path / "cached_dag.py").write_text("import cached_library\n" + DAG_SOURCE)
+
+        try:
+            import_dags(bundle_path / "cached_dag.py", bundle_path)
+            assert not isinstance(sys.modules["cached_library"].__loader__, _CachedBytecodeLoader)
+        finally:
+            sys.modules.pop("cached_library", None)
+        assert len(list(cache_dir.glob("*/*.bin"))) == 2
+
+    def test_cache_dir_is_private(self, bundle_path, cache_dir):
+        import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        assert all(entry.stat().st_mode & 0o777 == 0o700 for entry in cache_dir.iterdir())
+
+    def test_writable_by_others_cache_dir_is_refused(self, bundle_path, cache_dir):
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+
+        with mock.patch.object(_CachedBytecodeLoader, "get_code") as get_code:
+            import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        get_code.assert_not_called()
+        assert not list(cache_dir.iterdir())
+
+    def test_cache_dir_owned_by_other_user_is_refused(self, bundle_path, cache_dir):
+        cache_dir.mkdir(mode=0o700)
+
+        with (
+            mock.patch("airflow.dag_processing.importers.python_importer.os.getuid", return_value=-1),
+            mock.patch.object(_CachedBytecodeLoader, "get_code") as get_code,
+        ):
+            import_dags(bundle_path / "cached_dag.py", bundle_path)
+
+        get_code.assert_not_called()
@@ -36,10 +36,12 @@ from airflow.configuration import conf
 from airflow.dag_processing.collection import (
     AssetModelOperation,
     DagModelOperation,
+    ParsedDagFile,
     _get_latest_runs_stmt,
     _get_latest_runs_stmt_partitioned,
     _update_dag_tags,
     update_dag_parsing_results_in_db,
+    update_dag_parsing_results_in_db_batch,
 )
 from airflow.exceptions import SerializationError
 from airflow.models import DagModel, DagRun
@@ -63,6 +65,7 @@ from airflow.providers.standard.triggers.file import FileDeleteTrigger
 from airflow.sdk import DAG, Asset, AssetAlias, AssetAll, AssetWatcher
 from airflow.sdk.definitions.timetables.assets import PartitionedAssetTimetable
 from airflow.serialization.definitions.assets import SerializedAsset
+from airflow.serialization.definitions.dag import SerializedDAG
 from airflow.serialization.encoders import encode_trigger, ensure_serialized_asset
 from airflow.serialization.serialized_objects import LazyDeserializedDAG
 from airflow.timetables.simple import PartitionedAtRuntime
@@ -1436,6 +1439,99 @@ class TestUpdateDagParsingResults:
             orm_dag = session.get(DagModel, "dag_max_failed_runs_default")
             assert orm_dag.max_consecutive_failed_dag_runs == 6
 
+    @staticmethod
+    def _parsed_file(relative_fileloc, dag_ids, parse_duration=None, import_errors=None):
+        dags = []
+        for dag_id in dag_ids:
+            dag = DAG(dag_id=dag_id)
+            dag.fileloc = f"/opt/airflow/dags/{relative_fileloc}"
+            dag.relative_fileloc = relative_fileloc
+            dags.append(LazyDeserializedDAG.from_dag(dag))
+        return ParsedDagFile(
+            relative_fileloc=relative_fileloc,
+            dags=dags,
+            import_errors=import_errors or {},
+            parse_duration=parse_duration,
+            warnings=set(),
+        )
+
+    @pytest.mark.usefixtures("clean_db")
+    def test_batch_writes_the_results_of_all_files(self, testing_dag_bundle, session):
+        session.add(ParseImportError(filename="fixed.py", bundle_name="testing", stacktrace="Boom"))
+        session.flush()
+
+        update_dag_parsing_results_in_db_batch(
+            bundle_name="testing",
+            bundle_version=None,
+            files=[
+                self._parsed_file("a.py", ["dag_a1", "dag_a2"], parse_duration=1.0),
+                self._parsed_file("b.py", ["dag_b"], parse_duration=2.0),
+                self._parsed_file("fixed.py", [], parse_duration=3.0),
+                self._parsed_file("broken.py", [], import_errors={("testing", "broken.py"): "Error"}),
+            ],
+            session=session,
+        )
+
+        last_parse_durations = session.execute(select(DagModel.dag_id, DagModel.last_parse_duration))
+        assert {dag_id: duration for dag_id, duration in last_parse_durations} == {
+            "dag_a1": 1.0,
+            "dag_a2": 1.0,
+            "dag_b": 2.0,
+        }
+        assert session.scalar(select(func.count(SerializedDagModel.dag_id))) == 3
+        assert session.scalars(select(ParseImportError.filename)).all() == ["broken.py"]
+
+    @pytest.mark.usefixtures("clean_db")
+    def test_batch_with_duplicate_dag_ids(self, testing_dag_bundle, session):
+        update_dag_parsing_results_in_db_batch(
+            bundle_name="testing",
+            bundle_version=None,
+            files=[
+                self._parsed_file("first.py", ["duplicated_dag", "dag_1"]),
+                self._parsed_file("second.py", ["duplicated_dag", "dag_2"]),
+            ],
+            session=session,
+        )
+
+        assert session.get(DagModel, "duplicated_dag").relative_fileloc == "second.py"
+        assert set(session.scalars(select(DagModel.dag_id))) == {"duplicated_dag", "dag_1", "dag_2"}
+        warning = session.scalar(
+            select(DagWarning).where(
+                DagWarning.dag_id == "duplicated_dag",
+                DagWarning.warning_type == DagWarningType.DUPLICATE_DAG_ID,
+            )
+        )
+        assert warning is not None
+        assert "first.py" in warning.message
+
+    @pytest.mark.usefixtures("clean_db")
+    def test_batch_is_retried_as_a_whole(self, testing_dag_bundle, session):
+        bulk_write_to_db = SerializedDAG.bulk_write_to_db
+        calls = []
+
+        def fail_in_second_round(bundle_name, bundle_version, dags, *args, **kwargs):
+            calls.append(sorted(dag.dag_id for dag in dags))
+            if len(calls) == 2:
+                raise OperationalError(statement=mock.ANY, params=mock.ANY, orig=mock.ANY)
+            return bulk_write_to_db(bundle_name, bundle_version, dags, *args, **kwargs)
+
+        with patch.object(SerializedDAG, "bulk_write_to_db", side_effect=fail_in_second_round):
+            update_dag_parsing_results_in_db_batch(
+                bundle_name="testing",
+                bundle_version=None,
+                files=[
+                    self._parsed_file("first.py", ["duplicated_dag", "dag_1"]),
+                    self._parsed_file("second.py", ["duplicated_dag", "dag_2"]),
+                ],
+                session=session,
+            )
+
+        # The rollback discarded the first round too, so it is written again
+        assert calls == [["dag_1", "duplicated_dag"], ["dag_2", "duplicated_dag"]] * 2
+        assert set(session.scalars(select(DagModel.dag_id))) == {"duplicated_dag", "dag_1", "dag_2"}
+        assert session.get(DagModel, "duplicated_dag").relative_fileloc == "second.py"
+        assert session.scalar(select(func.count(SerializedDagModel.dag_id))) == 3
+
 
 @pytest.mark.db_test
 class TestUpdateDagTags:
@@ -0,0 +1,100 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from airflow.dag_processing.file_watcher import DagFileChanges, DagFileWatcher
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    (tmp_path / "dag.py").write_text("# dag")
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "subdir" / "nested_dag.py").write_text("# dag")
+    return tmp_path
+
+
+@pytest.fixture
+def watcher(bundle_path):
+    watcher = DagFileWatcher(bundle_path)
+    yield watcher
+    watcher.close()
+
+
+class TestDagFileWatcher:
+    def test_no_changes(self, watcher):
+        assert watcher.poll() == DagFileChanges(modified=set(), rescan=False)
+
+    def test_modified_files(self, watcher, bundle_path):
+        (bundle_path / "dag.py").write_text("# changed")
+        (bundle_path / "subdir" / "nested_dag.py").write_text("# changed")
+        (bundle_path / "data.csv").write_text("")
+
+        assert watcher.poll() == DagFileChanges(
+            modified={Path("dag.py"), Path("subdir/nested_dag.py")}, rescan=False
+        )
+        assert watcher.poll() == DagFileChanges(modified=set(), rescan=False)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            pytest.param(lambda path: (path / "new_dag.py").write_text(""), id="created"),
+            pytest.param(lambda path: (path / "dag.py").unlink(), id="deleted"),
+            pytest.param(lambda path: (path / "dag.py").rename(path / "renamed.py"), id="renamed"),
+            pytest.param(lambda path: (path / ".airflowignore").write_text("dag.py"), id="ignore-file"),
+            pytest.param(lambda path: (path / "new_dir").mkdir(), id="directory"),
+        ],
+    )
+    def test_changes_requiring_rescan(self, watcher, bundle_path, change):
+        change(bundle_path)
+
+        assert watcher.poll().rescan is True
+
+    def test_new_directories_are_watched(self, watcher, bundle_path):
+        (bundle_path / "new_dir").mkdir()
+        watcher.poll()
+
+        (bundle_path / "new_dir" / "dag.py").write_text("")
+        assert watcher.poll().rescan is True
+        (bundle_path / "new_dir" / "dag.py").write_text("# changed")
+        assert watcher.poll() == DagFileChanges(modified={Path("new_dir/dag.py")}, rescan=False)
+
+    def test_symlink_cycles_are_watched_once(self, bundle_path):
+        (bundle_path / "subdir" / "loop").symlink_to(bundle_path, target_is_directory=True)
+        watcher = DagFileWatcher(bundle_path)
+        try:
+            (bundle_path / "new_dir").mkdir()
+            (bundle_path / "new_dir" / "loop").symlink_to(bundle_path, target_is_directory=True)
+            assert watcher.poll().rescan is True
+
+            (bundle_path / "subdir" / "nested_dag.py").write_text("# changed")
+            assert watcher.poll() == DagFileChanges(modified={Path("subdir/nested_dag.py")}, rescan=False)
+        finally:
+            watcher.close()
+
+    def test_poll_after_close(self, watcher):
+        watcher.close()
+
+        with pytest.raises(ValueError, match="closed"):
+            watcher.poll()
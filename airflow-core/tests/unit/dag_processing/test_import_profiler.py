@@ -0,0 +1,116 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import importlib
+import importlib._bootstrap
+import sys
+import textwrap
+import time
+
+import pytest
+
+from airflow.dag_processing.dagbag import DagBag
+from airflow.dag_processing.import_profiler import ImportProfiler
+
+
+@pytest.fixture
+def modules_path(tmp_path, monkeypatch):
+    """Modules taking a known time to import: ``slow_outer`` imports ``slow_inner``."""
+    (tmp_path / "slow_inner.py").write_text("import time\ntime.sleep(0.05)\n")
+    (tmp_path / "slow_outer.py").write_text("import time\nimport slow_inner\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(tmp_path)
+    yield tmp_path
+    for name in ("slow_inner", "slow_outer"):
+        sys.modules.pop(name, None)
+
+
+class TestImportProfiler:
+    def test_import_times(self, modules_path):
+        with ImportProfiler() as profiler:
+            importlib.import_module("slow_outer")
+
+        profile = profiler.profile()
+        imports = {module.module: module for module in profile.imports}
+        outer, inner = imports["slow_outer"], imports["slow_inner"]
+        assert outer.direct
+        assert not inner.direct
+        assert inner.cumulative_duration >= 0.05
+        assert outer.cumulative_duration >= outer.self_duration + inner.cumulative_duration
+        assert outer.self_duration >= 0.02
+        assert profile.imports[0].module == "slow_outer"
+        assert profile.total_duration >= outer.cumulative_duration
+        assert profile.format_slowest().startswith("slow_outer (")
+
+    def test_already_imported_modules_are_not_recorded(self, modules_path):
+        importlib.import_module("slow_outer")
+
+        with ImportProfiler() as profiler:
+            importlib.import_module("slow_outer")
+
+        assert profiler.profile().imports == []
+
+    def test_top_level_code_duration(self, modules_path):
+        with ImportProfiler() as profiler:
+            importlib.import_module("slow_outer")
+            # Time spent outside of imports is top-level code
+            time.sleep(0.03)
+
+        profile = profiler.profile()
+        assert profile.top_level_code_duration >= 0.03
+        assert profile.top_level_code_duration < profile.total_duration - 0.05
+
+    def test_restores_import_machinery(self, modules_path):
+        original = importlib._bootstrap._find_and_load
+
+        with pytest.raises(ImportError):
+            with ImportProfiler():
+                importlib.import_module("slow_missing")
+
+        assert importlib._bootstrap._find_and_load is original
+
+    def test_max_modules(self, modules_path):
+        with ImportProfiler(max_modules=1) as profiler:
+            importlib.import_module("slow_outer")
+
+        assert [module.module for module in profiler.profile().imports] == ["slow_outer"]
+
+
+def test_dagbag_profile_imports(modules_path, tmp_path):
+    dag_folder = tmp_path / "dags"
+    dag_folder.mkdir()
+    (dag_folder / "profiled_dag.py").write_text(
+        textwrap.dedent(
+            """\
+            import slow_outer
+            from airflow.sdk import DAG
+
+            dag = DAG("profiled_dag", schedule=None)
+            """
+        )
+    )
+
+    assert DagBag(dag_folder=dag_folder).import_profiles == {}
+
+    sys.modules.pop("slow_outer", None)
+    sys.modules.pop("slow_inner", None)
+    dagbag = DagBag(dag_folder=dag_folder, profile_imports=True)
+
+    profile = dagbag.import_profiles["profiled_dag.py"]
+    assert "slow_outer" in [module.module for module in profile.imports if module.direct]
+    assert profile.total_duration >= 0.07
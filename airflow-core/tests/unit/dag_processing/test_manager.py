@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import copy
+import errno
 import json
 import logging
 import os
@@ -25,7 +26,9 @@ import random
 import re
 import shutil
 import signal
+import sys
 import textwrap
+import threading
 import time
 import zipfile
 from collections import OrderedDict, defaultdict, namedtuple
@@ -47,11 +50,13 @@ from airflow.callbacks.callback_requests import DagCallbackRequest
 from airflow.dag_processing.bundles.base import BaseDagBundle
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.dagbag import DagBag
+from airflow.dag_processing.file_watcher import DagFileWatcher
 from airflow.dag_processing.manager import (
     BundleState,
     DagFileInfo,
     DagFileProcessorManager,
     DagFileStat,
+    DagFileStatIndex,
 )
 from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
 from airflow.models import DagModel, DbCallbackRequest
@@ -61,6 +66,8 @@ from airflow.models.dagbundle import DagBundleModel
 from airflow.models.dagcode import DagCode
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.team import Team
+from airflow.sdk import DAG
+from airflow.serialization.serialized_objects import LazyDeserializedDAG
 from airflow.utils.net import get_hostname
 from airflow.utils.session import create_session
 
@@ -579,6 +586,42 @@ class TestDagFileProcessorManager:
         manager.prepare_file_queue(known_files=known_files)
         assert manager._file_queue == expected
 
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "duration"})
+    def test_files_sorted_by_last_duration(self):
+        """Test the slowest files to parse are queued first, and the files never parsed before them"""
+        now = timezone.utcnow()
+        durations = {"file_1.py": 0.05, "file_2.py": 30.0, "file_3.py": None, "file_4.py": 2.0}
+        manager = DagFileProcessorManager(max_runs=2)
+        for file, last_duration in zip(_get_file_infos(list(durations)), durations.values()):
+            if last_duration is not None:
+                manager._file_stats[file] = DagFileStat(
+                    last_finish_time=now - timedelta(hours=1), last_duration=last_duration, run_count=1
+                )
+
+        manager.prepare_file_queue(known_files={"testing": set(_get_file_infos(list(durations)))})
+
+        assert list(manager._file_queue) == _get_file_infos(
+            ["file_3.py", "file_2.py", "file_4.py", "file_1.py"]
+        )
+
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "parse_sla"})
+    def test_files_sorted_by_last_finish_time(self):
+        """Test the files parsed the longest time ago are queued first, and the files never parsed before them"""
+        now = timezone.utcnow()
+        parsed_ago = {"file_1.py": 2, "file_2.py": 10, "file_3.py": 5, "file_4.py": None}
+        manager = DagFileProcessorManager(max_runs=2)
+        for file, hours_ago in zip(_get_file_infos(list(parsed_ago)), parsed_ago.values()):
+            if hours_ago is not None:
+                manager._file_stats[file] = DagFileStat(
+                    last_finish_time=now - timedelta(hours=hours_ago), last_duration=1.0, run_count=1
+                )
+
+        manager.prepare_file_queue(known_files={"testing": set(_get_file_infos(list(parsed_ago)))})
+
+        assert list(manager._file_queue) == _get_file_infos(
+            ["file_4.py", "file_2.py", "file_3.py", "file_1.py"]
+        )
+
     @conf_vars({("dag_processor", "file_parsing_sort_mode"): "modified_time"})
     @mock.patch("airflow.utils.file.os.path.getmtime", new=mock_get_mtime)
     def test_files_sorted_by_modified_time(self):
@@ -1513,6 +1556,142 @@ class TestDagFileProcessorManager:
         assert manager._file_stats[file].last_finish_time > original_stat.last_finish_time
         assert manager._file_stats[file].num_dags == 0
 
+    @conf_vars({("dag_processor", "enable_parse_cache"): "True"})
+    def test_parse_cache_skips_unchanged_files(self, tmp_path, session):
+        (tmp_path / "dag.py").write_text("# dag")
+        manager = DagFileProcessorManager(max_runs=1)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        manager._bundle_versions["testing"] = None
+
+        processor, _ = self.mock_processor(start_time=time.monotonic() - 1)
+        processor.had_callbacks = False
+        processor.parsing_result = MagicMock(
+            import_errors={}, warnings=[], serialized_dags=[MagicMock(dag_id="dag_1")]
+        )
+
+        def parse(parsing_result):
+            manager._file_queue = OrderedDict.fromkeys([file])
+            with (
+                mock.patch.object(manager, "_create_process", return_value=processor) as create_process,
+                mock.patch.object(
+                    manager, "record_cached_parsing_results", return_value=set()
+                ) as record_cached,
+            ):
+                manager._start_new_processes()
+            if create_process.called:
+                processor.parsing_result = parsing_result
+                with mock.patch.object(manager, "persist_parsing_result"):
+                    manager.handle_parsing_result(file, manager._processors.pop(file), session=session)
+            return create_process.called, record_cached
+
+        parsed_result = processor.parsing_result
+        parsed, record_cached = parse(parsed_result)
+        assert parsed
+        record_cached.assert_not_called()
+
+        parsed, record_cached = parse(parsed_result)
+        assert not parsed
+        record_cached.assert_called_once_with(dag_ids=["dag_1"])
+        assert manager._file_stats[file].num_dags == 1
+        assert manager._file_stats[file].run_count == 2
+
+        # A file with import errors is parsed until it is fixed
+        (tmp_path / "dag.py").write_text("# changed")
+        parsed, _ = parse(MagicMock(import_errors={"dag.py": "boom"}, warnings=[], serialized_dags=[]))
+        assert parsed
+        parsed, _ = parse(parsed_result)
+        assert parsed
+        parsed, _ = parse(parsed_result)
+        assert not parsed
+
+    @conf_vars({("dag_processor", "enable_parse_cache"): "True"})
+    def test_parse_cache_hit_with_deleted_dag_is_parsed_again(self, tmp_path):
+        (tmp_path / "dag.py").write_text("# dag")
+        manager = DagFileProcessorManager(max_runs=1)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        manager._bundle_versions["testing"] = None
+        fingerprint = manager._parse_cache.fingerprint(file, bundle_version=None, get_variable=lambda key: None)
+        manager._parse_cache.store(file, fingerprint, ["dag_1"])
+        manager._file_queue = OrderedDict.fromkeys([file])
+
+        with (
+            mock.patch.object(manager, "_create_process") as create_process,
+            mock.patch.object(manager, "record_cached_parsing_results", return_value={"dag_1"}),
+        ):
+            manager._start_new_processes()
+
+        create_process.assert_not_called()
+        # The entry is dropped and the file queued again, so it is parsed on the next loop.
+        assert manager._parse_cache.get(file) is None
+        assert list(manager._file_queue) == [file]
+        assert file not in manager._file_stats
+
+    @conf_vars({("dag_processor", "enable_parse_cache"): "True"})
+    def test_requested_parse_bypasses_parse_cache(self, tmp_path):
+        (tmp_path / "dag.py").write_text("# dag")
+        manager = DagFileProcessorManager(max_runs=1)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        manager._parse_cache.store(file, "fingerprint", ["dag_1"])
+
+        with (
+            mock.patch.object(manager, "claim_priority_files", return_value=[file]),
+            mock.patch.object(manager, "request_bundle_refresh"),
+        ):
+            manager._queue_requested_files_for_parsing()
+
+        assert manager._parse_cache.get(file) is None
+        assert list(manager._file_queue) == [file]
+
+    @pytest.mark.usefixtures("testing_dag_bundle")
+    def test_record_cached_parsing_results_skips_inactive_dags(self, session):
+        last_parsed_time = timezone.utcnow() - timedelta(days=1)
+        for dag_id, is_stale in (("active_dag", False), ("stale_dag", True)):
+            session.add(
+                DagModel(
+                    dag_id=dag_id,
+                    bundle_name="testing",
+                    relative_fileloc="dag.py",
+                    last_parsed_time=last_parsed_time,
+                    is_stale=is_stale,
+                )
+            )
+        session.flush()
+
+        manager = DagFileProcessorManager(max_runs=1)
+        inactive = manager.record_cached_parsing_results(
+            dag_ids=["active_dag", "stale_dag", "deleted_dag"], session=session
+        )
+
+        assert inactive == {"stale_dag", "deleted_dag"}
+        session.expire_all()
+        assert session.get(DagModel, "active_dag").last_parsed_time > last_parsed_time
+        assert session.get(DagModel, "stale_dag").last_parsed_time == last_parsed_time
+
+    @pytest.mark.usefixtures("testing_dag_bundle")
+    def test_record_cached_parsing_results(self, session):
+        last_parsed_time = timezone.utcnow() - timedelta(days=1)
+        session.add(
+            DagModel(
+                dag_id="cached_dag",
+                bundle_name="testing",
+                relative_fileloc="dag.py",
+                last_parsed_time=last_parsed_time,
+                is_stale=False,
+            )
+        )
+        session.flush()
+
+        manager = DagFileProcessorManager(max_runs=1)
+        manager.record_cached_parsing_results(dag_ids=["cached_dag"], session=session)
+
+        session.expire_all()
+        assert session.get(DagModel, "cached_dag").last_parsed_time > last_parsed_time
+
+        DagFileProcessorManager(max_runs=1).record_cached_parsing_results(dag_ids=["cached_dag"])
+
+        session.expire_all()
+        assert session.get(DagModel, "cached_dag").last_parsed_time > last_parsed_time
+
     def test_collect_results_processes_remaining_files_when_one_persist_fails(self, session):
         manager = DagFileProcessorManager(max_runs=1)
         file_a = DagFileInfo(bundle_name="testing", rel_path=Path("a.py"), bundle_path=TEST_DAGS_FOLDER)
@@ -1556,6 +1735,82 @@ class TestDagFileProcessorManager:
         assert manager._file_stats[file_b].run_count == 2
         assert len(manager._processors) == 0
 
+    def _finished_processors(self, manager, rel_paths):
+        manager._bundle_versions["testing"] = "v1"
+        for rel_path in rel_paths:
+            file = DagFileInfo(bundle_name="testing", rel_path=Path(rel_path), bundle_path=TEST_DAGS_FOLDER)
+            proc, _ = self.mock_processor(start_time=time.monotonic() - 1)
+            proc.had_callbacks = False
+            proc.parsing_result = DagFileParsingResult(fileloc=rel_path, serialized_dags=[])
+            manager._processors[file] = proc
+        return list(manager._processors)
+
+    @conf_vars({("dag_processor", "parsing_result_batch_size"): "2"})
+    def test_collect_results_persists_results_in_batches(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        files = self._finished_processors(manager, ["a.py", "b.py", "c.py"])
+
+        with (
+            mock.patch.object(manager, "persist_parsing_results") as persist_parsing_results,
+            mock.patch.object(manager, "persist_parsing_result") as persist_parsing_result,
+        ):
+            manager._collect_results()
+
+        persist_parsing_result.assert_not_called()
+        assert [[file for file, _, _ in call.args[0]] for call in persist_parsing_results.call_args_list] == [
+            files[:2],
+            files[2:],
+        ]
+        assert all(manager._file_stats[file].run_count == 1 for file in files)
+        assert len(manager._processors) == 0
+
+    @conf_vars({("dag_processor", "parsing_result_batch_size"): "10"})
+    def test_collect_results_persists_one_by_one_when_batch_fails(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        file_a, file_b = self._finished_processors(manager, ["a.py", "b.py"])
+
+        with (
+            mock.patch.object(manager, "persist_parsing_results", side_effect=RuntimeError("boom")),
+            mock.patch.object(
+                manager, "persist_parsing_result", side_effect=[RuntimeError("boom"), None]
+            ) as persist_parsing_result,
+        ):
+            manager._collect_results()
+
+        assert persist_parsing_result.call_count == 2
+        assert manager._file_stats[file_a].num_dags == 0
+        assert manager._file_stats[file_a].run_count == 1
+        assert manager._file_stats[file_b].run_count == 1
+        assert len(manager._processors) == 0
+
+    @pytest.mark.usefixtures("testing_dag_bundle")
+    def test_persist_parsing_results(self, session):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._bundle_versions["testing"] = None
+        file_a, file_b = _get_file_infos(["a.py", "b.py"])
+        dag = DAG(dag_id="dag_a")
+        dag.relative_fileloc = "a.py"
+
+        manager.persist_parsing_results(
+            [
+                (
+                    file_a,
+                    DagFileParsingResult(fileloc="a.py", serialized_dags=[LazyDeserializedDAG.from_dag(dag)]),
+                    1.5,
+                ),
+                (
+                    file_b,
+                    DagFileParsingResult(fileloc="b.py", serialized_dags=[], import_errors={"b.py": "Boom"}),
+                    0.5,
+                ),
+            ],
+            session=session,
+        )
+
+        assert session.get(DagModel, "dag_a").last_parse_duration == 1.5
+        import_error = session.scalar(select(ParseImportError))
+        assert (import_error.filename, import_error.stacktrace) == ("b.py", "Boom")
+
     def test_collect_results_tolerates_stale_file_handle_on_close(self):
         """A stale NFS file handle on close (e.g. OpenShift) must not crash the manager."""
         manager = DagFileProcessorManager(max_runs=1)
@@ -2694,6 +2949,73 @@ class TestDagFileProcessorManager:
             manager._refresh_dag_bundles({})
             assert bundleone.refresh.call_count == 2  # forced refresh
 
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+    def test_bundle_file_changes_are_watched(self, tmp_path, configure_dag_bundles):
+        bundle_path = tmp_path / "bundleone"
+        bundle_path.mkdir()
+        dag_source = "from airflow.sdk import DAG\n"
+        (bundle_path / "dag_one.py").write_text(dag_source)
+
+        with (
+            configure_dag_bundles({"bundleone": bundle_path}),
+            conf_vars({("dag_processor", "file_change_detection"): "inotify"}),
+        ):
+            DagBundlesManager().sync_bundles_to_db()
+            manager = DagFileProcessorManager(max_runs=1)
+            manager._dag_bundles = list(DagBundlesManager().get_all_dag_bundles())
+            known_files: dict[str, set[DagFileInfo]] = {}
+            manager._refresh_dag_bundles(known_files)
+            assert manager._bundle_watchers["bundleone"] is not None
+            dag_one = DagFileInfo(
+                bundle_name="bundleone", bundle_path=bundle_path, rel_path=Path("dag_one.py")
+            )
+            assert known_files == {"bundleone": {dag_one}}
+
+            manager._file_queue.clear()
+            with mock.patch.object(manager, "_find_files_in_bundle") as find_files:
+                (bundle_path / "dag_one.py").write_text(dag_source + "# modified\n")
+                manager._process_bundle_file_changes(known_files)
+            find_files.assert_not_called()
+            assert list(manager._file_queue) == [dag_one]
+
+            manager._file_queue.clear()
+            (bundle_path / "dag_two.py").write_text(dag_source)
+            (bundle_path / "dag_one.py").unlink()
+            manager._process_bundle_file_changes(known_files)
+            dag_two = DagFileInfo(
+                bundle_name="bundleone", bundle_path=bundle_path, rel_path=Path("dag_two.py")
+            )
+            assert known_files == {"bundleone": {dag_two}}
+            assert list(manager._file_queue) == [dag_two]
+
+            manager._close_bundle_watchers()
+            assert manager._bundle_watchers == {}
+
+    def test_bundle_watcher_error_falls_back_to_polling(self, tmp_path, configure_dag_bundles):
+        bundle_path = tmp_path / "bundleone"
+        bundle_path.mkdir()
+        (bundle_path / "dag_one.py").write_text("from airflow.sdk import DAG\n")
+
+        with configure_dag_bundles({"bundleone": bundle_path}):
+            DagBundlesManager().sync_bundles_to_db()
+            manager = DagFileProcessorManager(max_runs=1)
+            manager._dag_bundles = list(DagBundlesManager().get_all_dag_bundles())
+            known_files: dict[str, set[DagFileInfo]] = {}
+            manager._refresh_dag_bundles(known_files)
+            watcher = mock.Mock(spec=DagFileWatcher)
+            watcher.poll.side_effect = OSError(errno.ENOSPC, "No space left on device")
+            manager._bundle_watchers["bundleone"] = watcher
+
+            (bundle_path / "dag_two.py").write_text("from airflow.sdk import DAG\n")
+            manager._process_bundle_file_changes(known_files)
+
+        watcher.close.assert_called_once()
+        assert manager._bundle_watchers == {"bundleone": None}
+        assert {file.rel_path for file in known_files["bundleone"]} == {
+            Path("dag_one.py"),
+            Path("dag_two.py"),
+        }
+
     def test_bundles_versions_are_stored(self, session):
         config = [
             {
@@ -3316,6 +3638,104 @@ class TestDagFileProcessorManager:
         # iteration will see a version mismatch and re-refresh rather than skip incorrectly
         assert "mock_bundle" not in manager._bundle_versions
 
+    @staticmethod
+    def _wait_for_bundle_refreshes(manager, *names):
+        for name in names:
+            manager._bundle_refreshes[name].future.result(timeout=10)
+
+    @conf_vars({("dag_processor", "bundle_refresh_workers"): "2"})
+    def test_refresh_dag_bundles_in_threads(self):
+        """A slow bundle refreshed in a worker thread does not delay the other bundles."""
+        manager = DagFileProcessorManager(max_runs=1)
+        slow_bundle = self._make_refresh_bundle()
+        slow_bundle.name = "slow_bundle"
+        slow_bundle.is_initialized = False
+        initialized_in = []
+
+        def initialize():
+            initialized_in.append(threading.current_thread().name)
+            slow_bundle.is_initialized = True
+
+        slow_bundle.initialize.side_effect = initialize
+        release = threading.Event()
+        slow_bundle.refresh.side_effect = lambda: release.wait(10)
+        fast_bundle = self._make_refresh_bundle()
+        fast_bundle.name = "fast_bundle"
+        manager._dag_bundles = [slow_bundle, fast_bundle]
+
+        known_files: dict[str, set[DagFileInfo]] = {}
+        with (
+            mock.patch.object(
+                manager, "get_bundle_state", return_value=BundleState(last_refreshed=None, version=None)
+            ),
+            mock.patch.object(manager, "update_bundle_state") as update_bundle_state,
+            mock.patch.object(manager, "_find_files_in_bundle", return_value=[Path("dag.py")]),
+            mock.patch.object(manager, "deactivate_deleted_dags"),
+            mock.patch.object(manager, "clear_orphaned_import_errors"),
+            mock.patch.object(manager, "_add_new_files_to_queue") as add_new_files_to_queue,
+        ):
+            manager._refresh_dag_bundles(known_files)
+            assert known_files == {}
+
+            self._wait_for_bundle_refreshes(manager, "fast_bundle")
+            manager._refresh_dag_bundles(known_files)
+            assert set(known_files) == {"fast_bundle"}
+            update_bundle_state.assert_called_once_with("fast_bundle", last_refreshed=mock.ANY, version=None)
+            add_new_files_to_queue.assert_called_once_with(known_files=known_files)
+
+            release.set()
+            self._wait_for_bundle_refreshes(manager, "slow_bundle")
+            manager._refresh_dag_bundles(known_files)
+            assert set(known_files) == {"fast_bundle", "slow_bundle"}
+
+        # Initialized in the worker thread rather than in the loop
+        assert len(initialized_in) == 1
+        assert initialized_in[0].startswith("bundle-refresh")
+        manager._stop_bundle_refreshes()
+
+    @conf_vars(
+        {
+            ("dag_processor", "bundle_refresh_workers"): "2",
+            ("dag_processor", "bundle_refresh_timeout"): "0.01",
+        }
+    )
+    def test_refresh_dag_bundles_in_threads_timeout(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        bundle = self._make_refresh_bundle()
+        release = threading.Event()
+        bundle.refresh.side_effect = lambda: release.wait(10)
+        manager._dag_bundles = [bundle]
+
+        with (
+            mock.patch.object(
+                manager, "get_bundle_state", return_value=BundleState(last_refreshed=None, version=None)
+            ),
+            mock.patch.object(manager, "update_bundle_state"),
+            mock.patch.object(manager, "_find_files_in_bundle", return_value=[]),
+            mock.patch.object(manager, "deactivate_deleted_dags"),
+            mock.patch.object(manager, "clear_orphaned_import_errors"),
+            mock.patch("airflow.dag_processing.manager.stats.incr") as stats_incr,
+        ):
+            manager._refresh_dag_bundles({})
+            time.sleep(0.05)
+            manager._force_refresh_bundles.add("mock_bundle")
+            manager._refresh_dag_bundles({})
+            manager._refresh_dag_bundles({})
+
+            stats_incr.assert_called_once_with(
+                "dag_processing.bundle_refresh_timeouts", tags={"bundle_name": "mock_bundle"}
+            )
+            # Not refreshed again while the first refresh is running
+            bundle.refresh.assert_called_once()
+
+            release.set()
+            self._wait_for_bundle_refreshes(manager, "mock_bundle")
+            known_files: dict[str, set[DagFileInfo]] = {}
+            manager._refresh_dag_bundles(known_files)
+
+        assert "mock_bundle" in known_files
+        manager._stop_bundle_refreshes()
+
     def test_unpack_bundle_version_with_bundle_version_dataclass(self):
         from airflow.dag_processing.bundles.base import BundleVersion, unpack_bundle_version
 
@@ -3382,6 +3802,53 @@ class TestDagFileProcessorManager:
         assert manager._bundle_version_data["mock_bundle"] == test_data
 
 
+class TestDagFileStatIndex:
+    def test_getitem_adds_missing_stat(self):
+        file = _get_file_infos(["a.py"])[0]
+        index = DagFileStatIndex()
+
+        assert index.get(file) is None
+        assert file not in index
+        assert index[file] == DagFileStat()
+        assert file in index
+        assert index.get_by_presence_key(file.presence_key) is index[file]
+
+    def test_lookup_by_presence_key(self):
+        file = _get_file_infos(["a.py"])[0]
+        versioned_file = _get_versioned_file_info("a.py")
+        index = DagFileStatIndex({file: DagFileStat(run_count=1)})
+        index[versioned_file] = DagFileStat(run_count=2)
+
+        assert list(index.presence_keys()) == [file.presence_key]
+        assert index.get_by_presence_key(file.presence_key) == DagFileStat(run_count=2)
+        assert list(index.items_by_presence_key()) == [(file.presence_key, DagFileStat(run_count=2))]
+
+        del index[versioned_file]
+        assert index.get_by_presence_key(file.presence_key) == DagFileStat(run_count=1)
+        del index[file]
+        assert index.get_by_presence_key(file.presence_key) is None
+        assert not index.presence_keys()
+
+    def test_pop_presence_key(self):
+        file, other_file = _get_file_infos(["a.py", "b.py"])
+        index = DagFileStatIndex({file: DagFileStat(), other_file: DagFileStat()})
+        index[_get_versioned_file_info("a.py")] = DagFileStat()
+
+        index.pop_presence_key(file.presence_key)
+
+        assert index == {other_file: DagFileStat()}
+        assert list(index.presence_keys()) == [other_file.presence_key]
+
+    def test_manager_converts_assigned_mapping(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        file = _get_file_infos(["a.py"])[0]
+
+        manager._file_stats = {file: DagFileStat(run_count=1)}
+
+        assert isinstance(manager._file_stats, DagFileStatIndex)
+        assert manager.processed_recently(timezone.utcnow(), file) is False
+
+
 class TestMultiTeamMetrics:
     """Tests for team_name tag on dag processing metrics in multi-team mode."""
 
@@ -0,0 +1,150 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.manager import DagFileInfo
+from airflow.dag_processing.parse_cache import DagFileParseCache, ParseCacheEntry
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "__init__.py").write_text("")
+    (tmp_path / "common" / "defaults.py").write_text("RETRIES = 1\n")
+    (tmp_path / "helpers.py").write_text("from common.defaults import RETRIES\n")
+    (tmp_path / "dags").mkdir()
+    (tmp_path / "dags" / "sibling.py").write_text("SCHEDULE = None\n")
+    (tmp_path / "dags" / "dag.py").write_text("import os\nimport helpers\nfrom . import sibling\n")
+    return tmp_path
+
+
+@pytest.fixture
+def file(bundle_path):
+    return DagFileInfo(bundle_name="testing", bundle_path=bundle_path, rel_path=Path("dags/dag.py"))
+
+
+def fingerprint(cache, file, bundle_version=None, variables=None):
+    return cache.fingerprint(
+        file, bundle_version=bundle_version, get_variable=lambda key: (variables or {}).get(key)
+    )
+
+
+def rewrite(path: Path, content: str):
+    path.write_text(content)
+    # Make sure the change is visible even on file systems with a coarse mtime resolution
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestDagFileParseCache:
+    def test_stable_fingerprint(self, file):
+        cache = DagFileParseCache()
+
+        first = fingerprint(cache, file)
+        assert first is not None
+        assert fingerprint(cache, file) == first
+        assert fingerprint(DagFileParseCache(), file) == first
+
+    def test_touching_the_file_keeps_the_fingerprint(self, file, bundle_path):
+        cache = DagFileParseCache()
+        first = fingerprint(cache, file)
+
+        rewrite(bundle_path / "dags" / "dag.py", (bundle_path / "dags" / "dag.py").read_text())
+
+        assert fingerprint(cache, file) == first
+
+    @pytest.mark.parametrize(
+        "changed_file",
+        [
+            pytest.param("dags/dag.py", id="dag-file"),
+            pytest.param("helpers.py", id="absolute-import"),
+            pytest.param("dags/sibling.py", id="relative-import"),
+            pytest.param("common/defaults.py", id="transitive-import"),
+            pytest.param("common/__init__.py", id="package-init"),
+        ],
+    )
+    def test_changes_of_the_file_and_its_local_modules(self, file, bundle_path, changed_file):
+        cache = DagFileParseCache()
+        first = fingerprint(cache, file)
+
+        rewrite(bundle_path / changed_file, "CHANGED = True\n")
+
+        assert fingerprint(cache, file) != first
+
+    def test_unrelated_modules_are_ignored(self, file, bundle_path):
+        cache = DagFileParseCache()
+        first = fingerprint(cache, file)
+
+        (bundle_path / "unrelated.py").write_text("X = 1\n")
+
+        assert fingerprint(cache, file) == first
+
+    def test_bundle_version(self, file):
+        cache = DagFileParseCache()
+
+        assert fingerprint(cache, file, bundle_version="v1") != fingerprint(cache, file, bundle_version="v2")
+
+    def test_declared_inputs(self, file, bundle_path):
+        rewrite(
+            bundle_path / "dags" / "dag.py",
+            "# airflow-parse-cache: env=DEPLOYMENT variables=tables,regions\nimport os\n",
+        )
+        cache = DagFileParseCache()
+
+        with mock.patch.dict(os.environ, {"DEPLOYMENT": "staging"}):
+            first = fingerprint(cache, file, variables={"tables": "a"})
+            assert fingerprint(cache, file, variables={"tables": "a"}) == first
+            assert fingerprint(cache, file, variables={"tables": "b"}) != first
+            assert fingerprint(cache, file, variables={"tables": "a", "regions": "eu"}) != first
+        with mock.patch.dict(os.environ, {"DEPLOYMENT": "production"}):
+            assert fingerprint(cache, file, variables={"tables": "a"}) != first
+
+    def test_disabled(self, file, bundle_path):
+        rewrite(bundle_path / "dags" / "dag.py", "# airflow-parse-cache: disable\n")
+
+        assert fingerprint(DagFileParseCache(), file) is None
+
+    def test_missing_file(self, bundle_path):
+        file = DagFileInfo(bundle_name="testing", bundle_path=bundle_path, rel_path=Path("missing.py"))
+
+        assert fingerprint(DagFileParseCache(), file) is None
+
+    def test_syntax_error(self, file, bundle_path):
+        rewrite(bundle_path / "dags" / "dag.py", "import (\n")
+
+        assert fingerprint(DagFileParseCache(), file) is not None
+
+    def test_entries(self, file):
+        cache = DagFileParseCache()
+        cache.store(file, "abc", ["dag_1", "dag_2"])
+
+        other_path = DagFileInfo(
+            bundle_name=file.bundle_name, bundle_path=Path("/elsewhere"), rel_path=file.rel_path
+        )
+        assert cache.get(other_path) == ParseCacheEntry(fingerprint="abc", dag_ids=["dag_1", "dag_2"])
+        assert len(cache) == 1
+
+        cache.discard(file.presence_key)
+        assert cache.get(file) is None
+        assert len(cache) == 0
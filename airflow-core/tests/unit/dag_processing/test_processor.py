@@ -54,6 +54,7 @@ from airflow.dag_processing.manager import DagFileProcessorManager, process_pars
 from airflow.dag_processing.processor import (
     DagFileParseRequest,
     DagFileParsingResult,
+    DagFileParsingResultChunk,
     DagFileProcessorProcess,
     ToDagProcessor,
     ToManager,
@@ -64,6 +65,7 @@ from airflow.dag_processing.processor import (
     _parse_file,
     _parse_file_entrypoint,
     _pre_import_airflow_modules,
+    preload_parsing_modules,
 )
 from airflow.models import DagRun
 from airflow.sdk import DAG, BaseOperator
@@ -85,6 +87,7 @@ from airflow.sdk.execution_time.comms import (
     XComSequenceSliceResult,
 )
 from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
+from airflow.serialization.serialized_objects import LazyDeserializedDAG
 from airflow.utils.session import create_session
 from airflow.utils.state import TaskInstanceState
 
@@ -196,6 +199,35 @@ class TestDagFileProcessor:
         assert result.import_errors == {}
         assert result.serialized_dags[0].dag_id == "test_abc"
 
+    @conf_vars({("dag_processor", "parsing_result_chunk_size"): "2"})
+    def test_dags_sent_in_chunks(self, tmp_path: pathlib.Path, inprocess_client):
+        def dag_in_a_fn():
+            from airflow.sdk import DAG
+
+            for i in range(5):
+                globals()[f"dag_{i}"] = DAG(f"test_chunk_{i}", schedule=None)
+
+        path = write_dag_in_a_fn_to_file(dag_in_a_fn, tmp_path)
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=path,
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path=str(path.relative_to(tmp_path)),
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+        )
+
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        result = proc.parsing_result
+        assert result is not None
+        assert result.import_errors == {}
+        assert sorted(dag.dag_id for dag in result.serialized_dags) == [f"test_chunk_{i}" for i in range(5)]
+
     def test_top_level_variable_access_not_found(
         self,
         spy_agency: SpyAgency,
@@ -481,6 +513,46 @@ class TestDagFileProcessor:
 
         assert logger.warning.call_count == 1
 
+    def test__pre_import_airflow_modules_freezes_new_modules(self, monkeypatch):
+        logger = MagicMock(spec=FilteringBoundLogger)
+
+        def import_module(name):
+            monkeypatch.setitem(sys.modules, name, MagicMock())
+
+        with (
+            env_vars({"AIRFLOW__DAG_PROCESSOR__PARSING_PRE_IMPORT_MODULES": "true"}),
+            patch("airflow.dag_processing.processor.iter_airflow_imports", return_value=["new_module"]),
+            patch("airflow.dag_processing.processor.gc.freeze") as mock_freeze,
+            patch("airflow.dag_processing.processor.importlib.import_module", side_effect=import_module),
+        ):
+            _pre_import_airflow_modules("test.py", logger)
+            mock_freeze.assert_called_once()
+
+            mock_freeze.reset_mock()
+            _pre_import_airflow_modules("test.py", logger)
+            mock_freeze.assert_not_called()
+
+    @conf_vars({("dag_processor", "parsing_preload_modules"): "json, non_existent_module"})
+    def test_preload_parsing_modules(self):
+        logger = MagicMock(spec=FilteringBoundLogger)
+        with patch(
+            "airflow.dag_processing.processor.importlib.import_module",
+            side_effect=[None, ModuleNotFoundError()],
+        ) as mock_import:
+            preload_parsing_modules(logger)
+
+        assert [c.args[0] for c in mock_import.call_args_list] == ["json", "non_existent_module"]
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args[1] == "non_existent_module"
+
+    def test_preload_parsing_modules_by_default(self):
+        logger = MagicMock(spec=FilteringBoundLogger)
+        with patch("airflow.dag_processing.processor.importlib.import_module") as mock_import:
+            preload_parsing_modules(logger)
+
+        mock_import.assert_not_called()
+        logger.info.assert_not_called()
+
 
 @pytest.mark.parametrize(
     ("platform_uses_exec", "target", "expected_use_exec"),
@@ -699,6 +771,64 @@ def test_parse_file_static_check_with_default_warning():
     )
 
 
+@pytest.mark.parametrize(
+    ("chunk_size", "expected_chunk_sizes", "expected_in_result"),
+    [
+        pytest.param("2", [2, 2], 1, id="chunks"),
+        pytest.param("5", [5], 0, id="one-full-chunk"),
+        pytest.param("10", [], 5, id="few-dags"),
+        pytest.param("0", [], 5, id="disabled"),
+    ],
+)
+def test_parse_file_sends_dags_in_chunks(tmp_path, chunk_size, expected_chunk_sizes, expected_in_result):
+    dag_file = tmp_path / "many_dags.py"
+    dag_file.write_text(
+        textwrap.dedent(
+            """\
+            from airflow.sdk import DAG
+
+            for i in range(5):
+                globals()[f"dag_{i}"] = DAG(f"dag_{i}", schedule=None)
+            """
+        )
+    )
+    chunks: list[DagFileParsingResultChunk] = []
+
+    with conf_vars({("dag_processor", "parsing_result_chunk_size"): chunk_size}):
+        result = _parse_file(
+            DagFileParseRequest(file=str(dag_file), bundle_path=tmp_path, bundle_name="testing"),
+            log=structlog.get_logger(),
+            send_chunk=chunks.append,
+        )
+
+    assert [len(chunk.serialized_dags) for chunk in chunks] == expected_chunk_sizes
+    assert len(result.serialized_dags) == expected_in_result
+    all_dags = [dag for chunk in chunks for dag in chunk.serialized_dags] + result.serialized_dags
+    assert sorted(dag.dag_id for dag in all_dags) == [f"dag_{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("profiling", [True, False])
+def test_parse_file_import_profile(profiling):
+    log = MagicMock()
+    with conf_vars({("dag_processor", "parsing_import_profiling"): str(profiling)}):
+        result = _parse_file(
+            DagFileParseRequest(
+                file=f"{TEST_DAG_FOLDER}/test_dag_version_inflation_check.py",
+                bundle_path=TEST_DAG_FOLDER,
+                bundle_name="testing",
+            ),
+            log=log,
+        )
+
+    assert result is not None
+    profile_calls = [c for c in log.info.call_args_list if c.args == ("DAG file import profile",)]
+    if profiling:
+        (call,) = profile_calls
+        assert 0 <= call.kwargs["top_level_code_duration"] <= call.kwargs["total_duration"]
+    else:
+        assert profile_calls == []
+
+
 def test_callback_processing_does_not_update_timestamps():
     """Callback processing should not update last_finish_time to prevent stale DAG detection."""
     stat = process_parse_results(
@@ -2205,6 +2335,33 @@ class TestDagFileProcessorProcess:
             proc._create_log_forwarder((), "task.stdout", data=b"")
         mock_base.assert_called_once_with((), "dag_processor.stdout", data=b"", log_level=logging.INFO)
 
+    def test_handle_request_parsing_result_chunks(self, proc):
+        def serialized_dags(*dag_ids):
+            return [LazyDeserializedDAG.from_dag(DAG(dag_id, schedule=None)) for dag_id in dag_ids]
+
+        with patch.object(DagFileProcessorProcess, "send_msg", autospec=True) as mock_send_msg:
+            for req_id, chunk in enumerate([("dag_0", "dag_1"), ("dag_2",)]):
+                proc._handle_request(
+                    DagFileParsingResultChunk(serialized_dags=serialized_dags(*chunk)),
+                    structlog.get_logger(),
+                    req_id=req_id,
+                )
+            assert proc.parsing_result is None
+            proc._handle_request(
+                DagFileParsingResult(fileloc="dags/my_dag.py", serialized_dags=serialized_dags("dag_3")),
+                structlog.get_logger(),
+                req_id=2,
+            )
+
+        # Every chunk is acknowledged, so the parsing process sends the next one when this one is handled
+        assert mock_send_msg.call_count == 3
+        assert [dag.dag_id for dag in proc.parsing_result.serialized_dags] == [
+            "dag_0",
+            "dag_1",
+            "dag_2",
+            "dag_3",
+        ]
+
     def test_handle_request_get_connection_masks_password_and_extra(self, proc):
         proc.client.connections.get.return_value = ConnectionResponse(
             conn_id="test_conn",
@@ -22,6 +22,7 @@ import datetime
 import logging
 import os
 import re
+import threading
 import time
 from collections import Counter, deque
 from collections.abc import Callable, Generator, Iterator
@@ -64,7 +65,7 @@ from airflow.executors.executor_loader import ExecutorLoader
 from airflow.executors.executor_utils import ExecutorName
 from airflow.executors.local_executor import LocalExecutor
 from airflow.jobs.job import Job, run_job
-from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_job_runner import ConcurrencyMap, SchedulerJobRunner
 from airflow.models.asset import (
     AssetActive,
     AssetAliasModel,
@@ -92,7 +93,7 @@ from airflow.models.deadline import Deadline
 from airflow.models.deadline_alert import DeadlineAlert
 from airflow.models.hitl import HITLDetail
 from airflow.models.log import Log
-from airflow.models.pool import Pool
+from airflow.models.pool import Pool, PoolOccupancy
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.team import Team
@@ -144,7 +145,7 @@ from airflow.timetables.simple import (
     PartitionedAtRuntime,
 )
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
-from airflow.utils.sqlalchemy import with_row_locks
+from airflow.utils.sqlalchemy import prohibit_commit, with_row_locks
 from airflow.utils.state import CallbackState, DagRunState, State, TaskInstanceState
 from airflow.utils.types import DagRunTriggeredByType, DagRunType
 
@@ -1422,6 +1423,28 @@ class TestSchedulerJob:
 
         patch_traceback_extract_stack.assert_called()
 
+    @conf_vars(
+        {
+            ("profiling", "scheduler_loop_profiling"): "True",
+            ("profiling", "scheduler_sampling_interval"): "0.001",
+        }
+    )
+    def test_loop_profiling(self, mock_executors, configure_testing_dag_bundle, tmp_path):
+        with configure_testing_dag_bundle(os.devnull):
+            scheduler_job = Job()
+            self.job_runner = SchedulerJobRunner(job=scheduler_job, num_runs=1)
+            self.job_runner._execute()
+
+        histograms = self.job_runner._loop_profiler.histograms
+        assert {"scheduling", "dagrun_scheduling", "executor_heartbeat", "executor_events"} <= set(histograms)
+        assert histograms["executor_heartbeat"].count == len(self.job_runner.executors)
+        assert histograms["dagrun_scheduling"].queries > 0
+        assert self.job_runner._stack_sampler._thread is None
+
+        with patch("airflow.jobs.scheduler_job_runner.AIRFLOW_HOME", str(tmp_path)):
+            self.job_runner._debug_dump(1, mock.MagicMock())
+        assert (tmp_path / "scheduler_profile.folded").exists()
+
     def test_find_executable_task_instances_backfill(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_backfill"
         task_id_1 = "dummy"
@@ -2414,6 +2437,257 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "60"})
+    def test_find_executable_task_instances_incremental_concurrency_map(self, dag_maker, session):
+        """The in-memory concurrency map is kept across critical sections and updated incrementally."""
+        with dag_maker(dag_id="incremental_concurrency_map", max_active_tasks=2, session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+            EmptyOperator(task_id="task_3")
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued_tis) == 2
+        concurrency_map = self.job_runner._concurrency_map
+        assert concurrency_map is not None
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 2
+
+        with mock.patch.object(concurrency_map, "load") as mock_load:
+            assert self.job_runner._get_concurrency_map(session=session) is concurrency_map
+        mock_load.assert_not_called()
+
+        # A finished task instance releases its slot without a reload.
+        finished_ti = session.get(TaskInstance, queued_tis[0].id)
+        finished_ti.state = State.SUCCESS
+        concurrency_map.record_finished(finished_ti)
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 1
+        assert (dr.dag_id, finished_ti.task_id) not in concurrency_map.task_concurrency_map
+        session.flush()
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued_tis) == 1
+        session.rollback()
+
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "60"})
+    def test_find_executable_task_instances_incremental_skips_saturated_dag_runs(self, dag_maker, session):
+        """The saturated DAG runs are excluded using the in-memory counts, without aggregating them."""
+        with dag_maker(dag_id="incremental_saturated_dag_runs", max_active_tasks=1, session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED, session=session)
+        dr1.get_task_instance("task_1", session=session).state = State.RUNNING
+        dr1.get_task_instance("task_2", session=session).state = State.SCHEDULED
+        dr2.get_task_instance("task_1", session=session).state = State.SCHEDULED
+        session.flush()
+
+        with mock.patch(
+            "airflow.jobs.scheduler_job_runner._get_current_dr_task_concurrency"
+        ) as mock_dr_task_concurrency:
+            queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+
+        mock_dr_task_concurrency.assert_not_called()
+        # The first run is full, so it does not starve the DAG's other run.
+        assert [(ti.run_id, ti.task_id) for ti in queued_tis] == [(dr2.run_id, "task_1")]
+        session.rollback()
+
+    @conf_vars({("scheduler", "pool_occupancy_reconcile_interval"): "60"})
+    def test_find_executable_task_instances_pool_occupancy(self, dag_maker, session):
+        """The pool occupancy ledger is kept across critical sections instead of re-aggregating."""
+        set_default_pool_slots(2)
+        with dag_maker(dag_id="pool_occupancy", session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+            EmptyOperator(task_id="task_3")
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued_tis) == 2
+        pool_occupancy = self.job_runner._pool_occupancy
+        assert pool_occupancy is not None
+        assert pool_occupancy.slots[(Pool.DEFAULT_POOL_NAME, TaskInstanceState.QUEUED)] == 2
+
+        with mock.patch.object(PoolOccupancy, "load") as mock_load:
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+        mock_load.assert_not_called()
+
+        finished_ti = session.get(TaskInstance, queued_tis[0].id)
+        finished_ti.state = State.SUCCESS
+        pool_occupancy.record_finished(finished_ti)
+        session.flush()
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued_tis) == 1
+        session.rollback()
+
+    def test_concurrency_map_reconcile_reports_drift(self, dag_maker, session):
+        with dag_maker(dag_id="concurrency_map_drift", session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+
+        dr = dag_maker.create_dagrun(session=session)
+        ti1, ti2 = dr.get_task_instances(session=session)
+        ti1.state = State.RUNNING
+        ti2.state = State.DEFERRED
+        session.flush()
+
+        concurrency_map = ConcurrencyMap()
+        concurrency_map.load(session=session)
+        assert concurrency_map.dag_run_active_tasks_map == {(dr.dag_id, dr.run_id): 1}
+        assert concurrency_map.task_concurrency_map == {(dr.dag_id, "task_1"): 1, (dr.dag_id, "task_2"): 1}
+
+        # Both task instances finished behind the scheduler's back.
+        ti1.state = State.SUCCESS
+        ti2.state = State.SUCCESS
+        session.flush()
+
+        assert concurrency_map.reconcile(session=session) == 5
+        assert concurrency_map.dag_run_active_tasks_map == {}
+        assert concurrency_map.task_concurrency_map == {}
+        assert concurrency_map.task_dagrun_concurrency_map == {}
+        assert concurrency_map.reconcile(session=session) == 0
+
+    @pytest.mark.parametrize(
+        ("state", "expected_dag_run_active", "expected_task"),
+        [
+            pytest.param(TaskInstanceState.SUCCESS, 0, 0, id="finished"),
+            pytest.param(TaskInstanceState.DEFERRED, 0, 1, id="deferred"),
+            pytest.param(TaskInstanceState.QUEUED, 1, 1, id="requeued"),
+        ],
+    )
+    def test_concurrency_map_record_finished(self, state, expected_dag_run_active, expected_task):
+        ti = mock.MagicMock(dag_id="dag", run_id="run", task_id="task", state=state)
+        concurrency_map = ConcurrencyMap()
+        concurrency_map.record_queued(ti)
+
+        concurrency_map.record_finished(ti)
+        # Decrementing again never makes a counter negative.
+        concurrency_map.record_finished(ti)
+
+        assert concurrency_map.dag_run_active_tasks_map[("dag", "run")] == expected_dag_run_active
+        assert concurrency_map.task_concurrency_map[("dag", "task")] == expected_task
+        assert concurrency_map.task_dagrun_concurrency_map[("dag", "run", "task")] == expected_task
+
+    def test_concurrency_map_resumed_task_is_not_counted_twice(self):
+        ti = mock.MagicMock(dag_id="dag", run_id="run", task_id="task", map_index=-1)
+        concurrency_map = ConcurrencyMap()
+        concurrency_map.record_queued(ti)
+
+        ti.state = TaskInstanceState.DEFERRED
+        concurrency_map.record_finished(ti)
+        assert concurrency_map.dag_run_active_tasks_map == {}
+        assert concurrency_map.task_concurrency_map == {("dag", "task"): 1}
+
+        # The trigger fired and the task instance is queued again: it only takes its DAG-run slot back.
+        ti.state = TaskInstanceState.SCHEDULED
+        concurrency_map.record_queued(ti)
+        assert concurrency_map.dag_run_active_tasks_map == {("dag", "run"): 1}
+        assert concurrency_map.task_concurrency_map == {("dag", "task"): 1}
+        assert concurrency_map.task_dagrun_concurrency_map == {("dag", "run", "task"): 1}
+
+    def test_concurrency_map_load_deferred(self, dag_maker, session):
+        with dag_maker(dag_id="concurrency_map_load_deferred", session=session):
+            EmptyOperator(task_id="task")
+
+        ti = dag_maker.create_dagrun(session=session).get_task_instance("task", session=session)
+        ti.state = State.DEFERRED
+        session.flush()
+
+        concurrency_map = ConcurrencyMap()
+        concurrency_map.load(session=session)
+        concurrency_map.load_deferred(session=session)
+        assert concurrency_map.deferred_tis == {(ti.dag_id, ti.run_id, ti.task_id, ti.map_index)}
+
+        concurrency_map.record_queued(ti)
+        assert concurrency_map.dag_run_active_tasks_map == {(ti.dag_id, ti.run_id): 1}
+        assert concurrency_map.task_concurrency_map == {(ti.dag_id, "task"): 1}
+
+    def test_concurrency_map_rollback(self):
+        resumed_ti = mock.MagicMock(dag_id="dag", run_id="run", task_id="resumed", map_index=-1)
+        new_ti = mock.MagicMock(dag_id="dag", run_id="run", task_id="new", map_index=-1)
+        concurrency_map = ConcurrencyMap()
+        concurrency_map.task_concurrency_map[("dag", "resumed")] = 1
+        concurrency_map.task_dagrun_concurrency_map[("dag", "run", "resumed")] = 1
+        concurrency_map.deferred_tis.add(("dag", "run", "resumed", -1))
+
+        concurrency_map.record_queued(new_ti)
+        concurrency_map.commit()
+        concurrency_map.record_queued(resumed_ti)
+        concurrency_map.record_queued(new_ti)
+        concurrency_map.rollback()
+
+        # Only the task instances queued since the last commit are undone.
+        assert concurrency_map.dag_run_active_tasks_map == {("dag", "run"): 1}
+        assert concurrency_map.task_concurrency_map == {("dag", "resumed"): 1, ("dag", "new"): 1}
+        assert concurrency_map.deferred_tis == {("dag", "run", "resumed", -1)}
+
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "60"})
+    def test_critical_section_rollback_undoes_concurrency_map(self, dag_maker, session):
+        from sqlalchemy.exc import OperationalError
+
+        with dag_maker(dag_id="concurrency_map_critical_section_rollback", session=session):
+            BashOperator(task_id="task", bash_command="true")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        dr.get_task_instance("task", session=session).state = State.SCHEDULED
+        session.commit()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        with (
+            mock.patch.object(self.job_runner, "_schedule_all_dag_runs", return_value=[]),
+            mock.patch.object(
+                self.job_runner,
+                "_enqueue_task_instances_with_queued_state",
+                side_effect=OperationalError("INSERT INTO log", {}, Exception("deadlock detected")),
+            ),
+            pytest.raises(OperationalError),
+        ):
+            self.job_runner._do_scheduling(session)
+
+        concurrency_map = self.job_runner._concurrency_map
+        assert concurrency_map is not None
+        assert concurrency_map.dag_run_active_tasks_map == {}
+        assert concurrency_map.task_concurrency_map == {}
+
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "60"})
+    def test_process_executor_events_releases_task_killed_externally(self, dag_maker, session):
+        with dag_maker(dag_id="concurrency_map_killed_externally", session=session):
+            EmptyOperator(task_id="task")
+        ti = dag_maker.create_dagrun(session=session).get_task_instance("task", session=session)
+        ti.state = State.QUEUED
+        session.commit()
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[executor])
+        concurrency_map = self.job_runner._get_concurrency_map(session=session)
+        assert concurrency_map.dag_run_active_tasks_map == {(ti.dag_id, ti.run_id): 1}
+
+        # The task instance is still queued when the event arrives, and only failed while handling it.
+        executor.event_buffer[ti.key] = State.FAILED, None
+        self.job_runner._process_executor_events(executor=executor, session=session)
+
+        ti.refresh_from_db(session=session)
+        assert ti.state == State.FAILED
+        assert concurrency_map.dag_run_active_tasks_map == {}
+        assert concurrency_map.task_concurrency_map == {}
+        assert concurrency_map.task_dagrun_concurrency_map == {}
+
     # TODO: This is a hack, I think I need to just remove the setting and have it on always
     def test_find_executable_task_instances_max_active_tis_per_dag(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_max_active_tis_per_dag"
@@ -3219,6 +3493,43 @@ class TestSchedulerJob:
         assert ti.state == State.NONE
         mock_queue_workload.assert_not_called()
 
+    @conf_vars(
+        {
+            ("scheduler", "concurrency_map_reconcile_interval"): "60",
+            ("scheduler", "pool_occupancy_reconcile_interval"): "60",
+        }
+    )
+    def test_enqueue_task_instances_releases_ti_if_dagrun_in_finish_state(self, dag_maker, session):
+        """Task instances reset because their dagrun finished no longer count as queued."""
+        with dag_maker(dag_id="enqueue_releases_finished_dagrun_ti", session=session):
+            EmptyOperator(task_id="task")
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        dr.get_task_instance("task", session=session).state = State.SCHEDULED
+        session.flush()
+
+        (ti,) = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        concurrency_map = self.job_runner._concurrency_map
+        pool_occupancy = self.job_runner._pool_occupancy
+        assert concurrency_map.dag_run_active_tasks_map == {(dr.dag_id, dr.run_id): 1}
+        assert pool_occupancy.slots[(Pool.DEFAULT_POOL_NAME, TaskInstanceState.QUEUED)] == 1
+
+        ti.dag_run.state = DagRunState.FAILED
+        with patch.object(BaseExecutor, "queue_workload") as mock_queue_workload:
+            self.job_runner._enqueue_task_instances_with_queued_state(
+                [ti], executor=self.null_exec, session=session
+            )
+
+        mock_queue_workload.assert_not_called()
+        assert ti.state is None
+        assert concurrency_map.dag_run_active_tasks_map == {}
+        assert concurrency_map.task_concurrency_map == {}
+        assert concurrency_map.task_dagrun_concurrency_map == {}
+        assert (Pool.DEFAULT_POOL_NAME, TaskInstanceState.QUEUED) not in pool_occupancy.slots
+        session.rollback()
+
     def test_enqueue_task_instances_skips_ti_without_dag_version_id(self, dag_maker, session, caplog):
         """Task instances without dag_version_id are not enqueued and an error is logged."""
         dag_id = "SchedulerJobTest.test_enqueue_task_instances_skips_ti_without_dag_version_id"
@@ -6564,6 +6875,137 @@ class TestSchedulerJob:
 
             assert mock_schedule.call_count == 1
 
+    @conf_vars({("scheduler", "dag_cache_max_size_mb"): "2"})
+    def test_dag_bag_cache_budget(self):
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        dag_bag = self.job_runner.scheduler_dag_bag
+        assert dag_bag._use_cache is True
+        assert dag_bag._dags.maxsize == 2 * 1024 * 1024
+        assert dag_bag._stats_prefix == "scheduler.dag_bag"
+
+    @conf_vars({("scheduler", "dag_run_scheduling_workers"): "2"})
+    def test_schedule_all_dag_runs_in_parallel(self, dag_maker, session):
+        """With dag_run_scheduling_workers, runs are scheduled on threads in their own sessions."""
+        runs = []
+        for dag_id in ("parallel_a", "parallel_b", "parallel_c"):
+            with dag_maker(dag_id=dag_id, schedule="@once"):
+                EmptyOperator(task_id="task")
+            runs.append(dag_maker.create_dagrun(state=DagRunState.RUNNING))
+        session.commit()
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, executors=[self.null_exec])
+
+        with (
+            patch.object(
+                self.job_runner,
+                "_schedule_dag_runs_in_own_session",
+                wraps=self.job_runner._schedule_dag_runs_in_own_session,
+            ) as mock_worker,
+            prohibit_commit(session) as guard,
+        ):
+            result = self.job_runner._schedule_all_dag_runs(guard, runs, session=session)
+
+        # All runs of a Dag go to the same thread, and each thread gets at least one Dag.
+        assert mock_worker.call_count == 2
+        partitions = [call.args[0] for call in mock_worker.call_args_list]
+        assert sorted(run_id for partition in partitions for run_id in partition) == sorted(r.id for r in runs)
+        assert all(partitions)
+        # Callbacks are paired with the DagRun objects of the calling session.
+        assert sorted((run.dag_id for run, _ in result)) == ["parallel_a", "parallel_b", "parallel_c"]
+        assert all(any(run is r for r in runs) for run, _ in result)
+
+        session.expunge_all()
+        states = session.scalars(select(TaskInstance.state).where(TaskInstance.task_id == "task")).all()
+        # EmptyOperator tasks are marked successful instead of being scheduled.
+        assert states == [TaskInstanceState.SUCCESS] * 3
+
+    @conf_vars({("scheduler", "dag_run_scheduling_workers"): "2"})
+    def test_schedule_all_dag_runs_in_parallel_retries_failed_partition_only(self, dag_maker, session):
+        """A database error in one thread only retries that thread's runs; listeners run on the caller's thread."""
+        from sqlalchemy.exc import OperationalError
+
+        runs = []
+        for dag_id in ("parallel_ok", "parallel_flaky"):
+            with dag_maker(dag_id=dag_id, schedule="@once"):
+                EmptyOperator(task_id="task")
+            run = dag_maker.create_dagrun(state=DagRunState.RUNNING)
+            # All tasks are done, so the run finishes and notifies listeners when scheduled.
+            for ti in run.task_instances:
+                ti.state = TaskInstanceState.SUCCESS
+            runs.append(run)
+        session.commit()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        schedule_dag_run = self.job_runner._schedule_dag_run
+        scheduled: list[str] = []
+
+        def flaky_schedule_dag_run(dag_run, session):
+            scheduled.append(dag_run.dag_id)
+            if dag_run.dag_id == "parallel_flaky" and scheduled.count("parallel_flaky") == 1:
+                raise OperationalError("UPDATE task_instance", {}, Exception("deadlock detected"))
+            return schedule_dag_run(dag_run, session=session)
+
+        listener_threads = []
+        with (
+            patch.object(self.job_runner, "_schedule_dag_run", side_effect=flaky_schedule_dag_run),
+            patch("airflow.models.dagrun.get_listener_manager") as mock_listener_manager,
+            prohibit_commit(session) as guard,
+        ):
+            mock_listener_manager.return_value.hook.on_dag_run_success.side_effect = (
+                lambda dag_run, msg: listener_threads.append((dag_run, threading.current_thread()))
+            )
+            result = self.job_runner._schedule_all_dag_runs(guard, runs, session=session)
+
+        # The committed partition is not scheduled again when the other one is retried.
+        assert sorted(scheduled) == ["parallel_flaky", "parallel_flaky", "parallel_ok"]
+        assert sorted(run.dag_id for run, _ in result) == ["parallel_flaky", "parallel_ok"]
+        # Listeners get the caller's DagRun objects, with the state committed by the threads.
+        assert sorted(run.dag_id for run, _ in listener_threads) == ["parallel_flaky", "parallel_ok"]
+        assert all(any(run is r for r in runs) for run, _ in listener_threads)
+        assert all(run.state == DagRunState.SUCCESS for run, _ in listener_threads)
+        assert {thread for _, thread in listener_threads} == {threading.current_thread()}
+
+    @conf_vars({("scheduler", "dag_run_scheduling_workers"): "2"})
+    def test_schedule_all_dag_runs_in_parallel_raises_after_committed_partitions(self, dag_maker, session):
+        """An unexpected error in one thread is raised once the other threads' callbacks are sent."""
+        runs = []
+        for dag_id in ("parallel_ok", "parallel_broken"):
+            with dag_maker(dag_id=dag_id, schedule="@once"):
+                EmptyOperator(task_id="task")
+            run = dag_maker.create_dagrun(state=DagRunState.RUNNING)
+            for ti in run.task_instances:
+                ti.state = TaskInstanceState.SUCCESS
+            runs.append(run)
+        session.commit()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        broken_run_id = runs[1].id
+        schedule_dag_runs_in_own_session = self.job_runner._schedule_dag_runs_in_own_session
+
+        def broken_partition(dag_run_ids):
+            if broken_run_id in dag_run_ids:
+                raise RuntimeError("broken partition")
+            return schedule_dag_runs_in_own_session(dag_run_ids)
+
+        with (
+            patch.object(self.job_runner, "_schedule_dag_runs_in_own_session", side_effect=broken_partition),
+            patch.object(DagRun, "get_running_dag_runs_to_examine", return_value=runs),
+            patch.object(self.job_runner, "_send_dag_callbacks_to_processor") as mock_send_callbacks,
+            patch("airflow.models.dagrun.get_listener_manager") as mock_listener_manager,
+            patch.object(self.job_runner, "_critical_section_enqueue_task_instances") as mock_critical_section,
+            pytest.raises(RuntimeError, match="broken partition"),
+        ):
+            self.job_runner._do_scheduling(session)
+
+        # The committed partition is notified and its callback sent; the queueing is not reached.
+        (sent_dag, _), _ = mock_send_callbacks.call_args
+        assert sent_dag.dag_id == "parallel_ok"
+        (call,) = mock_listener_manager.return_value.hook.on_dag_run_success.call_args_list
+        assert call.kwargs["dag_run"].dag_id == "parallel_ok"
+        mock_critical_section.assert_not_called()
+        assert self.job_runner._dag_run_scheduling_error is None
+
     def test_bulk_write_to_db_external_trigger_dont_skip_scheduled_run(self, dag_maker, testing_dag_bundle):
         """
         Test that externally triggered Dag Runs should not affect (by skipping) next
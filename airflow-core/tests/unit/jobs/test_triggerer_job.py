@@ -24,6 +24,7 @@ import itertools
 import os
 import random
 import selectors
+import signal
 import threading
 import time
 import typing
@@ -55,6 +56,7 @@ from airflow.executors.workloads.trigger import RunTrigger
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import (
     _USER_ACTION_CANCEL_MSG,
+    CoalescedTriggerRuns,
     ToTriggerRunner,
     ToTriggerSupervisor,
     TriggerCommsDecoder,
@@ -84,11 +86,13 @@ from airflow.sdk.execution_time.comms import (
     AssetStateStoreResult,
     ClearAssetStateStoreByName,
     ClearAssetStateStoreByUri,
+    ConnectionResult,
     DeleteAssetStateStoreByName,
     DeleteAssetStateStoreByUri,
     ErrorResponse,
     GetAssetStateStoreByName,
     GetAssetStateStoreByUri,
+    GetConnection,
     OKResponse,
     SetAssetStateStoreByName,
     SetAssetStateStoreByUri,
@@ -102,6 +106,7 @@ from airflow.serialization.serialized_objects import LazyDeserializedDAG
 from airflow.triggers.base import BaseEventTrigger, BaseTrigger, TriggerEvent
 from airflow.triggers.shared_stream import SharedStreamProducer
 from airflow.triggers.testing import FailureTrigger, SuccessTrigger
+from airflow.utils.loop_profiler import StepStats
 from airflow.utils.state import State, TaskInstanceState
 from airflow.utils.types import DagRunType
 
@@ -124,6 +129,66 @@ if TYPE_CHECKING:
 pytestmark = pytest.mark.db_test
 
 
+class BlockingTrigger(BaseTrigger):
+    """Trigger making a synchronous call, which blocks the event loop of the triggerer."""
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return ("tests.unit.jobs.test_triggerer_job.BlockingTrigger", {})
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        time.sleep(0.05)  # noqa: ASYNC251 - blocks the event loop on purpose
+        yield TriggerEvent(True)
+
+
+class CoalescedTrigger(BaseTrigger):
+    """Trigger firing its value once released, whose identical instances share a run."""
+
+    supports_coalescing = True
+    release: ClassVar[asyncio.Event]
+    started: ClassVar[asyncio.Queue]
+    runs: ClassVar[list[CoalescedTrigger]] = []
+    killed: ClassVar[list[CoalescedTrigger]] = []
+    cleaned_up: ClassVar[list[CoalescedTrigger]] = []
+
+    def __init__(self, value: str) -> None:
+        super().__init__()
+        self.value = value
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.release = asyncio.Event()
+        cls.started = asyncio.Queue()
+        cls.runs, cls.killed, cls.cleaned_up = [], [], []
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return ("tests.unit.jobs.test_triggerer_job.CoalescedTrigger", {"value": self.value})
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        self.runs.append(self)
+        self.started.put_nowait(self)
+        await self.release.wait()
+        yield TriggerEvent(self.value)
+
+    async def on_kill(self) -> None:
+        self.killed.append(self)
+
+    async def cleanup(self) -> None:
+        self.cleaned_up.append(self)
+
+
+class CoalescedProgressTrigger(CoalescedTrigger):
+    """Coalesced trigger blocking the event loop, then firing a progress event before its value."""
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return ("tests.unit.jobs.test_triggerer_job.CoalescedProgressTrigger", {"value": self.value})
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        time.sleep(0.04)  # noqa: ASYNC251 - blocks the event loop on purpose
+        yield TriggerEvent("progress")
+        await self.release.wait()
+        yield TriggerEvent(self.value)
+
+
 class SerializedKwargsTrigger(BaseTrigger):
     constructed: ClassVar[list[SerializedKwargsTrigger]] = []
 
@@ -499,6 +564,41 @@ def test_start_without_job_generates_uuid_id(mocker):
     fake_proc.send_msg.assert_called_once()
 
 
+def test_start_with_runner_processes_shares_selector(mocker):
+    """start() starts the extra runner subprocesses as shards sharing the selector of the first one."""
+    from airflow.sdk.execution_time.supervisor import WatchedSubprocess
+
+    started: list[dict] = []
+
+    @classmethod
+    def fake_super_start(cls, **kwargs):
+        started.append(kwargs)
+        return cls(
+            process_log=mocker.Mock(spec=FilteringBoundLogger),
+            id=kwargs["id"],
+            pid=len(started),
+            stdin=mocker.Mock(spec=socket),
+            process=mocker.Mock(),
+            **{k: v for k, v in kwargs.items() if k not in ("id", "target", "use_exec", "logger")},
+        )
+
+    mocker.patch.object(WatchedSubprocess, "start", fake_super_start)
+    mocker.patch.object(TriggerRunnerSupervisor, "send_msg")
+
+    proc = TriggerRunnerSupervisor.start(job=Job(id=999), capacity=10, runner_processes=3)
+
+    assert [runner.runner_index for runner in proc.runners] == [0, 1, 2]
+    assert all(runner.selector is proc.selector for runner in proc.shards)
+    assert "selector" not in started[0]
+    assert TriggerRunnerSupervisor.send_msg.call_count == 3
+
+
+def test_triggerer_job_runner_rejects_invalid_runner_processes():
+    with conf_vars({("triggerer", "runner_processes"): "0"}):
+        with pytest.raises(ValueError, match=r"Number of runner processes 0 is invalid"):
+            TriggererJobRunner(job=Job(), capacity=10)
+
+
 def test_heartbeat_raises_without_job(jobless_supervisor, mocker):
     """heartbeat() must fail loudly when job is None so missing subclass overrides surface."""
     perform_heartbeat = mocker.patch("airflow.jobs.triggerer_job_runner.perform_heartbeat")
@@ -1237,6 +1337,230 @@ class TestTriggerRunner:
         assert threshold == 0.5
         mock_stats_incr.assert_called_once_with("triggers.blocked_main_thread", tags=expected_tags)
 
+    @pytest.mark.asyncio
+    async def test_block_watchdog_records_loop_lag_with_step_accounting(self) -> None:
+        with conf_vars({("profiling", "triggerer_step_accounting"): "True"}):
+            trigger_runner = TriggerRunner()
+        trigger_runner.log = AsyncMock()
+
+        async def fake_sleep(_):
+            trigger_runner.stop = True
+
+        with (
+            patch("airflow.jobs.triggerer_job_runner.asyncio.sleep", side_effect=fake_sleep),
+            patch("airflow.jobs.triggerer_job_runner.time.monotonic", side_effect=[1.0, 1.15]),
+            patch("airflow.jobs.triggerer_job_runner.stats.timing") as mock_timing,
+        ):
+            await trigger_runner.block_watchdog()
+
+        assert trigger_runner.loop_lag.count == 1
+        assert trigger_runner.loop_lag.max_ms == pytest.approx(50)
+        mock_timing.assert_called_once_with("triggerer.loop_lag", pytest.approx(50), tags={})
+
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.Trigger._decrypt_kwargs", return_value={})
+    @patch(
+        "airflow.jobs.triggerer_job_runner.TriggerRunner.get_trigger_by_classpath",
+        return_value=BlockingTrigger,
+    )
+    async def test_step_accounting_finds_blocking_trigger(self, mock_get_trigger_by_classpath, _) -> None:
+        with conf_vars(
+            {
+                ("profiling", "triggerer_step_accounting"): "True",
+                ("triggerer", "blocked_main_thread_warning_threshold"): "0.02",
+            }
+        ):
+            trigger_runner = TriggerRunner()
+        trigger_runner.to_create.append(
+            workloads.RunTrigger.model_construct(id=1, classpath="blocking", encrypted_kwargs="fake")
+        )
+
+        with patch("airflow.jobs.triggerer_job_runner.stats") as mock_stats:
+            await trigger_runner.create_triggers()
+            await trigger_runner.triggers[1]["task"]
+            summary = trigger_runner.step_accounting_summary()
+            trigger_runner.emit_step_accounting_metrics()
+
+        step_stats = trigger_runner.trigger_step_stats[1]
+        assert step_stats.max_step_ms >= 50
+        assert step_stats.cpu_ms < step_stats.wall_ms
+        mock_stats.incr.assert_called_once_with("triggers.blocking_step", tags={"trigger_class": "blocking"})
+        assert "ID 1" in summary
+        mock_stats.gauge.assert_any_call(
+            "triggerer.trigger_class_busy_time", step_stats.wall_ms, tags={"trigger_class": "blocking"}
+        )
+
+        assert await trigger_runner.cleanup_finished_triggers() == [1]
+        assert trigger_runner.trigger_step_stats == {}
+
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.Trigger._decrypt_kwargs", return_value={})
+    @patch(
+        "airflow.jobs.triggerer_job_runner.TriggerRunner.get_trigger_by_classpath",
+        return_value=BlockingTrigger,
+    )
+    async def test_step_accounting_disabled_by_default(self, mock_get_trigger_by_classpath, _) -> None:
+        trigger_runner = TriggerRunner()
+        trigger_runner.to_create.append(
+            workloads.RunTrigger.model_construct(id=1, classpath="blocking", encrypted_kwargs="fake")
+        )
+
+        await trigger_runner.create_triggers()
+        await trigger_runner.triggers[1]["task"]
+
+        assert trigger_runner.trigger_step_stats == {}
+
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.Trigger._decrypt_kwargs", return_value={})
+    @patch(
+        "airflow.jobs.triggerer_job_runner.TriggerRunner.get_trigger_by_classpath",
+        return_value=BlockingTrigger,
+    )
+    async def test_load_aware_assignment_reports_busy_time(self, mock_get_trigger_by_classpath, _) -> None:
+        with conf_vars({("triggerer", "load_aware_assignment"): "True"}):
+            trigger_runner = TriggerRunner()
+        assert trigger_runner.step_accounting
+        trigger_runner.to_create.append(
+            workloads.RunTrigger.model_construct(id=1, classpath="blocking", encrypted_kwargs="fake")
+        )
+        await trigger_runner.create_triggers()
+        await trigger_runner.triggers[1]["task"]
+
+        with patch("airflow.jobs.triggerer_job_runner.time.monotonic", side_effect=[100.0, 105.0, 110.0]):
+            reported = trigger_runner.process_trigger_events(finished_ids=[])
+            # The busy time is only reported every _BUSY_TIME_REPORT_INTERVAL seconds
+            assert trigger_runner.process_trigger_events(finished_ids=[]).busy_time is None
+            assert trigger_runner.process_trigger_events(finished_ids=[]).busy_time is not None
+
+        assert reported.busy_time == {1: trigger_runner.trigger_step_stats[1].wall_ms}
+        assert reported.busy_time[1] >= 50
+        assert trigger_runner.sanitize_trigger_events(reported).busy_time == reported.busy_time
+
+    def test_busy_time_not_reported_by_default(self) -> None:
+        trigger_runner = TriggerRunner()
+
+        assert trigger_runner.process_trigger_events(finished_ids=[]).busy_time is None
+
+    @pytest.mark.asyncio
+    async def test_sync_state_releases_triggers_without_on_kill(self) -> None:
+        trigger_runner = TriggerRunner()
+        trigger_runner.comms_decoder = AsyncMock(spec=TriggerCommsDecoder)
+        task = MagicMock(spec=asyncio.Task)
+        trigger_runner.triggers = {1: {"task": task, "is_watcher": False, "name": "mock_name", "events": 0}}
+        trigger_runner.comms_decoder.asend.return_value = messages.TriggerStateSync(
+            to_create=[], to_cancel=set(), to_release={1, 2}
+        )
+
+        await trigger_runner.sync_state_to_supervisor(finished_ids=[])
+
+        # A plain cancellation, which run_trigger() does not take for a user action
+        task.cancel.assert_called_once_with()
+        assert not trigger_runner.to_cancel
+
+    @staticmethod
+    async def _start_coalesced_triggers(trigger_runner, triggers, expected_runs):
+        for trigger_id, trigger in triggers.items():
+            trigger.task_instance = MagicMock()
+            trigger.task_instance.map_index = -1
+            trigger_runner.triggers[trigger_id] = {
+                "task": MagicMock(spec=asyncio.Task),
+                "is_watcher": False,
+                "name": f"ID {trigger_id}",
+                "events": 0,
+            }
+            trigger_runner.triggers[trigger_id]["task"] = asyncio.create_task(
+                trigger_runner.run_trigger(trigger_id, trigger)
+            )
+        for _ in range(expected_runs):
+            await asyncio.wait_for(CoalescedTrigger.started.get(), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_identical_triggers_share_a_run(self) -> None:
+        CoalescedTrigger.reset()
+        trigger_runner = TriggerRunner()
+        await self._start_coalesced_triggers(
+            trigger_runner,
+            {1: CoalescedTrigger("a"), 2: CoalescedTrigger("a"), 3: CoalescedTrigger("b")},
+            expected_runs=2,
+        )
+
+        CoalescedTrigger.release.set()
+        await asyncio.gather(*(details["task"] for details in trigger_runner.triggers.values()))
+
+        assert sorted((entry.trigger_id, entry.event.payload) for entry in trigger_runner.events) == [
+            (1, "a"),
+            (2, "a"),
+            (3, "b"),
+        ]
+        assert sorted(trigger.value for trigger in CoalescedTrigger.runs) == ["a", "b"]
+        assert sorted(trigger.value for trigger in CoalescedTrigger.cleaned_up) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_run_is_killed_with_the_last_of_its_triggers(self) -> None:
+        CoalescedTrigger.reset()
+        trigger_runner = TriggerRunner()
+        await self._start_coalesced_triggers(
+            trigger_runner, {1: CoalescedTrigger("a"), 2: CoalescedTrigger("a")}, expected_runs=1
+        )
+        first, second = (trigger_runner.triggers[trigger_id]["task"] for trigger_id in (1, 2))
+
+        first.cancel(_USER_ACTION_CANCEL_MSG)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert CoalescedTrigger.killed == []
+        assert CoalescedTrigger.cleaned_up == []
+        assert not second.done()
+
+        second.cancel(_USER_ACTION_CANCEL_MSG)
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert CoalescedTrigger.killed == CoalescedTrigger.runs
+        assert CoalescedTrigger.cleaned_up == CoalescedTrigger.runs
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_receives_the_events_already_fired(self) -> None:
+        CoalescedTrigger.reset()
+        coalesced_runs = CoalescedTriggerRuns()
+        key = CoalescedTriggerRuns.key_for(CoalescedProgressTrigger("a"))
+        first_events = coalesced_runs.subscribe(1, CoalescedProgressTrigger("a"), key)
+        assert (await anext(first_events)).payload == "progress"
+
+        late_events = coalesced_runs.subscribe(2, CoalescedProgressTrigger("a"), key)
+        CoalescedTrigger.release.set()
+
+        assert [event.payload async for event in late_events] == ["progress", "a"]
+        assert [event.payload async for event in first_events] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_run_time_is_shared_by_its_triggers(self) -> None:
+        CoalescedTrigger.reset()
+        CoalescedTrigger.release.set()
+        coalesced_runs = CoalescedTriggerRuns()
+        key = CoalescedTriggerRuns.key_for(CoalescedProgressTrigger("a"))
+        step_stats = {trigger_id: StepStats("CoalescedProgressTrigger") for trigger_id in (1, 2)}
+        events = [
+            coalesced_runs.subscribe(
+                trigger_id, CoalescedProgressTrigger("a"), key, step_stats=step_stats[trigger_id]
+            )
+            for trigger_id in (1, 2)
+        ]
+
+        for trigger_events in events:
+            assert [event.payload async for event in trigger_events] == ["progress", "a"]
+
+        assert 15 <= step_stats[1].wall_ms == step_stats[2].wall_ms
+        # The time of the run is not counted as steps of the triggers
+        assert step_stats[1].steps == step_stats[2].steps == 0
+
+    def test_coalescing_key(self) -> None:
+        key = CoalescedTriggerRuns.key_for(CoalescedTrigger("a"))
+
+        assert key is not None
+        assert CoalescedTriggerRuns.key_for(CoalescedTrigger("a")) == key
+        assert CoalescedTriggerRuns.key_for(CoalescedTrigger("b")) != key
+        # Triggers have to opt in
+        assert CoalescedTriggerRuns.key_for(BlockingTrigger()) is None
+
     def test_run_inline_trigger_canceled(self, session) -> None:
         trigger_runner = TriggerRunner()
         trigger_runner.triggers = {
@@ -2489,6 +2813,267 @@ def test_update_triggers_delegates_workload_creation(supervisor_builder, mocker)
     assert supervisor.cancelling_triggers == {1}
 
 
+@pytest.fixture
+def sharded_supervisor(mocker):
+    """Build a TriggerRunnerSupervisor with two extra runner subprocesses sharing its selector."""
+    import psutil
+
+    def build(runner_index, selector):
+        process = mocker.Mock(spec=psutil.Process, pid=42 + runner_index)
+        process.ProcessNotFound = psutil.NoSuchProcess
+        return TriggerRunnerSupervisor(
+            process_log=mocker.Mock(spec=FilteringBoundLogger),
+            id=uuid.uuid4(),
+            job=None,
+            pid=process.pid,
+            stdin=mocker.Mock(spec=socket),
+            process=process,
+            capacity=30,
+            runner_index=runner_index,
+            selector=selector,
+        )
+
+    selector = mocker.Mock(spec=selectors.DefaultSelector)
+    selector.select.return_value = []
+    supervisor = build(0, selector)
+    supervisor.shards.extend(build(index, selector) for index in (1, 2))
+    mocker.patch.object(
+        TriggerRunnerSupervisor,
+        "build_trigger_workloads",
+        autospec=True,
+        side_effect=lambda self, trigger_ids: [
+            workloads.RunTrigger(id=trigger_id, classpath="some.trigger", encrypted_kwargs="", ti=None)
+            for trigger_id in sorted(trigger_ids)
+        ],
+    )
+    return supervisor
+
+
+def _creating_trigger_ids(runner):
+    return {workload.id for workload in runner.creating_triggers}
+
+
+class TestShardedTriggerRunnerSupervisor:
+    def test_update_triggers_splits_new_triggers_between_runners(self, sharded_supervisor):
+        sharded_supervisor.update_triggers(set(range(1, 31)))
+
+        splits = [_creating_trigger_ids(runner) for runner in sharded_supervisor.runners]
+        assert set().union(*splits) == set(range(1, 31))
+        assert sum(len(split) for split in splits) == 30
+        # The split stays within the slack of a tenth of the share of the capacity of each runner
+        assert max(map(len, splits)) - min(map(len, splits)) <= 1
+
+    def test_update_triggers_split_does_not_depend_on_the_runner_instance(self, sharded_supervisor):
+        sharded_supervisor.update_triggers({5})
+        (runner,) = (r for r in sharded_supervisor.runners if r.creating_triggers)
+
+        for other in sharded_supervisor.runners:
+            other.creating_triggers.clear()
+        sharded_supervisor.update_triggers({5})
+
+        assert _creating_trigger_ids(runner) == {5}
+
+    def test_update_triggers_keeps_triggers_in_their_runner(self, sharded_supervisor):
+        first, second, third = sharded_supervisor.runners
+        first.running_triggers = {1, 2}
+        third.running_triggers = {3}
+
+        sharded_supervisor.update_triggers({1, 3})
+
+        assert not any(runner.creating_triggers for runner in sharded_supervisor.runners)
+        assert first.cancelling_triggers == {2}
+        assert not second.cancelling_triggers
+        assert not third.cancelling_triggers
+
+    def test_update_triggers_sends_new_triggers_to_least_loaded_runner(self, sharded_supervisor):
+        first, second, third = sharded_supervisor.runners
+        first.running_triggers = set(range(100, 110))
+        second.running_triggers = set(range(200, 210))
+
+        sharded_supervisor.update_triggers(first.running_triggers | second.running_triggers | {1, 2, 3})
+
+        assert _creating_trigger_ids(third) == {1, 2, 3}
+
+    def test_handle_events_and_failures_of_all_runners(self, sharded_supervisor):
+        first, second, third = sharded_supervisor.runners
+        event = TriggerEvent(True)
+        second.events.append(TriggerEventEntry(1, event, 7))
+        third.failed_triggers.append((2, None))
+
+        with (
+            mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True) as mock_event,
+            mock.patch.object(TriggerRunnerSupervisor, "on_trigger_failure", autospec=True) as mock_failure,
+        ):
+            sharded_supervisor.handle_events()
+            sharded_supervisor.handle_failed_triggers()
+
+        mock_event.assert_called_once_with(first, trigger_id=1, event=event)
+        mock_failure.assert_called_once_with(first, trigger_id=2, exc=None)
+        # The confirmation goes back to the runner which sent the event
+        assert list(second.persisted_event_seqs) == [7]
+        assert not first.persisted_event_seqs
+        assert not second.events
+        assert not third.failed_triggers
+
+    def test_emit_metrics_counts_triggers_of_all_runners(self, sharded_supervisor, mocker):
+        first, second, third = sharded_supervisor.runners
+        first.running_triggers = {1, 2}
+        third.running_triggers = {3}
+        mocker.patch.object(TriggerRunnerSupervisor, "metric_tags", return_value={})
+        gauge = mocker.patch("airflow.jobs.triggerer_job_runner.stats.gauge")
+
+        sharded_supervisor.emit_metrics()
+
+        assert gauge.mock_calls[:2] == [
+            mock.call("triggers.running", 3, tags={}),
+            mock.call("triggerer.capacity_left", 27, tags={}),
+        ]
+
+    def test_is_alive_until_any_runner_exits(self, sharded_supervisor):
+        assert sharded_supervisor.is_alive()
+
+        sharded_supervisor.shards[1]._exit_code = 1
+
+        assert not sharded_supervisor.is_alive()
+
+    def test_debug_dump_is_forwarded_to_all_runners(self, sharded_supervisor, mocker):
+        signal_subprocess = mocker.patch.object(TriggerRunnerSupervisor, "_signal_subprocess", autospec=True)
+        job_runner = TriggererJobRunner(job=Job(), capacity=30)
+        job_runner.trigger_runner = sharded_supervisor
+        sharded_supervisor.shards[0]._exit_code = 0
+
+        job_runner._debug_dump(signal.SIGUSR2, None)
+
+        assert signal_subprocess.mock_calls == [
+            mock.call(runner, signal.SIGUSR2)
+            for runner in sharded_supervisor.runners
+            if runner is not sharded_supervisor.shards[0]
+        ]
+
+    def test_kill_signals_all_runners(self, sharded_supervisor, mocker):
+        signal_subprocess = mocker.patch.object(TriggerRunnerSupervisor, "_signal_subprocess", autospec=True)
+        mocker.patch.object(
+            TriggerRunnerSupervisor, "_service_subprocess", autospec=True, side_effect=lambda self, **_: 0
+        )
+
+        sharded_supervisor.kill(escalation_delay=1)
+
+        signalled = [call.args[0] for call in signal_subprocess.mock_calls]
+        # All runners are signalled before waiting for any of them to exit
+        assert signalled[:3] == sharded_supervisor.runners
+
+
+class TestLoadAwareAssignment:
+    @staticmethod
+    def _measure(supervisor, mocker, busy_ms_per_runner):
+        """Measure the load of the runners over a sample, from the busy time their triggers report."""
+        monotonic = mocker.patch("airflow.jobs.triggerer_job_runner.time.monotonic", return_value=100.0)
+        supervisor.assignable_capacity()
+        for runner, busy_ms in zip(supervisor.runners, busy_ms_per_runner):
+            runner.running_triggers = set(busy_ms)
+            runner.trigger_busy_ms = busy_ms
+        monotonic.return_value = 130.0
+        return supervisor.assignable_capacity()
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, sharded_supervisor, mocker):
+        sharded_supervisor.job = mocker.Mock(id=1)
+        mocker.patch.object(TriggerRunnerSupervisor, "metric_tags", return_value={})
+        mocker.patch.object(Trigger, "has_other_alive_triggerer", return_value=True)
+        self.gauge = mocker.patch("airflow.jobs.triggerer_job_runner.stats.gauge")
+
+    def test_full_capacity_until_the_load_is_measured(self, sharded_supervisor, mocker):
+        mocker.patch("airflow.jobs.triggerer_job_runner.time.monotonic", return_value=100.0)
+
+        assert sharded_supervisor.assignable_capacity() == 30
+
+    def test_capacity_is_scaled_to_the_loop_utilization(self, sharded_supervisor, mocker):
+        # Four triggers each keeping a loop busy 20% of the 30 seconds, over three runners
+        capacity = self._measure(
+            sharded_supervisor, mocker, [{1: 6000.0, 2: 6000.0}, {3: 6000.0}, {4: 6000.0}]
+        )
+
+        # Each trigger costs 1/15 of the loop of the triggerer: 7 more fit below 75% utilization
+        assert capacity == 11
+        self.gauge.assert_called_once_with("triggerer.loop_utilization", pytest.approx(0.8 / 3), tags={})
+        assert not any(runner.releasing_triggers for runner in sharded_supervisor.runners)
+
+    def test_idle_triggers_leave_full_capacity(self, sharded_supervisor, mocker):
+        capacity = self._measure(sharded_supervisor, mocker, [{1: 0.0}, {}, {}])
+
+        assert capacity == 30
+
+    def test_overloaded_triggerer_releases_its_busiest_trigger(self, sharded_supervisor, mocker):
+        first, second, third = sharded_supervisor.runners
+        monotonic = mocker.patch("airflow.jobs.triggerer_job_runner.time.monotonic", return_value=100.0)
+        first.running_triggers, first.trigger_busy_ms = {1, 2}, {1: 0.0, 2: 0.0}
+        second.running_triggers, second.trigger_busy_ms = {3}, {3: 0.0}
+        sharded_supervisor.assignable_capacity()
+        first.trigger_busy_ms = {1: 27000.0, 2: 20000.0}
+        second.trigger_busy_ms = {3: 29000.0}
+        # Trigger 4 is the busiest, but started after the load sample did
+        third.running_triggers, third.trigger_busy_ms = {4}, {4: 30000.0}
+        monotonic.return_value = 130.0
+
+        assert sharded_supervisor.assignable_capacity() == 0
+
+        assert second.releasing_triggers == {3}
+        assert list(second.release_requests) == [3]
+        assert not first.releasing_triggers
+        assert not third.releasing_triggers
+
+        # At most one trigger is moved per load sample
+        monotonic.return_value = 140.0
+        assert sharded_supervisor.assignable_capacity() == 0
+        assert list(second.release_requests) == [3]
+
+    def test_no_trigger_is_released_without_another_triggerer(self, sharded_supervisor, mocker):
+        Trigger.has_other_alive_triggerer.return_value = False
+
+        capacity = self._measure(sharded_supervisor, mocker, [{1: 30000.0, 2: 30000.0}, {3: 30000.0}, {}])
+
+        assert capacity == 0
+        assert not any(runner.releasing_triggers for runner in sharded_supervisor.runners)
+
+    def test_released_trigger_is_stopped_then_unassigned(self, sharded_supervisor, mocker):
+        first = sharded_supervisor
+        first.running_triggers = {1, 2}
+        first.releasing_triggers.add(1)
+        first.release_requests.append(1)
+        log = MagicMock(spec=FilteringBoundLogger)
+
+        # The runner is told to stop the trigger, which is not cancelled in the meantime
+        with mock.patch.object(TriggerRunnerSupervisor, "send_msg", autospec=True) as mock_send:
+            first._handle_request(messages.TriggerStateChanges(events=None), log=log, req_id=1)
+        assert mock_send.call_args.args[1].to_release == {1}
+        first.update_triggers({1, 2})
+        assert not first.cancelling_triggers
+
+        with mock.patch.object(TriggerRunnerSupervisor, "send_msg", autospec=True) as mock_send:
+            first._handle_request(
+                messages.TriggerStateChanges(events=None, finished=[1], busy_time={2: 5.0}),
+                log=log,
+                req_id=2,
+            )
+        assert mock_send.call_args.args[1].to_release is None
+        assert first.released_triggers == {1}
+        assert first.trigger_busy_ms == {2: 5.0}
+
+        # It is neither restarted nor cancelled until it is unassigned from the triggerer
+        first.update_triggers({1, 2})
+        assert not first.creating_triggers
+        assert not first.cancelling_triggers
+
+        release = mocker.patch.object(Trigger, "release")
+        mocker.patch.object(Trigger, "assign_unassigned")
+        mocker.patch.object(Trigger, "ids_for_triggerer", return_value=[2])
+        first.load_triggers()
+
+        release.assert_called_once_with({1}, 1)
+        assert not first.released_triggers
+        assert not first.releasing_triggers
+
+
 def test_update_triggers_uses_fetch_hooks(session, supervisor_builder, mocker):
     trigger = TimeDeltaTrigger(datetime.timedelta(days=7))
     _, _, trigger_orm, _ = create_trigger_in_db(session, trigger)
@@ -3015,6 +3600,47 @@ async def test_all_send_paths_concurrent(decoder_pair):
     assert all(isinstance(r, messages.TriggerStateSync) for r in results)
 
 
+@pytest.mark.asyncio
+@pytest.mark.execution_timeout(15)
+@pytest.mark.parametrize(
+    ("connection_cache_ttl", "expected_requests"), [(0, ["a", "a", "a", "b"]), (60, ["a", "b"])]
+)
+async def test_connection_cache(decoder_pair, connection_cache_ttl, expected_requests):
+    """With a TTL, the lookups of a connection share one request to the supervisor, concurrent ones too."""
+    decoder, server_sock = decoder_pair
+    decoder.connection_cache_ttl = connection_cache_ttl
+    requests = []
+
+    def supervisor():
+        while (frame := _read_frame_sync(server_sock)) is not None:
+            requests.append(frame.body["conn_id"])
+            server_sock.sendall(
+                _ResponseFrame(
+                    id=frame.id,
+                    body=ConnectionResult(
+                        conn_id=frame.body["conn_id"],
+                        conn_type="http",
+                        host=None,
+                        schema=None,
+                        login=None,
+                        password=None,
+                        port=None,
+                        extra=None,
+                    ).model_dump(by_alias=True),
+                ).as_bytes()
+            )
+
+    threading.Thread(target=supervisor, daemon=True).start()
+
+    results = await asyncio.gather(*(decoder.asend(GetConnection(conn_id="a")) for _ in range(2)))
+    results.append(await decoder.asend(GetConnection(conn_id="a")))
+    results.append(await decoder.asend(GetConnection(conn_id="b")))
+
+    assert [result.conn_id for result in results] == ["a", "a", "a", "b"]
+    assert all(isinstance(result, ConnectionResult) for result in results)
+    assert requests == expected_requests
+
+
 @pytest.mark.asyncio
 async def test_connection_close_cancels_pending(decoder_pair):
     """When the connection closes while asend() is awaiting, the future is cancelled."""
@@ -3087,6 +3713,45 @@ def test_handle_events_records_persist_confirmations(jobless_supervisor):
     assert len(jobless_supervisor.events) == 0
 
 
+@mock.patch.object(TriggerRunnerSupervisor, "event_batch_size", 2)
+def test_handle_events_persists_events_in_batches(jobless_supervisor):
+    """With event_batch_size above 1, the events are persisted in batches and all their seqs confirmed."""
+    events = [TriggerEvent(index) for index in range(3)]
+    for index, event in enumerate(events):
+        jobless_supervisor.events.append(TriggerEventEntry(index, event, index + 10 if index != 1 else None))
+
+    with (
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True) as mock_event,
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True) as mock_events,
+    ):
+        jobless_supervisor.handle_events()
+
+    mock_event.assert_not_called()
+    assert mock_events.mock_calls == [
+        mock.call(jobless_supervisor, [(0, events[0]), (1, events[1])]),
+        mock.call(jobless_supervisor, [(2, events[2])]),
+    ]
+    assert list(jobless_supervisor.persisted_event_seqs) == [10, 12]
+    assert len(jobless_supervisor.events) == 0
+
+
+@mock.patch.object(TriggerRunnerSupervisor, "event_batch_size", 10)
+def test_handle_events_does_not_confirm_batch_when_persist_fails(jobless_supervisor):
+    jobless_supervisor.events.append(TriggerEventEntry(1, TriggerEvent(True), 7))
+    jobless_supervisor.events.append(TriggerEventEntry(2, TriggerEvent(True), 8))
+
+    with mock.patch.object(
+        TriggerRunnerSupervisor,
+        "on_trigger_events",
+        autospec=True,
+        side_effect=RuntimeError("db down"),
+    ):
+        with pytest.raises(RuntimeError, match="db down"):
+            jobless_supervisor.handle_events()
+
+    assert list(jobless_supervisor.persisted_event_seqs) == []
+
+
 def test_handle_events_does_not_confirm_seq_when_persist_fails(jobless_supervisor):
     """A seq whose event failed to persist is never confirmed, so the broker advance fails out."""
     jobless_supervisor.events.append(TriggerEventEntry(1, TriggerEvent(True), 7))
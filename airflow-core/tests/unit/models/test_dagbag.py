@@ -35,6 +35,7 @@ from airflow.serialization.serialized_objects import LazyDeserializedDAG, Serial
 from airflow.utils.session import create_session
 
 from tests_common.test_utils import db
+from tests_common.test_utils.asserts import assert_queries_count
 
 pytestmark = pytest.mark.db_test
 
@@ -447,3 +448,85 @@ class TestDBDagBagCache:
         dag_bag._read_dag(mock_serdag)
 
         mock_stats.gauge.assert_called_with("api_server.dag_bag.cache_size", 1, rate=0.1)
+
+
+class TestDBDagBagSizeBoundedCache:
+    """Tests for DBDagBag caching bounded by the estimated size of the cached DAGs."""
+
+    @staticmethod
+    def _serdag(version_id, size):
+        serdag = MagicMock(spec=SerializedDagModel)
+        serdag.dag = MagicMock(spec=SerializedDAG)
+        serdag.dag_version_id = version_id
+        serdag.dag_hash = f"hash_{version_id}"
+        serdag._data_size = size
+        return serdag
+
+    def test_size_bounded_cache_enabled_with_cache_max_bytes(self):
+        dag_bag = DBDagBag(cache_size=10, cache_max_bytes=1000)
+        assert dag_bag._use_cache is True
+        assert isinstance(dag_bag._dags, LRUCache)
+        assert dag_bag._dags.maxsize == 1000
+
+    def test_evicts_least_recently_used_to_stay_within_budget(self):
+        dag_bag = DBDagBag(cache_max_bytes=250)
+
+        dag_bag._read_dag(self._serdag("v1", 100))
+        dag_bag._read_dag(self._serdag("v2", 100))
+        # Touch v1 so v2 is the least recently used.
+        assert dag_bag._get_dag("v1", MagicMock()) is not None
+        dag_bag._read_dag(self._serdag("v3", 100))
+
+        assert set(dag_bag._dags) == {"v1", "v3"}
+        assert dag_bag._dags.currsize == 200
+
+    def test_dag_larger_than_budget_is_returned_but_not_cached(self):
+        dag_bag = DBDagBag(cache_max_bytes=50)
+        serdag = self._serdag("v1", 100)
+
+        assert dag_bag._read_dag(serdag) is serdag.dag
+        assert "v1" not in dag_bag._dags
+
+    @patch("airflow.models.dagbag.stats")
+    def test_metrics_use_stats_prefix(self, mock_stats):
+        dag_bag = DBDagBag(cache_max_bytes=150, stats_prefix="scheduler.dag_bag")
+
+        dag_bag._read_dag(self._serdag("v1", 100))
+        dag_bag._read_dag(self._serdag("v2", 100))
+
+        mock_stats.incr.assert_called_once_with("scheduler.dag_bag.cache_eviction")
+        mock_stats.gauge.assert_any_call("scheduler.dag_bag.cache_size", 1, rate=0.1)
+        mock_stats.gauge.assert_called_with("scheduler.dag_bag.cache_bytes", 100, rate=0.1)
+
+    @pytest.mark.parametrize("get_dag", ["by_version", "latest"])
+    def test_size_is_loaded_with_the_serialized_dag(self, get_dag):
+        dag_id = "sized_dag"
+        db.clear_db_dags()
+        db.clear_db_serialized_dags()
+        db.clear_db_dag_bundles()
+        with DAG(dag_id, schedule=None) as dag:
+            EmptyOperator(task_id="task")
+        with create_session() as session:
+            session.add(DagBundleModel(name="testing"))
+            session.flush()
+            session.add(DagModel(dag_id=dag_id, bundle_name="testing"))
+            session.flush()
+            SerializedDagModel.write_dag(
+                LazyDeserializedDAG.from_dag(dag), bundle_name="testing", session=session
+            )
+            session.commit()
+            version_id = DagVersion.get_latest_version(dag_id, session=session).id
+
+        dag_bag = DBDagBag(cache_max_bytes=10 * 1024 * 1024)
+        with create_session() as session:
+            # A single query, the size is not lazy-loaded on its own
+            with assert_queries_count(1, session=session):
+                if get_dag == "latest":
+                    dag_bag.get_latest_version_of_dag(dag_id, session=session)
+                else:
+                    dag_bag.get_dag(version_id, session=session)
+            assert dag_bag._dags[version_id].size > 0
+
+        db.clear_db_dags()
+        db.clear_db_serialized_dags()
+        db.clear_db_dag_bundles()
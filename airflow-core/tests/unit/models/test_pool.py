@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pendulum
 import pytest
@@ -26,10 +27,10 @@ from sqlalchemy import func, select
 from airflow import settings
 from airflow.exceptions import AirflowException, PoolNotFound
 from airflow.models.dag_version import DagVersion
-from airflow.models.pool import Pool, normalize_pool_name_for_stats
+from airflow.models.pool import Pool, PoolOccupancy, normalize_pool_name_for_stats
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.utils.session import create_session
-from airflow.utils.state import State
+from airflow.utils.state import State, TaskInstanceState
 
 from tests_common.test_utils.db import (
     clear_db_dags,
@@ -267,6 +268,165 @@ class TestPool:
             }
         }
 
+    def test_slots_stats_with_occupancy(self, dag_maker, session):
+        pool = Pool(pool="test_pool", slots=5, include_deferred=True)
+        session.add(pool)
+        with dag_maker(dag_id="test_slots_stats_with_occupancy", session=session):
+            EmptyOperator(task_id="dummy1", pool="test_pool")
+            EmptyOperator(task_id="dummy2", pool="test_pool", pool_slots=2)
+
+        dr = dag_maker.create_dagrun(session=session)
+        ti1, ti2 = sorted(dr.get_task_instances(session=session), key=lambda ti: ti.task_id)
+        ti1.state = State.RUNNING
+        ti2.state = State.SCHEDULED
+        session.flush()
+
+        occupancy = PoolOccupancy()
+        occupancy.load(session=session)
+        assert occupancy.slots == {("test_pool", TaskInstanceState.RUNNING): 1}
+        stats = Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]
+        assert stats == {"total": 5, "running": 1, "queued": 0, "deferred": 0, "scheduled": 2, "open": 4}
+
+        # The ledger is used as-is, without looking at the queued and running task instances again.
+        occupancy.record_queued(ti2)
+        ti2.state = State.QUEUED
+        session.flush()
+        stats = Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]
+        assert stats == {"total": 5, "running": 1, "queued": 2, "deferred": 0, "scheduled": 0, "open": 2}
+
+        ti2.state = State.DEFERRED
+        session.flush()
+        occupancy.record_finished(ti2)
+        stats = Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]
+        assert stats == {"total": 5, "running": 1, "queued": 0, "deferred": 2, "scheduled": 0, "open": 2}
+
+        ti1.state = State.SUCCESS
+        occupancy.record_finished(ti1)
+        assert occupancy.slots == {("test_pool", TaskInstanceState.DEFERRED): 2}
+        session.flush()
+
+        assert occupancy.reconcile(session=session) == 0
+
+        # Slots released behind the scheduler's back are dropped on reconciliation.
+        occupancy.slots[("test_pool", TaskInstanceState.QUEUED)] = 3
+        assert occupancy.reconcile(session=session) == 3
+        assert occupancy.slots == {("test_pool", TaskInstanceState.DEFERRED): 2}
+
+    @pytest.mark.parametrize("include_deferred", [True, False])
+    def test_slots_stats_with_occupancy_deferred_resumed(self, dag_maker, session, include_deferred):
+        pool = Pool(pool="test_pool", slots=5, include_deferred=include_deferred)
+        session.add(pool)
+        with dag_maker(dag_id="test_slots_stats_with_occupancy_deferred_resumed", session=session):
+            EmptyOperator(task_id="dummy", pool="test_pool", pool_slots=2)
+
+        ti = dag_maker.create_dagrun(session=session).get_task_instances(session=session)[0]
+        ti.state = State.DEFERRED
+        session.flush()
+
+        occupancy = PoolOccupancy()
+        occupancy.load(session=session)
+        stats = Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]
+        assert stats["deferred"] == 2
+        assert stats["open"] == (3 if include_deferred else 5)
+
+        # The trigger fired: the task instance is scheduled again, without any executor event.
+        ti.state = State.SCHEDULED
+        ti.next_method = "execute_complete"
+        session.flush()
+        stats = Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]
+        assert stats["open"] == 5
+        if include_deferred:
+            assert stats["deferred"] == 0
+
+        occupancy.record_queued(ti)
+        stats = Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]
+        assert stats["queued"] == 2
+        assert stats["open"] == 3
+
+    def test_slots_stats_with_occupancy_deferred_finished_in_triggerer(self, dag_maker, session):
+        pool = Pool(pool="test_pool", slots=5, include_deferred=True)
+        session.add(pool)
+        with dag_maker(dag_id="test_slots_stats_with_occupancy_deferred_finished", session=session):
+            EmptyOperator(task_id="dummy", pool="test_pool", pool_slots=2)
+
+        ti = dag_maker.create_dagrun(session=session).get_task_instances(session=session)[0]
+        ti.state = State.DEFERRED
+        session.flush()
+
+        occupancy = PoolOccupancy()
+        occupancy.load(session=session)
+        assert Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]["open"] == 3
+
+        # The trigger finished the task instance itself, so no executor event is ever received.
+        ti.state = State.SUCCESS
+        session.flush()
+        stats = Pool.slots_stats(occupancy=occupancy, session=session)["test_pool"]
+        assert stats["deferred"] == 0
+        assert stats["open"] == 5
+        assert occupancy.reconcile(session=session) == 0
+
+    def test_pool_occupancy_rollback(self):
+        occupancy = PoolOccupancy()
+        committed_ti = mock.MagicMock(pool="test_pool", pool_slots=1)
+        ti = mock.MagicMock(pool="test_pool", pool_slots=2)
+
+        occupancy.record_queued(committed_ti)
+        occupancy.commit()
+        occupancy.record_queued(ti)
+        occupancy.rollback()
+
+        # Only the task instances queued since the last commit are undone.
+        assert occupancy.slots == {("test_pool", TaskInstanceState.QUEUED): 1}
+
+    def test_slots_stats_with_occupancy_reads_untracked_slots_before_locking(self, dag_maker, session):
+        pool = Pool(pool="test_pool", slots=5, include_deferred=False)
+        session.add(pool)
+        with dag_maker(dag_id="test_slots_stats_with_occupancy_untracked", session=session):
+            EmptyOperator(task_id="dummy", pool="test_pool", pool_slots=2)
+
+        ti = dag_maker.create_dagrun(session=session).get_task_instances(session=session)[0]
+        occupancy = PoolOccupancy()
+        occupancy.load(session=session)
+
+        # The task instance is scheduled without the ledger being told.
+        ti.state = State.SCHEDULED
+        session.flush()
+
+        calls = []
+        untracked_slots = occupancy.untracked_slots
+
+        def record_untracked_slots(session):
+            calls.append("untracked_slots")
+            return untracked_slots(session=session)
+
+        def record_row_locks(query, **kwargs):
+            calls.append("with_row_locks")
+            return query
+
+        with (
+            mock.patch.object(occupancy, "untracked_slots", side_effect=record_untracked_slots),
+            mock.patch("airflow.models.pool.with_row_locks", side_effect=record_row_locks),
+        ):
+            stats = Pool.slots_stats(lock_rows=True, occupancy=occupancy, session=session)["test_pool"]
+
+        assert calls == ["untracked_slots", "with_row_locks"]
+        assert stats["scheduled"] == 2
+        assert stats["open"] == 5
+        # The scheduled slots are not kept in the ledger, so they cannot drift.
+        assert occupancy.slots == {}
+
+    def test_pool_occupancy_record_finished_never_goes_negative(self):
+        occupancy = PoolOccupancy()
+        occupancy.slots[("test_pool", TaskInstanceState.QUEUED)] = 1
+        occupancy.slots[("test_pool", TaskInstanceState.RUNNING)] = 2
+        ti = mock.MagicMock(pool="test_pool", pool_slots=2, state=TaskInstanceState.SUCCESS)
+
+        occupancy.record_finished(ti)
+        assert occupancy.slots == {("test_pool", TaskInstanceState.RUNNING): 1}
+
+        occupancy.record_finished(ti)
+        assert occupancy.slots == {}
+
     def test_get_pool(self):
         self.add_pools()
         pool = Pool.get_pool(pool_name=self.pools[0].pool)
@@ -1234,3 +1234,102 @@ class TestSerializedDagModel:
         alert = session.scalar(select(DAM).where(DAM.serialized_dag_id == orig_serdag.id))
         assert alert is not None
         assert alert.id == orig_alert.id
+
+
+class TestSerializedDagStorageFormat:
+    @pytest.fixture(autouse=True)
+    def _clear_db(self):
+        db.clear_db_dags()
+        db.clear_db_serialized_dags()
+        yield
+        db.clear_db_serialized_dags()
+
+    @staticmethod
+    def _storage_format(storage_format: str, compress: bool = False):
+        return mock.patch.multiple(
+            "airflow.models.serialized_dag",
+            _SERIALIZED_DAG_STORAGE_FORMAT=storage_format,
+            _COMPRESS_SERIALIZED_DAGS=compress,
+        )
+
+    @pytest.mark.parametrize(
+        ("storage_format", "compress", "marker"),
+        [
+            pytest.param("json", True, b"\x78", id="json-compressed"),
+            pytest.param("msgpack", False, b"\x01", id="msgpack"),
+            pytest.param("msgpack", True, b"\x02", id="msgpack-compressed"),
+        ],
+    )
+    def test_binary_storage_round_trip(self, storage_format, compress, marker, testing_dag_bundle, session):
+        with DAG("storage_format", schedule=None, params={"count": 3}) as dag:
+            EmptyOperator(task_id="start") >> BashOperator(
+                task_id="run", bash_command="echo {{ params.count }}"
+            )
+
+        with self._storage_format(storage_format, compress):
+            sync_dag_to_db(dag, session=session)
+            session.commit()
+            written = session.scalar(select(SDM).where(SDM.dag_id == "storage_format"))
+            expected_data, expected_hash = json.loads(json.dumps(written.data)), written.dag_hash
+            session.expunge_all()
+
+            serdag = session.scalar(select(SDM).where(SDM.dag_id == "storage_format"))
+            assert serdag._data is None
+            assert serdag._data_compressed.startswith(marker)
+            assert serdag.data == expected_data
+            assert serdag.dag_hash == expected_hash
+            assert serdag.dag.get_task("run").upstream_task_ids == {"start"}
+
+    def test_get_dependencies_with_msgpack(self, session):
+        with self._storage_format("msgpack"):
+            for dag in make_example_dags(example_dags_module).values():
+                SDM.write_dag(LazyDeserializedDAG.from_dag(dag), bundle_name="testing")
+            assert "consumes_asset_decorator" in SDM.get_dag_dependencies(session=session)
+
+    def test_reencode_stored_dags(self, testing_dag_bundle, session):
+        with DAG("reencode", schedule=None) as dag:
+            EmptyOperator(task_id="task")
+        sync_dag_to_db(dag, session=session)
+        session.commit()
+        original = session.scalar(select(SDM).where(SDM.dag_id == "reencode"))
+        data, dag_hash = json.loads(json.dumps(original.data)), original.dag_hash
+
+        with self._storage_format("msgpack"):
+            assert SDM.reencode_stored_dags(session=session) == 1
+            # Already in the configured format.
+            assert SDM.reencode_stored_dags(session=session) == 0
+        session.expunge_all()
+        serdag = session.scalar(select(SDM).where(SDM.dag_id == "reencode"))
+        assert serdag._data is None
+        assert serdag._data_compressed.startswith(b"\x01")
+        assert (serdag.data, serdag.dag_hash) == (data, dag_hash)
+
+        assert SDM.reencode_stored_dags(bundle_names=["other"], session=session) == 0
+        assert SDM.reencode_stored_dags(session=session) == 1
+        session.expunge_all()
+        serdag = session.scalar(select(SDM).where(SDM.dag_id == "reencode"))
+        assert serdag._data_compressed is None
+        assert serdag.data == data
+
+    @pytest.mark.parametrize(
+        ("storage_format", "compress"),
+        [
+            pytest.param("json", False, id="json"),
+            pytest.param("json", True, id="json-compressed"),
+            pytest.param("msgpack", False, id="msgpack"),
+        ],
+    )
+    def test_data_size(self, storage_format, compress, testing_dag_bundle, session):
+        with DAG("data_size", schedule=None) as dag:
+            EmptyOperator(task_id="task")
+
+        with self._storage_format(storage_format, compress):
+            sync_dag_to_db(dag, session=session)
+            session.commit()
+        serdag = session.scalar(select(SDM).where(SDM.dag_id == "data_size"))
+
+        if serdag._data_compressed is not None:
+            assert serdag._data_size == len(serdag._data_compressed)
+        else:
+            # The database may not store the JSON with the spacing of json.dumps
+            assert 0.5 < serdag._data_size / len(json.dumps(serdag._data)) < 2
@@ -4282,6 +4282,44 @@ def test_insert_mapping_includes_context_carrier(dag_maker, session):
     assert "traceparent" in mapping["context_carrier"]
 
 
+@pytest.mark.db_test
+def test_insert_mappings_computes_builtin_priority_weight_once(dag_maker):
+    with dag_maker("test_insert_mappings_weight"):
+        EmptyOperator(task_id="t1", weight_rule="downstream")
+    op = create_scheduler_operator(dag_maker.dag.get_task("t1"))
+
+    with mock.patch.object(type(op.weight_rule), "get_weight", autospec=True, return_value=7) as get_weight:
+        mappings = list(
+            TaskInstance.insert_mappings(
+                "test_run", op, range(3), dag_version_id=None, dag_run=mock.MagicMock(context_carrier=None)
+            )
+        )
+
+    assert get_weight.call_count == 1
+    assert [(m["map_index"], m["priority_weight"]) for m in mappings] == [(0, 7), (1, 7), (2, 7)]
+    # Every task instance gets its own context carrier.
+    assert len({id(m["context_carrier"]) for m in mappings}) == 3
+
+
+@pytest.mark.db_test
+def test_insert_mappings_computes_custom_priority_weight_per_map_index(dag_maker):
+    from airflow.task.priority_strategy import PriorityWeightStrategy
+
+    class MapIndexWeight(PriorityWeightStrategy):
+        def get_weight(self, ti):
+            return 10 + ti.map_index
+
+    with dag_maker("test_insert_mappings_custom_weight"):
+        EmptyOperator(task_id="t1")
+    op = create_scheduler_operator(dag_maker.dag.get_task("t1"))
+    op._weight_rule = MapIndexWeight()
+
+    mappings = TaskInstance.insert_mappings(
+        "test_run", op, range(3), dag_version_id=None, dag_run=mock.MagicMock(context_carrier=None)
+    )
+    assert [m["priority_weight"] for m in mappings] == [10, 11, 12]
+
+
 @pytest.mark.db_test
 def test_clear_task_instances_resets_context_carrier(dag_maker, session):
     """clear_task_instances should assign fresh context carriers to both the TI and its dag run."""
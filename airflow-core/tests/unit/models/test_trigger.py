@@ -258,6 +258,100 @@ def test_submit_event_no_n_plus_one_for_assets(_, session, asset_count, expected
         Trigger.submit_event(trigger_id, TriggerEvent("payload"), session=session)
 
 
+def _deferred_task_instances(dag_maker, session, count):
+    with dag_maker(dag_id="test_submit_events", session=session):
+        for index in range(count):
+            EmptyOperator(task_id=f"task_{index}")
+    dag_run = dag_maker.create_dagrun()
+    task_instances = sorted(dag_run.get_task_instances(session=session), key=lambda ti: ti.task_id)
+    triggers = []
+    for task_instance in task_instances:
+        trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+        session.add(trigger)
+        session.flush()
+        triggers.append(trigger)
+        task_instance.state = State.DEFERRED
+        task_instance.trigger_id = trigger.id
+        task_instance.next_method = "execute_complete"
+        task_instance.next_kwargs = {"index": int(task_instance.task_id.split("_")[1])}
+    session.commit()
+    return task_instances, triggers
+
+
+@patch.object(TriggererCallback, "handle_event")
+def test_submit_events(mock_callback_handle_event, session, dag_maker):
+    """A batch of events resumes the task instances of every trigger, and notifies assets and callbacks."""
+    (plain_ti, unusable_ti, task_end_ti), (plain, unusable, task_end) = _deferred_task_instances(
+        dag_maker, session, 3
+    )
+    asset = AssetModel("test")
+    asset.add_trigger(plain, "test_asset_watcher")
+    session.add(asset)
+    callback = TriggererCallback(callback_def=AsyncCallback("classpath.callback"))
+    callback.trigger = unusable
+    session.add(callback)
+    session.commit()
+
+    first, second = TriggerEvent("first"), TriggerEvent("second")
+    # serde refuses any dict carrying its reserved keys, at any depth.
+    unusable_event = TriggerEvent({"__classname__": "anything"})
+    Trigger.submit_events(
+        [
+            (plain.id, first),
+            (unusable.id, unusable_event),
+            (task_end.id, TaskSkippedEvent()),
+            (plain.id, second),
+        ],
+        session=session,
+    )
+    session.flush()
+    session.expire_all()
+
+    plain_ti, unusable_ti, task_end_ti = (
+        session.get(TaskInstance, ti.id) for ti in (plain_ti, unusable_ti, task_end_ti)
+    )
+    # Only the first event of a trigger resumes its task instances
+    assert plain_ti.state == State.SCHEDULED
+    assert plain_ti.trigger_id is None
+    assert plain_ti.scheduled_dttm is not None
+    assert plain_ti.next_method == "execute_complete"
+    assert plain_ti.next_kwargs == {"event": "first", "index": 0}
+    # The task instances which cannot be resumed are failed, as by submit_event
+    assert unusable_ti.state == State.SCHEDULED
+    assert unusable_ti.next_method == "__fail__"
+    assert "event payload could not be serialized" in unusable_ti.next_kwargs["error"]
+    assert task_end_ti.state == State.SKIPPED
+    # Every event reaches the assets and callbacks
+    asset_events = session.scalars(select(AssetEvent).where(AssetEvent.asset_id == asset.id)).all()
+    assert sorted(asset_event.extra["payload"] for asset_event in asset_events) == ["first", "second"]
+    mock_callback_handle_event.assert_called_once_with(unusable_event, session)
+
+
+def test_submit_events_ignores_task_instances_no_longer_deferred(session, dag_maker):
+    (task_instance,), (trigger,) = _deferred_task_instances(dag_maker, session, 1)
+    task_instance.state = State.SUCCESS
+    session.commit()
+
+    Trigger.submit_events([(trigger.id, TriggerEvent("payload"))], session=session)
+    session.flush()
+    session.expire_all()
+
+    task_instance = session.get(TaskInstance, task_instance.id)
+    assert task_instance.state == State.SUCCESS
+    assert task_instance.next_kwargs == {"index": 0}
+
+
+@pytest.mark.parametrize("trigger_count", [1, 10])
+@patch("airflow.models.trigger.AssetManager.register_asset_change")
+def test_submit_events_query_count_does_not_depend_on_batch_size(_, session, dag_maker, trigger_count):
+    _, triggers = _deferred_task_instances(dag_maker, session, trigger_count)
+    events = [(trigger.id, TriggerEvent("payload")) for trigger in triggers]
+    session.expire_all()
+
+    with assert_queries_count(6, session=session):
+        Trigger.submit_events(events, session=session)
+
+
 @pytest.mark.parametrize(
     "stored_next_kwargs",
     [
@@ -730,6 +824,42 @@ def test_assign_unassigned_with_qeueus(session, create_triggerer, create_trigger
     )
 
 
+def test_release(session, create_triggerer):
+    """Only the released triggers still assigned to the triggerer are unassigned."""
+    time_now = timezone.utcnow()
+    triggerer = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    other_triggerer = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.flush()
+    released, kept, taken_over = (
+        Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(3)
+    )
+    released.triggerer_id = kept.triggerer_id = triggerer.id
+    taken_over.triggerer_id = other_triggerer.id
+    session.add_all([released, kept, taken_over])
+    session.commit()
+
+    Trigger.release([released.id, taken_over.id], triggerer.id, session=session)
+
+    session.expire_all()
+    assert released.triggerer_id is None
+    assert kept.triggerer_id == triggerer.id
+    assert taken_over.triggerer_id == other_triggerer.id
+
+
+def test_has_other_alive_triggerer(session, create_triggerer):
+    time_now = timezone.utcnow()
+    triggerer = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    create_triggerer(session, State.RUNNING, latest_heartbeat=time_now - datetime.timedelta(seconds=100))
+    session.commit()
+
+    assert not Trigger.has_other_alive_triggerer(triggerer.id, 30, session=session)
+
+    create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+
+    assert Trigger.has_other_alive_triggerer(triggerer.id, 30, session=session)
+
+
 def test_queue_column_max_len_matches_ti_column_max_len() -> None:
     """Ensures that the `trigger.queue` column has the same max length as the `task_instance.queue` column."""
     expected_queue_col_max_length_from_ti = TaskInstance.queue.property.columns[0].type.length
@@ -0,0 +1,104 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG, TaskGroup, task, task_group
+from airflow.serialization.definitions.topology import DagTopology
+
+from tests_common.test_utils.dag import create_scheduler_dag
+
+
+@pytest.fixture
+def scheduler_dag():
+    with DAG("topology", schedule=None) as dag:
+        s1 = EmptyOperator(task_id="s1").as_setup()
+        w1 = EmptyOperator(task_id="w1")
+        w2 = EmptyOperator(task_id="w2")
+        t1 = EmptyOperator(task_id="t1").as_teardown(setups=s1)
+        s1 >> w1 >> w2 >> t1
+        with TaskGroup("group"):
+            EmptyOperator(task_id="in_group")
+    return create_scheduler_dag(dag)
+
+
+class TestDagTopology:
+    def test_relatives(self, scheduler_dag):
+        topology = DagTopology.build(scheduler_dag)
+
+        for t in scheduler_dag.tasks:
+            assert set(topology.upstream_task_ids(t.task_id)) == t.upstream_task_ids
+            assert set(topology.downstream_task_ids(t.task_id)) == t.downstream_task_ids
+            for upstream in (True, False):
+                assert topology.flat_relative_ids(t.task_id, upstream=upstream) == t.get_flat_relative_ids(
+                    upstream=upstream
+                )
+
+    def test_flat_relatives_are_memoized(self, scheduler_dag):
+        topology = DagTopology.build(scheduler_dag)
+        assert topology.flat_relative_ids("w1") is topology.flat_relative_ids("w1")
+
+    def test_leaves_ignore_teardowns(self, scheduler_dag):
+        topology = DagTopology.build(scheduler_dag)
+        assert topology.leaf_task_ids == {"w2", "group.in_group"}
+
+    def test_teardown_scope(self, scheduler_dag):
+        topology = DagTopology.build(scheduler_dag)
+        # w2 is a direct upstream of t1, so it is checked by the trigger rule itself.
+        assert topology.teardown_scope_ids("t1") == {"w1"}
+        assert topology.teardown_scope_ids("w1") == frozenset()
+
+    def test_relevant_setups(self, scheduler_dag):
+        topology = DagTopology.build(scheduler_dag)
+
+        for t in scheduler_dag.tasks:
+            expected = {s.task_id for s in t.get_upstreams_only_setups()}
+            assert topology.relevant_setup_ids(t.task_id) == expected
+        assert topology.relevant_setup_ids("w2") == {"s1"}
+
+    def test_task_group_membership(self):
+        @task
+        def double(x):
+            return x * 2
+
+        with DAG("topology_mapped", schedule=None) as dag:
+            EmptyOperator(task_id="outside")
+
+            @task_group
+            def mapped(x):
+                double(x)
+
+            mapped.expand(x=[1, 2])
+            double.expand(x=[1, 2])
+
+        topology = DagTopology.build(create_scheduler_dag(dag))
+        assert topology.closest_mapped_task_group_id("outside") is None
+        assert topology.closest_mapped_task_group_id("mapped.double") == "mapped"
+        assert topology.task_group_id("mapped.double") == "mapped"
+        assert topology.task_group_id("outside") is None
+        assert topology.expanding_task_ids == {"mapped.double", "double"}
+
+    def test_serialized_dag_caches_topology(self, scheduler_dag):
+        assert scheduler_dag.topology is scheduler_dag.topology
+        assert DagTopology.of(scheduler_dag) is scheduler_dag.topology
+
+    def test_partial_subset_builds_its_own_topology(self, scheduler_dag):
+        assert "t1" in scheduler_dag.topology.indexes
+        subset = scheduler_dag.partial_subset(["group.in_group"], include_upstream=False)
+        assert "t1" not in subset.topology.indexes
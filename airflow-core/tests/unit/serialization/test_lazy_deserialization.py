@@ -0,0 +1,138 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG, TaskGroup, task, task_group
+from airflow.serialization.serialized_objects import DagSerialization, OperatorSerialization, _LazyTaskDict
+
+
+@pytest.fixture
+def serialized_dag():
+    with DAG("lazy", schedule=None) as dag:
+        start = EmptyOperator(task_id="start")
+        with TaskGroup("group") as group:
+            inner = EmptyOperator(task_id="inner")
+            with TaskGroup("nested"):
+                EmptyOperator(task_id="deepest")
+        end = EmptyOperator(task_id="end", retries=3)
+        start >> group >> end
+        start >> inner
+    return DagSerialization.to_dict(dag)
+
+
+class TestLazyDeserialization:
+    def test_tasks_are_deserialized_on_access(self, serialized_dag):
+        dag = DagSerialization.from_dict(serialized_dag, lazy=True)
+
+        assert isinstance(dag.task_dict, _LazyTaskDict)
+        assert dag.has_task("end")
+        assert not dag.task_dict.is_deserialized("end")
+
+        end = dag.get_task("end")
+        assert end.retries == 3
+        assert end.dag is dag
+        assert dag.task_dict.is_deserialized("end")
+        assert not any(
+            dag.task_dict.is_deserialized(t) for t in ("start", "group.inner", "group.nested.deepest")
+        )
+        assert dag.get_task("end") is end
+
+    def test_matches_eager_deserialization(self, serialized_dag):
+        eager = DagSerialization.from_dict(serialized_dag)
+        lazy = DagSerialization.from_dict(serialized_dag, lazy=True)
+
+        assert lazy.task_ids == eager.task_ids
+        # Access in reverse order, so relations cannot rely on upstream tasks being deserialized first.
+        for task_id in reversed(eager.task_ids):
+            lazy_task, eager_task = lazy.get_task(task_id), eager.get_task(task_id)
+            assert lazy_task.upstream_task_ids == eager_task.upstream_task_ids
+            assert lazy_task.downstream_task_ids == eager_task.downstream_task_ids
+            assert lazy_task.task_group.group_id == eager_task.task_group.group_id
+        assert lazy.task_group.get_task_group_dict().keys() == eager.task_group.get_task_group_dict().keys()
+        assert [t.task_id for t in lazy.task_group.iter_tasks()] == [
+            t.task_id for t in eager.task_group.iter_tasks()
+        ]
+
+    def test_task_group_tree_does_not_deserialize_tasks(self, serialized_dag):
+        dag = DagSerialization.from_dict(serialized_dag, lazy=True)
+
+        group = dag.task_group_dict["group"]
+        assert set(group.children) == {"group.inner", "group.nested"}
+        assert not any(dag.task_dict.is_deserialized(t) for t in dag.task_ids)
+
+        inner = group.children["group.inner"]
+        assert inner is dag.get_task("group.inner")
+        assert inner.task_group.group_id == "group"
+
+    def test_topology_does_not_deserialize_tasks(self):
+        @task
+        def double(x):
+            return x * 2
+
+        with DAG("lazy_topology", schedule=None) as dag:
+            setup = EmptyOperator(task_id="setup").as_setup()
+            work = EmptyOperator(task_id="work")
+            teardown = EmptyOperator(task_id="teardown").as_teardown(
+                setups=setup, on_failure_fail_dagrun=True
+            )
+
+            @task_group
+            def mapped(x):
+                double(x)
+
+            setup >> work >> mapped.expand(x=[1, 2]) >> double.expand(x=[1, 2]) >> teardown
+        data = DagSerialization.to_dict(dag)
+        eager = DagSerialization.from_dict(data).topology
+        lazy_dag = DagSerialization.from_dict(data, lazy=True)
+        lazy = lazy_dag.topology
+
+        assert not any(lazy_dag.task_dict.is_deserialized(t) for t in lazy_dag.task_ids)
+        assert lazy.task_ids == eager.task_ids
+        for task_id in eager.task_ids:
+            assert lazy.upstream_task_ids(task_id) == eager.upstream_task_ids(task_id)
+            assert lazy.downstream_task_ids(task_id) == eager.downstream_task_ids(task_id)
+        assert lazy.task_group_ids == eager.task_group_ids
+        assert lazy.mapped_task_group_ids == eager.mapped_task_group_ids
+        assert lazy.setup_task_ids == eager.setup_task_ids == {"setup"}
+        assert lazy.teardown_task_ids == eager.teardown_task_ids == {"teardown"}
+        assert lazy.expanding_task_ids == eager.expanding_task_ids == {"mapped.double", "double"}
+        assert lazy.leaf_task_ids == eager.leaf_task_ids == {"teardown"}
+        assert lazy.teardown_scopes == eager.teardown_scopes
+
+    def test_partial_subset(self, serialized_dag):
+        dag = DagSerialization.from_dict(serialized_dag, lazy=True)
+
+        subset = dag.partial_subset("end", include_upstream=True)
+        assert set(subset.task_ids) == set(dag.task_ids)
+        assert subset.get_task("end").upstream_task_ids == {"group.inner", "group.nested.deepest"}
+
+    def test_task_access_does_not_change_load_op_links_of_other_dags(self, serialized_dag, monkeypatch):
+        monkeypatch.setattr(DagSerialization, "_load_operator_extra_links", False)
+        dag = DagSerialization.from_dict(serialized_dag, lazy=True)
+        monkeypatch.setattr(DagSerialization, "_load_operator_extra_links", True)
+        monkeypatch.setattr(OperatorSerialization, "_load_operator_extra_links", True)
+
+        with mock.patch("airflow.plugins_manager.get_operator_extra_links") as get_operator_extra_links:
+            dag.get_task("end")
+
+        get_operator_extra_links.assert_not_called()
+        assert OperatorSerialization._load_operator_extra_links is True
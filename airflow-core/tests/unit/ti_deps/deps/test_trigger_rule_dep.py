@@ -36,9 +36,11 @@ from airflow.sdk import task, task_group
 from airflow.sdk.bases.operator import BaseOperator
 from airflow.task.trigger_rule import TriggerRule
 from airflow.ti_deps.dep_context import DepContext
-from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamTIStates
+from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, UpstreamStateCounts, _UpstreamTIStates
 from airflow.utils.state import DagRunState, TaskInstanceState
 
+from tests_common.test_utils.asserts import count_queries
+
 pytestmark = pytest.mark.db_test
 
 if TYPE_CHECKING:
@@ -2381,3 +2383,113 @@ class TestTriggerRuleUpstreamCountMemo:
         assert evolved.upstream_task_id_counts is dep_context.upstream_task_id_counts
         evolved.upstream_task_id_counts[("d", "r", frozenset({"u2"}))] = [("u2", 1)]
         assert ("d", "r", frozenset({"u2"})) in dep_context.upstream_task_id_counts
+
+
+class TestUpstreamStateCounts:
+    """The scheduling pass counts the upstream states of every task instance from one load of the run."""
+
+    def _count_scheduling_queries(self, dag_maker, session, n_downstreams):
+        @task
+        def src(i):
+            return i
+
+        @task
+        def plain():
+            return 1
+
+        with dag_maker(dag_id=f"state_counts_{n_downstreams}", session=session, serialized=True) as dag:
+            nums = src.expand(i=[0, 1, 2])
+            for k in range(n_downstreams):
+                # A distinct direct upstream per downstream, so the per-pass count memo cannot share
+                # one query between them.
+                [nums, EmptyOperator(task_id=f"u{k}")] >> plain.override(task_id=f"p{k}")()
+
+        dr = dag_maker.create_dagrun()
+        dr.dag = dag_maker.serialized_dag
+        _expand_mapped_task(dr, dag, "src", [SUCCESS, SUCCESS, SUCCESS], session)
+        for ti in dr.get_task_instances(session=session):
+            if ti.task_id.startswith("u"):
+                ti.state = SUCCESS
+        session.commit()
+
+        with count_queries(session=session) as result:
+            decision = dr.task_instance_scheduling_decisions(session=session)
+        assert {ti.task_id for ti in decision.schedulable_tis} == {f"p{k}" for k in range(n_downstreams)}
+        return sum(result.values())
+
+    def test_query_count_does_not_grow_with_schedulable_tis(self, dag_maker, session):
+        few = self._count_scheduling_queries(dag_maker, session, n_downstreams=2)
+        many = self._count_scheduling_queries(dag_maker, session, n_downstreams=8)
+        assert few == many
+
+    def test_counts_match_the_task_instances(self, dag_maker, session):
+        with dag_maker(dag_id="state_counts_build", session=session, serialized=True):
+            setup = EmptyOperator(task_id="setup").as_setup()
+            setup >> EmptyOperator(task_id="work")
+
+        dr = dag_maker.create_dagrun()
+        dr.dag = dag_maker.serialized_dag
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+        tis["setup"].state = SKIPPED
+
+        topology = dr.dag.topology
+        counts = UpstreamStateCounts.build(dr, topology, tis.values())
+        assert counts.covers(tis["work"], topology)
+        assert counts.count(["setup", "work"]) == 2
+        assert counts.upstream_states(["setup"]) == _UpstreamTIStates(
+            success=0,
+            skipped=1,
+            failed=0,
+            upstream_failed=0,
+            removed=0,
+            done=1,
+            success_setup=0,
+            skipped_setup=1,
+        )
+
+    def test_invalidated_with_the_count_memo(self):
+        dep_context = DepContext(upstream_state_counts=mock.Mock(spec=UpstreamStateCounts))
+        dep_context.invalidate_upstream_task_id_counts()
+        assert dep_context.upstream_state_counts is None
+
+
+class TestFinishedTIsByTaskId:
+    """Trigger rules look up the finished upstreams in a per-pass index instead of scanning the run."""
+
+    def test_index_groups_finished_tis_once_per_pass(self, dag_maker, session):
+        with dag_maker(dag_id="finished_index", session=session):
+            EmptyOperator(task_id="a")
+            EmptyOperator(task_id="b")
+
+        dr = dag_maker.create_dagrun()
+        finished_tis = dr.get_task_instances(session=session)
+        dep_context = DepContext(finished_tis=finished_tis)
+
+        index = dep_context.ensure_finished_tis_by_task_id(dr, session=session)
+        assert {task_id: [ti.key for ti in tis] for task_id, tis in index.items()} == {
+            ti.task_id: [ti.key] for ti in finished_tis
+        }
+        finished_tis.clear()
+        assert dep_context.ensure_finished_tis_by_task_id(dr, session=session) is index
+
+    def test_unrelated_finished_tis_are_not_counted(self, dag_maker, session):
+        with dag_maker(dag_id="finished_index_unrelated", session=session):
+            upstreams = [EmptyOperator(task_id=f"up{i}") for i in range(2)]
+            for i in range(3):
+                EmptyOperator(task_id=f"other{i}")
+            upstreams >> EmptyOperator(task_id="down", trigger_rule=TriggerRule.ALL_SUCCESS)
+
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+        tis["up0"].state = SUCCESS
+        tis["up1"].state = FAILED
+        for i in range(3):
+            tis[f"other{i}"].state = SUCCESS
+        session.flush()
+
+        dep_context = DepContext(finished_tis=[ti for ti in tis.values() if ti.state])
+        statuses = list(
+            TriggerRuleDep()._evaluate_trigger_rule(ti=tis["down"], dep_context=dep_context, session=session)
+        )
+        assert len(statuses) == 1
+        assert "upstream_states=_UpstreamTIStates(success=1, skipped=0, failed=1" in statuses[0].reason
@@ -0,0 +1,251 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from airflow.utils.loop_profiler import (
+    LoopProfiler,
+    PhaseHistogram,
+    StackSampler,
+    StepStats,
+    run_in_timed_steps,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+class TestPhaseHistogram:
+    def test_percentile(self):
+        histogram = PhaseHistogram()
+        for duration_ms in (0.5, 3, 3, 4, 150):
+            histogram.record(duration_ms)
+
+        assert histogram.count == 5
+        assert histogram.max_ms == 150
+        assert histogram.percentile(20) == 1
+        assert histogram.percentile(50) == 5
+        assert histogram.percentile(100) == 150
+
+    def test_percentile_without_records(self):
+        assert PhaseHistogram().percentile(95) == 0.0
+
+
+class TestLoopProfiler:
+    def test_queries_are_counted_in_innermost_phase(self, engine):
+        profiler = LoopProfiler(stats_prefix="scheduler", engine=engine)
+        with profiler, engine.connect() as conn:
+            with profiler.phase("outer"):
+                conn.execute(text("SELECT 1"))
+                with profiler.phase("inner"):
+                    conn.execute(text("SELECT 1"))
+                    conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 1"))
+
+        assert profiler.histograms["outer"].queries == 1
+        assert profiler.histograms["inner"].queries == 2
+        assert profiler.histograms["outer"].count == profiler.histograms["inner"].count == 1
+        assert profiler.histograms["outer"].total_ms >= profiler.histograms["inner"].total_ms
+
+    def test_queries_from_other_threads_are_counted(self, engine):
+        profiler = LoopProfiler(stats_prefix="scheduler", engine=engine)
+
+        def query():
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        with profiler, profiler.phase("threaded"):
+            thread = threading.Thread(target=query)
+            thread.start()
+            thread.join()
+
+        assert profiler.histograms["threaded"].queries == 1
+
+    def test_phases_are_tracked_per_thread(self, engine):
+        profiler = LoopProfiler(stats_prefix="scheduler", engine=engine)
+        in_worker_phase = threading.Event()
+        main_queried = threading.Event()
+
+        def worker():
+            with profiler.phase("worker"), engine.connect() as conn:
+                in_worker_phase.set()
+                main_queried.wait()
+                conn.execute(text("SELECT 1"))
+
+        with profiler, profiler.phase("main"), engine.connect() as conn:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            in_worker_phase.wait()
+            conn.execute(text("SELECT 1"))
+            main_queried.set()
+            thread.join()
+
+        assert profiler.histograms["main"].queries == 1
+        assert profiler.histograms["worker"].queries == 1
+
+    def test_failed_queries_do_not_leave_their_start(self, engine):
+        profiler = LoopProfiler(stats_prefix="scheduler", engine=engine)
+        with profiler, engine.connect() as conn, profiler.phase("failing"):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            assert conn.info["loop_profiler_query_start"] == []
+            conn.execute(text("SELECT 1"))
+
+        assert profiler.histograms["failing"].queries == 1
+
+    def test_listeners_are_removed_on_exit(self, engine):
+        profiler = LoopProfiler(stats_prefix="scheduler", engine=engine)
+        with profiler:
+            pass
+        with profiler.phase("after_exit"), engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert profiler.histograms["after_exit"].queries == 0
+
+    @mock.patch("airflow.utils.loop_profiler.stats")
+    def test_metrics_are_tagged_with_phase(self, mock_stats, engine):
+        profiler = LoopProfiler(stats_prefix="scheduler", engine=engine)
+        with profiler, engine.connect() as conn, profiler.phase("critical_section"):
+            conn.execute(text("SELECT 1"))
+        with profiler.phase("executor_heartbeat"):
+            pass
+
+        tags = {"phase": "critical_section"}
+        mock_stats.incr.assert_called_once_with("scheduler.loop_phase_queries", 1, tags=tags)
+        assert [c.args[0] for c in mock_stats.timing.call_args_list] == [
+            "scheduler.loop_phase_duration",
+            "scheduler.loop_phase_query_duration",
+            "scheduler.loop_phase_duration",
+        ]
+        assert mock_stats.timing.call_args_list[-1].kwargs == {"tags": {"phase": "executor_heartbeat"}}
+
+    def test_phase_is_recorded_on_exception(self):
+        profiler = LoopProfiler(stats_prefix="scheduler")
+        with pytest.raises(RuntimeError), profiler.phase("failing"):
+            raise RuntimeError
+
+        assert profiler.histograms["failing"].count == 1
+
+    def test_wrap(self):
+        profiler = LoopProfiler(stats_prefix="scheduler")
+        action = profiler.wrap("heartbeat_timeout_purge", lambda: 42)
+
+        assert action() == 42
+        assert profiler.histograms["heartbeat_timeout_purge"].count == 1
+        assert "heartbeat_timeout_purge" in profiler.summary()
+
+
+class TestRunInTimedSteps:
+    def test_steps_between_awaits_are_timed(self):
+        async def coro():
+            time.sleep(0.02)  # noqa: ASYNC251 - blocks the event loop on purpose
+            await asyncio.sleep(0.05)
+            await asyncio.sleep(0)
+            return "result"
+
+        step_stats = StepStats("coro")
+
+        assert asyncio.run(run_in_timed_steps(coro(), step_stats)) == "result"
+        assert step_stats.steps == 3
+        # The time spent awaiting does not count
+        assert 20 <= step_stats.wall_ms < 50
+        assert step_stats.max_step_ms >= 20
+        assert step_stats.take_window() == (step_stats.wall_ms, step_stats.cpu_ms)
+        assert step_stats.take_window() == (0.0, 0.0)
+
+    def test_slow_steps_are_reported(self):
+        async def coro():
+            await asyncio.sleep(0)
+            time.sleep(0.02)  # noqa: ASYNC251 - blocks the event loop on purpose
+
+        on_slow_step = mock.Mock()
+
+        asyncio.run(run_in_timed_steps(coro(), StepStats("coro", slow_step_ms=10, on_slow_step=on_slow_step)))
+
+        on_slow_step.assert_called_once()
+        assert on_slow_step.call_args.args[0] >= 20
+
+    def test_exceptions_are_raised(self):
+        async def coro():
+            await asyncio.sleep(0)
+            raise ValueError("failed")
+
+        step_stats = StepStats("coro")
+
+        with pytest.raises(ValueError, match="failed"):
+            asyncio.run(run_in_timed_steps(coro(), step_stats))
+        assert step_stats.steps == 2
+
+    def test_cancellation_reaches_the_coroutine(self):
+        cleaned_up = []
+
+        async def coro():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                cleaned_up.append(True)
+
+        async def main():
+            task = asyncio.create_task(run_in_timed_steps(coro(), StepStats("coro")))
+            await asyncio.sleep(0)
+            task.cancel("stopping")
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+        assert cleaned_up == [True]
+
+
+class TestStackSampler:
+    def test_sample_and_dump(self, tmp_path):
+        sampler = StackSampler(interval=0.01)
+        sampler.sample()
+        sampler.sample()
+
+        path = tmp_path / "profile.folded"
+        assert sampler.dump(str(path)) >= 1
+
+        folded = dict(line.rsplit(" ", 1) for line in path.read_text().splitlines())
+        stack, count = next(item for item in folded.items() if "test_sample_and_dump" in item[0])
+        assert stack.startswith(f"{threading.current_thread().name};")
+        assert " " not in stack
+        assert int(count) == 2
+
+    def test_sampler_thread_excludes_itself(self):
+        sampler = StackSampler(interval=0.001)
+        sampler.start()
+        try:
+            while not sampler.samples:
+                threading.Event().wait(0.001)
+        finally:
+            sampler.stop()
+
+        assert not any(stack.startswith("stack-sampler;") for stack in sampler.samples)
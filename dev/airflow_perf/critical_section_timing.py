@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+import rich_click as click
+from sqlalchemy import delete
+
+DAG_ID = "perf_critical_section"
+
+MODES = {
+    "full": {},
+    "incremental": {
+        "AIRFLOW__SCHEDULER__CONCURRENCY_MAP_RECONCILE_INTERVAL": "3600",
+        "AIRFLOW__SCHEDULER__POOL_OCCUPANCY_RECONCILE_INTERVAL": "3600",
+    },
+}
+
+
+def create_task_instances(num_running, num_runs, num_scheduled, session):
+    """
+    Create a DAG with ``num_runs`` runs, ``num_running`` running TIs spread over them and
+    ``num_scheduled`` scheduled TIs per run.
+    """
+    from airflow.models.dag_version import DagVersion
+    from airflow.models.dagrun import DagRun
+    from airflow.models.pool import Pool
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG
+    from airflow.utils import timezone
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+    session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+    Pool.create_or_update_pool(
+        Pool.DEFAULT_POOL_NAME, slots=-1, description="", include_deferred=False, session=session
+    )
+
+    with DAG(DAG_ID, schedule=None, max_active_tasks=num_running + num_scheduled) as dag:
+        running = EmptyOperator(task_id="running")
+        for i in range(num_scheduled):
+            EmptyOperator(task_id=f"scheduled_{i}")
+
+    scheduler_dag = sync_dag_to_db(dag, session=session)
+    dag_version = DagVersion.get_latest_version(DAG_ID, session=session)
+    now = timezone.utcnow()
+    for run_index in range(num_runs):
+        dag_run = scheduler_dag.create_dagrun(
+            run_id=f"perf_{run_index}",
+            run_after=now,
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+        for ti in dag_run.get_task_instances(session=session):
+            ti.state = TaskInstanceState.SCHEDULED if ti.task_id != running.task_id else None
+        session.add_all(
+            TaskInstance(
+                task=running,
+                dag_version_id=dag_version.id,
+                run_id=dag_run.run_id,
+                state=TaskInstanceState.RUNNING,
+                map_index=map_index,
+            )
+            for map_index in range(run_index, num_running, num_runs)
+        )
+    session.commit()
+
+
+def time_critical_section(repeat, max_tis):
+    """Time ``_executable_task_instances_to_queued``, rolling back after each call."""
+    from airflow.executors.executor_loader import ExecutorLoader
+    from airflow.jobs.job import Job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.utils.session import create_session
+
+    job_runner = SchedulerJobRunner(job=Job(), executors=[ExecutorLoader.load_executor("LocalExecutor")])
+    times = []
+    with create_session() as session:
+        # Warm up, this also performs the initial load in incremental mode.
+        job_runner._executable_task_instances_to_queued(max_tis=max_tis, session=session)
+        session.rollback()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            job_runner._executable_task_instances_to_queued(max_tis=max_tis, session=session)
+            times.append(time.perf_counter() - start)
+            session.rollback()
+    return times
+
+
+@click.command()
+@click.option(
+    "--running",
+    "running_counts",
+    default="1000,10000,50000",
+    help="comma separated numbers of running task instances to measure",
+)
+@click.option("--runs", default=100, help="number of DAG runs the running task instances are spread over")
+@click.option("--scheduled", default=1, help="number of scheduled task instances per DAG run")
+@click.option("--max-tis", default=32, help="max_tis passed to the critical section")
+@click.option("--repeat", default=5, help="number of times to time the critical section, to reduce variance")
+def main(running_counts, runs, scheduled, max_tis, repeat):
+    """
+    Measure the duration of the scheduler critical section against the number of running TIs.
+
+    For every requested number of running task instances, the critical section
+    (``SchedulerJobRunner._executable_task_instances_to_queued``) is timed with the concurrency map and
+    pool occupancy rebuilt from the database on every call ("full", the default) and with both kept in
+    memory ("incremental", see ``[scheduler] concurrency_map_reconcile_interval`` and
+    ``[scheduler] pool_occupancy_reconcile_interval``).
+
+    Every call is rolled back, so the same task instances are examined on each repetition. The script
+    uses the database configured for Airflow and deletes any previous runs of the benchmark DAG.
+    """
+    from airflow.utils.session import create_session
+
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    print(f"{'running TIs':>12} {'mode':>12} {'critical section':>24}")
+    for num_running in map(int, running_counts.split(",")):
+        with create_session() as session:
+            create_task_instances(num_running, runs, scheduled, session)
+        for mode, env in MODES.items():
+            os.environ.update(env)
+            try:
+                times = time_critical_section(repeat, max_tis)
+            finally:
+                for key in env:
+                    os.environ.pop(key)
+            timing = f"{statistics.mean(times) * 1000:.2f}ms"
+            if len(times) > 1:
+                timing += f" (±{statistics.stdev(times) * 1000:.2f}ms)"
+            print(f"{num_running:>12} {mode:>12} {timing:>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+import rich_click as click
+from sqlalchemy import delete, select
+
+DAG_ID_PREFIX = "perf_dag_run_scheduling_"
+
+
+def create_dag_runs(num_dags, runs_per_dag, num_tasks, session):
+    """Create ``num_dags`` DAGs with a chain of ``num_tasks`` tasks and ``runs_per_dag`` running runs each."""
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG, chain
+    from airflow.utils import timezone
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id.startswith(DAG_ID_PREFIX)))
+    session.execute(delete(DagRun).where(DagRun.dag_id.startswith(DAG_ID_PREFIX)))
+
+    now = timezone.utcnow()
+    for dag_index in range(num_dags):
+        with DAG(f"{DAG_ID_PREFIX}{dag_index}", schedule=None, max_active_runs=runs_per_dag) as dag:
+            chain(*(BashOperator(task_id=f"task_{i}", bash_command="true") for i in range(num_tasks)))
+        scheduler_dag = sync_dag_to_db(dag, session=session)
+        for run_index in range(runs_per_dag):
+            scheduler_dag.create_dagrun(
+                run_id=f"perf_{run_index}",
+                run_after=now,
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.RUNNING,
+                session=session,
+            )
+    session.commit()
+
+
+def time_schedule_all_dag_runs(workers, num_dags, runs_per_dag, num_tasks, repeat):
+    """Time ``_schedule_all_dag_runs`` over freshly created runs, ``repeat`` times."""
+    from airflow.executors.executor_loader import ExecutorLoader
+    from airflow.jobs.job import Job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.models.dagrun import DagRun
+    from airflow.utils.session import create_session
+    from airflow.utils.sqlalchemy import prohibit_commit
+
+    os.environ["AIRFLOW__SCHEDULER__DAG_RUN_SCHEDULING_WORKERS"] = str(workers)
+    try:
+        job_runner = SchedulerJobRunner(job=Job(), executors=[ExecutorLoader.load_executor("LocalExecutor")])
+    finally:
+        del os.environ["AIRFLOW__SCHEDULER__DAG_RUN_SCHEDULING_WORKERS"]
+
+    times = []
+    for _ in range(repeat):
+        with create_session() as session:
+            create_dag_runs(num_dags, runs_per_dag, num_tasks, session)
+        with create_session() as session, prohibit_commit(session) as guard:
+            dag_runs = session.scalars(select(DagRun).where(DagRun.dag_id.startswith(DAG_ID_PREFIX))).all()
+            start = time.perf_counter()
+            job_runner._schedule_all_dag_runs(guard, dag_runs, session)
+            times.append(time.perf_counter() - start)
+            guard.commit()
+    return times
+
+
+@click.command()
+@click.option("--workers", "worker_counts", default="1,2,4,8", help="comma separated numbers of workers")
+@click.option("--dags", default=20, help="number of DAGs")
+@click.option("--runs-per-dag", default=10, help="number of running DAG runs per DAG")
+@click.option("--tasks", default=20, help="number of chained tasks per DAG")
+@click.option("--repeat", default=3, help="number of times to time scheduling, to reduce variance")
+def main(worker_counts, dags, runs_per_dag, tasks, repeat):
+    """
+    Measure how long the scheduler takes to make scheduling decisions for all running DAG runs.
+
+    ``SchedulerJobRunner._schedule_all_dag_runs`` is timed with every requested value of
+    ``[scheduler] dag_run_scheduling_workers``, each time over freshly created DAG runs. 1 is the
+    serial behaviour.
+
+    The script uses the database configured for Airflow and deletes any previous runs of the benchmark
+    DAGs. The gains depend on the database round-trip latency, so measure against the database used in
+    production rather than SQLite.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    print(f"{'workers':>8} {'DAG runs':>10} {'scheduling decisions':>28}")
+    for workers in map(int, worker_counts.split(",")):
+        times = time_schedule_all_dag_runs(workers, dags, runs_per_dag, tasks, repeat)
+        timing = f"{statistics.mean(times) * 1000:.2f}ms"
+        if len(times) > 1:
+            timing += f" (±{statistics.stdev(times) * 1000:.2f}ms)"
+        print(f"{workers:>8} {dags * runs_per_dag:>10} {timing:>28}")
+
+
+if __name__ == "__main__":
+    main()
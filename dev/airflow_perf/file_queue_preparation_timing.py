@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+import rich_click as click
+
+BUNDLE_NAME = "perf_file_queue"
+
+
+def make_manager(bundle_path, num_files, sort_mode):
+    """Return a manager tracking ``num_files`` files, half of them processed recently, and the known files."""
+    from airflow._shared.timezones import timezone
+    from airflow.dag_processing.manager import DagFileInfo, DagFileProcessorManager, DagFileStat
+
+    with mock.patch.dict(os.environ, {"AIRFLOW__DAG_PROCESSOR__FILE_PARSING_SORT_MODE": sort_mode}):
+        manager = DagFileProcessorManager(max_runs=-1)
+    now = timezone.utcnow()
+    files = set()
+    for index in range(num_files):
+        file = DagFileInfo(bundle_name=BUNDLE_NAME, bundle_path=bundle_path, rel_path=Path(f"dag_{index}.py"))
+        files.add(file)
+        finished_ago = timedelta(seconds=1 if index % 2 else 3600)
+        manager._file_stats[file] = DagFileStat(num_dags=1, last_finish_time=now - finished_ago, run_count=1)
+    return manager, {BUNDLE_NAME: files}
+
+
+def time_prepare_file_queue(bundle_path, num_files, sort_mode, repeat):
+    times = []
+    for _ in range(repeat):
+        manager, known_files = make_manager(bundle_path, num_files, sort_mode)
+        start = time.perf_counter()
+        manager.prepare_file_queue(known_files=known_files)
+        for files in known_files.values():
+            for file in files:
+                manager.processed_recently(manager._file_stats[file].last_finish_time, file)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@click.command()
+@click.option(
+    "--files",
+    "file_counts",
+    default="1000,5000,20000",
+    help="comma separated numbers of DAG files in the bundle",
+)
+@click.option(
+    "--sort-modes",
+    default="modified_time,alphabetical,random_seeded_by_host",
+    help="comma separated values of [dag_processor] file_parsing_sort_mode to measure",
+)
+@click.option("--repeat", default=3, help="number of times to time the queue preparation, to reduce variance")
+def main(file_counts, sort_modes, repeat):
+    """
+    Measure how the DAG processor's file queue preparation scales with the number of DAG files.
+
+    For every requested number of files, ``DagFileProcessorManager.prepare_file_queue`` is timed with
+    every file already parsed once, followed by a ``processed_recently`` check of every file. Empty DAG
+    files are created in a temporary directory, so the ``modified_time`` sort mode stats real files.
+
+    A flat time per file across the file counts means the preparation is not quadratic.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    print(f"{'files':>8} {'sort mode':>24} {'prepare_file_queue':>26} {'per file':>12}")
+    for num_files in map(int, file_counts.split(",")):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bundle_path = Path(tmp_dir)
+            for index in range(num_files):
+                (bundle_path / f"dag_{index}.py").touch()
+            for sort_mode in sort_modes.split(","):
+                times = time_prepare_file_queue(bundle_path, num_files, sort_mode, repeat)
+                timing = f"{statistics.mean(times) * 1000:.2f}ms"
+                if len(times) > 1:
+                    timing += f" (±{statistics.stdev(times) * 1000:.2f}ms)"
+                per_file = f"{statistics.mean(times) / num_files * 1e6:.2f}us"
+                print(f"{num_files:>8} {sort_mode:>24} {timing:>26} {per_file:>12}")
+
+
+if __name__ == "__main__":
+    main()
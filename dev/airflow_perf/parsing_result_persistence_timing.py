@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import time
+
+import rich_click as click
+
+BUNDLE_NAME = "dags-folder"
+
+
+def make_parsed_files(num_files, dags_per_file, run):
+    """Return the parsing results of ``num_files`` files, with DAGs tagged differently on every run."""
+    from airflow.dag_processing.collection import ParsedDagFile
+    from airflow.sdk import DAG
+    from airflow.serialization.serialized_objects import LazyDeserializedDAG
+
+    files = []
+    for file_index in range(num_files):
+        relative_fileloc = f"perf_persistence_{file_index}.py"
+        dags = []
+        for dag_index in range(dags_per_file):
+            dag = DAG(dag_id=f"perf_persistence_{file_index}_{dag_index}", schedule=None, tags=[f"run_{run}"])
+            dag.fileloc = f"/dags/{relative_fileloc}"
+            dag.relative_fileloc = relative_fileloc
+            dags.append(LazyDeserializedDAG.from_dag(dag))
+        files.append(
+            ParsedDagFile(
+                relative_fileloc=relative_fileloc,
+                dags=dags,
+                import_errors={},
+                parse_duration=0.1,
+                warnings=set(),
+            )
+        )
+    return files
+
+
+def time_one_by_one(files):
+    from airflow.dag_processing.collection import update_dag_parsing_results_in_db
+    from airflow.utils.session import create_session
+
+    start = time.perf_counter()
+    for file in files:
+        with create_session() as session:
+            update_dag_parsing_results_in_db(
+                bundle_name=BUNDLE_NAME,
+                bundle_version=None,
+                dags=file.dags,
+                import_errors={},
+                parse_duration=file.parse_duration,
+                warnings=set(),
+                session=session,
+                files_parsed={(BUNDLE_NAME, file.relative_fileloc)},
+            )
+    return time.perf_counter() - start
+
+
+def time_batched(files, batch_size):
+    from airflow.dag_processing.collection import update_dag_parsing_results_in_db_batch
+    from airflow.utils.helpers import chunks
+    from airflow.utils.session import create_session
+
+    start = time.perf_counter()
+    for batch in chunks(files, batch_size):
+        with create_session() as session:
+            update_dag_parsing_results_in_db_batch(
+                bundle_name=BUNDLE_NAME, bundle_version=None, files=batch, session=session
+            )
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--files", "num_files", default=200, help="number of DAG files whose results are persisted")
+@click.option("--dags-per-file", default=1, help="number of DAGs defined by every file")
+@click.option(
+    "--batch-sizes",
+    default="10,50,200",
+    help="comma separated values of [dag_processor] parsing_result_batch_size to measure",
+)
+@click.option("--repeat", default=3, help="number of times to persist the results, to reduce variance")
+def main(num_files, dags_per_file, batch_sizes, repeat):
+    """
+    Measure how fast the parsing results of DAG files are written to the metadata database.
+
+    The results are written one file per transaction, like with ``parsing_result_batch_size = 1``, then
+    in batches of every requested size. The DAGs change on every run, so every write updates the
+    serialized DAGs. The metadata database configured in the environment must be initialized.
+    """
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.utils.session import create_session
+
+    with create_session() as session:
+        if session.get(DagBundleModel, BUNDLE_NAME) is None:
+            session.add(DagBundleModel(name=BUNDLE_NAME))
+
+    modes = [("one by one", None), *((f"batches of {size}", int(size)) for size in batch_sizes.split(","))]
+    print(f"{'mode':>16} {'total':>24} {'per file':>12}")
+    run = 0
+    for mode, batch_size in modes:
+        times = []
+        for _ in range(repeat):
+            run += 1
+            files = make_parsed_files(num_files, dags_per_file, run)
+            times.append(time_one_by_one(files) if batch_size is None else time_batched(files, batch_size))
+        timing = f"{statistics.mean(times) * 1000:.2f}ms"
+        if len(times) > 1:
+            timing += f" (±{statistics.stdev(times) * 1000:.2f}ms)"
+        per_file = f"{statistics.mean(times) / num_files * 1000:.2f}ms"
+        print(f"{mode:>16} {timing:>24} {per_file:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+import rich_click as click
+from sqlalchemy import delete, select
+
+DAG_ID_PREFIX = "perf_serialized_dag_storage_"
+
+FORMATS = {
+    "json": ("json", False),
+    "json+zlib": ("json", True),
+    "msgpack": ("msgpack", False),
+    "msgpack+zlib": ("msgpack", True),
+}
+
+
+def make_dags(num_dags, num_tasks):
+    """Create ``num_dags`` DAGs with a chain of ``num_tasks`` templated tasks, ready to be written."""
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG, chain
+    from airflow.serialization.serialized_objects import LazyDeserializedDAG
+
+    dags = []
+    for dag_index in range(num_dags):
+        with DAG(f"{DAG_ID_PREFIX}{dag_index}", schedule=None, params={"index": dag_index}) as dag:
+            chain(
+                *(
+                    BashOperator(task_id=f"task_{i}", bash_command="echo {{ params.index }}", retries=i % 3)
+                    for i in range(num_tasks)
+                )
+            )
+        dags.append(LazyDeserializedDAG.from_dag(dag))
+    return dags
+
+
+def clear_dags(session):
+    from airflow.models.dag import DagModel
+    from airflow.models.dag_version import DagVersion
+    from airflow.models.serialized_dag import SerializedDagModel
+
+    session.execute(delete(SerializedDagModel).where(SerializedDagModel.dag_id.startswith(DAG_ID_PREFIX)))
+    session.execute(delete(DagVersion).where(DagVersion.dag_id.startswith(DAG_ID_PREFIX)))
+    session.execute(delete(DagModel).where(DagModel.dag_id.startswith(DAG_ID_PREFIX)))
+
+
+def measure_format(storage_format, compress, dags, repeat):
+    """Return write and read timings, stored bytes and decoded memory for one storage format."""
+    import airflow.models.serialized_dag as serialized_dag_module
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.utils.session import create_session
+
+    serialized_dag_module._SERIALIZED_DAG_STORAGE_FORMAT = storage_format
+    serialized_dag_module._COMPRESS_SERIALIZED_DAGS = compress
+
+    write_times, read_times = [], []
+    for _ in range(repeat):
+        with create_session() as session:
+            clear_dags(session)
+        with create_session() as session:
+            SerializedDAG.bulk_write_to_db("dags-folder", None, dags, session=session)
+            start = time.perf_counter()
+            for dag in dags:
+                SerializedDagModel.write_dag(dag, bundle_name="dags-folder", session=session)
+            session.flush()
+            write_times.append(time.perf_counter() - start)
+
+        with create_session() as session:
+            start = time.perf_counter()
+            SerializedDagModel.read_all_dags(session=session)
+            read_times.append(time.perf_counter() - start)
+
+    with create_session() as session:
+        query = select(SerializedDagModel).where(SerializedDagModel.dag_id.startswith(DAG_ID_PREFIX))
+        # Loading the rows is included, as the JSON column is decoded by the DB driver.
+        tracemalloc.start()
+        decoded = [serdag.data for serdag in session.scalars(query)]
+        decoded_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del decoded
+        stored_bytes = sum(
+            len(data_compressed) if data_compressed else len(json.dumps(data))
+            for data, data_compressed in session.execute(
+                select(SerializedDagModel._data, SerializedDagModel._data_compressed).where(
+                    SerializedDagModel.dag_id.startswith(DAG_ID_PREFIX)
+                )
+            )
+        )
+        clear_dags(session)
+
+    return write_times, read_times, stored_bytes, decoded_bytes
+
+
+def _timing(times):
+    timing = f"{statistics.mean(times) * 1000:.2f}ms"
+    if len(times) > 1:
+        timing += f" (±{statistics.stdev(times) * 1000:.2f}ms)"
+    return timing
+
+
+@click.command()
+@click.option("--dags", default=50, help="number of DAGs")
+@click.option("--tasks", default=500, help="number of tasks per DAG")
+@click.option("--formats", default=",".join(FORMATS), help="comma separated storage formats to measure")
+@click.option("--repeat", default=3, help="number of times to time writes and reads, to reduce variance")
+def main(dags, tasks, formats, repeat):
+    """
+    Compare the storage formats of serialized DAGs in the metadata DB.
+
+    For every requested combination of ``[core] serialized_dag_storage_format`` and ``[core]
+    compress_serialized_dags``, the DAGs are written with ``SerializedDagModel.write_dag`` and read back
+    with ``SerializedDagModel.read_all_dags``. The size stored in the DB and the memory taken by the
+    decoded DAGs (before deserialization) are reported as well.
+
+    The script uses the database configured for Airflow and deletes any previous benchmark DAGs.
+    """
+    from airflow.dag_processing.bundles.manager import DagBundlesManager
+    from airflow.utils.session import create_session
+
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+    with create_session() as session:
+        DagBundlesManager().sync_bundles_to_db(session=session)
+
+    lazy_dags = make_dags(dags, tasks)
+    print(
+        f"{'format':>14} {'write_dag':>24} {'read_all_dags':>24} {'stored size':>14} {'decoded memory':>16}"
+    )
+    for name in formats.split(","):
+        storage_format, compress = FORMATS[name]
+        write_times, read_times, stored_bytes, decoded_bytes = measure_format(
+            storage_format, compress, lazy_dags, repeat
+        )
+        print(
+            f"{name:>14} {_timing(write_times):>24} {_timing(read_times):>24} "
+            f"{stored_bytes / 1024 / 1024:>12.2f}MB {decoded_bytes / 1024 / 1024:>14.2f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
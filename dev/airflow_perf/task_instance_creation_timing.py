@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from unittest import mock
+
+import rich_click as click
+from sqlalchemy import delete
+
+DAG_ID = "perf_task_instance_creation"
+
+
+def create_dag(num_mapped):
+    """Sync a DAG with a task mapped over ``num_mapped`` literals, expanded when a run is created."""
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    with DAG(DAG_ID, schedule=None) as dag:
+        BashOperator.partial(task_id="mapped").expand(bash_command=["true"] * num_mapped)
+    return sync_dag_to_db(dag)
+
+
+def time_create_dagrun(scheduler_dag, repeat):
+    """Time ``create_dagrun``, which creates and expands the task instances, ``repeat`` times."""
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils import timezone
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    times = []
+    for run_index in range(repeat):
+        with create_session() as session:
+            session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+            session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+        with create_session() as session:
+            start = time.perf_counter()
+            scheduler_dag.create_dagrun(
+                run_id=f"perf_{run_index}",
+                run_after=timezone.utcnow(),
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.RUNNING,
+                session=session,
+            )
+            session.flush()
+            times.append(time.perf_counter() - start)
+    return times
+
+
+@click.command()
+@click.option(
+    "--mapped",
+    "mapped_counts",
+    default="1000,10000,50000",
+    help="comma separated numbers of mapped task instances to create",
+)
+@click.option("--repeat", default=3, help="number of times to time the run creation, to reduce variance")
+def main(mapped_counts, repeat):
+    """
+    Measure the throughput of task instance creation when a DAG run is created.
+
+    For every requested number of mapped task instances, ``create_dagrun`` is timed with the bulk
+    insert path used when no ``task_instance_mutation_hook`` cluster policy is defined ("bulk"), and
+    with the ORM path used when there is one ("orm").
+
+    The script uses the database configured for Airflow and deletes any previous runs of the benchmark
+    DAG.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    from airflow import settings
+
+    print(f"{'mapped TIs':>12} {'mode':>6} {'create_dagrun':>24} {'TIs/s':>10}")
+    for num_mapped in map(int, mapped_counts.split(",")):
+        scheduler_dag = create_dag(num_mapped)
+        for mode, is_noop in (("bulk", True), ("orm", False)):
+            with mock.patch.object(settings.task_instance_mutation_hook, "is_noop", is_noop):
+                times = time_create_dagrun(scheduler_dag, repeat)
+            timing = f"{statistics.mean(times) * 1000:.2f}ms"
+            if len(times) > 1:
+                timing += f" (±{statistics.stdev(times) * 1000:.2f}ms)"
+            print(f"{num_mapped:>12} {mode:>6} {timing:>24} {num_mapped / statistics.mean(times):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
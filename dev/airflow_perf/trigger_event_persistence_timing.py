@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+import rich_click as click
+from sqlalchemy import delete, select, update
+
+DAG_ID = "perf_trigger_event_persistence"
+
+
+def create_dag(num_triggers):
+    """Sync a DAG with a task mapped over ``num_triggers`` literals, expanded when a run is created."""
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    with DAG(DAG_ID, schedule=None) as dag:
+        BashOperator.partial(task_id="sensor").expand(bash_command=["true"] * num_triggers)
+    return sync_dag_to_db(dag)
+
+
+def defer_task_instances(scheduler_dag, run_index):
+    """Create a run whose task instances are all deferred, each on its own trigger; return the trigger ids."""
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.trigger import Trigger
+    from airflow.utils import timezone
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    with create_session() as session:
+        session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+        session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+        session.execute(delete(Trigger).where(Trigger.classpath == "perf.DeferredTrigger"))
+    with create_session() as session:
+        dag_run = scheduler_dag.create_dagrun(
+            run_id=f"perf_{run_index}",
+            run_after=timezone.utcnow(),
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+        ti_ids = session.scalars(select(TaskInstance.id).where(TaskInstance.run_id == dag_run.run_id)).all()
+        triggers = [Trigger(classpath="perf.DeferredTrigger", kwargs={}) for _ in ti_ids]
+        session.add_all(triggers)
+        session.flush()
+        session.execute(
+            update(TaskInstance),
+            [
+                {
+                    "id": ti_id,
+                    "trigger_id": trigger.id,
+                    "state": TaskInstanceState.DEFERRED,
+                    "next_method": "execute_complete",
+                    "next_kwargs": {},
+                }
+                for ti_id, trigger in zip(ti_ids, triggers)
+            ],
+        )
+        return [trigger.id for trigger in triggers]
+
+
+def time_submit(scheduler_dag, repeat, batch_size):
+    """Time the persistence of one event per trigger, in batches of ``batch_size`` events, ``repeat`` times."""
+    from airflow.models.trigger import Trigger
+    from airflow.triggers.base import TriggerEvent
+    from airflow.utils.session import create_session
+
+    times = []
+    for run_index in range(repeat):
+        trigger_ids = defer_task_instances(scheduler_dag, run_index)
+        start = time.perf_counter()
+        # One transaction per batch, as the triggerer does
+        for batch_start in range(0, len(trigger_ids), batch_size):
+            batch = trigger_ids[batch_start : batch_start + batch_size]
+            with create_session() as session:
+                if batch_size == 1:
+                    Trigger.submit_event(batch[0], TriggerEvent({"status": "done"}), session=session)
+                else:
+                    Trigger.submit_events(
+                        [(trigger_id, TriggerEvent({"status": "done"})) for trigger_id in batch],
+                        session=session,
+                    )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@click.command()
+@click.option(
+    "--triggers",
+    "trigger_counts",
+    default="1000,5000",
+    help="comma separated numbers of triggers firing at once, each with one deferred task instance",
+)
+@click.option(
+    "--batch-sizes",
+    default="1,100,500",
+    help="comma separated values of [triggerer] event_batch_size to compare",
+)
+@click.option("--repeat", default=3, help="number of times to time the persistence, to reduce variance")
+def main(trigger_counts, batch_sizes, repeat):
+    """
+    Measure the throughput of the triggerer persisting a burst of trigger events.
+
+    For every requested number of triggers, one event per trigger is persisted with ``Trigger.submit_event``
+    when the batch size is 1, as ``[triggerer] event_batch_size`` defaults to, and with
+    ``Trigger.submit_events`` in batches of the given size otherwise.
+
+    The script uses the database configured for Airflow and deletes any previous runs of the benchmark
+    DAG.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    print(f"{'triggers':>10} {'batch':>6} {'persist events':>24} {'events/s':>10}")
+    for num_triggers in map(int, trigger_counts.split(",")):
+        scheduler_dag = create_dag(num_triggers)
+        for batch_size in map(int, batch_sizes.split(",")):
+            times = time_submit(scheduler_dag, repeat, batch_size)
+            timing = f"{statistics.mean(times) * 1000:.2f}ms"
+            if len(times) > 1:
+                timing += f" (±{statistics.stdev(times) * 1000:.2f}ms)"
+            print(
+                f"{num_triggers:>10} {batch_size:>6} {timing:>24} {num_triggers / statistics.mean(times):>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -41,6 +41,9 @@ class DateTimeTrigger(BaseTrigger):
         reached or resume the task after time condition reached.
     """
 
+    # Tasks waiting for the same moment share a single run in the triggerer
+    supports_coalescing = True
+
     def __init__(self, moment: datetime.datetime, *, end_from_trigger: bool = False) -> None:
         super().__init__()
         if not isinstance(moment, datetime.datetime):